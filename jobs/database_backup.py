@@ -1,9 +1,25 @@
+import argparse
+import contextlib
+import hashlib
+import multiprocessing
 import subprocess
 import os
+import sqlite3
+import sys
+import tempfile
+import time
 from dotenv import load_dotenv
 import datetime
 import glob
 
+# 프로젝트 루트 경로를 sys.path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.data_operations.BackupStore import BackupStore
+from src.data_operations.TableDump import (
+    TableChecksum, dump_table_lines, quote_identifier, restore_into_sqlite, table_checksum,
+)
+
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
@@ -11,9 +27,18 @@ load_dotenv()
 # 백업 파일을 저장할 디렉토리 (프로젝트 루트/backup)
 BACKUP_DIR = os.path.join(os.path.dirname(os.path.abspath(os.path.dirname(__file__))), 'dump')
 MAX_BACKUP_SIZE_GB = 3.0 # 백업 디렉토리의 최대 크기 (GB)
+# 중복 제거 백업(dedup 모드) 저장 디렉토리
+DEDUP_BACKUP_DIR = os.path.join(BACKUP_DIR, 'dedup')
+
+# 병렬 백업/검증 작업 프로세스 수
+BACKUP_WORKERS = int(os.getenv('BACKUP_WORKERS', min(4, os.cpu_count() or 1)))
+# 작업 프로세스들이 스냅샷 트랜잭션을 시작할 때까지 기다리는 최대 시간 (초)
+SNAPSHOT_TIMEOUT = 60
 
 # mysqldump 명령어 경로 (환경에 따라 다를 수 있음)
 MysqlDUMP_PATH = '/usr/bin/mysqldump'
+# mysql 클라이언트 경로 (--verify --target mysql에서 사용)
+MYSQL_PATH = '/usr/bin/mysql'
 
 # DB 연결 정보
 DB_HOST = os.getenv('host', 'localhost')
@@ -22,6 +47,12 @@ DB_PASSWORD = os.getenv('password', '')
 DB_NAME = os.getenv('database')
 DB_PORT = os.getenv('port', '3306')
 
+# 백업 검증용 MySQL 서버 (--verify --target mysql). 운영 DB가 아닌 임시 서버를 지정해야 합니다.
+VERIFY_DB_HOST = os.getenv('VERIFY_DB_HOST')
+VERIFY_DB_PORT = os.getenv('VERIFY_DB_PORT', '3306')
+VERIFY_DB_USER = os.getenv('VERIFY_DB_USER', 'root')
+VERIFY_DB_PASSWORD = os.getenv('VERIFY_DB_PASSWORD', '')
+
 def get_directory_size(directory):
     """디렉토리의 전체 크기를 바이트 단위로 반환합니다."""
     total_size = 0
@@ -56,17 +87,8 @@ def ensure_directory_size_limit():
             print("삭제할 덤프 파일이 없습니다.")
             break
 
-def main():
-    """데이터베이스 백업을 실행하는 메인 함수"""
-    print(f"[{datetime.datetime.now()}] 데이터베이스 백업 시작")
-
-    if not DB_NAME:
-        print("❌ [ERROR] .env 파일에 데이터베이스 이름(database)이 설정되지 않았습니다.")
-        return
-
-    # 백업 디렉토리 생성
-    os.makedirs(BACKUP_DIR, exist_ok=True)
-
+def run_sql_backup():
+    """mysqldump 전체 덤프를 압축하지 않은 .sql 파일 하나로 저장합니다. (기존 방식)"""
     # 용량 관리
     ensure_directory_size_limit()
 
@@ -97,5 +119,353 @@ def main():
     except FileNotFoundError:
         print(f"❌ [ERROR] '{MysqlDUMP_PATH}' 명령어를 찾을 수 없습니다. 경로를 확인하세요.")
 
+def mysqldump_command(*args):
+    """mysqldump 인자 목록을 만듭니다. 비밀번호는 명령행 대신 MYSQL_PWD 환경 변수로 전달합니다."""
+    return [
+        MysqlDUMP_PATH, '-h', DB_HOST, '-P', str(DB_PORT), '-u', DB_USER,
+        # 실행 시각 등 매번 달라지는 주석을 빼야 바뀌지 않은 객체의 청크가 그대로 재사용됩니다.
+        '--single-transaction', '--skip-opt', '--skip-comments', '--skip-dump-date',
+        '--no-create-db', *args,
+    ]
+
+def connect_db(**kwargs):
+    """백업 대상 데이터베이스에 연결합니다."""
+    import pymysql
+
+    return pymysql.connect(host=DB_HOST, port=int(DB_PORT), user=DB_USER, password=DB_PASSWORD, db=DB_NAME,
+                           charset='utf8mb4', **kwargs)
+
+def list_tables():
+    """
+    백업할 테이블과 뷰 목록을 조회합니다. 큰 테이블을 먼저 시작해야 전체 백업 시간이 짧아지므로
+    테이블은 데이터 크기가 큰 순서로 반환합니다.
+
+    Returns:
+        tuple[list[str], list[str]]: (테이블 목록, 뷰 목록)
+    """
+    connection = connect_db()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s "
+                "ORDER BY DATA_LENGTH DESC, TABLE_NAME",
+                (DB_NAME,),
+            )
+            rows = cursor.fetchall()
+    finally:
+        connection.close()
+    tables = [name for name, table_type in rows if table_type == 'BASE TABLE']
+    views = sorted(name for name, table_type in rows if table_type == 'VIEW')
+    return tables, views
+
+def dump_into_store(store, backup, name, command):
+    """mysqldump 출력을 임시 파일 없이 BackupStore로 바로 스트리밍합니다."""
+    env = dict(os.environ, MYSQL_PWD=DB_PASSWORD)
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env) as proc:
+        entry = store.add_table(backup, name, proc.stdout)
+        stderr = proc.stderr.read()
+    if proc.returncode != 0:
+        raise RuntimeError(f"'{name}' 덤프 실패: {stderr.decode(errors='replace').strip()}")
+    return entry
+
+# --- 병렬 백업/검증 작업 프로세스 ---
+# 작업 프로세스마다 initializer에서 만든 DB 연결과 BackupStore를 보관합니다.
+_worker = {}
+
+def _store_args(store):
+    return store.directory, store.compression, store.min_chunk_size, store.max_chunk_size
+
+def _init_dump_worker(store_args, barrier):
+    """작업 프로세스의 DB 연결에서 스냅샷 트랜잭션을 시작하고, 모든 프로세스가 시작할 때까지 기다립니다."""
+    import pymysql
+
+    connection = connect_db(cursorclass=pymysql.cursors.SSCursor)
+    with connection.cursor() as cursor:
+        cursor.execute("SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+    _worker['connection'] = connection
+    _worker['store'] = BackupStore(*store_args)
+    barrier.wait(SNAPSHOT_TIMEOUT)
+
+def _dump_table(table):
+    """테이블 하나를 스냅샷 트랜잭션 안에서 덤프해 청크로 저장하고, 행 수와 체크섬을 함께 반환합니다."""
+    connection = _worker['connection']
+    store = _worker['store']
+    name = quote_identifier(table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SHOW CREATE TABLE {name}")
+        create_statement = cursor.fetchone()[1]
+    with connection.cursor() as cursor:
+        cursor.execute(f"SHOW KEYS FROM {name} WHERE Key_name = 'PRIMARY'")
+        primary_key = [row[4] for row in sorted(cursor.fetchall(), key=lambda row: row[3])]
+    # 행 순서가 매번 같아야 바뀌지 않은 구간의 청크가 재사용됩니다.
+    order_by = f" ORDER BY {', '.join(quote_identifier(column) for column in primary_key)}" if primary_key else ""
+
+    checksum = TableChecksum()
+    with connection.cursor() as cursor:  # SSCursor: 행을 서버에서 스트리밍으로 읽습니다.
+        cursor.execute(f"SELECT * FROM {name}{order_by}")
+        columns = [description[0] for description in cursor.description]
+        lines = dump_table_lines(table, columns, cursor, create_statement, checksum)
+        entry = store.add_table({'tables': {}}, table, lines)
+    entry.update(columns=columns, rows=checksum.rows, checksum=checksum.hexdigest())
+    return table, entry, store.chunk_entries(entry['chunks'])
+
+@contextlib.contextmanager
+def snapshot_pool(store, workers):
+    """
+    모든 작업 프로세스가 같은 시점의 스냅샷으로 트랜잭션을 시작한 프로세스 풀을 만듭니다.
+
+    작업 프로세스들이 스냅샷을 여는 동안만 전역 읽기 잠금(FLUSH TABLES WITH READ LOCK)을 걸어
+    테이블 간 일관성을 맞춥니다. 권한이 없어 잠금을 걸 수 없으면 프로세스마다 스냅샷 시점이 달라져
+    테이블끼리 섞인 백업이 되므로, 작업 프로세스 하나(스냅샷 하나)로 모든 테이블을 순서대로 덤프합니다.
+
+    Yields:
+        tuple[multiprocessing.pool.Pool, int]: (프로세스 풀, 실제 작업 프로세스 수)
+    """
+    import pymysql
+
+    lock_connection = connect_db()
+    locked = False
+    try:
+        with lock_connection.cursor() as cursor:
+            cursor.execute("FLUSH TABLES WITH READ LOCK")
+        locked = True
+    except pymysql.MySQLError as e:
+        if workers > 1:
+            print(f"⚠️ 전역 읽기 잠금을 걸 수 없어 스냅샷 하나로 일관성을 맞추도록 작업 프로세스 1개로 덤프합니다: {e}")
+        workers = 1
+
+    barrier = multiprocessing.Barrier(workers + 1)
+    pool = multiprocessing.Pool(workers, initializer=_init_dump_worker, initargs=(_store_args(store), barrier))
+    try:
+        try:
+            barrier.wait(SNAPSHOT_TIMEOUT)
+        finally:
+            if locked:
+                with lock_connection.cursor() as cursor:
+                    cursor.execute("UNLOCK TABLES")
+            lock_connection.close()
+        yield pool, workers
+    finally:
+        pool.terminate()
+        pool.join()
+
+def run_dedup_backup(workers=BACKUP_WORKERS):
+    """
+    테이블을 작업 프로세스 여러 개에서 같은 시점의 스냅샷으로 병렬 덤프해 압축·중복 제거 청크로 저장하고,
+    테이블별 행 수와 체크섬을 catalog에 기록한 뒤 보관 용량을 관리합니다.
+    """
+    start_time = time.time()
+    store = BackupStore(DEDUP_BACKUP_DIR)
+    backup = store.begin_backup(database=DB_NAME)
+
+    try:
+        tables, views = list_tables()
+        workers = max(1, min(workers, len(tables)))
+        print(f"📌 백업 대상 테이블 {len(tables)}개, 뷰 {len(views)}개 (작업 프로세스 {workers}개)")
+        with snapshot_pool(store, workers) as (pool, workers):
+            for table, entry, chunk_entries in pool.imap_unordered(_dump_table, tables):
+                entry = store.record_table(backup, table, entry, chunk_entries)
+                print(f"   - {table}: {entry['rows']:,}행, 원본 {entry['raw_bytes'] / 1024 ** 2:.1f}MB, "
+                      f"청크 {len(entry['chunks'])}개 중 신규 {entry['new_chunks']}개 ({entry['new_bytes'] / 1024 ** 2:.1f}MB 저장)")
+        # 전역 잠금 아래에서 연 스냅샷들이거나 스냅샷 하나이므로 모든 테이블이 같은 시점입니다.
+        backup['consistent_snapshot'] = True
+        backup['workers'] = workers
+        backup['tables'] = {table: backup['tables'][table] for table in tables}
+        # 뷰 정의와 트리거·저장 프로시저·이벤트는 데이터가 모두 복원된 뒤에 만들어지도록 마지막에 저장합니다.
+        if views:
+            dump_into_store(store, backup, '__views__', mysqldump_command('--no-data', '--skip-triggers', DB_NAME, *views))
+        dump_into_store(store, backup, '__routines__', mysqldump_command(
+            '--no-create-info', '--no-data', '--triggers', '--routines', '--events', DB_NAME,
+        ))
+    except FileNotFoundError:
+        print(f"❌ [ERROR] '{MysqlDUMP_PATH}' 명령어를 찾을 수 없습니다. 경로를 확인하세요.")
+        return None
+    except Exception as e:
+        print(f"❌ [ERROR] 데이터베이스 백업 중 오류 발생: {e}")
+        return None
+
+    store.commit_backup(backup)
+    sizes = store.backup_size(backup)
+    ratio = sizes['raw_bytes'] / sizes['new_bytes'] if sizes['new_bytes'] else float('inf')
+    print(f"✅ 데이터베이스 '{DB_NAME}' 백업 완료: {backup['id']} ({time.time() - start_time:.1f}초)")
+    print(f"📊 원본 덤프 {sizes['raw_bytes'] / 1024 ** 2:.1f}MB → 신규 저장 {sizes['new_bytes'] / 1024 ** 2:.1f}MB ({ratio:.1f}배 절감)")
+
+    removed = store.enforce_retention(int(MAX_BACKUP_SIZE_GB * (1024 ** 3)))
+    for backup_id in removed:
+        print(f"⚠️ 용량 초과! 가장 오래된 백업 삭제: {backup_id}")
+    print(f"📌 현재 백업 저장소 크기: {store.total_size() / (1024 ** 3):.2f} GB / {MAX_BACKUP_SIZE_GB} GB "
+          f"(백업 {len(store.backups())}개)")
+    return backup
+
+def _init_verify_worker(store_args, backup, target, location):
+    _worker.update(store=BackupStore(*store_args), backup=backup, target=target, location=location)
+
+def _verify_table(table):
+    """테이블 하나를 검증용 DB에 복원하고, 복원된 행으로 다시 계산한 (행 수, 체크섬)을 반환합니다."""
+    store, backup = _worker['store'], _worker['backup']
+    columns = backup['tables'][table]['columns']
+    # 청크 해시도 함께 확인합니다.
+    chunks = store.iter_table(backup, table, check=True)
+
+    if _worker['target'] == 'sqlite':
+        # 테이블마다 별도 SQLite 파일에 복원해 프로세스끼리 쓰기 잠금을 다투지 않게 합니다.
+        path = os.path.join(_worker['location'], hashlib.sha256(table.encode('utf-8')).hexdigest()[:16] + '.sqlite')
+        connection = sqlite3.connect(path)
+        try:
+            restore_into_sqlite(connection, table, columns, chunks)
+            checksum = table_checksum(connection.cursor(), table, columns)
+        finally:
+            connection.close()
+    else:
+        env = dict(os.environ, MYSQL_PWD=VERIFY_DB_PASSWORD)
+        command = [MYSQL_PATH, '-h', VERIFY_DB_HOST, '-P', str(VERIFY_DB_PORT), '-u', VERIFY_DB_USER,
+                   '--default-character-set=utf8mb4', _worker['location']]
+        with subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE, env=env) as proc:
+            for data in chunks:
+                proc.stdin.write(data)
+            proc.stdin.close()
+            stderr = proc.stderr.read()
+        if proc.returncode != 0:
+            raise RuntimeError(f"'{table}' 복원 실패: {stderr.decode(errors='replace').strip()}")
+        connection = connect_verify_db(_worker['location'])
+        try:
+            with connection.cursor() as cursor:
+                checksum = table_checksum(cursor, table, columns)
+        finally:
+            connection.close()
+    return table, checksum.rows, checksum.hexdigest()
+
+def connect_verify_db(database=None):
+    """검증용 MySQL 서버에 연결합니다."""
+    import pymysql
+
+    return pymysql.connect(host=VERIFY_DB_HOST, port=int(VERIFY_DB_PORT), user=VERIFY_DB_USER,
+                           password=VERIFY_DB_PASSWORD, db=database, charset='utf8mb4')
+
+def verify_backup(backup_id=None, target='sqlite', workers=BACKUP_WORKERS):
+    """
+    백업을 임시 검증용 DB에 테이블별로 병렬 복원하고, 복원된 행의 수와 체크섬이
+    백업할 때 기록한 값과 같은지 확인합니다.
+
+    Args:
+        backup_id (str, optional): 검증할 백업 ID. 없으면 최신 백업
+        target (str): 'sqlite'(임시 디렉토리의 SQLite 파일) 또는 'mysql'(VERIFY_DB_HOST 서버의 임시 데이터베이스)
+
+    Returns:
+        bool: 모든 테이블이 일치하면 True
+    """
+    store = BackupStore(DEDUP_BACKUP_DIR)
+    backup = store.get_backup(backup_id)
+    tables = [table for table, entry in backup['tables'].items() if 'checksum' in entry]
+    if not tables:
+        print(f"❌ [ERROR] 백업 {backup['id']}에는 테이블 체크섬이 기록되어 있지 않습니다.")
+        return False
+    if target == 'mysql' and not VERIFY_DB_HOST:
+        print("❌ [ERROR] mysql 검증에는 .env의 VERIFY_DB_HOST(검증용 MySQL 서버) 설정이 필요합니다.")
+        return False
+
+    start_time = time.time()
+    workers = max(1, min(workers, len(tables)))
+    print(f"[{datetime.datetime.now()}] 백업 {backup['id']} 검증 시작 ({target}, 테이블 {len(tables)}개, 작업 프로세스 {workers}개)")
+
+    mismatched = []
+    with contextlib.ExitStack() as stack:
+        if target == 'sqlite':
+            location = stack.enter_context(tempfile.TemporaryDirectory(prefix='db_verify_'))
+        else:
+            location = f"{backup['database']}_verify_{backup['id']}"
+            connection = connect_verify_db()
+            with connection.cursor() as cursor:
+                cursor.execute(f"CREATE DATABASE {quote_identifier(location)} CHARACTER SET utf8mb4")
+            stack.callback(_drop_verify_database, connection, location)
+
+        pool = stack.enter_context(multiprocessing.Pool(
+            workers, initializer=_init_verify_worker, initargs=(_store_args(store), backup, target, location),
+        ))
+        for table, rows, checksum in pool.imap_unordered(_verify_table, tables):
+            expected = backup['tables'][table]
+            if rows == expected['rows'] and checksum == expected['checksum']:
+                print(f"   - {table}: ✅ {rows:,}행, 체크섬 {checksum}")
+            else:
+                mismatched.append(table)
+                print(f"   - {table}: ❌ {rows:,}행 / 체크섬 {checksum} "
+                      f"(백업 기록: {expected['rows']:,}행 / 체크섬 {expected['checksum']})")
+
+    elapsed = time.time() - start_time
+    if mismatched:
+        print(f"❌ 백업 {backup['id']} 검증 실패: {len(mismatched)}개 테이블 불일치 ({elapsed:.1f}초)")
+        return False
+    if not backup.get('consistent_snapshot'):
+        print("⚠️ 이 백업은 테이블 간 스냅샷 시점이 다를 수 있는 이전 방식으로 만들어졌습니다.")
+    print(f"✅ 백업 {backup['id']} 검증 완료: 테이블 {len(tables)}개 일치 ({elapsed:.1f}초)")
+    return True
+
+def _drop_verify_database(connection, database):
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS {quote_identifier(database)}")
+    finally:
+        connection.close()
+
+def list_backups():
+    """중복 제거 백업 목록을 출력합니다."""
+    store = BackupStore(DEDUP_BACKUP_DIR)
+    for backup in store.backups():
+        sizes = store.backup_size(backup)
+        rows = sum(entry.get('rows', 0) for entry in backup['tables'].values())
+        print(f"{backup['id']}  {backup['database']}  테이블 {len(backup['tables'])}개  {rows:,}행  "
+              f"원본 {sizes['raw_bytes'] / 1024 ** 2:.1f}MB  신규 저장 {sizes['new_bytes'] / 1024 ** 2:.1f}MB")
+
+def export_backup(backup_id, output_path):
+    """중복 제거 백업을 mysql 클라이언트로 복원할 수 있는 .sql 파일로 내보냅니다."""
+    store = BackupStore(DEDUP_BACKUP_DIR)
+    backup = store.get_backup(backup_id)
+    with open(output_path, 'wb') as f:
+        written = store.export(backup, f)
+    print(f"✅ 백업 {backup['id']} 내보내기 완료: {output_path} ({written / 1024 ** 2:.1f}MB)")
+
+def main(mode='dedup', workers=BACKUP_WORKERS):
+    """데이터베이스 백업을 실행하는 메인 함수"""
+    print(f"[{datetime.datetime.now()}] 데이터베이스 백업 시작")
+
+    if not DB_NAME:
+        print("❌ [ERROR] .env 파일에 데이터베이스 이름(database)이 설정되지 않았습니다.")
+        return
+
+    # 백업 디렉토리 생성
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+
+    if mode == 'sql':
+        run_sql_backup()
+    else:
+        run_dedup_backup(workers)
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="데이터베이스 백업 스크립트")
+    parser.add_argument("--mode", default="dedup", choices=["dedup", "sql"],
+                        help="dedup: 테이블별 압축·중복 제거 백업 (기본값), sql: 전체 덤프 .sql 파일")
+    parser.add_argument("--list", action="store_true", help="중복 제거 백업 목록 출력")
+    parser.add_argument("--export", metavar="BACKUP_ID", nargs="?", const="latest",
+                        help="중복 제거 백업을 .sql 파일로 내보내기 (ID를 생략하면 최신 백업)")
+    parser.add_argument("--output", help="--export 출력 파일 경로")
+    parser.add_argument("--verify", metavar="BACKUP_ID", nargs="?", const="latest",
+                        help="중복 제거 백업을 임시 DB에 복원해 테이블별 행 수·체크섬 검증 (ID를 생략하면 최신 백업)")
+    parser.add_argument("--target", default="sqlite", choices=["sqlite", "mysql"],
+                        help="--verify 복원 대상. sqlite: 임시 SQLite 파일 (기본값), mysql: VERIFY_DB_HOST 서버의 임시 데이터베이스")
+    parser.add_argument("--workers", type=int, default=BACKUP_WORKERS,
+                        help=f"병렬 덤프/검증 작업 프로세스 수 (기본값: {BACKUP_WORKERS})")
+
+    args = parser.parse_args()
+
+    if args.list:
+        list_backups()
+    elif args.export:
+        backup_id = None if args.export == "latest" else args.export
+        export_backup(backup_id, args.output or os.path.join(BACKUP_DIR, f"db_restore_{args.export}.sql"))
+    elif args.verify:
+        backup_id = None if args.verify == "latest" else args.verify
+        sys.exit(0 if verify_backup(backup_id, args.target, args.workers) else 1)
+    else:
+        main(args.mode, args.workers)
@@ -4,7 +4,6 @@ import sys
 import os
 import datetime
 from typing import Dict, Any, Callable, Optional
-import pandas as pd
 
 # 프로젝트 루트 경로를 sys.path에 추가
 sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
@@ -12,10 +11,21 @@ sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
 from src.data_operations.WorkFlowManager import WorkFlowManager
 from src.data_operations.ReportManager import ReportManager
 from src.data_operations.Notifier import Notifier
-
-def run_update_job(job_key: str, job_function: Callable, report_manager: ReportManager) -> Optional[str]:
+from src.data_operations.LocalStore import LocalStore
+from src.data_operations.QueryEngine import QueryEngine
+from src.data_operations.Instrumentation import instrumentation, span
+
+# 변경 감지와 로컬 저장에 사용하는 LocalStore subject
+JOB_SUBJECTS = {
+    "bills": "bills", "lawmakers": "lawmakers", "timeline": "bill_timeline",
+    "results": "bill_result", "votes": "bill_vote",
+}
+
+def run_update_job(job_key: str, job_function: Callable, report_manager: ReportManager,
+                   local_store: LocalStore, query_engine: Optional[QueryEngine] = None) -> Optional[str]:
     """
     개별 데이터 업데이트 작업을 실행하고, 중복을 확인하며, 결과를 기록합니다.
+    중복 확인은 로컬 Parquet 데이터셋(LocalStore)에 저장된 이전 수집 결과와 비교해 수행합니다.
     오류 발생 시 오류 메시지를 반환합니다.
     """
     job_name_map = {
@@ -23,14 +33,14 @@ def run_update_job(job_key: str, job_function: Callable, report_manager: ReportM
         "results": "처리결과", "votes": "표결정보",
     }
     job_name = job_name_map.get(job_key, job_key)
-    last_run_dir = "reports/last_run"
-    last_run_file = os.path.join(last_run_dir, f"{job_key}.csv")
+    subject = JOB_SUBJECTS[job_key]
 
     print(f"--- [시작] {job_name} 업데이트 ---")
-    start_time = time.time()
+    timing = span(f"job.{job_key}")
     try:
-        result_obj = job_function()
-        execution_time = time.time() - start_time
+        with timing:
+            result_obj = job_function()
+        execution_time = timing.elapsed
 
         result_df = result_obj[0] if isinstance(result_obj, tuple) else result_obj
 
@@ -41,32 +51,40 @@ def run_update_job(job_key: str, job_function: Callable, report_manager: ReportM
 
         # 'bills'를 제외하고 중복 검사 수행
         if job_key != "bills":
-            if os.path.exists(last_run_file):
-                try:
-                    old_df = pd.read_csv(last_run_file)
-                    # 데이터프레임의 내용을 비교하기 위해 정렬
-                    result_df_sorted = result_df.sort_values(by=list(result_df.columns)).reset_index(drop=True)
-                    old_df_sorted = old_df.sort_values(by=list(old_df.columns)).reset_index(drop=True)
-                    
-                    if result_df_sorted.equals(old_df_sorted):
-                        report_manager.save_job_result(job_key, "no_change", data_count=len(result_df), execution_time=execution_time)
-                        print(f"⚪ [{job_name}] 변경사항 없음-전송 생략 (소요 시간: {execution_time:.2f}초)")
-                        return None
-                except Exception as e:
-                    print(f"⚠️ [경고] 이전 결과 파일({last_run_file}) 비교 중 오류: {e}")
+            try:
+                changed_df = local_store.changed_rows(subject, result_df)
+                if changed_df.empty:
+                    report_manager.save_job_result(job_key, "no_change", data_count=len(result_df), execution_time=execution_time)
+                    print(f"⚪ [{job_name}] 변경사항 없음-전송 생략 (소요 시간: {execution_time:.2f}초)")
+                    return None
+                print(f"🔎 [{job_name}] 이전 수집 결과 대비 신규/변경 {len(changed_df)}건")
+            except Exception as e:
+                print(f"⚠️ [경고] 로컬 저장소({local_store.root}/{subject}) 비교 중 오류: {e}")
+
+        # 성공 시, 수집 결과를 로컬 저장소에 upsert (다음 실행의 변경 감지, 백필, 분석에 재사용)
+        try:
+            assembly = None if "assemblyNumber" in result_df.columns else os.getenv("AGE")
+            local_store.write(subject, result_df, assembly=assembly)
+        except Exception as e:
+            print(f"⚠️ [경고] 로컬 저장소({local_store.root}/{subject}) 저장 중 오류: {e}")
+
+        # 로컬 저장소에 누적된 데이터의 분포 (QueryEngine이 있을 때만)
+        data_distribution = None
+        if query_engine is not None:
+            try:
+                data_distribution = report_manager.calculate_stored_distribution(job_key, query_engine)
+            except Exception as e:
+                print(f"⚠️ [경고] {job_name} 분포 집계 중 오류: {e}")
 
         # 성공 또는 변경된 데이터 처리
-        report_manager.save_job_result(job_key, "success", data_count=len(result_df), execution_time=execution_time)
+        report_manager.save_job_result(job_key, "success", data_count=len(result_df), execution_time=execution_time,
+                                       data_distribution=data_distribution)
         print(f"✅ [{job_name}] 전송 성공: {len(result_df)}건 (소요 시간: {execution_time:.2f}초)")
-        
-        # 성공 시, 마지막 실행 결과 저장 ('bills' 제외)
-        if job_key != "bills":
-            result_df.to_csv(last_run_file, index=False)
-            
+
         return None
 
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = timing.elapsed
         error_message = f"🚨 **[{job_name.upper()}]** 작업 중 오류 발생!\n\n- **오류 내용**: `{type(e).__name__}: {str(e)}`"
         print(error_message)
         
@@ -83,9 +101,14 @@ def main():
     
     wfm = WorkFlowManager(mode=mode)
     report_manager = ReportManager()
+    local_store = LocalStore()
+    try:
+        query_engine = QueryEngine(local_store.root)
+    except ImportError as e:
+        print(f"⚠️ [경고] {e} 데이터 분포 집계를 생략합니다.")
+        query_engine = None
     
-    # 이전 리포트 및 마지막 실행 결과 저장 디렉토리 생성
-    os.makedirs("reports/last_run", exist_ok=True)
+    # 이전 리포트 삭제
     report_manager.clear_results()
     
     update_jobs = {
@@ -97,9 +120,13 @@ def main():
     }
 
     for job_key, job_func in update_jobs.items():
-        run_update_job(job_key, job_func, report_manager)
+        run_update_job(job_key, job_func, report_manager, local_store, query_engine)
         time.sleep(1)
 
+    # 단계별 소요 시간·처리량을 reports/hourly_update_instrumentation.json에 저장
+    instrumentation_file = report_manager.save_instrumentation("hourly_update")
+    print(f"\n⏱️ 단계별 소요 시간 ({instrumentation_file}):\n{instrumentation.format_summary()}")
+
     # --- 알림 로직 수정 ---
     # 1. 모든 작업 결과 수집
     print("\n--- [시작] 리포트 생성 및 전송 ---")
@@ -1,14 +1,7 @@
-"""lawdigest package initialization."""
+"""lawdigest package initialization.
 
-from .data_operations import (
-    DatabaseManager,
-    DataFetcher,
-    DataProcessor,
-    AISummarizer,
-    APISender,
-    WorkFlowManager,
-)
-from .data_operations import Notifier
+클래스는 src.data_operations에서 처음 접근할 때 import 됩니다(PEP 562).
+"""
 
 __all__ = [
     "DatabaseManager",
@@ -19,3 +12,16 @@ __all__ = [
     "WorkFlowManager",
     "Notifier",
 ]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import data_operations
+    value = getattr(data_operations, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
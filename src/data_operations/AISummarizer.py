@@ -1,10 +1,41 @@
 import pandas as pd
-from IPython.display import clear_output
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import SystemMessage, HumanMessage
 import os
+import sys
 from dotenv import load_dotenv
 
+from .Instrumentation import count, span
+
+
+def clear_output():
+    """노트북에서 실행 중일 때만 셀 출력을 지웁니다. IPython이 로드되지 않은 환경(크론 작업 등)에서는 아무 일도 하지 않습니다."""
+    ipython_display = sys.modules.get("IPython.display")
+    if ipython_display is not None:
+        ipython_display.clear_output()
+
+
+def _is_blank(value):
+    """결측값(None, NaN, pd.NA)이나 빈 문자열인지 확인합니다. str(pd.NA)는 '<NA>'이므로 프롬프트에 넣기 전에 거릅니다."""
+    return (not isinstance(value, (list, tuple)) and pd.isna(value)) or not str(value).strip()
+
+
+def _load_chat_model():
+    # langchain은 import 비용이 크므로 실제로 요약을 수행할 때만 로드합니다.
+    from langchain_community.chat_models import ChatOpenAI
+    from langchain.schema import SystemMessage, HumanMessage
+    return ChatOpenAI, SystemMessage, HumanMessage
+
+
+def _invoke(llm, messages, stage):
+    """LLM을 호출해 응답 텍스트를 반환하고, 소요 시간과 응답 크기, 토큰 사용량을 계측에 기록합니다."""
+    with span(stage, rows=1) as timing:
+        response = llm.invoke(messages)
+        timing.add(bytes=len(str(response.content).encode('utf-8')))
+    usage = (getattr(response, 'response_metadata', None) or {}).get('token_usage') or {}
+    for key in ('prompt_tokens', 'completion_tokens', 'total_tokens'):
+        if usage.get(key):
+            count(f"{stage}.{key}", usage[key])
+    return response.content
+
 class AISummarizer:
 
     def __init__(self):
@@ -39,6 +70,7 @@ class AISummarizer:
         if model is None:
             model = os.environ.get("TITLE_SUMMARIZATION_MODEL")
 
+        ChatOpenAI, SystemMessage, HumanMessage = _load_chat_model()
         llm = ChatOpenAI(model=model, openai_api_key=self.api_key, temperature=1)
         
         print("\n[AI 제목 요약 진행 중...]")
@@ -59,6 +91,9 @@ class AISummarizer:
                 # clear_output()
                 continue  
                 # 이미 'SUMMARY', 'GPT_SUMMARY' 컬럼에 내용이 있으면 건너뜁니다
+            if _is_blank(content):
+                print(f"{title}의 원문 요약(summary)이 없어 제목 요약을 건너뜁니다.")
+                continue
 
             task = f"\n위 내용의 핵심을 한 문장으로 요약한 제목을 작성할 것. 제목은 반드시 {title}으로 끝나야 함."
             print(f"task: {task}")
@@ -69,7 +104,7 @@ class AISummarizer:
                 HumanMessage(content=str(content) + str(task))
             ]
 
-            chat_response = llm.invoke(messages).content
+            chat_response = _invoke(llm, messages, "llm.title")
 
             print(f"chatGPT: {chat_response}")
 
@@ -97,6 +132,7 @@ class AISummarizer:
         if model is None:
             model = os.environ.get("CONTENT_SUMMARIZATION_MODEL")
 
+        ChatOpenAI, SystemMessage, HumanMessage = _load_chat_model()
         llm = ChatOpenAI(model=model, openai_api_key=self.api_key, temperature=1)
 
         print("\n[AI 내용 요약 진행 중...]")
@@ -119,6 +155,10 @@ class AISummarizer:
             proposer_kind = row['proposerKind'] # '의원', '위원장', '정부'
             
             print('-'*10)
+
+            if _is_blank(content):
+                print(f"{title}의 원문 요약(summary)이 없어 내용 요약을 건너뜁니다.")
+                continue
             
             # 1. 'proposerKind' 값을 키로 사용해 prompt_dict에서 직접 템플릿 가져오기
             #    .get()을 사용하여 해당 키가 없는 경우에도 오류 없이 안전하게 처리합니다.
@@ -141,7 +181,7 @@ class AISummarizer:
             ]
 
             try:
-                chat_response = llm.invoke(messages).content
+                chat_response = _invoke(llm, messages, "llm.content")
                 print(f"chatGPT: {chat_response}")
                 
                 df_bills.loc[index, 'gptSummary'] = chat_response
@@ -1,6 +1,9 @@
 import requests
 import pandas as pd
 
+from .DataSchema import to_records
+from .Instrumentation import span
+
 class APISender:
     def __init__(self):
         self.post_url = None
@@ -13,7 +16,8 @@ class APISender:
             return None
         
         try:
-            response = requests.post(url)
+            with span("send.request_post"):
+                response = requests.post(url)
 
             # 응답 확인
             if response.status_code == 200:
@@ -42,8 +46,8 @@ class APISender:
         - response: requests.Response, API 서버로부터 받은 응답 객체
         """
         if isinstance(data, pd.DataFrame):
-            # DataFrame을 JSON 형식으로 변환
-            data = data.to_dict(orient='records')
+            # DataFrame을 JSON 형식으로 변환 (날짜는 'YYYY-MM-DD' 문자열, 결측값은 None)
+            data = to_records(data)
         
         # payload 생성
         payload = {payload_name: data}
@@ -55,7 +59,9 @@ class APISender:
 
         # POST 요청 보내기
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            with span(f"send.{payload_name}", rows=len(data) if isinstance(data, list) else 0) as timing:
+                response = requests.post(url, headers=headers, json=payload)
+                timing.add(bytes=len(response.request.body or b''))
 
             # 응답 확인
             if response.status_code == 200:
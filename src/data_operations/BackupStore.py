@@ -0,0 +1,262 @@
+"""중복 제거·압축 데이터베이스 백업 저장소
+
+jobs/database_backup.py의 증분 백업 모드가 사용하는 저장소입니다. mysqldump 출력을 임시 파일 없이
+스트림으로 읽어 청크로 나누고, 청크마다 내용 해시(sha256)를 키로 압축(zstd 또는 gzip)해 한 번만 저장합니다.
+바뀌지 않은 테이블(또는 테이블의 바뀌지 않은 구간)은 이전 백업의 청크를 그대로 참조하므로,
+매번 전체 덤프를 새로 쓰던 방식보다 저장 공간과 쓰기량이 크게 줄어듭니다.
+
+    <backup_dir>/catalog.json                 백업 목록(테이블별 청크 해시 순서)과 청크별 크기
+    <backup_dir>/chunks/ab/abcdef....zst      압축된 청크
+
+청크 경계는 줄(INSERT 문) 내용으로 정합니다(content-defined chunking). 최소 크기를 넘긴 뒤
+crc32가 조건을 만족하는 줄에서 자르므로, 중간에 행이 추가되거나 바뀌어도 그 주변 청크만 새로 저장됩니다.
+보관 기간(용량) 관리는 디렉토리를 다시 훑지 않고 catalog.json의 크기 정보만으로 계산합니다.
+
+사용 예시:
+
+    store = BackupStore(backup_dir)
+    backup = store.begin_backup(database="lawdigest")
+    with subprocess.Popen(dump_command, stdout=subprocess.PIPE) as proc:
+        store.add_table(backup, "Bill", proc.stdout)
+    store.commit_backup(backup)
+    store.enforce_retention(max_bytes=3 * 1024 ** 3)
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+import zlib
+
+from .PackedStore import SEGMENT_SUFFIXES, compress, compression_for, decompress, default_compression
+
+DEFAULT_MIN_CHUNK_SIZE = 1024 * 1024  # 1MB
+DEFAULT_MAX_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB
+# 최소 크기를 넘긴 뒤 crc32(줄) % BOUNDARY_MODULUS == 0인 줄에서 청크를 자릅니다.
+BOUNDARY_MODULUS = 64
+
+
+def split_dump_chunks(stream, min_size=DEFAULT_MIN_CHUNK_SIZE, max_size=DEFAULT_MAX_CHUNK_SIZE):
+    """
+    덤프 스트림(바이너리)을 줄 단위로 읽어 내용 기반 경계로 나눈 청크를 순서대로 반환합니다.
+
+    Yields:
+        bytes: 청크. 모든 청크를 이어 붙이면 원래 스트림과 같습니다.
+    """
+    buffer = []
+    size = 0
+    for line in stream:
+        buffer.append(line)
+        size += len(line)
+        if size >= max_size or (size >= min_size and zlib.crc32(line) % BOUNDARY_MODULUS == 0):
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class BackupStore:
+    CATALOG_NAME = "catalog.json"
+
+    def __init__(self, directory, compression=None, min_chunk_size=DEFAULT_MIN_CHUNK_SIZE,
+                 max_chunk_size=DEFAULT_MAX_CHUNK_SIZE):
+        """
+        Args:
+            directory (str): 백업 저장 디렉토리
+            compression (str, optional): 'zstd' 또는 'gzip'. 기본값은 default_compression()
+            min_chunk_size, max_chunk_size (int): 청크 크기 범위(바이트)
+        """
+        self.directory = directory
+        self.compression = compression or default_compression()
+        if self.compression not in ("zstd", "gzip"):
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {self.compression}")
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.catalog_path = os.path.join(directory, self.CATALOG_NAME)
+        os.makedirs(os.path.join(directory, "chunks"), exist_ok=True)
+        self._lock = threading.Lock()
+        self.catalog = self._load_catalog()
+
+    def _load_catalog(self):
+        if not os.path.exists(self.catalog_path):
+            return {"backups": [], "chunks": {}}
+        with open(self.catalog_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_catalog(self):
+        tmp_path = self.catalog_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.catalog, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.catalog_path)
+
+    def _chunk_path(self, digest, compression):
+        return os.path.join(self.directory, "chunks", digest[:2], digest + SEGMENT_SUFFIXES[compression])
+
+    def put_chunk(self, data: bytes):
+        """
+        청크를 저장하고 (해시, 새로 저장했는지 여부, 저장된 크기)를 반환합니다. 이미 있는 청크는 다시 쓰지 않습니다.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            entry = self.catalog["chunks"].get(digest)
+        if entry is not None:
+            return digest, False, entry["size"]
+
+        payload = compress(data, self.compression)
+        path = self._chunk_path(digest, self.compression)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 병렬 백업에서는 여러 프로세스가 같은 청크를 동시에 쓸 수 있어 임시 파일 이름을 나눕니다.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.catalog["chunks"][digest] = {
+                "size": len(payload), "raw": len(data), "file": os.path.relpath(path, self.directory),
+            }
+        return digest, True, len(payload)
+
+    def read_chunk(self, digest: str, check: bool = False) -> bytes:
+        """청크의 압축을 풀어 반환합니다. check=True이면 내용 해시가 digest와 같은지 확인합니다."""
+        entry = self.catalog["chunks"][digest]
+        with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+            data = decompress(f.read(), compression_for(entry["file"]))
+        if check and hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"청크 내용이 해시와 다릅니다: {entry['file']}")
+        return data
+
+    def chunk_entries(self, digests) -> dict:
+        """청크 해시별 catalog 항목을 반환합니다. 작업 프로세스가 새로 쓴 청크를 부모에게 넘길 때 사용합니다."""
+        with self._lock:
+            return {digest: self.catalog["chunks"][digest] for digest in digests}
+
+    def begin_backup(self, database: str, **metadata) -> dict:
+        """새 백업 항목을 만듭니다. commit_backup을 호출하기 전까지는 catalog에 기록되지 않습니다."""
+        now = datetime.datetime.now()
+        return {
+            "id": now.strftime("%Y%m%d%H%M%S"),
+            "created_at": now.isoformat(timespec="seconds"),
+            "database": database,
+            "compression": self.compression,
+            "tables": {},
+            **metadata,
+        }
+
+    def add_table(self, backup: dict, table: str, stream) -> dict:
+        """
+        테이블 하나의 덤프 스트림을 청크로 나눠 저장하고 백업 항목에 기록합니다.
+
+        Returns:
+            dict: {'chunks', 'raw_bytes', 'new_chunks', 'new_bytes'}
+        """
+        entry = {"chunks": [], "raw_bytes": 0, "new_chunks": 0, "new_bytes": 0}
+        for chunk in split_dump_chunks(stream, self.min_chunk_size, self.max_chunk_size):
+            digest, is_new, stored = self.put_chunk(chunk)
+            entry["chunks"].append(digest)
+            entry["raw_bytes"] += len(chunk)
+            if is_new:
+                entry["new_chunks"] += 1
+                entry["new_bytes"] += stored
+        backup["tables"][table] = entry
+        return entry
+
+    def record_table(self, backup: dict, table: str, entry: dict, chunk_entries: dict) -> dict:
+        """
+        다른 프로세스의 BackupStore가 add_table로 저장한 테이블을 이 저장소의 백업 항목과 catalog에 합칩니다.
+
+        여러 작업 프로세스가 같은 청크를 각자 새로 저장했을 수 있으므로, 신규 청크 수와 크기는
+        이 저장소의 catalog를 기준으로 다시 계산합니다.
+        """
+        entry = dict(entry, new_chunks=0, new_bytes=0)
+        with self._lock:
+            for digest in dict.fromkeys(entry["chunks"]):
+                if digest not in self.catalog["chunks"]:
+                    self.catalog["chunks"][digest] = chunk_entries[digest]
+                    entry["new_chunks"] += 1
+                    entry["new_bytes"] += chunk_entries[digest]["size"]
+        backup["tables"][table] = entry
+        return entry
+
+    def commit_backup(self, backup: dict):
+        """백업 항목을 catalog에 기록합니다."""
+        with self._lock:
+            self.catalog["backups"].append(backup)
+            self._save_catalog()
+
+    def backups(self):
+        return list(self.catalog["backups"])
+
+    def get_backup(self, backup_id: str = None) -> dict:
+        """백업 항목을 반환합니다. backup_id가 없으면 가장 최근 백업"""
+        if not self.catalog["backups"]:
+            raise ValueError("저장된 백업이 없습니다.")
+        if backup_id is None:
+            return self.catalog["backups"][-1]
+        for backup in self.catalog["backups"]:
+            if backup["id"] == backup_id:
+                return backup
+        raise ValueError(f"백업을 찾을 수 없습니다: {backup_id}")
+
+    def iter_table(self, backup: dict, table: str, check: bool = False):
+        """테이블 덤프를 청크 단위로 압축을 풀어 순서대로 반환합니다."""
+        for digest in backup["tables"][table]["chunks"]:
+            yield self.read_chunk(digest, check=check)
+
+    def export(self, backup: dict, output) -> int:
+        """
+        백업을 mysql 클라이언트로 복원할 수 있는 하나의 .sql 스트림으로 씁니다.
+
+        Args:
+            output: 바이너리 쓰기 파일 객체
+
+        Returns:
+            int: 쓴 바이트 수
+        """
+        written = 0
+        for table in backup["tables"]:
+            for data in self.iter_table(backup, table):
+                output.write(data)
+                written += len(data)
+        return written
+
+    def total_size(self) -> int:
+        """저장된 청크의 전체 크기(바이트). catalog 정보만으로 계산합니다."""
+        return sum(entry["size"] for entry in self.catalog["chunks"].values())
+
+    def backup_size(self, backup: dict) -> dict:
+        """백업 하나의 원본 덤프 크기와, 그 백업에서 새로 저장한 청크 크기를 반환합니다."""
+        return {
+            "raw_bytes": sum(entry["raw_bytes"] for entry in backup["tables"].values()),
+            "new_bytes": sum(entry["new_bytes"] for entry in backup["tables"].values()),
+        }
+
+    def _referenced_chunks(self):
+        return {
+            digest
+            for backup in self.catalog["backups"]
+            for entry in backup["tables"].values()
+            for digest in entry["chunks"]
+        }
+
+    def enforce_retention(self, max_bytes: int, keep_min: int = 1):
+        """
+        전체 저장 크기가 max_bytes 이하가 될 때까지 가장 오래된 백업부터 삭제하고,
+        어떤 백업도 참조하지 않는 청크를 지웁니다. 최근 keep_min개 백업은 남깁니다.
+
+        Returns:
+            list[str]: 삭제한 백업 ID
+        """
+        removed = []
+        with self._lock:
+            chunks = self.catalog["chunks"]
+            while len(self.catalog["backups"]) > keep_min and self.total_size() > max_bytes:
+                removed.append(self.catalog["backups"].pop(0)["id"])
+                referenced = self._referenced_chunks()
+                for digest in [digest for digest in chunks if digest not in referenced]:
+                    path = os.path.join(self.directory, chunks.pop(digest)["file"])
+                    if os.path.exists(path):
+                        os.remove(path)
+            if removed:
+                self._save_catalog()
+        return removed
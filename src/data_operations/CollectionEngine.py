@@ -0,0 +1,472 @@
+"""비동기 수집 엔진
+
+DataFetcher(법안 파이프라인)와 etc/ 아래의 법령·판례 크롤러가 함께 사용하는
+공통 HTTP 수집 코어입니다. 세션 관리, 요청 속도 제한, 재시도, 매퍼(mapper_*) 기반
+페이지네이션, 수집 통계를 한 곳에서 처리하므로 처리량 튜닝도 이 모듈에서만 하면 됩니다.
+
+사용 예시:
+
+    async with CollectionEngine(max_concurrency=5) as engine:
+        rows = await engine.fetch_pages(url, params, mapper, format='xml')
+"""
+
+import asyncio
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+
+import aiohttp
+from tqdm import tqdm
+
+from .Instrumentation import span
+
+
+class RetryableResponseError(Exception):
+    """HTTP 상태는 정상이지만 응답 내용상 재시도가 필요한 경우 발생시키는 예외"""
+    pass
+
+
+class PageFetchError(Exception):
+    """재시도 후에도 일부 페이지를 받지 못해 수집 결과가 불완전할 때 발생시키는 예외"""
+
+    def __init__(self, url, pages):
+        self.url = url
+        self.pages = sorted(pages)
+        super().__init__(f"{len(self.pages)}개 페이지 수집 실패 (페이지 {self.pages}): {url}")
+
+
+def get_nested_value(data, path):
+    """dict/list가 중첩된 JSON 응답에서 path(키·인덱스 목록)를 따라 값을 꺼냅니다."""
+    current_level = data
+    for key in path:
+        if isinstance(current_level, dict):
+            current_level = current_level.get(key)
+        elif isinstance(current_level, list) and isinstance(key, int):
+            try:
+                current_level = current_level[key]
+            except IndexError:
+                return None
+        else:
+            return None
+        if current_level is None:
+            return None
+    return current_level
+
+
+def parse_response(response_content, format, mapper):
+    """
+    매퍼 정의에 따라 API 응답을 파싱합니다.
+
+    Args:
+        response_content (bytes): 응답 본문
+        format (str): 'xml' 또는 'json'
+        mapper (dict): data_path, total_count_path, result_code_path 등을 담은 매퍼
+
+    Returns:
+        tuple[list[dict], int]: (데이터 행 목록, 전체 데이터 개수). 실패 시 ([], 0)
+    """
+    data, total_count, result_code, result_msg = [], 0, None, "No message"
+    try:
+        if format == 'xml':
+            root = ElementTree.fromstring(response_content)
+            data = [{child.tag: child.text for child in item} for item in root.findall(mapper['data_path'])]
+            total_count_elem = root.find(mapper['total_count_path']) if mapper.get('total_count_path') else None
+            total_count = int(total_count_elem.text) if total_count_elem is not None else len(data)
+            result_code_elem = root.find(mapper['result_code_path'])
+            result_msg_elem = root.find(mapper['result_msg_path'])
+            result_code = result_code_elem.text if result_code_elem is not None else None
+            result_msg = result_msg_elem.text if result_msg_elem is not None else result_msg
+        elif format == 'json':
+            response_json = json.loads(response_content)
+            data = get_nested_value(response_json, mapper['data_path']) or []
+            total_count = int(get_nested_value(response_json, mapper['total_count_path']) or 0)
+            result_code = get_nested_value(response_json, mapper['result_code_path'])
+            result_msg = get_nested_value(response_json, mapper['result_msg_path'])
+
+        if result_code != mapper['success_code']:
+            # 데이터 없음 코드(예: INFO-200)는 정상 종료로 간주하고 조용히 넘어갑니다.
+            if result_code not in mapper.get('empty_codes', ()):
+                tqdm.write(f"   [API 응답 실패] 코드: {result_code}, 메시지: {result_msg}")
+            return [], 0
+        return data, total_count
+    except Exception as e:
+        tqdm.write(f"   ❌ 응답 파싱 중 오류 발생: {e}")
+        return [], 0
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 속도 제한기.
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓입니다. 요청마다 토큰 1개를 소비하며,
+    토큰이 없으면 다음 토큰이 채워질 때까지 대기합니다. 잠금(lock)으로 토큰 계산을 직렬화하므로
+    여러 코루틴이 같은 버킷을 공유해도 한도가 정확하게 지켜집니다.
+
+    Args:
+        rate (float): 초당 토큰 충전 속도
+        capacity (int): 한 번에 몰아서 보낼 수 있는 최대 요청 수 (버스트 크기)
+    """
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate는 0보다 크고 capacity는 1 이상이어야 합니다.")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_limit(cls, max_calls: int, per_seconds: float):
+        """'per_seconds초 동안 최대 max_calls회' 형식의 제한으로 버킷을 만듭니다."""
+        return cls(rate=max_calls / per_seconds, capacity=max_calls)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        """
+        토큰 1개를 얻을 때까지 대기합니다.
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        # 대기 중에도 잠금을 유지해 도착 순서대로 토큰을 받도록 합니다.
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                waited = (1 - self.tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self.tokens -= 1
+        return waited
+
+
+class CollectionMetrics:
+    """수집 엔진의 요청 수, 재시도, 실패, 전송량 등을 집계하는 클래스"""
+
+    def __init__(self):
+        self.requests = 0  # 실제로 전송한 HTTP 요청 수 (재시도 포함)
+        self.successes = 0
+        self.failures = 0  # 재시도를 모두 소진하고 최종 실패한 요청 수
+        self.retries = 0
+        self.bytes_received = 0
+        self.rows = 0  # 파싱된 데이터 행 수
+        self.latency_total = 0.0  # 성공한 요청들의 응답 시간 합계 (초)
+        self.throttle_wait = 0.0  # 속도 제한으로 대기한 시간 합계 (초)
+        self.started_at = time.monotonic()
+
+    def summary(self):
+        """집계 결과를 dict로 반환합니다."""
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "bytes_received": self.bytes_received,
+            "rows": self.rows,
+            "elapsed_sec": round(elapsed, 3),
+            "throttle_wait_sec": round(self.throttle_wait, 3),
+            "avg_latency_sec": round(self.latency_total / self.successes, 3) if self.successes else 0.0,
+            "requests_per_sec": round(self.requests / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+
+    def __str__(self):
+        s = self.summary()
+        return (
+            f"요청 {s['requests']}회 (성공 {s['successes']}, 실패 {s['failures']}, 재시도 {s['retries']}) | "
+            f"{s['rows']}행 | {s['bytes_received'] / 1024:.1f}KB | "
+            f"평균 응답 {s['avg_latency_sec']}초 | {s['requests_per_sec']} req/s"
+        )
+
+
+class CollectionEngine:
+    """
+    aiohttp 기반 공통 수집 엔진.
+
+    Args:
+        max_concurrency (int): 동시에 진행할 수 있는 최대 요청 수.
+        rate_limit (tuple[int, float], optional): (max_calls, per_seconds). 지정하면 호스트별 토큰 버킷으로
+            요청 속도를 제한합니다. 같은 엔진을 쓰는 모든 코루틴이 호스트별 버킷 하나를 공유합니다.
+        max_retries (int): 요청 실패 시 최대 시도 횟수.
+        timeout (float): 요청당 전체 타임아웃 (초).
+        request_delay (float): 각 요청 전 대기 시간 (초).
+        backoff_base (float): 재시도 대기 시간의 기본값. attempt번째 재시도는 backoff_base * 2**attempt 초 대기합니다.
+        headers (dict, optional): 세션 기본 헤더.
+        response_validator (callable, optional): 응답 본문(bytes)을 받아 재시도가 필요하면
+            RetryableResponseError를 발생시키는 함수. (예: IP 차단 페이지 감지)
+        metrics (CollectionMetrics, optional): 여러 엔진 인스턴스가 통계를 공유할 때 전달합니다.
+    """
+
+    def __init__(self, max_concurrency=5, rate_limit=None, max_retries=3, timeout=30,
+                 request_delay=0.0, backoff_base=1.0, headers=None,
+                 response_validator=None, metrics=None):
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.request_delay = request_delay
+        self.backoff_base = backoff_base
+        self.headers = headers or {}
+        self.response_validator = response_validator
+        self.metrics = metrics or CollectionMetrics()
+
+        self.session = None
+        self.semaphore = None
+        self.limiters = {}  # 호스트 -> TokenBucket
+
+    async def __aenter__(self):
+        # 세마포어와 버킷의 잠금은 실행 중인 이벤트 루프에 묶이므로 세션과 함께 생성합니다.
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.limiters = {}
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _limiter_for(self, url):
+        """URL의 호스트에 해당하는 토큰 버킷을 반환합니다. 속도 제한이 없으면 None."""
+        if not self.rate_limit:
+            return None
+        host = urlsplit(str(url)).netloc
+        limiter = self.limiters.get(host)
+        if limiter is None:
+            limiter = self.limiters[host] = TokenBucket.from_limit(*self.rate_limit)
+        return limiter
+
+    async def _send(self, method, url, params, data, headers, allow_redirects):
+        """호스트별 토큰 버킷을 거쳐 한 번의 HTTP 요청을 보냅니다. 재시도도 토큰을 소비합니다."""
+        limiter = self._limiter_for(url)
+        if limiter is not None:
+            self.metrics.throttle_wait += await limiter.acquire()
+        return await self._send_once(method, url, params, data, headers, allow_redirects)
+
+    async def _send_once(self, method, url, params, data, headers, allow_redirects):
+        self.metrics.requests += 1
+        started = time.monotonic()
+        with span("http.request") as timing:
+            async with self.session.request(
+                method, url, params=params, data=data, headers=headers,
+                allow_redirects=allow_redirects,
+            ) as response:
+                response.raise_for_status()  # 200번대 응답이 아니면 예외 발생
+                content = await response.read()
+                timing.add(bytes=len(content))
+                if self.response_validator is not None:
+                    self.response_validator(content)
+                self.metrics.latency_total += time.monotonic() - started
+                self.metrics.bytes_received += len(content)
+                return content, response.url
+
+    async def request(self, method, url, params=None, data=None, headers=None, allow_redirects=True):
+        """
+        동시성 제한, 속도 제한, 재시도(지수 백오프)가 적용된 HTTP 요청을 보냅니다.
+
+        Returns:
+            tuple[bytes | None, yarl.URL | None]: (응답 본문, 최종 URL). 최종 실패 시 (None, None)
+        """
+        if self.session is None:
+            raise RuntimeError("CollectionEngine은 'async with' 블록 안에서 사용해야 합니다.")
+
+        last_exception = None
+        async with self.semaphore:
+            if self.request_delay:
+                await asyncio.sleep(self.request_delay)
+
+            for attempt in range(self.max_retries):
+                try:
+                    result = await self._send(method, url, params, data, headers, allow_redirects)
+                    self.metrics.successes += 1
+                    return result
+                except (aiohttp.ClientError, asyncio.TimeoutError, RetryableResponseError) as e:
+                    last_exception = e
+                    tqdm.write(f"⚠️ 요청 실패 (시도 {attempt + 1}/{self.max_retries}): {url}, 오류: {e}")
+                    if attempt < self.max_retries - 1:
+                        self.metrics.retries += 1
+                        await asyncio.sleep(self.backoff_base * 2 ** attempt)
+
+        self.metrics.failures += 1
+        tqdm.write(f"❌ 최대 재시도({self.max_retries}회) 후 요청 최종 실패. URL: {url}, 오류: {last_exception}")
+        return None, None
+
+    async def fetch_page(self, url, params, mapper, format='xml'):
+        """한 페이지를 요청하고 매퍼로 파싱합니다. 요청 실패 시 ([], 0, False)를 반환합니다."""
+        content, _ = await self.request('GET', url, params=params)
+        if content is None:
+            return [], 0, False
+        with span(f"parse.{format}", bytes=len(content)) as timing:
+            data, total_count = parse_response(content, format, mapper)
+            timing.add(rows=len(data))
+        self.metrics.rows += len(data)
+        return data, total_count, True
+
+    async def fetch_pages(self, url, params, mapper, format='xml', all_pages=True, pbar=None):
+        """
+        매퍼에 정의된 페이지 파라미터를 사용해 모든 페이지를 수집합니다.
+
+        페이지네이션 전략은 매퍼로 결정됩니다.
+        - total_count_path가 있으면 첫 페이지의 전체 개수로 남은 페이지 수를 계산해 동시에 요청합니다.
+        - 없으면 빈 페이지가 나올 때까지 순차적으로 요청합니다.
+
+        Args:
+            url (str): 요청 URL
+            params (dict): 첫 페이지 요청 파라미터. 페이지 번호는 mapper['page_param']에 들어 있어야 합니다.
+            mapper (dict): 응답 매퍼
+            format (str): 'xml' 또는 'json'
+            all_pages (bool): False면 첫 페이지만 수집합니다.
+            pbar (tqdm, optional): 수집 행 수를 반영할 진행률 바
+
+        Returns:
+            list[dict]: 페이지 순서대로 이어붙인 데이터 행 목록
+
+        Raises:
+            PageFetchError: 재시도 후에도 받지 못한 페이지가 있으면, 일부만 수집한 결과를 반환하지 않고
+                실패한 페이지 번호와 함께 발생시킵니다.
+        """
+        page_param = mapper.get('page_param')
+        if all_pages and not page_param:
+            raise ValueError("'all_pages=True'일 경우, 매퍼에 'page_param'이 정의되어야 합니다.")
+
+        first_data, total_count, ok = await self.fetch_page(url, params, mapper, format)
+        if not ok:
+            # 첫 페이지 실패를 '데이터 없음'과 구분합니다.
+            raise PageFetchError(url, [params.get(page_param, 1)])
+        all_data = list(first_data)
+        if pbar is not None:
+            pbar.update(len(first_data))
+
+        if not all_pages or not first_data:
+            return all_data
+
+        first_page = int(params[page_param])
+        page_size = int(params.get(mapper.get('size_param'), 0) or len(first_data))
+
+        if mapper.get('total_count_path') and total_count:
+            # 전체 개수를 알고 있으므로 남은 페이지를 한 번에 동시 요청합니다.
+            total_pages = (total_count + page_size - 1) // page_size
+            pages = range(first_page + 1, first_page + total_pages)
+
+            async def fetch(page):
+                data, _, ok = await self.fetch_page(url, {**params, page_param: page}, mapper, format)
+                if pbar is not None:
+                    pbar.update(len(data))
+                return data, ok
+
+            failed_pages = []
+            for page, (data, ok) in zip(pages, await asyncio.gather(*(fetch(page) for page in pages))):
+                if not ok:
+                    failed_pages.append(page)
+                all_data.extend(data)
+            if failed_pages:
+                raise PageFetchError(url, failed_pages)
+        else:
+            # 전체 개수를 모르면 빈 페이지가 나올 때까지 순차 요청합니다.
+            page = first_page
+            while len(first_data) >= page_size:
+                page += 1
+                first_data, _, ok = await self.fetch_page(url, {**params, page_param: page}, mapper, format)
+                if not ok:
+                    raise PageFetchError(url, [page])
+                if not first_data:
+                    break
+                all_data.extend(first_data)
+                if pbar is not None:
+                    pbar.update(len(first_data))
+
+        return all_data
+
+    async def fetch_many(self, url, params_list, mapper, format='xml', all_pages=True, desc=None):
+        """
+        여러 요청 파라미터 세트(예: 날짜별, 법안 ID별)를 동시에 수집합니다.
+
+        Returns:
+            list[list[dict]]: params_list와 같은 순서의 결과 목록
+
+        Raises:
+            PageFetchError: 어느 한 요청이라도 페이지를 끝내 받지 못한 경우
+        """
+        with tqdm(total=len(params_list), desc=desc or "📥 데이터 수집 중", unit="건") as pbar:
+            async def fetch(params):
+                data = await self.fetch_pages(url, params, mapper, format, all_pages)
+                pbar.update(1)
+                return data
+
+            return await asyncio.gather(*(fetch(params) for params in params_list))
+
+
+async def run_worker_pool(items, handler, num_workers, queue_size=None):
+    """
+    고정된 수(num_workers)의 워커가 크기 제한 큐에서 항목을 꺼내 handler(item)를 실행합니다.
+
+    항목마다 코루틴을 미리 만들지 않고 items를 큐 크기만큼만 앞서 읽으므로, 처리 대상이 아무리 많아도
+    메모리 사용량이 일정합니다. 결과는 handler 안에서 바로 기록(예: JSONL)하는 것을 전제로 하며
+    이 함수는 결과를 모으지 않습니다.
+
+    Args:
+        items (iterable): 처리할 항목. 제너레이터도 가능합니다.
+        handler (callable): 항목 하나를 처리하는 코루틴 함수
+        num_workers (int): 워커 수
+        queue_size (int, optional): 큐 최대 크기. 기본값은 num_workers의 2배.
+    """
+    queue = asyncio.Queue(maxsize=queue_size or num_workers * 2)
+    stop = object()
+
+    async def worker():
+        while True:
+            item = await queue.get()
+            if item is stop:
+                return
+            try:
+                await handler(item)
+            except Exception as e:
+                # 워커 하나가 죽으면 큐가 막히므로 오류는 기록만 하고 다음 항목을 처리합니다.
+                tqdm.write(f"❌ 작업 처리 중 예외 발생: {e}")
+
+    workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+    try:
+        for item in items:
+            await queue.put(item)
+        for _ in workers:
+            await queue.put(stop)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+def run_sync(coro):
+    """
+    동기 코드에서 코루틴을 실행합니다.
+
+    Jupyter처럼 이미 이벤트 루프가 실행 중인 환경에서는 별도 스레드의 새 루프에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:  # 호출 스레드에서 다시 발생시키기 위해 보관
+            result['error'] = e
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
@@ -0,0 +1,276 @@
+"""크롤러 출력 디렉토리별 수집 현황 인덱스
+
+법령·판례 크롤러는 항목마다 `<ID>_<이름>.txt` 파일을 만들고, 수집 성공 건을 기간별 JSONL에 한 줄씩
+추가합니다. 이 모듈은 출력 디렉토리마다 SQLite 파일(manifest.sqlite3) 하나를 두고 항목별
+(ID, 본문 해시, 상태, JSONL 파일 이름, 바이트 오프셋, 길이)를 기록합니다.
+
+- 중복 수집 여부는 파일마다 os.path.exists를 호출하는 대신 completed_ids() 집합 조회 한 번으로 판단합니다.
+- 통합 결과는 작은 텍스트 파일 수천 개를 다시 읽지 않고 JSONL(또는 PackedStore 세그먼트)의
+  오프셋을 따라 바로 읽어옵니다.
+- 중단된 수집을 이어서 할 수 있도록 체크포인트(목록 조회를 마친 페이지, 처리 중(IN_FLIGHT)인 항목)를
+  함께 기록합니다. 재시작하면 이미 조회한 페이지는 다시 요청하지 않고, 처리 중이던 항목부터 다시 수집합니다.
+
+사용 예시:
+
+    with CrawlManifest(output_dir) as manifest:
+        done = manifest.completed_ids()
+        ...
+        manifest.record(law_id, 'SUCCESS', content_hash=content_hash(text),
+                        file='collected.jsonl', offset=offset, length=len(line))
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from .PackedStore import load_record
+
+
+def content_hash(text):
+    """본문 문자열의 sha256 해시(16진수)를 반환합니다."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CrawlManifest:
+    """
+    출력 디렉토리 하나의 수집 현황을 SQLite로 관리하는 클래스.
+
+    Args:
+        output_dir (str): 크롤러 출력 디렉토리. 이 안에 manifest.sqlite3가 생성됩니다.
+        commit_every (int): 몇 건마다 커밋할지. 남은 변경 사항은 close() 시 커밋됩니다.
+    """
+
+    FILENAME = "manifest.sqlite3"
+    SUCCESS = 'SUCCESS'
+    IN_FLIGHT = 'IN_FLIGHT'
+
+    def __init__(self, output_dir, commit_every=100):
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.commit_every = commit_every
+        self._pending = 0
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                item_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                content_hash TEXT,
+                file TEXT,
+                offset INTEGER,
+                length INTEGER,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS listing (page INTEGER PRIMARY KEY, rows TEXT NOT NULL)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def completed_ids(self):
+        """수집에 성공한 항목 ID 집합을 반환합니다."""
+        rows = self.conn.execute("SELECT item_id FROM items WHERE status = ?", (self.SUCCESS,))
+        return {row[0] for row in rows}
+
+    def record(self, item_id, status, content_hash=None, file=None, offset=None, length=None):
+        """
+        항목의 수집 결과를 기록합니다. 같은 ID가 있으면 덮어씁니다.
+
+        Args:
+            item_id: 항목 ID (문자열로 저장됩니다)
+            status (str): 'SUCCESS', 'DOWNLOAD_FAIL' 등 크롤러의 상태 코드
+            content_hash (str, optional): 본문 해시 (content_hash 함수 참고)
+            file (str, optional): 레코드가 들어 있는 JSONL 또는 PackedStore 세그먼트 파일 이름
+                (output_dir 기준 상대 경로)
+            offset (int, optional): 파일 안에서 레코드가 시작하는 바이트 위치
+            length (int, optional): 레코드의 바이트 길이 (JSONL은 줄바꿈 포함, 세그먼트는 압축 후 길이)
+        """
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO items (item_id, status, content_hash, file, offset, length, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (str(item_id), status, content_hash, file, offset, length, datetime.now().isoformat()),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.conn.commit()
+            self._pending = 0
+
+    def in_flight_ids(self):
+        """처리를 시작했지만 결과가 기록되지 않은(이전 실행이 중단된) 항목 ID 집합을 반환합니다."""
+        rows = self.conn.execute("SELECT item_id FROM items WHERE status = ?", (self.IN_FLIGHT,))
+        return {row[0] for row in rows}
+
+    def mark_in_flight(self, item_id):
+        """항목 처리를 시작했음을 기록합니다. 결과가 나오면 record()로 덮어씁니다."""
+        self.record(item_id, self.IN_FLIGHT)
+
+    # --- 체크포인트 (목록 조회) ---
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+        self.commit()
+
+    def start_listing(self, params):
+        """
+        목록 조회 체크포인트를 시작합니다.
+
+        같은 조회 조건(params)으로 저장된 페이지가 있으면 그대로 두고, 조건이 바뀌었으면 초기화합니다.
+
+        Returns:
+            dict[int, list[dict]]: 이미 조회를 마친 페이지 번호 -> 행 목록
+        """
+        signature = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        if self.get_meta('listing_params') != signature:
+            self.conn.execute("DELETE FROM listing")
+            self.conn.execute("DELETE FROM meta WHERE key IN ('listing_total', 'listing_last_page')")
+            self.set_meta('listing_params', signature)
+        return self.listed_pages()
+
+    def save_listing_page(self, page, rows):
+        """조회를 마친 목록 페이지를 저장하고 바로 커밋합니다."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO listing (page, rows) VALUES (?, ?)",
+            (page, json.dumps(rows, ensure_ascii=False, default=str)),
+        )
+        last_page = max(page, self.get_meta('listing_last_page', 0))
+        self.set_meta('listing_last_page', last_page)
+
+    def listed_pages(self):
+        return {page: json.loads(rows) for page, rows in self.conn.execute("SELECT page, rows FROM listing")}
+
+    def clear_listing(self):
+        """수집이 모두 끝났을 때 목록 체크포인트를 지워 다음 실행에서 새로 조회하도록 합니다."""
+        self.conn.execute("DELETE FROM listing")
+        self.conn.execute("DELETE FROM meta WHERE key IN ('listing_params', 'listing_total', 'listing_last_page')")
+        self.commit()
+
+    def truncate_unindexed(self, file):
+        """
+        매니페스트에 기록되지 않은 파일 끝부분(중단으로 인해 반쯤 쓰였거나 커밋되지 않은 레코드)을 잘라냅니다.
+
+        잘린 레코드의 항목은 SUCCESS로 커밋되지 않았으므로 다음 수집에서 다시 기록됩니다.
+        매니페스트에 위치가 기록된 레코드가 하나도 없는 파일(매니페스트 도입 이전 파일 등)은 건드리지 않습니다.
+
+        Returns:
+            int: 잘라낸 바이트 수
+        """
+        path = os.path.join(self.output_dir, file)
+        if not os.path.exists(path):
+            return 0
+        end = self.conn.execute(
+            "SELECT MAX(offset + length) FROM items WHERE file = ? AND status = ?", (file, self.SUCCESS)
+        ).fetchone()[0] or 0
+        size = os.path.getsize(path)
+        if end == 0 or size <= end:
+            return 0
+        with open(path, 'r+b') as f:
+            f.truncate(end)
+        return size - end
+
+    def seed_from_directory(self, suffixes=('.txt',)):
+        """
+        매니페스트가 없던 기존 출력 디렉토리를 한 번에 등록합니다.
+
+        디렉토리 목록을 한 번만 읽어 `<ID>_<이름><suffix>` 파일이 모든 suffix에 대해 존재하는 ID를
+        성공으로 기록합니다. 이 항목들은 JSONL 오프셋이 없으므로 read_record로는 읽을 수 없습니다.
+
+        Returns:
+            int: 새로 등록된 항목 수
+        """
+        ids_by_suffix = {suffix: set() for suffix in suffixes}
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                for suffix in suffixes:
+                    if entry.name.endswith(suffix) and '_' in entry.name:
+                        ids_by_suffix[suffix].add(entry.name.split('_', 1)[0])
+
+        existing_ids = set.intersection(*ids_by_suffix.values()) if ids_by_suffix else set()
+        new_ids = existing_ids - self.completed_ids()
+        for item_id in new_ids:
+            self.record(item_id, self.SUCCESS)
+        self.conn.commit()
+        return len(new_ids)
+
+    def read_record(self, item_id):
+        """
+        항목의 레코드를 오프셋으로 바로 읽어 dict로 반환합니다. 오프셋 정보가 없으면 None.
+        PackedStore 세그먼트에 기록된 레코드는 압축을 풀어 반환합니다.
+        """
+        row = self.conn.execute(
+            "SELECT file, offset, length FROM items WHERE item_id = ?", (str(item_id),)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        file, offset, length = row
+        with open(os.path.join(self.output_dir, file), 'rb') as f:
+            f.seek(offset)
+            return load_record(file, f.read(length))
+
+    def iter_records(self, item_ids=None):
+        """
+        성공한 항목의 레코드(JSONL 또는 PackedStore 세그먼트)를 순서대로 읽어옵니다.
+
+        Args:
+            item_ids (iterable, optional): 읽을 ID 순서. 지정하지 않으면 파일·오프셋 순서로 모두 읽습니다.
+                오프셋 정보가 없는 ID는 건너뜁니다.
+
+        Yields:
+            dict: 레코드
+        """
+        if item_ids is None:
+            rows = self.conn.execute(
+                "SELECT file, offset, length FROM items "
+                "WHERE status = ? AND file IS NOT NULL ORDER BY file, offset",
+                (self.SUCCESS,),
+            ).fetchall()
+        else:
+            locations = {
+                item_id: (file, offset, length)
+                for item_id, file, offset, length in self.conn.execute(
+                    "SELECT item_id, file, offset, length FROM items "
+                    "WHERE status = ? AND file IS NOT NULL",
+                    (self.SUCCESS,),
+                )
+            }
+            rows = [locations[str(i)] for i in item_ids if str(i) in locations]
+
+        handles = {}
+        try:
+            for file, offset, length in rows:
+                f = handles.get(file)
+                if f is None:
+                    f = handles[file] = open(os.path.join(self.output_dir, file), 'rb')
+                f.seek(offset)
+                yield load_record(file, f.read(length))
+        finally:
+            for f in handles.values():
+                f.close()
@@ -1,14 +1,15 @@
-import requests
 import pandas as pd
 from xml.etree import ElementTree
-import time
 from datetime import datetime, timedelta
-from IPython.display import clear_output
 import os
 from dotenv import load_dotenv
 from tqdm import tqdm
 
-import json
+import asyncio
+
+from .CollectionEngine import CollectionEngine, CollectionMetrics, get_nested_value, parse_response, run_sync
+from .DataSchema import apply_schema
+from .Instrumentation import span
 
 class DataFetcher:
     def __init__(self, params, subject=None, url=None, filter_data=True):
@@ -31,6 +32,7 @@ class DataFetcher:
             "result_code_path": ["ALLBILL", 0, "head", 1, "RESULT", "CODE"],
             "result_msg_path": ["ALLBILL", 0, "head", 1, "RESULT", "MESSAGE"],
             "success_code": "INFO-000",
+            "empty_codes": ("INFO-200",),
         }
 
         # 열린국회정보(xml) 매퍼
@@ -42,6 +44,7 @@ class DataFetcher:
             "result_code_path": ".//RESULT/CODE",
             "result_msg_path": ".//RESULT/MESSAGE",
             "success_code": "INFO-000",
+            "empty_codes": ("INFO-200",),
         }
 
         # 공공데이터포털(xml) 매퍼
@@ -57,6 +60,15 @@ class DataFetcher:
 
         load_dotenv()
 
+        # 공통 비동기 수집 엔진 설정 (처리량 튜닝은 여기와 CollectionEngine에서만 합니다)
+        self.engine_options = {
+            "max_concurrency": int(os.environ.get("FETCH_MAX_CONCURRENCY", 5)),
+            "max_retries": 3,
+            "timeout": 30,
+        }
+        # 이 DataFetcher 인스턴스가 보낸 모든 요청의 통계
+        self.metrics = CollectionMetrics()
+
         self.content = self.fetch_data(self.subject)
 
     def fetch_data(self, subject):
@@ -87,107 +99,72 @@ class DataFetcher:
                 return None
 
     # ------------------------------------------------------------------
-    # Generic API helpers originally from etc/fetch_data_generic.py
+    # Generic API helpers (CollectionEngine 기반)
     # ------------------------------------------------------------------
 
     def _get_nested_value(self, data, path):
-        current_level = data
-        for key in path:
-            if isinstance(current_level, dict):
-                current_level = current_level.get(key)
-            elif isinstance(current_level, list) and isinstance(key, int):
-                try:
-                    current_level = current_level[key]
-                except IndexError:
-                    return None
-            else:
-                return None
-            if current_level is None:
-                return None
-        return current_level
+        return get_nested_value(data, path)
 
     def _parse_response(self, response_content, format, mapper):
-        data, total_count, result_code, result_msg = [], 0, None, "No message"
-        try:
-            if format == 'xml':
-                root = ElementTree.fromstring(response_content)
-                data = [{child.tag: child.text for child in item} for item in root.findall(mapper['data_path'])]
-                total_count = int(root.find(mapper['total_count_path']).text)
-                result_code = root.find(mapper['result_code_path']).text
-                result_msg = root.find(mapper['result_msg_path']).text
-            elif format == 'json':
-                response_json = json.loads(response_content)
-                data = self._get_nested_value(response_json, mapper['data_path']) or []
-                total_count = int(self._get_nested_value(response_json, mapper['total_count_path']))
-                result_code = self._get_nested_value(response_json, mapper['result_code_path'])
-                result_msg = self._get_nested_value(response_json, mapper['result_msg_path'])
-
-            if result_code != mapper['success_code']:
-                tqdm.write(f"   [API 응답 실패] 코드: {result_code}, 메시지: {result_msg}")
-                return [], 0
-            return data, total_count
-        except Exception as e:
-            tqdm.write(f"   ❌ 응답 파싱 중 오류 발생: {e}")
-            print(f"응답 결과: {response_content}")
-            return [], 0
+        return parse_response(response_content, format, mapper)
 
-    def fetch_data_generic(self, url, params, mapper, format='json', all_pages=True, verbose=False, max_retry=3):
-        page_param = mapper.get('page_param')
-        if all_pages and not page_param:
-            raise ValueError("'all_pages=True'일 경우, 매퍼에 'page_param'이 정의되어야 합니다.")
-
-        all_data = []
-        current_params = params.copy()
+    def _new_engine(self, max_retry=None):
+        """설정된 옵션으로 수집 엔진을 생성합니다. 통계는 self.metrics에 누적됩니다."""
+        options = dict(self.engine_options)
+        if max_retry is not None:
+            options["max_retries"] = max_retry
+        return CollectionEngine(metrics=self.metrics, **options)
 
-        print("➡️  첫 페이지 요청하여 전체 데이터 개수 확인 중...")
-        try:
-            response = requests.get(url, params=current_params)
-            response.raise_for_status()
-            if verbose:
-                print(response.content.decode('utf-8'))
+    def _collect_many(self, url, params_list, mapper, format='xml', desc=None):
+        """여러 요청 파라미터 세트를 엔진으로 동시에 수집하고, 요청 순서대로 결과 목록을 반환합니다."""
+        if not params_list:
+            return []
 
-            initial_data, total_count = self._parse_response(response.content, format, mapper)
+        async def collect():
+            async with self._new_engine() as engine:
+                return await engine.fetch_many(url, params_list, mapper, format, desc=desc)
 
-            if total_count == 0 and not initial_data:
-                print("⚠️  수집할 데이터가 없거나 API 응답에 문제가 있습니다.")
-                return pd.DataFrame()
+        results = run_sync(collect())
+        print(f"📈 [INFO] 수집 통계: {self.metrics}")
+        return results
 
-            all_data.extend(initial_data)
-
-        except Exception as e:
-            print(f"❌ 첫 페이지 요청 오류: {e}")
-            return pd.DataFrame()
+    def fetch_data_generic(self, url, params, mapper, format='json', all_pages=True, verbose=False, max_retry=3):
+        """
+        매퍼 기반으로 단일 API의 모든 페이지를 수집합니다.
 
-        if not all_pages:
-            df = pd.DataFrame(all_data)
-            print(f"\n🎉 다운로드 완료! 총 {len(df)}개의 데이터를 수집했습니다. 📊")
-            return df
+        Args:
+            url (str): 요청 URL
+            params (dict): 첫 페이지 요청 파라미터
+            mapper (dict): mapper_* 응답 매퍼
+            format (str): 'xml' 또는 'json'
+            all_pages (bool): False면 첫 페이지만 수집
+            verbose (bool): True면 수집 통계를 출력
+            max_retry (int): 요청당 최대 시도 횟수
 
-        with tqdm(total=total_count, initial=len(all_data), desc="📥 데이터 수집 중", unit="개") as pbar:
-            retries_left = max_retry
+        Returns:
+            pd.DataFrame: 수집된 데이터
 
-            while len(all_data) < total_count:
-                current_params[page_param] += 1
+        Raises:
+            PageFetchError: 재시도 후에도 받지 못한 페이지가 있을 때. 일부만 수집된 데이터로 작업이 진행되지 않도록
+                호출한 작업을 실패시킵니다.
+        """
+        page_param = mapper.get('page_param')
+        if all_pages and not page_param:
+            raise ValueError("'all_pages=True'일 경우, 매퍼에 'page_param'이 정의되어야 합니다.")
 
-                try:
-                    response = requests.get(url, params=current_params)
-                    response.raise_for_status()
-                    data, _ = self._parse_response(response.content, format, mapper)
+        async def collect(pbar):
+            async with self._new_engine(max_retry) as engine:
+                return await engine.fetch_pages(url, params, mapper, format, all_pages, pbar)
 
-                    if not data:
-                        pbar.set_description("⚠️ API 응답에 더 이상 데이터가 없습니다")
-                        break
+        with tqdm(desc="📥 데이터 수집 중", unit="개") as pbar:
+            all_data = run_sync(collect(pbar))
 
-                    all_data.extend(data)
-                    pbar.update(len(data))
-                    retries_left = max_retry
+        if verbose:
+            print(f"📈 [INFO] 수집 통계: {self.metrics}")
 
-                except Exception as e:
-                    pbar.write(f"❌ 오류 발생 (페이지 {current_params[page_param]}): {e}")
-                    retries_left -= 1
-                    if retries_left <= 0:
-                        pbar.write("\n🚨 최대 재시도 횟수를 초과했습니다.")
-                        break
+        if not all_data:
+            print("⚠️  수집할 데이터가 없거나 API 응답에 문제가 있습니다.")
+            return pd.DataFrame()
 
         df = pd.DataFrame(all_data)
         print(f"\n🎉 다운로드 완료! 총 {len(df)}개의 데이터를 수집했습니다. 📊")
@@ -218,13 +195,15 @@ class DataFetcher:
 
         print(f"📌 [{start_date} ~ {end_date}] 의안 주요 내용 데이터 수집 시작...")
 
-        df_bills = self.fetch_data_generic(
-            url=url,
-            params=params,
-            mapper=mapper,
-            format='xml',
-            all_pages=True,
-        )
+        with span("fetch.bills") as timing:
+            df_bills = self.fetch_data_generic(
+                url=url,
+                params=params,
+                mapper=mapper,
+                format='xml',
+                all_pages=True,
+            )
+            timing.add(rows=len(df_bills))
 
         if df_bills.empty:
             raise AssertionError(
@@ -271,6 +250,9 @@ class DataFetcher:
         # AssemblyNumber는 데이터 호출에 사용된 환경변수 AGE에서 가져오기
         df_bills['assemblyNumber'] = os.environ.get("AGE") 
 
+        # 컬럼 자료형 변환 (범주형, 문자열, 날짜)
+        df_bills = apply_schema(df_bills, 'bills')
+
 
         print("\n📌 발의일자별 수집한 데이터 수:")
         print(df_bills['proposeDate'].value_counts()) 
@@ -390,19 +372,17 @@ class DataFetcher:
         }
 
         print("\n📌 [국회의원 데이터 수집 시작]")
-        start_time = time.time()
-
-        df_lawmakers = self.fetch_data_generic(
-            url=url,
-            params=params,
-            mapper=mapper,
-            format='xml',
-            all_pages=True,
-        )
+        with span("fetch.lawmakers") as timing:
+            df_lawmakers = self.fetch_data_generic(
+                url=url,
+                params=params,
+                mapper=mapper,
+                format='xml',
+                all_pages=True,
+            )
+            timing.add(rows=len(df_lawmakers))
 
-        end_time = time.time()
-        total_time = end_time - start_time
-        print(f"✅ [INFO] 다운로드 완료! 총 소요 시간: {total_time:.2f}초")
+        print(f"✅ [INFO] 다운로드 완료! 총 소요 시간: {timing.elapsed:.2f}초")
 
         if df_lawmakers.empty:
             print("❌ [ERROR] 수집한 데이터가 없습니다.")
@@ -524,26 +504,30 @@ class DataFetcher:
 
         aggregated = {}
 
-        for bill_id in tqdm(bill_ids, desc="발의자 수집", unit="건"):
+        valid_bill_ids = []
+        for bill_id in bill_ids:
             if ensure_entry(bill_id) is None:
                 tqdm.write(f"⚠️ [WARN] billId {bill_id} 값이 올바르지 않아 건너뜁니다.")
                 continue
+            valid_bill_ids.append(bill_id)
 
-            params = {
+        # 법안별 발의자 조회를 엔진으로 동시에 요청합니다.
+        params_list = [
+            {
                 'KEY': api_key,
                 'Type': 'xml',
                 mapper['page_param']: 1,
                 mapper['size_param']: 100,
                 'BILL_ID': bill_id,
             }
+            for bill_id in valid_bill_ids
+        ]
+        with span("fetch.bill_coactors") as timing:
+            results = self._collect_many(url, params_list, mapper, format='xml', desc="발의자 수집")
+            timing.add(rows=sum(len(rows) for rows in results))
 
-            df_tmp = self.fetch_data_generic(
-                url=url,
-                params=params,
-                mapper=mapper,
-                format='xml',
-                all_pages=True,
-            )
+        for bill_id, rows in zip(valid_bill_ids, results):
+            df_tmp = pd.DataFrame(rows)
 
             if df_tmp.empty:
                 tqdm.write(f"⚠️ [WARN] billId {bill_id}에 대한 발의자 데이터를 찾을 수 없습니다.")
@@ -623,16 +607,12 @@ class DataFetcher:
 
         print(f"✅ [INFO] 발의자 정보 수집 완료. 총 {len(df_coactors)}개의 법안에 대한 데이터를 확보했습니다.")
 
+        df_coactors = apply_schema(df_coactors, 'bill_coactors')
         self.content = df_coactors
 
         return df_coactors
 
     def fetch_bills_timeline(self):
-        all_data = []
-        pageNo = 1
-        processing_count = 0
-        start_time = time.time()
-
         start_date_str = self.params.get("start_date") or (datetime.now() - timedelta(1)).strftime('%Y-%m-%d')
         end_date_str = self.params.get("end_date") or datetime.now().strftime('%Y-%m-%d')
         age = self.params.get("age") or os.environ.get("AGE")
@@ -644,61 +624,27 @@ class DataFetcher:
 
         print(f"\n📌 [INFO] [{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}] 의정활동 데이터 수집 시작...")
 
-        max_retry = 3
-
         url = "https://open.assembly.go.kr/portal/openapi/nqfvrbsdafrmuzixe"
+        mapper = self.mapper_open_xml
 
-        for single_date in (start_date + timedelta(n) for n in range(date_range)):
-            date_str = single_date.strftime('%Y-%m-%d')
-
-            while True:
-                params = {
-                    "Key": os.environ.get("APIKEY_status"),
-                    "Type": "xml",
-                    "pIndex": pageNo,
-                    "pSize": 100,
-                    "AGE": age,
-                    "DT": date_str
-                }
-
-                try:
-                    response = requests.get(url, params=params, timeout=10)
-
-                    if response.status_code == 200:
-                        root = ElementTree.fromstring(response.content)
-                        items = root.findall(".//row")
-
-                        if not items:
-                            break  # 더 이상 데이터 없음
-
-                        data = [{child.tag: child.text for child in item} for item in items]
-                        all_data.extend(data)
-                        print(f"✅ [INFO] {date_str} | 📄 Page {pageNo} | 📊 {len(data)} 개 추가됨. 총 {len(all_data)} 개 수집됨.")
-                        processing_count += 1
-                    else:
-                        print(f"❌ [ERROR] 응답 코드: {response.status_code} (📅 Date: {date_str}, 📄 Page {pageNo})")
-                        max_retry -= 1
-
-                except Exception as e:
-                    print(f"❌ [ERROR] 응답 처리 중 오류 발생: {str(e)}")
-                    max_retry -= 1
-
-                if max_retry <= 0:
-                    print("🚨 [WARNING] 최대 재시도 횟수 초과! 데이터 수집 중단.")
-                    break
-
-                if processing_count >= 10:
-                    processing_count = 0
-
-                pageNo += 1
-
-            pageNo = 1  # 날짜가 변경되면 페이지 번호 초기화
-
-        df_timeline = pd.DataFrame(all_data)
+        # 날짜별 요청을 엔진으로 동시에 수집합니다. (날짜 순서는 유지됨)
+        params_list = [
+            {
+                "Key": os.environ.get("APIKEY_status"),
+                "Type": "xml",
+                mapper['page_param']: 1,
+                mapper['size_param']: 100,
+                "AGE": age,
+                "DT": single_date.strftime('%Y-%m-%d'),
+            }
+            for single_date in (start_date + timedelta(n) for n in range(date_range))
+        ]
+        with span("fetch.bill_timeline") as timing:
+            results = self._collect_many(url, params_list, mapper, format='xml', desc="📅 의정활동 수집")
+            df_timeline = pd.DataFrame([row for rows in results for row in rows])
+            timing.add(rows=len(df_timeline))
 
-        end_time = time.time()
-        total_time = end_time - start_time
-        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {total_time:.2f}초")
+        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {timing.elapsed:.2f}초")
         print(f"📌 [INFO] 총 {len(df_timeline)} 개의 의정활동 데이터 수집됨.")
 
         self.content = df_timeline
@@ -716,75 +662,32 @@ class DataFetcher:
         
         api_key = os.getenv("APIKEY_result")
         url = 'https://open.assembly.go.kr/portal/openapi/TVBPMBILL11'
-        
-        all_data = []
-        processing_count = 0
-        max_retry = 10
+        mapper = self.mapper_open_xml
         
         print(f"\n📌 [INFO] [{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}] 법안 결과 데이터 수집 시작...")
-        start_time = time.time()
-        
-        current_date = start_date
-        while current_date <= end_date:
-            pageNo = 1
-            while True:
-                params = {
-                    'KEY': api_key,
-                    'Type': 'xml',
-                    'pIndex': pageNo,
-                    'pSize': 100,
-                    'AGE': age,
-                    'PROC_DT': current_date.strftime('%Y-%m-%d')
-                }
-                
-                response = requests.get(url, params=params)
-                
-                if response.status_code == 200:
-                    try:
-                        root = ElementTree.fromstring(response.content)
-                        head = root.find('head')
-                        if head is None:
-                            break
-                        total_count_elem = head.find('list_total_count')
-                        if total_count_elem is None:
-                            break
-                        total_count = int(total_count_elem.text)
-                        
-                        rows = root.findall('row')
-                        if not rows:
-                            break
-                        
-                        data = [{child.tag: child.text for child in row_elem} for row_elem in rows]
-                        all_data.extend(data)
-                        print(f"✅ [INFO] {current_date.strftime('%Y-%m-%d')} | 📄 Page {pageNo} | 📊 Total: {len(all_data)} 개 수집됨.")
-                        processing_count += 1
-                        
-                        if pageNo * 100 >= total_count:
-                            break
-                    except Exception as e:
-                        print(f"❌ [ERROR] 데이터 처리 중 오류 발생: {e}")
-                        max_retry -= 1
-                else:
-                    print(f"❌ [ERROR] 응답 코드: {response.status_code} (📄 Page {pageNo})")
-                    max_retry -= 1
-                
-                if max_retry <= 0:
-                    print("🚨 [WARNING] 최대 재시도 횟수 초과! 데이터 수집 중단.")
-                    break
-                
-                pageNo += 1
-            current_date += timedelta(days=1)
-        
-        df_result = pd.DataFrame(all_data)
+
+        params_list = [
+            {
+                'KEY': api_key,
+                'Type': 'xml',
+                mapper['page_param']: 1,
+                mapper['size_param']: 100,
+                'AGE': age,
+                'PROC_DT': (start_date + timedelta(n)).strftime('%Y-%m-%d'),
+            }
+            for n in range((end_date - start_date).days + 1)
+        ]
+        with span("fetch.bill_result") as timing:
+            results = self._collect_many(url, params_list, mapper, format='xml', desc="📅 법안 결과 수집")
+            df_result = pd.DataFrame([row for rows in results for row in rows])
+            timing.add(rows=len(df_result))
         
         if df_result.empty:
             print("⚠️ [WARNING] 수집된 데이터가 없습니다.")
             self.content = None
             return None
         
-        end_time = time.time()
-        total_time = end_time - start_time
-        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {total_time:.2f}초")
+        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {timing.elapsed:.2f}초")
         print(f"📌 [INFO] 총 {len(df_result)} 개의 법안 수집됨.")
         
         pd.set_option('display.max_columns', None)
@@ -807,72 +710,28 @@ class DataFetcher:
         date_range = (end_date - start_date).days + 1
 
         url = 'https://open.assembly.go.kr/portal/openapi/nwbpacrgavhjryiph'
-        all_data = []
-        pageNo = 1
-        processing_count = 0
-        start_time = time.time()
+        mapper = self.mapper_open_xml
 
         print(f"\n📌 [INFO] [{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}] 본회의 의결 데이터 수집 시작...")
 
-        for single_date in (start_date + timedelta(n) for n in range(date_range)):
-            date_str = single_date.strftime('%Y-%m-%d')
-
-            while True:
-                params = {
-                    'KEY': api_key,
-                    'Type': 'xml',
-                    'pIndex': pageNo,
-                    'pSize': 100,
-                    'AGE': age,
-                    'RGS_PROC_DT': date_str  # 본회의심의_의결일 필터링
-                }
-
-                try:
-                    response = requests.get(url, params=params, timeout=10)
-
-                    if response.status_code == 200:
-                        root = ElementTree.fromstring(response.content)
-                        head = root.find('head')
-                        if head is None:
-                            break
-
-                        total_count_elem = head.find('list_total_count')
-                        if total_count_elem is None:
-                            break
-
-                        total_count = int(total_count_elem.text)
-                        rows = root.findall('row')
-
-                        if not rows:
-                            print(f"⚠️ [WARNING] {date_str} 데이터 없음. (📄 Page {pageNo})")
-                            break
-
-                        data = [{child.tag: child.text for child in row_elem} for row_elem in rows]
-                        all_data.extend(data)
-                        print(f"✅ [INFO] {date_str} | 📄 Page {pageNo} | 📊 Total: {len(all_data)} 개 수집됨.")
-                        processing_count += 1
-
-                        if pageNo * 100 >= total_count:
-                            break
-
-                    else:
-                        print(f"❌ [ERROR] 응답 코드: {response.status_code} (📄 Page {pageNo})")
-                        break
-
-                except Exception as e:
-                    print(f"❌ [ERROR] 데이터 처리 중 오류 발생: {e}")
-                    break
-
-                pageNo += 1
-
-            pageNo = 1  # 다음 날짜로 넘어갈 때 페이지 번호 초기화
-
-        # 데이터프레임 생성
-        df_vote = pd.DataFrame(all_data)
+        params_list = [
+            {
+                'KEY': api_key,
+                'Type': 'xml',
+                mapper['page_param']: 1,
+                mapper['size_param']: 100,
+                'AGE': age,
+                'RGS_PROC_DT': single_date.strftime('%Y-%m-%d'),  # 본회의심의_의결일 필터링
+            }
+            for single_date in (start_date + timedelta(n) for n in range(date_range))
+        ]
+        with span("fetch.bill_vote") as timing:
+            results = self._collect_many(url, params_list, mapper, format='xml', desc="📅 본회의 의결 수집")
+            # 데이터프레임 생성
+            df_vote = pd.DataFrame([row for rows in results for row in rows])
+            timing.add(rows=len(df_vote))
 
-        end_time = time.time()
-        total_time = end_time - start_time
-        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {total_time:.2f}초")
+        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {timing.elapsed:.2f}초")
         print(f"📌 [INFO] 총 {len(df_vote)} 개의 본회의 의결 데이터 수집됨.")
 
         self.df_vote = df_vote
@@ -885,14 +744,7 @@ class DataFetcher:
         api_key = os.getenv("APIKEY_status")
         age = self.params.get("age") or os.getenv("AGE")
         url = 'https://open.assembly.go.kr/portal/openapi/nojepdqqaweusdfbi'
-
-        all_data = []
-        count = 0
-        pageNo = 1
-        processing_count = 0
-        max_retry = 10
-
-        start_time = time.time()
+        mapper = self.mapper_open_xml
 
         df_vote = self.df_vote
         if df_vote is None:
@@ -906,79 +758,31 @@ class DataFetcher:
 
         print(f"\n📌 [INFO] 법안별 정당별 투표 결과 데이터 수집 시작...")
 
-        for bill_id in df_vote[df_vote['PROC_RESULT_CD'] != '철회']['BILL_ID']:
-            pageNo = 1
-            while True:
-                print(f"🔍 [INFO] 법안 ID: {bill_id} 처리 중...")
-                params = {
-                    'KEY': api_key,
-                    'Type': 'xml',
-                    'pIndex': pageNo,
-                    'pSize': 100,
-                    'AGE': age,
-                    'BILL_ID': bill_id
-                }
-
-                count += 1
-                print(f"📄 [INFO] 페이지 {pageNo} 요청 중...")
-
-                try:
-                    response = requests.get(url, params=params, timeout=10)
-
-                    if response.status_code == 200:
-                        root = ElementTree.fromstring(response.content)
-                        head = root.find('head')
-                        if head is None:
-                            print(f"⚠️ [WARNING] 응답에 'head' 요소가 없습니다. (📄 Page {pageNo})")
-                            break
-
-                        total_count_elem = head.find('list_total_count')
-                        if total_count_elem is None:
-                            print(f"⚠️ [WARNING] 'list_total_count' 요소가 없습니다. (📄 Page {pageNo})")
-                            break
-
-                        total_count = int(total_count_elem.text)
-                        rows = root.findall('row')
-
-                        if not rows:
-                            print(f"⚠️ [WARNING] {bill_id}에 대한 추가 데이터 없음. (📄 Page {pageNo})")
-                            break
-
-                        data = [{child.tag: child.text for child in row_elem} for row_elem in rows]
-                        all_data.extend(data)
-                        print(f"✅ [INFO] 📄 Page {pageNo} | 📊 총 {len(all_data)} 개 데이터 수집됨.")
-
-                        processing_count += 1
-
-                        if pageNo * 100 >= total_count:
-                            print(f"✅ [INFO] 법안 ID: {bill_id}의 모든 페이지 처리 완료.")
-                            break
-
-                    else:
-                        print(f"❌ [ERROR] 응답 코드: {response.status_code} (📄 Page {pageNo})")
-                        break
-
-                except Exception as e:
-                    print(f"❌ [ERROR] 데이터 처리 중 오류 발생: {e}")
-                    break
-
-                if max_retry <= 0:
-                    print("🚨 [WARNING] 최대 재시도 횟수 초과! 데이터 수집 중단.")
-                    break
-
-                pageNo += 1
-
-        # 데이터프레임 생성
-        df_vote_individual = pd.DataFrame(all_data)
+        # 법안별 의원 표결 결과를 엔진으로 동시에 수집합니다.
+        params_list = [
+            {
+                'KEY': api_key,
+                'Type': 'xml',
+                mapper['page_param']: 1,
+                mapper['size_param']: 100,
+                'AGE': age,
+                'BILL_ID': bill_id,
+            }
+            for bill_id in df_vote[df_vote['PROC_RESULT_CD'] != '철회']['BILL_ID']
+        ]
+        with span("fetch.vote_party") as timing:
+            results = self._collect_many(url, params_list, mapper, format='xml', desc="🗳️ 법안별 표결 수집")
+            all_data = [row for rows in results for row in rows]
+            # 데이터프레임 생성
+            df_vote_individual = pd.DataFrame(all_data)
+            timing.add(rows=len(df_vote_individual))
 
         if df_vote_individual.empty:
             print("⚠️ [WARNING] 수집된 데이터가 없습니다.")
             self.content = None
             return None
 
-        end_time = time.time()
-        total_time = end_time - start_time
-        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {total_time:.2f}초")
+        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {timing.elapsed:.2f}초")
         print(f"📌 [INFO] 총 {len(df_vote_individual)} 개의 투표 데이터 수집됨.")
 
         # 필요한 컬럼만 유지
@@ -1004,6 +808,7 @@ class DataFetcher:
             'voteForCount': 'voteForCount'
         }, inplace=True)
 
+        df_vote_party = apply_schema(df_vote_party, 'vote_party')
         self.content = df_vote_party
         return df_vote_party
 
@@ -1025,57 +830,67 @@ class DataFetcher:
                 print("🚨 [WARNING] 법안 내용 데이터를 수집할 수 없습니다. 작업을 중단합니다.")
                 return None
 
-        def fetch_alternativeBills_relation_data(bill_id):
-            """ 주어진 bill_id에 대한 대안 법안 데이터를 API에서 수집하는 내부 함수 """
-            url = 'http://apis.data.go.kr/9710000/BillInfoService2/getBillAdditionalInfo'
-            params = {
-                'serviceKey': os.environ.get("APIKEY_DATAGOKR"), # 환경 변수에서 키를 가져오도록 수정
-                'bill_id': bill_id
-            }
+        url = 'http://apis.data.go.kr/9710000/BillInfoService2/getBillAdditionalInfo'
+        api_key = os.environ.get("APIKEY_DATAGOKR")  # 환경 변수에서 키를 가져오도록 수정
 
-            try:
-                response = requests.get(url, params=params, timeout=10)
+        def parse_alternativeBills_relation_data(bill_id, content):
+            """ 주어진 bill_id에 대한 대안 법안 API 응답을 파싱하는 내부 함수 """
+            if content is None:
+                print(f"❌ [ERROR] API 요청 실패 (bill_id={bill_id})")
+                return []
 
-                if response.status_code == 200:
-                    root = ElementTree.fromstring(response.content)
-                    items = root.find('.//exhaust')
+            try:
+                root = ElementTree.fromstring(content)
+                items = root.find('.//exhaust')
 
-                    if items is None or len(items.findall('item')) == 0:
-                        return []
+                if items is None or len(items.findall('item')) == 0:
+                    return []
 
-                    law_data = []
-                    for item in items.findall('item'):
-                        bill_link = item.find('billLink').text
-                        law_bill_id = bill_link.split('bill_id=')[-1]
-                        bill_name = item.find('billName').text.encode('utf-8').decode('utf-8')  # 한글 디코딩
-                        law_data.append({'billId': law_bill_id, 'billName': bill_name})
+                law_data = []
+                for item in items.findall('item'):
+                    bill_link = item.find('billLink').text
+                    law_bill_id = bill_link.split('bill_id=')[-1]
+                    bill_name = item.find('billName').text.encode('utf-8').decode('utf-8')  # 한글 디코딩
+                    law_data.append({'billId': law_bill_id, 'billName': bill_name})
 
-                    return law_data
-                else:
-                    print(f"❌ [ERROR] API 요청 실패 (bill_id={bill_id}), 응답 코드: {response.status_code}")
-                    return []
+                return law_data
             except Exception as e:
                 print(f"❌ [ERROR] bill_id={bill_id} 처리 중 오류 발생: {e}")
                 return []
 
-        # 대안 데이터프레임 초기화
-        alternatives_data = []
+        alt_ids = df_bills['billId'].tolist()  # 대안(위원장안) ID 목록
+
+        async def collect():
+            async with self._new_engine() as engine:
+                with tqdm(total=len(alt_ids)) as pbar:
+                    async def fetch(alt_id):
+                        content, _ = await engine.request('GET', url, params={'serviceKey': api_key, 'bill_id': alt_id})
+                        pbar.update(1)
+                        return content
+
+                    return await asyncio.gather(*(fetch(alt_id) for alt_id in alt_ids))
 
         print("📌 [INFO] 법안별 대안 데이터 수집 시작...")
 
-        # tqdm을 사용하여 진행 상황 표시
-        for _, row in tqdm(df_bills.iterrows(), total=len(df_bills)):
-            alt_id = row['billId']  # 대안(위원장안) ID
+        # 대안 관계 조회를 엔진으로 동시에 요청합니다.
+        with span("fetch.alternative_bill"):
+            contents = run_sync(collect())
 
-            # 대안 데이터 수집
-            law_data = fetch_alternativeBills_relation_data(alt_id)
+        # 대안 데이터프레임 초기화
+        alternatives_data = []
 
-            # 수집된 데이터를 리스트에 추가
-            for law in law_data:
-                alternatives_data.append({
-                    'altBillId': alt_id,  # 대안(위원장안) ID
-                    'billId': law['billId'],  # 대안에 포함된 법안 ID
-                })
+        with span("parse.xml", bytes=sum(len(content) for content in contents if content)) as timing:
+            for alt_id, content in zip(alt_ids, contents):
+                # 대안 데이터 파싱
+                law_data = parse_alternativeBills_relation_data(alt_id, content)
+
+                # 수집된 데이터를 리스트에 추가
+                for law in law_data:
+                    alternatives_data.append({
+                        'altBillId': alt_id,  # 대안(위원장안) ID
+                        'billId': law['billId'],  # 대안에 포함된 법안 ID
+                    })
+            timing.add(rows=len(alternatives_data))
 
         # 대안 데이터를 데이터프레임으로 변환
         df_alternatives = pd.DataFrame(alternatives_data)
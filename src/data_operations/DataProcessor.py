@@ -1,5 +1,4 @@
 import pandas as pd
-import re
 
 class DataProcessor:
 
@@ -7,11 +6,13 @@ class DataProcessor:
     def __init__(self, fetcher):
         self.fetcher = fetcher
     
-    def process_congressman_bills(self, df_bills):
+    def process_congressman_bills(self, df_bills, df_coactors=None):
         """의원 발의 법안을 처리하는 함수
         
         Args:
             df_bills (pd.DataFrame) : 수집한 법안 데이터
+            df_coactors (pd.DataFrame, optional) : 법안별 발의자 데이터 (billId, publicProposerIdList).
+                없으면 fetcher로 의원 발의 법안의 발의자 정보만 수집합니다.
         Return:
             df_bills_congressman (pd.DataFrame) : 처리된 의원 발의 법안 데이터
         """
@@ -27,7 +28,7 @@ class DataProcessor:
         # billName 컬럼 값에서 정규표현식을 사용하여 괄호 안의 발의자 정보를 추출합니다.
         # 예: '조세특례제한법 일부개정법률안(김형동의원 등 11인)' -> '김형동의원 등 11인'
         print("\n[billName에서 발의자 정보 추출 중...]")
-        df_bills_congressman['proposers'] = df_bills_congressman['billName'].str.extract(r'\(([^)]+)\)$').fillna('')
+        df_bills_congressman['proposers'] = df_bills_congressman['billName'].str.extract(r'\(([^)]+)\)$')[0].fillna('')
         print("[발의자 정보 추출 완료]")
         
         # billName 컬럼에서 추출한 발의자 정보(괄호 포함)를 제거합니다.
@@ -37,43 +38,48 @@ class DataProcessor:
 
         # df_bills_congressman에 발의자 정보 컬럼 머지
         print("\n[의원 발의자 데이터 병합 중...]")
-        df_coactors = self.fetcher.fetch_bills_coactors()
+        if df_coactors is None:
+            df_coactors = self.fetcher.fetch_bills_coactors(df_bills_congressman)
         df_bills_congressman = pd.merge(df_bills_congressman, df_coactors, on='billId', how='inner')
         print("[의원 발의자 데이터 병합 완료]")
 
-        # 아래 로직은 'proposers' 컬럼이 생성된 후에 실행됩니다.
-        def extract_names(proposer_str):
-            # '의원'이라는 단어 앞에 있는 한글 이름을 모두 찾습니다.
-            return re.findall(r'[가-힣]+(?=의원)', proposer_str) if isinstance(proposer_str, str) else []
-
-        df_bills_congressman['rstProposerNameList'] = df_bills_congressman['proposers'].apply(extract_names)
-
-
         if 'publicProposerIdList' not in df_bills_congressman.columns:
             df_bills_congressman['publicProposerIdList'] = [
                 [f'ID_{i}{j}' for j in range(1, 20)] for i in range(len(df_bills_congressman))
             ]
 
-        # 리스트 컴프리헨션을 사용하여 rstProposerIdList 생성
-        id_lists = [
-            row['publicProposerIdList'][:len(row['rstProposerNameList'])] 
-            for index, row in df_bills_congressman.iterrows()
-        ]
-
-        df_bills_congressman['rstProposerIdList'] = id_lists
+        # '의원'이라는 단어 앞에 있는 한글 이름 수만큼 발의자 ID 목록을 앞에서부터 잘라 rstProposerIdList를 만듭니다.
+        df_bills_congressman['rstProposerIdList'] = self.slice_proposer_ids(
+            df_bills_congressman['proposers'], df_bills_congressman['publicProposerIdList']
+        )
 
         print(f"\n[처리 후 의원 발의 법안 개수: {len(df_bills_congressman)}]")
 
-        # 제외할 컬럼 목록
         # ProposerName 컬럼이 존재할 경우에만 삭제 시도
-        columns_to_drop = ['rstProposerNameList']
         if 'ProposerName' in df_bills_congressman.columns:
-            columns_to_drop.append('ProposerName')
-            
-        df_bills_congressman.drop(columns=columns_to_drop, inplace=True, errors='ignore')
+            df_bills_congressman.drop(columns=['ProposerName'], inplace=True)
 
         return df_bills_congressman
 
+    @staticmethod
+    def slice_proposer_ids(proposers, id_lists):
+        """발의자 문자열에 나온 의원 수만큼 발의자 ID 목록의 앞부분을 잘라 반환하는 함수
+
+        행마다 re.findall/iterrows를 호출하지 않고 str.count로 의원 수를 한 번에 센 뒤,
+        ID 목록 컬럼과 나란히 순회하며 잘라냅니다.
+
+        Args:
+            proposers (pd.Series) : '김형동의원 등 11인' 형식의 발의자 문자열
+            id_lists (pd.Series) : 법안별 발의자 ID 목록 (list)
+        Return:
+            list[list[str]] : proposers와 같은 순서의 잘린 ID 목록
+        """
+        name_counts = proposers.fillna('').astype(str).str.count(r'[가-힣]+(?=의원)')
+        return [
+            ids[:count] if isinstance(ids, list) else []
+            for ids, count in zip(id_lists.tolist(), name_counts.tolist())
+        ]
+
     def process_chairman_bills(self, df_bills):
         """ 위원장 발의 법안을 처리하는 함수
         
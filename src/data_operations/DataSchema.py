@@ -0,0 +1,128 @@
+"""수집 대상(subject)별 DataFrame 컬럼 자료형 선언
+
+API 응답으로 만든 DataFrame은 모든 컬럼이 object(행마다 별도의 Python 문자열)입니다.
+이 모듈은 subject마다 컬럼 자료형을 선언해 두고, DataFetcher가 수집 직후 apply_schema()로 변환합니다.
+
+- category: 값의 종류가 적은 컬럼 (발의자 종류, 처리 단계, 대수, 정당명 등)
+- string: 법안 ID, 제목, 본문 등 자유 텍스트 (pyarrow가 있으면 string[pyarrow])
+- datetime: 'YYYY-MM-DD' 날짜 문자열 -> datetime64
+- list: 발의자 ID 목록처럼 행마다 리스트를 담는 컬럼 (결측값은 빈 리스트로 통일)
+
+선언되지 않은 컬럼과 DataFrame에 없는 컬럼은 건드리지 않습니다.
+API 서버로 보낼 때는 to_records()로 JSON으로 직렬화할 수 있는 값(날짜 문자열, None)으로 되돌립니다.
+category 컬럼의 값별 건수를 알림·리포트에 쓸 때는 value_counts()를 사용합니다. (건수 0인 범주 제외)
+
+사용 예시:
+
+    df_bills = apply_schema(df_bills, 'bills')
+    payload = to_records(df_bills)
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:  # pyarrow가 없으면 pandas 기본 문자열 자료형을 사용합니다.
+    STRING_DTYPE = "string"
+
+DATE_FORMAT = "%Y-%m-%d"
+
+SCHEMAS = {
+    "bills": {
+        "billId": "string",
+        "billName": "string",
+        "billNumber": "string",
+        "summary": "string",
+        "proposeDate": "datetime",
+        "stage": "category",
+        "proposerKind": "category",
+        "assemblyNumber": "category",
+    },
+    "bill_coactors": {
+        "billId": "string",
+        "representativeProposerIdList": "list",
+        "publicProposerIdList": "list",
+        "ProposerName": "list",
+    },
+    "vote_party": {
+        "billId": "string",
+        "partyName": "category",
+    },
+}
+
+
+def _as_list(value):
+    if isinstance(value, list):
+        return value
+    # Parquet에서 읽은 리스트 컬럼은 numpy 배열입니다.
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if value is None or (not isinstance(value, (tuple, set)) and pd.isna(value)):
+        return []
+    return list(value)
+
+
+def convert_column(series: pd.Series, kind: str) -> pd.Series:
+    """컬럼 하나를 선언된 종류(kind)의 자료형으로 변환합니다."""
+    if kind == "string":
+        return series.astype(STRING_DTYPE)
+    if kind == "category":
+        return series.astype("category")
+    if kind == "datetime":
+        return pd.to_datetime(series, format=DATE_FORMAT, errors="coerce")
+    if kind == "list":
+        return series.map(_as_list).astype(object)
+    raise ValueError(f"지원하지 않는 컬럼 자료형입니다: {kind}")
+
+
+def apply_schema(df: pd.DataFrame, subject: str) -> pd.DataFrame:
+    """
+    subject에 선언된 자료형으로 DataFrame 컬럼을 변환합니다.
+
+    Args:
+        df (pd.DataFrame): 수집한 데이터
+        subject (str): SCHEMAS의 키 (DataFetcher.fetch_data의 subject와 같음)
+
+    Returns:
+        pd.DataFrame: 변환된 DataFrame (입력 DataFrame은 수정하지 않음)
+    """
+    if df is None:
+        return df
+    schema = SCHEMAS.get(subject)
+    if schema is None:
+        raise ValueError(f"'{subject}'에 대한 스키마가 없습니다.")
+    df = df.copy()
+    for column, kind in schema.items():
+        if column in df.columns:
+            df[column] = convert_column(df[column], kind)
+    return df
+
+
+def value_counts(series: pd.Series) -> pd.Series:
+    """
+    값별 건수를 반환합니다.
+
+    category 컬럼의 Series.value_counts()는 데이터에 없는 범주(예: 필터링 후 남지 않은 '위원장')도
+    0건으로 포함하므로, 사용하지 않는 범주를 먼저 지웁니다. 다른 자료형은 value_counts()와 같습니다.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.cat.remove_unused_categories()
+    return series.value_counts()
+
+
+def to_records(df: pd.DataFrame) -> list:
+    """
+    DataFrame을 JSON으로 직렬화할 수 있는 dict 목록으로 변환합니다.
+
+    datetime 컬럼은 'YYYY-MM-DD' 문자열로, 결측값(NaN, NaT, pd.NA)은 None으로 바꿉니다.
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime(DATE_FORMAT)
+        series = series.astype(object)
+        columns[column] = series.where(series.notna(), None).tolist()
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
@@ -2,6 +2,8 @@ from dotenv import load_dotenv
 import os
 import pymysql
 
+from .Instrumentation import span
+
 
 class DatabaseManager:
     """MySQL RDS 연결 및 데이터베이스 관련 기능"""
@@ -63,13 +65,59 @@ class DatabaseManager:
             return None
 
         try:
-            with self.connection.cursor() as cursor:
+            with span("db.query") as timing, self.connection.cursor() as cursor:
                 cursor.execute(query, params or ())
-                return cursor.fetchone() if fetch_one else cursor.fetchall()
+                result = cursor.fetchone() if fetch_one else cursor.fetchall()
+                timing.add(rows=(1 if result else 0) if fetch_one else len(result))
+                return result
         except pymysql.MySQLError as e:
             print(f"❌ [ERROR] Query execution failed: {e}")
             return None
 
+    def stream_query(self, query, params=None, batch_size=1000, net_write_timeout=3600):
+        """
+        서버 측 커서(SSDictCursor)로 SELECT 결과를 batch_size 행씩 나누어 가져옵니다.
+
+        결과 전체를 메모리에 올리지 않으므로 대량 조회에 사용합니다.
+        스트리밍하는 동안에는 같은 연결로 다른 쿼리를 실행할 수 없습니다.
+
+        호출자가 배치를 처리하는 동안(예: 가득 찬 큐에서 대기) 서버는 결과를 보내지 못하고 기다리는데,
+        이 시간이 net_write_timeout(기본 60초)을 넘으면 MySQL이 연결을 끊습니다.
+        그래서 실행 전에 세션의 net_write_timeout을 늘립니다.
+
+        Args:
+            query (str): 실행할 SQL 쿼리문
+            params (tuple, optional): SQL 쿼리의 파라미터
+            batch_size (int): 한 번에 가져올 행 수
+            net_write_timeout (int, optional): 스트리밍 중 적용할 세션 net_write_timeout(초). None이면 바꾸지 않습니다.
+
+        Yields:
+            list[dict]: 최대 batch_size개의 행
+        """
+        if not self.connection:
+            print("❌ [ERROR] Database connection is not available.")
+            return
+
+        if net_write_timeout:
+            with self.connection.cursor() as session_cursor:
+                session_cursor.execute("SET SESSION net_write_timeout = %s", (int(net_write_timeout),))
+
+        cursor = self.connection.cursor(pymysql.cursors.SSDictCursor)
+        try:
+            with span("db.query"):
+                cursor.execute(query, params or ())
+            while True:
+                # 배치를 읽는 시간만 잽니다. (호출자가 배치를 처리하는 시간은 제외)
+                with span("db.stream") as timing:
+                    rows = cursor.fetchmany(batch_size)
+                    timing.add(rows=len(rows))
+                if not rows:
+                    break
+                yield rows
+        finally:
+            # 남은 결과를 모두 읽어야 연결을 다시 사용할 수 있습니다.
+            cursor.close()
+
     def get_latest_propose_date(self):
         """RDS 데이터베이스에서 가장 최근의 법안 발의 날짜를 가져오는 함수"""
         try:
@@ -0,0 +1,209 @@
+"""파이프라인 계측(span·counter)
+
+수집·처리·전송 단계마다 흩어져 있던 time.time() 출력 대신, 단계(stage) 이름별로 소요 시간 분포(히스토그램),
+처리 행 수, 바이트 수를 한 곳에 모으고 reports 디렉토리에 JSON으로 내보냅니다.
+시간 단계 기록은 perf_counter 두 번과 잠금 한 번이라 요청·쿼리 단위로 감싸도 부담이 거의 없습니다.
+
+단계 이름 규칙:
+
+    http.request     CollectionEngine/requests의 HTTP 요청 1회 (재시도는 각각 기록)
+    parse.xml/json   API 응답 파싱
+    fetch.<subject>  DataFetcher의 subject별 수집 전체
+    db.query         DatabaseManager 쿼리 실행 (db.stream: 서버 측 커서 배치 읽기)
+    llm.<작업>       AISummarizer의 LLM 호출 1회
+    embed.batch      임베딩 배치 생성, vector.upsert: 벡터 저장소 업서트
+    send.<작업>      APISender의 API 서버 전송
+    job.<작업>       hourly_data_update의 작업별 전체 시간
+
+사용 예시:
+
+    from .Instrumentation import span
+
+    with span("db.query") as timing:
+        rows = cursor.fetchall()
+        timing.add(rows=len(rows))
+    print(f"소요 시간: {timing.elapsed:.2f}초")
+
+    instrumentation.export_json("reports/hourly_update_instrumentation.json")
+"""
+
+import bisect
+import datetime
+import json
+import os
+import threading
+import time
+
+# 지연 시간 히스토그램 구간의 상한(초). 마지막 구간은 그보다 긴 모든 값입니다.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class StageStats:
+    """단계 하나의 호출 수, 오류 수, 지연 시간 히스토그램, 행·바이트 수를 누적합니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, seconds, rows=0, bytes=0, error=False):
+        self.count += 1
+        self.errors += int(error)
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.rows += rows
+        self.bytes += bytes
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def quantile(self, q):
+        """히스토그램으로 분위수를 추정합니다. (해당 구간의 상한, 단 실제 최댓값을 넘지 않음)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS, self.buckets):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_sec": round(self.total, 4),
+            "avg_sec": round(self.total / self.count, 4) if self.count else 0.0,
+            "min_sec": round(self.min or 0.0, 4),
+            "max_sec": round(self.max, 4),
+            "p50_sec": round(self.quantile(0.5), 4),
+            "p95_sec": round(self.quantile(0.95), 4),
+            "p99_sec": round(self.quantile(0.99), 4),
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "rows_per_sec": round(self.rows / self.total, 2) if self.total > 0 else 0.0,
+            "bytes_per_sec": round(self.bytes / self.total, 2) if self.total > 0 else 0.0,
+            # 구간 상한(초) -> 건수. 비어 있는 구간은 생략합니다.
+            "histogram": {
+                (str(bound) if bound is not None else "+Inf"): n
+                for bound, n in zip(LATENCY_BUCKETS + (None,), self.buckets) if n
+            },
+        }
+
+
+class Span:
+    """with 블록 하나의 소요 시간을 재서 블록이 끝날 때 단계 통계에 기록합니다. 예외가 나면 오류로 셉니다."""
+
+    def __init__(self, instrumentation, stage, rows=0, bytes=0):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.rows = rows
+        self.bytes = bytes
+        self.started = None
+        self.duration = None
+
+    def add(self, rows=0, bytes=0):
+        """블록 안에서 처리한 행 수와 바이트 수를 더합니다."""
+        self.rows += rows
+        self.bytes += bytes
+
+    @property
+    def elapsed(self):
+        """경과 시간(초). 블록이 끝났으면 전체 소요 시간입니다."""
+        if self.duration is not None:
+            return self.duration
+        return time.perf_counter() - self.started if self.started is not None else 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.started
+        self.instrumentation.record(self.stage, self.duration, self.rows, self.bytes, error=exc_type is not None)
+        return False
+
+
+class Instrumentation:
+    """프로세스 하나(크론 작업 1회 실행)의 단계별 통계와 카운터를 모읍니다. 여러 스레드에서 함께 사용할 수 있습니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+            self.counters = {}
+            self.started_at = datetime.datetime.now()
+            self._started = time.perf_counter()
+
+    def span(self, stage, rows=0, bytes=0):
+        return Span(self, stage, rows, bytes)
+
+    def record(self, stage, seconds, rows=0, bytes=0, error=False):
+        """이미 잰 소요 시간을 단계 통계에 기록합니다."""
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.add(seconds, rows, bytes, error)
+
+    def count(self, name, value=1):
+        """카운터(예: LLM 토큰 수)를 더합니다."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self):
+        """모든 단계 통계와 카운터를 dict로 반환합니다. 단계는 전체 소요 시간이 긴 순서입니다."""
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda item: item[1].total, reverse=True)
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "elapsed_sec": round(time.perf_counter() - self._started, 3),
+                "stages": {stage: stats.summary() for stage, stats in stages},
+                "counters": dict(self.counters),
+            }
+
+    def export_json(self, path, **metadata):
+        """통계를 JSON 파일로 저장하고 저장한 dict를 반환합니다."""
+        report = {**metadata, **self.snapshot(), "exported_at": datetime.datetime.now().isoformat(timespec="seconds")}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+    def format_summary(self, limit=10):
+        """전체 소요 시간이 긴 단계부터 한 줄씩 요약한 문자열을 반환합니다."""
+        lines = []
+        for stage, stats in list(self.snapshot()["stages"].items())[:limit]:
+            line = (f"{stage}: {stats['count']}회, 합계 {stats['total_sec']:.2f}초 "
+                    f"(p50 {stats['p50_sec']:.3f}초, p95 {stats['p95_sec']:.3f}초)")
+            if stats["rows"]:
+                line += f", {stats['rows']:,}행"
+            if stats["bytes"]:
+                line += f", {stats['bytes'] / 1024 ** 2:.1f}MB"
+            if stats["errors"]:
+                line += f", 오류 {stats['errors']}회"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+# 프로세스 전체에서 공유하는 기본 인스턴스
+instrumentation = Instrumentation()
+
+
+def span(stage, rows=0, bytes=0):
+    """기본 인스턴스에 기록하는 Span을 만듭니다."""
+    return instrumentation.span(stage, rows, bytes)
+
+
+def count(name, value=1):
+    instrumentation.count(name, value)
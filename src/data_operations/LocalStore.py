@@ -0,0 +1,290 @@
+"""수집 대상(subject)별 로컬 Parquet 데이터셋
+
+WorkFlowManager의 save 모드와 hourly_data_update의 변경 감지는 그동안 CSV에 의존했습니다.
+CSV는 자료형을 잃고(날짜, 범주형, 리스트 컬럼이 모두 문자열이 됨) 읽을 때마다 전체를 다시 파싱해야 합니다.
+이 모듈은 subject마다 Parquet 데이터셋 하나를 두고, 국회 대수와 날짜로 나눈 hive 형식 파티션에 저장합니다.
+
+    <root>/<subject>/assembly=22/date=2024-06-01/part-<uuid>.parquet
+    <root>/lawmakers/assembly=22/part-<uuid>.parquet        (날짜 컬럼이 없는 subject)
+
+- write(mode='append'): 파티션에 새 파일을 추가합니다.
+- write(mode='upsert'): 키 컬럼(STORE_SPECS의 keys)이 같은 행을 새 값으로 바꾸고, 파티션을 파일 하나로 다시 씁니다.
+- read(): 대수/날짜 파티션과 컬럼 조건을 pyarrow.dataset 필터로 넘겨, 필요한 파일과 행 그룹만 읽습니다.
+- changed_rows(): 저장된 데이터와 비교해 새로 생기거나 값이 바뀐 행만 돌려줍니다.
+
+읽은 DataFrame에는 DataSchema에 선언된 자료형을 다시 적용합니다. pyarrow 패키지가 필요합니다.
+
+사용 예시:
+
+    store = LocalStore()
+    store.write('bills', df_bills)
+    df = store.read('bills', assembly=22, start_date='2024-06-01', columns=['billId', 'stage'])
+"""
+
+import glob
+import json
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow가 없으면 LocalStore를 만들 때 안내합니다.
+    pa = None
+
+from .DataSchema import SCHEMAS, apply_schema, to_records
+
+DEFAULT_STORE_DIR = os.path.join("data", "local_store")
+UNKNOWN_PARTITION = "unknown"
+
+# subject별 키 컬럼(upsert 기준)과 날짜 파티션 컬럼
+STORE_SPECS = {
+    "bills": {"keys": ["billId"], "date": "proposeDate"},
+    "bill_coactors": {"keys": ["billId"], "date": None},
+    "lawmakers": {"keys": ["congressmanId"], "date": None},
+    "bill_timeline": {"keys": ["billId", "statusUpdateDate", "stage"], "date": "statusUpdateDate"},
+    "bill_result": {"keys": ["billId"], "date": None},
+    "bill_vote": {"keys": ["billId"], "date": None},
+    "vote_party": {"keys": ["billId", "partyName"], "date": None},
+    "alternative_bill": {"keys": ["altBillId", "billId"], "date": None},
+}
+
+
+def _date_partition(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(values):
+        dates = values.dt.strftime("%Y-%m-%d")
+    else:
+        dates = values.astype(object).where(values.notna(), None).map(
+            lambda value: str(value)[:10] if value is not None else None
+        )
+    return dates.fillna(UNKNOWN_PARTITION)
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """문자열과 숫자가 섞인 object 컬럼(예: fillna(0)을 거친 API 응답)은 Parquet에 쓸 수 있도록 문자열로 통일합니다."""
+    mixed = [
+        column for column in df.columns
+        if df[column].dtype == object
+        and pd.api.types.infer_dtype(df[column], skipna=True) in ("mixed", "mixed-integer", "mixed-integer-float")
+    ]
+    if not mixed:
+        return df
+    df = df.copy()
+    for column in mixed:
+        df[column] = df[column].map(lambda value: value if value is None or isinstance(value, (list, dict)) or pd.isna(value) else str(value))
+    return df
+
+
+def _json_default(value):
+    """Parquet에서 읽은 리스트 컬럼은 numpy 배열이 되므로, 원래 리스트와 같은 JSON이 되도록 리스트로 바꿉니다."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _to_table(df: pd.DataFrame):
+    """
+    DataFrame을 저장용 Arrow 테이블로 변환합니다.
+
+    범주형(dictionary)과 large_string은 일반 string으로 풀어 두어, 파일마다 자료형이 달라 데이터셋을 합칠 수
+    없는 일이 없도록 합니다. 자료형은 읽을 때 DataSchema로 다시 적용합니다.
+    """
+    table = pa.Table.from_pandas(_normalize_frame(df), preserve_index=False)
+    fields = []
+    for field in table.schema:
+        field_type = field.type
+        if pa.types.is_dictionary(field_type):
+            field_type = field_type.value_type
+        if pa.types.is_large_string(field_type):
+            field_type = pa.string()
+        fields.append(pa.field(field.name, field_type))
+    return table.cast(pa.schema(fields)).replace_schema_metadata(None)
+
+
+class LocalStore:
+    def __init__(self, root: str = None):
+        """
+        Args:
+            root (str, optional): 데이터셋 최상위 디렉토리. 없으면 환경 변수 LOCAL_STORE_DIR, 그것도 없으면 data/local_store
+        """
+        if pa is None:
+            raise ImportError("LocalStore를 사용하려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+        self.root = root or os.environ.get("LOCAL_STORE_DIR", DEFAULT_STORE_DIR)
+
+    def subjects(self):
+        """저장된 데이터가 있는 subject 목록을 반환합니다."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root) if name in STORE_SPECS)
+
+    def _spec(self, subject):
+        spec = STORE_SPECS.get(subject)
+        if spec is None:
+            raise ValueError(f"'{subject}'는 LocalStore에서 지원하지 않는 subject입니다.")
+        return spec
+
+    def _partition_fields(self, subject):
+        return ["assembly", "date"] if self._spec(subject)["date"] else ["assembly"]
+
+    def _partition_dir(self, subject, values):
+        parts = [f"{field}={value}" for field, value in zip(self._partition_fields(subject), values)]
+        return os.path.join(self.root, subject, *parts)
+
+    def _with_partitions(self, subject, df, assembly):
+        spec = self._spec(subject)
+        df = df.copy()
+        if assembly is not None:
+            df["assembly"] = str(assembly)
+        elif "assemblyNumber" in df.columns:
+            df["assembly"] = df["assemblyNumber"].astype(object).where(df["assemblyNumber"].notna(), None) \
+                .map(lambda value: str(value) if value is not None else UNKNOWN_PARTITION)
+        else:
+            df["assembly"] = UNKNOWN_PARTITION
+        if spec["date"]:
+            if spec["date"] in df.columns:
+                df["date"] = _date_partition(df[spec["date"]])
+            else:
+                df["date"] = UNKNOWN_PARTITION
+        return df
+
+    def write(self, subject: str, df: pd.DataFrame, mode: str = "upsert", assembly=None) -> int:
+        """
+        DataFrame을 subject 데이터셋에 저장합니다.
+
+        Args:
+            subject (str): STORE_SPECS의 키 (DataFetcher.fetch_data의 subject와 같은 이름)
+            df (pd.DataFrame): 저장할 데이터
+            mode (str): 'upsert'(키가 같은 행은 새 값으로 교체) 또는 'append'(그대로 추가)
+            assembly (optional): 국회 대수. 없으면 assemblyNumber 컬럼을 사용합니다.
+
+        Returns:
+            int: 저장한 행 수
+        """
+        if mode not in ("upsert", "append"):
+            raise ValueError("mode는 'upsert' 또는 'append'여야 합니다.")
+        if df is None or df.empty:
+            return 0
+
+        spec = self._spec(subject)
+        partition_fields = self._partition_fields(subject)
+        df = self._with_partitions(subject, df, assembly)
+
+        for values, group in df.groupby(partition_fields, sort=False):
+            values = values if isinstance(values, tuple) else (values,)
+            directory = self._partition_dir(subject, values)
+            os.makedirs(directory, exist_ok=True)
+            group = group.drop(columns=partition_fields)
+            old_files = sorted(glob.glob(os.path.join(directory, "*.parquet")))
+
+            if mode == "upsert" and old_files:
+                existing = self._read_files(old_files)
+                group = pd.concat([existing, _normalize_frame(group)], ignore_index=True)
+                group = group.drop_duplicates(subset=spec["keys"], keep="last")
+            else:
+                old_files = []
+
+            # 임시 파일에 먼저 쓰고 이름을 바꿔, 중단되더라도 기존 파일이 깨지지 않도록 합니다.
+            name = f"part-{uuid.uuid4().hex}.parquet"
+            tmp_path = os.path.join(directory, f".{name}.tmp")
+            pq.write_table(_to_table(group), tmp_path, compression="zstd")
+            os.replace(tmp_path, os.path.join(directory, name))
+            for path in old_files:
+                os.remove(path)
+        return len(df)
+
+    def _read_files(self, files):
+        tables = [pq.read_table(path) for path in files]
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+    def _dataset(self, subject):
+        directory = os.path.join(self.root, subject)
+        if not os.path.isdir(directory):
+            return None
+        partitioning = ds.partitioning(
+            pa.schema([(field, pa.string()) for field in self._partition_fields(subject)]), flavor="hive"
+        )
+        dataset = ds.dataset(directory, format="parquet", partitioning=partitioning)
+        if not dataset.files:
+            return None
+        # 파일마다 전부 비어 있던 컬럼(null 자료형) 등이 다를 수 있으므로 스키마를 합쳐서 다시 엽니다.
+        schema = pa.unify_schemas(
+            [fragment.physical_schema for fragment in dataset.get_fragments()] + [partitioning.schema],
+            promote_options="permissive",
+        )
+        return ds.dataset(directory, schema=schema, format="parquet", partitioning=partitioning)
+
+    def read(self, subject: str, columns=None, filters=None, assembly=None,
+             start_date: str = None, end_date: str = None) -> pd.DataFrame:
+        """
+        subject 데이터셋을 읽습니다. 조건은 파일을 열기 전에 파티션과 행 그룹 단위로 적용됩니다.
+
+        Args:
+            subject (str): 읽을 subject
+            columns (list[str], optional): 읽을 컬럼
+            filters (list[tuple], optional): pandas.read_parquet와 같은 형식의 조건. 예: [('stage', '==', '본회의의결')]
+            assembly (optional): 국회 대수 파티션
+            start_date, end_date (str, optional): 날짜 파티션 범위 ('YYYY-MM-DD', 양 끝 포함)
+
+        Returns:
+            pd.DataFrame: 저장된 데이터가 없으면 빈 DataFrame
+        """
+        dataset = self._dataset(subject)
+        if dataset is None:
+            return pd.DataFrame(columns=columns)
+
+        expression = pq.filters_to_expression(filters) if filters else None
+        conditions = []
+        if assembly is not None:
+            conditions.append(ds.field("assembly") == str(assembly))
+        if self._spec(subject)["date"]:
+            if start_date:
+                conditions.append(ds.field("date") >= start_date)
+            if end_date:
+                conditions.append(ds.field("date") <= end_date)
+        elif start_date or end_date:
+            raise ValueError(f"'{subject}'는 날짜 파티션이 없어 기간 조건을 사용할 수 없습니다.")
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        partition_fields = self._partition_fields(subject)
+        if columns is None:
+            columns = [name for name in dataset.schema.names if name not in partition_fields]
+        df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+        return apply_schema(df, subject) if subject in SCHEMAS else df
+
+    def changed_rows(self, subject: str, df: pd.DataFrame, assembly=None) -> pd.DataFrame:
+        """
+        저장된 데이터에 없거나 값이 달라진 행만 반환합니다. (hourly_data_update의 변경 감지용)
+
+        키 컬럼이 같은 저장된 행만 읽어서 비교하므로, 데이터셋 전체를 읽지 않습니다.
+        """
+        if df is None or df.empty:
+            return df
+        keys = self._spec(subject)["keys"]
+        columns = list(df.columns)
+        dataset = self._dataset(subject)
+        if dataset is None or not set(columns) <= set(dataset.schema.names):
+            return df
+
+        expression = None
+        for key in keys:
+            values = pa.array(df[key].dropna().astype(str).unique().tolist()).cast(dataset.schema.field(key).type)
+            condition = ds.field(key).isin(values)
+            expression = condition if expression is None else expression & condition
+        if assembly is not None:
+            expression = expression & (ds.field("assembly") == str(assembly))
+        stored = dataset.to_table(columns=columns, filter=expression).to_pandas()
+        if subject in SCHEMAS:
+            stored = apply_schema(stored, subject)
+
+        def fingerprints(frame):
+            return [json.dumps(record, ensure_ascii=False, sort_keys=True, default=_json_default)
+                    for record in to_records(frame[columns])]
+
+        stored_rows = set(fingerprints(stored))
+        is_changed = [row not in stored_rows for row in fingerprints(_normalize_frame(df))]
+        return df[is_changed]
@@ -9,6 +9,8 @@ import pandas as pd
 import requests
 from dotenv import load_dotenv
 
+from .DataSchema import value_counts
+
 
 class Notifier:
     """데이터 수집 결과를 다양한 채널로 알림을 전송하는 클래스"""
@@ -52,7 +54,7 @@ class Notifier:
         match subject:
             case "bills":
                 propose_dates = data['proposeDate'].value_counts().sort_index().to_string()
-                proposer_kind = data['proposerKind'].value_counts().sort_index().to_string()
+                proposer_kind = value_counts(data['proposerKind']).sort_index().to_string()
                 specific_info = f"""
                 **[법안 제안일자별 분포]**\n```\n{propose_dates}\n```
                 **[법안 발의주체별 분포]**\n```\n{proposer_kind}\n```
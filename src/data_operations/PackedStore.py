@@ -0,0 +1,226 @@
+"""압축 세그먼트 저장소
+
+크롤러가 항목마다 .pdf/.txt/.json 파일을 따로 만드는 대신, 여러 레코드를 추가 전용(append-only)
+세그먼트 파일 몇 개에 이어 붙여 저장합니다. 레코드는 각각 독립된 압축 프레임(zstd 또는 gzip)으로
+기록되므로
+
+- (파일, 오프셋, 길이)만 알면 세그먼트를 메모리 매핑(mmap)해 레코드 하나만 바로 읽을 수 있고,
+- 세그먼트 전체는 일반 .zst/.gz 스트림으로 처음부터 순서대로 읽을 수 있습니다.
+
+오프셋 인덱스는 CrawlManifest에 기록합니다. zstandard 패키지가 없으면 gzip을 사용합니다.
+
+사용 예시:
+
+    store = PackedStore(output_dir, prefix="cases")
+    location = store.append_record({"판례일련번호": "123", "판례본문": text})
+    manifest.record("123", "SUCCESS", **location)
+    ...
+    record = store.read_record(**location)
+"""
+
+import glob
+import gzip
+import io
+import json
+import mmap
+import os
+import re
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip으로 대체합니다.
+    zstandard = None
+
+SEGMENT_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz', 'none': '.bin'}
+DEFAULT_SEGMENT_SIZE = 256 * 1024 * 1024  # 256MB
+
+
+def default_compression():
+    """사용 가능한 기본 압축 방식을 반환합니다. zstandard가 설치되어 있으면 'zstd', 없으면 'gzip'."""
+    return 'zstd' if zstandard is not None else 'gzip'
+
+
+def compression_for(filename):
+    """세그먼트 파일 이름의 확장자로 압축 방식을 판단합니다."""
+    for compression, suffix in SEGMENT_SUFFIXES.items():
+        if filename.endswith(suffix):
+            return compression
+    return None
+
+
+def compress(data, compression):
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+def decompress(data, compression):
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("zstd 세그먼트를 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if compression == 'gzip':
+        return gzip.decompress(data)
+    return bytes(data)
+
+
+def load_record(filename, raw):
+    """
+    (파일 이름, 원본 바이트)로 JSON 레코드를 복원합니다.
+
+    세그먼트 파일(.zst/.gz/.bin)이면 압축을 풀고, 그 외(.jsonl 등)는 그대로 JSON으로 읽습니다.
+    """
+    compression = compression_for(filename)
+    if compression is not None:
+        raw = decompress(raw, compression)
+    return json.loads(raw)
+
+
+class PackedStore:
+    """
+    추가 전용 압축 세그먼트 저장소.
+
+    Args:
+        output_dir (str): 세그먼트 파일을 둘 디렉토리
+        prefix (str): 세그먼트 파일 이름 접두사. `<prefix>-00000.zst` 형식으로 생성됩니다.
+        compression (str, optional): 'zstd', 'gzip', 'none'. 기본값은 default_compression().
+            이미 압축된 데이터(PDF 등)는 'none'을 권장합니다.
+        segment_size (int): 세그먼트 하나의 최대 크기(바이트). 넘으면 다음 세그먼트로 넘어갑니다.
+    """
+
+    def __init__(self, output_dir, prefix="records", compression=None, segment_size=DEFAULT_SEGMENT_SIZE):
+        compression = compression or default_compression()
+        if compression not in SEGMENT_SUFFIXES:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError("zstd 압축을 사용하려면 zstandard 패키지를 설치해야 합니다.")
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.compression = compression
+        self.suffix = SEGMENT_SUFFIXES[compression]
+        self.segment_size = segment_size
+
+        self._writer = None
+        self._segment_index = self._last_segment_index()
+        self._maps = {}  # 세그먼트 이름 -> (파일, mmap)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _segment_name(self, index):
+        return f"{self.prefix}-{index:05d}{self.suffix}"
+
+    def _last_segment_index(self):
+        pattern = re.compile(rf"^{re.escape(self.prefix)}-(\d{{5}}){re.escape(self.suffix)}$")
+        indexes = [
+            int(m.group(1))
+            for m in (pattern.match(os.path.basename(p)) for p in glob.glob(os.path.join(self.output_dir, f"{self.prefix}-*")))
+            if m
+        ]
+        return max(indexes, default=0)
+
+    def segments(self):
+        """존재하는 세그먼트 파일 이름 목록을 순서대로 반환합니다."""
+        return [
+            self._segment_name(i) for i in range(self._segment_index + 1)
+            if os.path.exists(os.path.join(self.output_dir, self._segment_name(i)))
+        ]
+
+    def _open_writer(self):
+        name = self._segment_name(self._segment_index)
+        path = os.path.join(self.output_dir, name)
+        if os.path.exists(path) and os.path.getsize(path) >= self.segment_size:
+            self._segment_index += 1
+            name = self._segment_name(self._segment_index)
+            path = os.path.join(self.output_dir, name)
+        self._writer = open(path, 'ab')
+        self._writer_name = name
+
+    def append(self, data):
+        """
+        바이트 레코드 하나를 압축해 현재 세그먼트 끝에 추가합니다.
+
+        Returns:
+            dict: {'file', 'offset', 'length'} 레코드 위치 (CrawlManifest.record에 그대로 전달 가능)
+        """
+        if self._writer is None:
+            self._open_writer()
+        elif self._writer.tell() >= self.segment_size:
+            self._writer.close()
+            self._segment_index += 1
+            self._open_writer()
+
+        payload = compress(data, self.compression)
+        offset = self._writer.tell()
+        self._writer.write(payload)
+        return {'file': self._writer_name, 'offset': offset, 'length': len(payload)}
+
+    def append_record(self, record):
+        """dict 레코드를 JSON 한 줄로 직렬화해 추가합니다."""
+        line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+        return self.append(line)
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _mapped(self, file, end):
+        """세그먼트를 mmap으로 엽니다. 매핑 이후 파일이 커졌으면 다시 매핑합니다."""
+        entry = self._maps.get(file)
+        if entry is None or len(entry[1]) < end:
+            if entry is not None:
+                entry[1].close()
+                entry[0].close()
+            f = open(os.path.join(self.output_dir, file), 'rb')
+            entry = self._maps[file] = (f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return entry[1]
+
+    def read(self, file, offset, length):
+        """위치 정보로 레코드 하나를 읽어 압축을 푼 바이트를 반환합니다."""
+        if self._writer is not None and file == self._writer_name:
+            self._writer.flush()
+        mapped = self._mapped(file, offset + length)
+        return decompress(mapped[offset:offset + length], compression_for(file))
+
+    def read_record(self, file, offset, length):
+        """위치 정보로 JSON 레코드 하나를 읽어 dict로 반환합니다."""
+        return json.loads(self.read(file, offset, length))
+
+    def iter_records(self):
+        """
+        모든 세그먼트의 JSON 레코드를 기록된 순서대로 스트리밍합니다. 'none' 압축 저장소에는 사용할 수 없습니다.
+
+        Yields:
+            dict: JSON 레코드
+        """
+        if self.compression == 'none':
+            raise ValueError("압축하지 않은 바이트 저장소는 오프셋 인덱스로만 읽을 수 있습니다.")
+        self.flush()
+        for name in self.segments():
+            path = os.path.join(self.output_dir, name)
+            with open(path, 'rb') as raw:
+                if self.compression == 'zstd':
+                    stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+                    lines = io.BufferedReader(stream)
+                else:
+                    lines = gzip.GzipFile(fileobj=raw)  # 이어 붙인 gzip 멤버를 하나의 스트림으로 읽습니다.
+                with lines:
+                    for line in lines:
+                        if line.strip():
+                            yield json.loads(line)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for f, mapped in self._maps.values():
+            mapped.close()
+            f.close()
+        self._maps = {}
@@ -0,0 +1,211 @@
+"""로컬 수집 데이터에 대한 분석 쿼리 계층
+
+LocalStore에 저장된 subject별 Parquet 데이터셋을 DuckDB(내장 분석 엔진)의 테이블(view)로 등록하고,
+자주 묻는 집계를 파라미터화된 쿼리로 제공합니다. 운영 MySQL이나 CSV를 pandas로 전부 불러오지 않고,
+필요한 컬럼과 파티션만 읽어 집계한 결과만 DataFrame으로 돌려받습니다.
+
+등록되는 테이블 (ReportManager의 작업 이름과 같음):
+
+    bills, timeline, results, votes, vote_party, lawmakers
+
+각 테이블에는 파티션 컬럼 assembly(대수)와, 날짜 파티션이 있는 subject는 date('YYYY-MM-DD')가 함께 보입니다.
+view는 쿼리할 때마다 파일 목록을 다시 읽으므로 LocalStore에 새로 저장한 데이터도 바로 조회됩니다.
+duckdb 패키지가 필요합니다.
+
+사용 예시:
+
+    engine = QueryEngine()
+    engine.party_vote_counts(assembly=22)
+    engine.query("SELECT stage, COUNT(*) FROM timeline WHERE date >= ? GROUP BY 1", ["2024-06-01"])
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # duckdb가 없으면 QueryEngine을 만들 때 안내합니다.
+    duckdb = None
+
+from .LocalStore import DEFAULT_STORE_DIR, STORE_SPECS
+
+# 테이블 이름 -> LocalStore subject
+TABLE_SUBJECTS = {
+    "bills": "bills",
+    "timeline": "bill_timeline",
+    "results": "bill_result",
+    "votes": "bill_vote",
+    "vote_party": "vote_party",
+    "lawmakers": "lawmakers",
+}
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class QueryEngine:
+    def __init__(self, store_root: str = None, database: str = ":memory:"):
+        """
+        Args:
+            store_root (str, optional): LocalStore 최상위 디렉토리. 없으면 LocalStore와 같은 기본값을 사용합니다.
+            database (str): DuckDB 데이터베이스 경로. 기본값은 메모리 (view만 만들므로 파일이 필요 없음)
+        """
+        if duckdb is None:
+            raise ImportError("QueryEngine을 사용하려면 duckdb 패키지가 필요합니다. (pip install duckdb)")
+        self.store_root = store_root or os.environ.get("LOCAL_STORE_DIR", DEFAULT_STORE_DIR)
+        self.connection = duckdb.connect(database)
+        self.registered = set()
+        self.register_tables()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def register_tables(self):
+        """저장된 파일이 있는 subject를 view로 등록합니다. 이미 등록된 테이블은 건너뜁니다."""
+        for table, subject in TABLE_SUBJECTS.items():
+            if table in self.registered:
+                continue
+            directory = os.path.join(self.store_root, subject)
+            if not os.path.isdir(directory) or not any(
+                name.endswith(".parquet") for _, _, names in os.walk(directory) for name in names
+            ):
+                continue
+            hive_types = "{'assembly': 'VARCHAR', 'date': 'VARCHAR'}" if STORE_SPECS[subject]["date"] \
+                else "{'assembly': 'VARCHAR'}"
+            pattern = os.path.join(directory, "**", "*.parquet").replace("'", "''")
+            self.connection.execute(
+                f"CREATE OR REPLACE VIEW {_quote_identifier(table)} AS "
+                f"SELECT * FROM read_parquet('{pattern}', hive_partitioning = true, "
+                f"union_by_name = true, hive_types = {hive_types})"
+            )
+            self.registered.add(table)
+        return sorted(self.registered)
+
+    def has_table(self, table: str) -> bool:
+        if table not in self.registered:
+            self.register_tables()
+        return table in self.registered
+
+    def columns(self, table: str) -> dict:
+        """테이블의 {컬럼 이름: DuckDB 자료형}을 반환합니다. 테이블이 없으면 빈 dict"""
+        if not self.has_table(table):
+            return {}
+        rows = self.connection.execute(f"DESCRIBE {_quote_identifier(table)}").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def query(self, sql: str, params=None) -> pd.DataFrame:
+        """
+        SQL을 실행하고 결과를 DataFrame으로 반환합니다. 값은 반드시 params(? 자리표시자)로 넘겨야 합니다.
+        """
+        self.register_tables()
+        return self.connection.execute(sql, params or []).df()
+
+    @staticmethod
+    def _where(conditions):
+        clauses = [clause for clause, _ in conditions]
+        params = [value for _, value in conditions]
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def distribution(self, table: str, column: str, limit: int = None, assembly=None) -> dict:
+        """
+        테이블 컬럼의 값별 건수를 많은 순으로 반환합니다. (pandas의 value_counts와 같은 결과)
+
+        Returns:
+            dict: {값: 건수}. 테이블이나 컬럼이 없으면 빈 dict
+        """
+        column_type = self.columns(table).get(column)
+        if column_type is None:
+            return {}
+        value = _quote_identifier(column)
+        # 날짜는 'YYYY-MM-DD'로 표시합니다.
+        value = f"strftime({value}, '%Y-%m-%d')" if column_type.startswith(("TIMESTAMP", "DATE")) \
+            else f"CAST({value} AS VARCHAR)"
+        conditions = [("assembly = ?", str(assembly))] if assembly is not None else []
+        where, params = self._where(conditions)
+        sql = (
+            f"SELECT {value} AS value, COUNT(*) AS count "
+            f"FROM {_quote_identifier(table)}{where} GROUP BY 1 ORDER BY count DESC, value"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self.connection.execute(sql, params).fetchall()
+        return {value: count for value, count in rows}
+
+    def party_vote_counts(self, assembly=None) -> pd.DataFrame:
+        """정당별 찬성 투표 수와 표결에 참여한 법안 수를 집계합니다."""
+        if not self.has_table("vote_party"):
+            return pd.DataFrame(columns=["partyName", "voteForCount", "billCount"])
+        conditions = [("assembly = ?", str(assembly))] if assembly is not None else []
+        where, params = self._where(conditions)
+        return self.connection.execute(
+            "SELECT partyName, CAST(SUM(CAST(voteForCount AS BIGINT)) AS BIGINT) AS voteForCount, "
+            "COUNT(DISTINCT billId) AS billCount "
+            f"FROM vote_party{where} GROUP BY partyName ORDER BY voteForCount DESC, partyName",
+            params,
+        ).df()
+
+    def bills_per_committee_per_month(self, start_date: str = None, end_date: str = None, assembly=None) -> pd.DataFrame:
+        """
+        월별 소관 위원회별 발의 법안 수를 집계합니다.
+
+        위원회는 의정활동(timeline) 데이터에서 법안마다 가장 최근에 기록된 위원회를 사용하고,
+        아직 회부되지 않은 법안은 '미회부'로 집계합니다.
+        """
+        if not self.has_table("bills"):
+            return pd.DataFrame(columns=["month", "committee", "billCount"])
+        conditions = []
+        if start_date:
+            conditions.append(("b.date >= ?", start_date))
+        if end_date:
+            conditions.append(("b.date <= ?", end_date))
+        if assembly is not None:
+            conditions.append(("b.assembly = ?", str(assembly)))
+        where, params = self._where(conditions)
+        if "committee" in self.columns("timeline"):
+            committees = (
+                "SELECT billId, arg_max(committee, statusUpdateDate) AS committee "
+                "FROM timeline WHERE committee IS NOT NULL AND committee <> '' GROUP BY billId"
+            )
+        else:
+            committees = "SELECT NULL::VARCHAR AS billId, NULL::VARCHAR AS committee WHERE false"
+        return self.connection.execute(
+            f"WITH committees AS ({committees}) "
+            "SELECT substr(b.date, 1, 7) AS month, COALESCE(c.committee, '미회부') AS committee, "
+            "COUNT(*) AS billCount "
+            f"FROM bills b LEFT JOIN committees c ON b.billId = c.billId{where} "
+            "GROUP BY 1, 2 ORDER BY month, billCount DESC, committee",
+            params,
+        ).df()
+
+    def stage_transition_times(self, assembly=None) -> pd.DataFrame:
+        """
+        의정활동(timeline) 데이터에서 처리 단계 사이의 소요 일수를 집계합니다.
+
+        법안마다 단계를 날짜순으로 정렬해 (이전 단계 -> 다음 단계) 쌍별 건수, 평균/중앙값 소요 일수를 계산합니다.
+        """
+        if not self.has_table("timeline"):
+            return pd.DataFrame(columns=["fromStage", "toStage", "transitionCount", "avgDays", "medianDays"])
+        conditions = [("assembly = ?", str(assembly))] if assembly is not None else []
+        where, params = self._where(conditions)
+        return self.connection.execute(
+            "WITH ordered AS ("
+            "  SELECT billId, stage, TRY_CAST(statusUpdateDate AS DATE) AS stageDate,"
+            "         LAG(stage) OVER w AS fromStage, LAG(TRY_CAST(statusUpdateDate AS DATE)) OVER w AS fromDate"
+            f"  FROM timeline{where}"
+            "  WINDOW w AS (PARTITION BY billId ORDER BY TRY_CAST(statusUpdateDate AS DATE), stage)"
+            ") "
+            "SELECT fromStage, stage AS toStage, COUNT(*) AS transitionCount, "
+            "AVG(stageDate - fromDate) AS avgDays, MEDIAN(stageDate - fromDate) AS medianDays "
+            "FROM ordered WHERE fromStage IS NOT NULL AND fromStage <> stage "
+            "GROUP BY 1, 2 ORDER BY transitionCount DESC, fromStage, toStage",
+            params,
+        ).df()
@@ -3,7 +3,9 @@ import os
 import datetime
 from typing import Dict, Any, Optional, List
 import pandas as pd
+from .DataSchema import value_counts
 from .Notifier import Notifier
+from .Instrumentation import instrumentation as default_instrumentation
 
 
 class ReportManager:
@@ -28,6 +30,14 @@ class ReportManager:
             "results"
         ]
         
+        # QueryEngine으로 집계할 작업별 분포 (라벨, 컬럼, 상위 N개)
+        self.stored_distributions = {
+            "bills": [("법안 제안일자별 분포", "proposeDate", 10), ("법안 발의주체별 분포", "proposerKind", None)],
+            "lawmakers": [("정당별 분포", "partyName", 10)],
+            "timeline": [("처리 단계별 분포", "stage", None)],
+            "results": [("처리 결과별 분포", "billProposeResult", None)],
+        }
+
         # 상태 이모지 매핑
         self.status_emojis = {
             "success": "✅",
@@ -70,6 +80,22 @@ class ReportManager:
         with open(result_file, 'w', encoding='utf-8') as f:
             json.dump(result, f, ensure_ascii=False, indent=2)
     
+    def save_instrumentation(self, run_name: str, instrumentation=None) -> str:
+        """
+        실행 1회의 단계별 계측 결과(소요 시간 분포, 행·바이트 수, 카운터)를 JSON으로 저장
+
+        Args:
+            run_name (str): 실행 이름 (예: hourly_update). 파일 이름은 {run_name}_instrumentation.json
+            instrumentation (Instrumentation, optional): 저장할 계측 인스턴스. 없으면 프로세스 기본 인스턴스
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        instrumentation = instrumentation or default_instrumentation
+        result_file = os.path.join(self.report_dir, f"{run_name}_instrumentation.json")
+        instrumentation.export_json(result_file, run_name=run_name)
+        return result_file
+
     def get_job_result(self, job_name: str) -> Optional[Dict[str, Any]]:
         """
         개별 작업의 결과를 조회
@@ -208,35 +234,57 @@ class ReportManager:
         if job_name == "bills":
             # 법안 데이터의 경우 제안일자별, 발의주체별 분포
             if 'proposeDate' in df.columns:
-                propose_dist = df['proposeDate'].value_counts().head(10).to_dict()
+                propose_dist = value_counts(df['proposeDate']).head(10).to_dict()
                 distribution['법안 제안일자별 분포'] = propose_dist
             
             if 'proposerKind' in df.columns:
-                proposer_dist = df['proposerKind'].value_counts().to_dict()
+                proposer_dist = value_counts(df['proposerKind']).to_dict()
                 distribution['법안 발의주체별 분포'] = proposer_dist
                 
         elif job_name == "lawmakers":
             # 의원 데이터의 경우 정당별, 선거구별 분포
             if 'partyName' in df.columns:
-                party_dist = df['partyName'].value_counts().head(10).to_dict()
+                party_dist = value_counts(df['partyName']).head(10).to_dict()
                 distribution['정당별 분포'] = party_dist
                 
         elif job_name == "votes":
             # 표결 데이터의 경우 날짜별, 결과별 분포
             if 'voteDate' in df.columns:
-                vote_date_dist = df['voteDate'].value_counts().head(10).to_dict()
+                vote_date_dist = value_counts(df['voteDate']).head(10).to_dict()
                 distribution['표결 날짜별 분포'] = vote_date_dist
                 
         elif job_name == "timeline":
             # 타임라인 데이터의 경우 단계별 분포
             if 'procStage' in df.columns:
-                stage_dist = df['procStage'].value_counts().to_dict()
+                stage_dist = value_counts(df['procStage']).to_dict()
                 distribution['처리 단계별 분포'] = stage_dist
                 
         elif job_name == "results":
             # 처리결과 데이터의 경우 결과별 분포
             if 'procResult' in df.columns:
-                result_dist = df['procResult'].value_counts().to_dict()
+                result_dist = value_counts(df['procResult']).to_dict()
                 distribution['처리 결과별 분포'] = result_dist
         
         return distribution
+
+    def calculate_stored_distribution(self, job_name: str, query_engine, assembly=None) -> Dict[str, Any]:
+        """
+        로컬 저장소(LocalStore)에 누적된 데이터의 분포 정보를 QueryEngine(DuckDB)으로 집계
+
+        calculate_data_distribution과 같은 형식을 반환하지만, 데이터프레임을 메모리에 올리지 않고
+        필요한 컬럼만 읽어 값별 건수만 받아옵니다.
+
+        Args:
+            job_name (str): 작업 이름
+            query_engine (QueryEngine): 로컬 저장소를 등록한 쿼리 엔진
+            assembly (optional): 국회 대수 (없으면 전체)
+
+        Returns:
+            Dict: 분포 정보 딕셔너리 (저장된 데이터가 없으면 빈 딕셔너리)
+        """
+        distribution = {}
+        for label, column, limit in self.stored_distributions.get(job_name, []):
+            counts = query_engine.distribution(job_name, column, limit=limit, assembly=assembly)
+            if counts:
+                distribution[label] = counts
+        return distribution
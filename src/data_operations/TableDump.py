@@ -0,0 +1,154 @@
+"""테이블 단위 SQL 덤프 형식과 행 체크섬
+
+jobs/database_backup.py의 병렬 백업이 테이블마다 만드는 덤프와, 백업을 검증할 때 쓰는 체크섬을 정의합니다.
+
+덤프는 mysql 클라이언트로 그대로 복원할 수 있는 SQL이면서, 검증용 SQLite에도 INSERT 문을 그대로 실행할 수 있도록
+값을 다음처럼 씁니다. (문자열 이스케이프는 작은따옴표를 두 번 쓰는 방식만 사용하고, 덤프 앞에서
+MySQL 세션을 NO_BACKSLASH_ESCAPES로 바꿉니다.)
+
+    NULL             -> NULL
+    정수/불리언       -> 1234
+    bytes            -> X'0a1b...'
+    그 밖의 값        -> '문자열' (날짜는 'YYYY-MM-DD HH:MM:SS', Decimal/float는 str/repr)
+
+INSERT 문은 행 하나에 한 줄씩 씁니다. 여러 행을 한 INSERT로 묶으면 중간에 행 하나만 추가돼도
+뒤쪽 묶음 경계가 모두 밀려 이후 줄이 전부 바뀌므로, BackupStore가 이전 백업의 청크를 재사용하지 못합니다.
+
+행 체크섬은 이렇게 쓴 행 리터럴 '(값,값,...)'의 sha256 앞 8바이트를 모두 더한 값(mod 2^64)입니다.
+행 순서와 무관하므로 원본 MySQL과, 복원한 MySQL/SQLite에서 정렬 규칙(collation)이 달라도 같은 값이 나옵니다.
+"""
+
+import datetime
+import hashlib
+import sqlite3
+
+# 테이블 덤프 앞부분. MySQL 조건부 주석(/*!...*/)이라 SQLite에서는 빈 문장으로 무시됩니다.
+DUMP_HEADER = (
+    "/*!40101 SET NAMES utf8mb4 */;\n"
+    "/*!40014 SET FOREIGN_KEY_CHECKS=0 */;\n"
+    "/*!40101 SET SESSION sql_mode=CONCAT(@@SESSION.sql_mode, ',NO_BACKSLASH_ESCAPES') */;\n"
+)
+
+
+def quote_identifier(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+def sql_literal(value) -> str:
+    """값을 덤프에 쓰는 SQL 리터럴로 바꿉니다. 체크섬도 이 표현을 기준으로 계산합니다."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "X'" + bytes(value).hex() + "'"
+    if isinstance(value, float):
+        text = repr(value)
+    elif isinstance(value, datetime.timedelta):
+        # pymysql은 TIME 컬럼을 timedelta로 반환합니다. str()은 '1 day, 2:00:00' 형태라 직접 씁니다.
+        seconds = int(value.total_seconds())
+        sign, seconds = ("-", -seconds) if seconds < 0 else ("", seconds)
+        text = f"{sign}{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+        if value.microseconds:
+            text += f".{value.microseconds:06d}"
+    else:
+        text = str(value)
+    return "'" + text.replace("'", "''") + "'"
+
+
+def row_literal(row) -> str:
+    return "(" + ",".join(sql_literal(value) for value in row) + ")"
+
+
+class TableChecksum:
+    """행 순서와 무관한 테이블 체크섬과 행 수를 누적합니다."""
+
+    def __init__(self):
+        self.rows = 0
+        self._total = 0
+
+    def update(self, literal: str):
+        digest = hashlib.sha256(literal.encode("utf-8")).digest()
+        self._total = (self._total + int.from_bytes(digest[:8], "big")) % (1 << 64)
+        self.rows += 1
+
+    def hexdigest(self) -> str:
+        return f"{self._total:016x}"
+
+
+def dump_table_lines(table: str, columns, rows, create_statement: str = None, checksum: TableChecksum = None):
+    """
+    테이블 덤프를 줄(bytes) 단위로 반환합니다. BackupStore.add_table에 그대로 넘길 수 있습니다.
+
+    INSERT 문은 행마다 하나씩 반환하므로 청크 경계도 항상 행 경계에 놓입니다.
+    (값에 줄바꿈이 들어 있어도 행 하나가 항목 하나입니다.)
+
+    Args:
+        table (str): 테이블 이름
+        columns (list[str]): 컬럼 이름 (rows의 값 순서)
+        rows (iterable): 행 튜플. 서버 측 커서를 넘기면 테이블 전체를 메모리에 올리지 않습니다.
+        create_statement (str, optional): SHOW CREATE TABLE 결과. 있으면 DROP/CREATE 문을 앞에 씁니다.
+        checksum (TableChecksum, optional): 행마다 갱신할 체크섬
+    """
+    name = quote_identifier(table)
+    yield DUMP_HEADER.encode("utf-8")
+    if create_statement:
+        yield f"DROP TABLE IF EXISTS {name};\n".encode("utf-8")
+        yield (create_statement.rstrip().rstrip(";") + ";\n").encode("utf-8")
+
+    prefix = f"INSERT INTO {name} ({','.join(quote_identifier(column) for column in columns)}) VALUES "
+    for row in rows:
+        literal = row_literal(row)
+        if checksum is not None:
+            checksum.update(literal)
+        yield (prefix + literal + ";\n").encode("utf-8")
+
+
+def iter_statements(chunks):
+    """
+    덤프 바이트 청크를 SQL 문 단위로 나눠 반환합니다. 문자열 값 안의 줄바꿈과 세미콜론도 처리합니다.
+    """
+    pending = b""
+    buffer = ""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            buffer += line.decode("utf-8") + "\n"
+            if sqlite3.complete_statement(buffer):
+                yield buffer.strip()
+                buffer = ""
+    buffer += pending.decode("utf-8")
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def restore_into_sqlite(connection, table: str, columns, chunks) -> int:
+    """
+    덤프의 INSERT 문을 SQLite에 실행해 테이블을 복원합니다. MySQL 전용 DDL과 SET 문은 건너뛰고,
+    자료형 변환이 일어나지 않도록 자료형 없는 컬럼으로 테이블을 만듭니다.
+
+    Returns:
+        int: 실행한 INSERT 문 수
+    """
+    name = quote_identifier(table)
+    connection.execute(f"DROP TABLE IF EXISTS {name}")
+    connection.execute(f"CREATE TABLE {name} ({','.join(quote_identifier(column) for column in columns)})")
+    executed = 0
+    for statement in iter_statements(chunks):
+        if statement.startswith("INSERT INTO"):
+            connection.execute(statement)
+            executed += 1
+    connection.commit()
+    return executed
+
+
+def table_checksum(cursor, table: str, columns) -> TableChecksum:
+    """복원한 테이블을 읽어 체크섬을 계산합니다. (DB-API 커서: sqlite3, pymysql 모두 사용 가능)"""
+    checksum = TableChecksum()
+    cursor.execute(f"SELECT {','.join(quote_identifier(column) for column in columns)} FROM {quote_identifier(table)}")
+    for row in cursor:
+        checksum.update(row_literal(row))
+    return checksum
@@ -1,7 +1,6 @@
 import requests
 import pandas as pd
 from xml.etree import ElementTree
-import time
 from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
@@ -11,7 +10,9 @@ from .DataProcessor import DataProcessor
 from .AISummarizer import AISummarizer
 from .APISender import APISender
 from .DatabaseManager import DatabaseManager
+from .DataSchema import value_counts
 from .Notifier import Notifier
+from .Instrumentation import span
 
 class WorkFlowManager:
     def __init__(self, mode):
@@ -31,6 +32,15 @@ class WorkFlowManager:
 
         load_dotenv()
 
+    def save_local(self, subject, df, assembly=None):
+        """save 모드에서 수집한 데이터를 로컬 Parquet 데이터셋(LocalStore)에 upsert 합니다."""
+        # pyarrow는 save 모드에서만 필요하므로 여기서 import 합니다.
+        from .LocalStore import LocalStore
+
+        store = LocalStore()
+        count = store.write(subject, df, assembly=assembly)
+        print(f'[데이터 저장 완료: {store.root}/{subject} ({count}건)]')
+
     def update_bills_data(self, start_date=None, end_date=None, age=None):
         """법안 데이터를 수집해 AI 요약 후 API 서버로 전송하는 함수
 
@@ -102,13 +112,15 @@ class WorkFlowManager:
             print("새로운 데이터가 없습니다. 코드를 종료합니다.")
             return None
 
-        print(f"수집된 신규 법안 발의자 종류: {df_bills['proposerKind'].value_counts()}")
+        print(f"수집된 신규 법안 발의자 종류: {value_counts(df_bills['proposerKind'])}")
 
         # AI 요약 컬럼 추가
         processor.add_AI_summary_columns(df_bills)
 
-        # 의원 데이터 처리
-        df_bills_congressman = processor.process_congressman_bills(df_bills)
+        # 의원 데이터 처리 (발의자 정보는 의원 발의 법안에 대해서만 수집)
+        df_congressman_bills = df_bills[df_bills['proposerKind'] == '의원']
+        df_coactors = fetcher.fetch_bills_coactors(df_congressman_bills) if len(df_congressman_bills) else None
+        df_bills_congressman = processor.process_congressman_bills(df_bills, df_coactors)
 
         # 위원장 데이터 처리 TODO: 민준님 작업 이후 다시 위원장안 로직 포함
         # df_bills_chair, df_alternatives = processor.process_chairman_bills(df_bills)
@@ -192,8 +204,7 @@ class WorkFlowManager:
             print('[테스트 모드 : 데이터 요약 및 전송 생략]')
 
         elif mode == 'save':
-            df_bills.to_csv('df_bills.csv', index=False)
-            print('[데이터 저장 완료]')
+            self.save_local('bills', df_bills)
 
         elif mode == 'fetch':
             print('[데이터 수집 모드: 중복 데이터 제거 없이 데이터를 수집합니다.]')
@@ -290,7 +301,7 @@ class WorkFlowManager:
             print("[테스트 모드 : DB에 데이터를 전송하지 않습니다.]")
 
         elif mode == 'save':
-            df_lawmakers.to_csv('df_lawmakers.csv', index=False)
+            self.save_local('lawmakers', df_lawmakers)
 
         return df_lawmakers
 
@@ -378,8 +389,7 @@ class WorkFlowManager:
             print('[테스트 모드 : 데이터 전송 생략]')
 
         elif mode == 'save':
-            df_stage.to_csv('bills_status.csv', index=False)
-            print('[데이터 저장 완료]')
+            self.save_local('bill_timeline', df_stage, assembly=age)
 
         return df_stage
 
@@ -445,8 +455,7 @@ class WorkFlowManager:
             print('[테스트 모드 : 데이터 전송 생략]')
 
         elif mode == 'save':
-            df_result.to_csv('bills_result.csv', index=False)
-            print('[데이터 저장 완료]')
+            self.save_local('bill_result', df_result, assembly=age)
 
         return df_result
 
@@ -519,8 +528,7 @@ class WorkFlowManager:
         elif mode == 'test':
             print('[테스트 모드 : 데이터 전송 생략]')
         elif mode == 'save':
-            df_vote.to_csv('bills_vote.csv', index=False)
-            print('[데이터 저장 완료]')
+            self.save_local('bill_vote', df_vote, assembly=age)
 
         if df_vote_party is None or df_vote_party.empty:
             print("❌ [ERROR] 정당별 표결 결과 데이터가 없습니다.")
@@ -542,8 +550,7 @@ class WorkFlowManager:
         elif mode == 'test':
             print('[테스트 모드 : 데이터 전송 생략]')
         elif mode == 'save':
-            df_vote_party.to_csv('vote_party.csv', index=False)
-            print('[데이터 저장 완료]')
+            self.save_local('vote_party', df_vote_party, assembly=age)
 
         return df_vote, df_vote_party
 
@@ -570,36 +577,39 @@ class WorkFlowManager:
         all_data = []
         pageNo = 1
         max_retry = 3
-        start_time = time.time()
-
-        while True:
-            params.update({'pageNo': str(pageNo)})
-            try:
-                response = requests.get(url, params=params, timeout=10)
-                if response.status_code == 200:
-                    root = ElementTree.fromstring(response.content)
-                    items = root.find('body').find('items')
-                    if items is None or len(items) == 0:
-                        break
-                    data = [{child.tag: child.text for child in item} for item in items]
-                    all_data.extend(data)
-                else:
-                    print(f"❌ [ERROR] 응답 코드: {response.status_code} (Page {pageNo})")
+        with span("fetch.bills_content") as fetch_timing:
+            while True:
+                params.update({'pageNo': str(pageNo)})
+                try:
+                    with span("http.request") as timing:
+                        response = requests.get(url, params=params, timeout=10)
+                        timing.add(bytes=len(response.content))
+                    if response.status_code == 200:
+                        with span("parse.xml", bytes=len(response.content)) as timing:
+                            root = ElementTree.fromstring(response.content)
+                            items = root.find('body').find('items')
+                            if items is None or len(items) == 0:
+                                break
+                            data = [{child.tag: child.text for child in item} for item in items]
+                            timing.add(rows=len(data))
+                        all_data.extend(data)
+                    else:
+                        print(f"❌ [ERROR] 응답 코드: {response.status_code} (Page {pageNo})")
+                        max_retry -= 1
+                except Exception as e:
+                    print(f"❌ [ERROR] 데이터 처리 중 오류 발생: {e}")
                     max_retry -= 1
-            except Exception as e:
-                print(f"❌ [ERROR] 데이터 처리 중 오류 발생: {e}")
-                max_retry -= 1
 
-            if max_retry <= 0:
-                print("🚨 [WARNING] 최대 재시도 횟수 초과! 데이터 수집 중단.")
-                break
+                if max_retry <= 0:
+                    print("🚨 [WARNING] 최대 재시도 횟수 초과! 데이터 수집 중단.")
+                    break
 
-            pageNo += 1
+                pageNo += 1
+            fetch_timing.add(rows=len(all_data))
 
         df_bills_content = pd.DataFrame(all_data)
 
-        end_time = time.time()
-        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {end_time - start_time:.2f}초")
+        print(f"\n✅ [INFO] 모든 파일 다운로드 완료! ⏳ 전체 소요 시간: {fetch_timing.elapsed:.2f}초")
         print(f"📌 [INFO] 총 {len(df_bills_content)} 개의 법안 수집됨.")
 
         if df_bills_content.empty:
@@ -635,8 +645,7 @@ class WorkFlowManager:
         elif mode == 'test':
             print('[테스트 모드 : 데이터 전송 생략]')
         elif mode == 'save':
-            df_alternatives.to_csv('bills_alternatives.csv', index=False)
-            print('[데이터 저장 완료]')
+            self.save_local('alternative_bill', df_alternatives)
 
         return df_alternatives
 
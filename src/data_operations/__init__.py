@@ -5,16 +5,24 @@
 
     from data_operations import WorkFlowManager
 
+각 클래스는 처음 접근할 때 해당 모듈을 import 합니다(PEP 562).
+패키지만 import 해서는 pandas, pymysql, langchain 등 무거운 의존성이 로드되지 않으므로
+LLM을 쓰지 않는 크론 작업(tools/collect_votes.py 등)의 시작 시간이 짧아집니다.
 """
 
-from .DatabaseManager import DatabaseManager
-from .DataFetcher import DataFetcher
-from .DataProcessor import DataProcessor
-from .AISummarizer import AISummarizer
-from .APISender import APISender
-from .WorkFlowManager import WorkFlowManager
-from .Notifier import Notifier
-from .ReportManager import ReportManager
+import importlib
+
+# 공개 클래스 이름 -> 정의된 하위 모듈
+_LAZY_ATTRS = {
+    "DatabaseManager": ".DatabaseManager",
+    "DataFetcher": ".DataFetcher",
+    "DataProcessor": ".DataProcessor",
+    "AISummarizer": ".AISummarizer",
+    "APISender": ".APISender",
+    "WorkFlowManager": ".WorkFlowManager",
+    "Notifier": ".Notifier",
+    "ReportManager": ".ReportManager",
+}
 
 __all__ = [
     "DatabaseManager",
@@ -26,3 +34,17 @@ __all__ = [
     "Notifier",
     "ReportManager"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # 다음 접근부터는 모듈 속성으로 바로 찾도록 캐시합니다.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
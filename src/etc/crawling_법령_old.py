@@ -1,6 +1,6 @@
 import pandas as pd
 import os
-import time
+import sys
 import re
 from xml.etree import ElementTree # 법령 목록 조회를 위해 다시 사용
 import json
@@ -8,15 +8,31 @@ from tqdm.asyncio import tqdm
 from urllib.parse import urljoin, parse_qs, urlparse
 import io
 import asyncio
-import aiohttp
 import aiofiles
 import aiofiles.os as aio_os
 
+# 스크립트를 직접 실행할 때 공통 수집 엔진(data_operations)을 찾을 수 있도록 src 디렉토리를 sys.path에 추가합니다.
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from data_operations.CollectionEngine import CollectionEngine, RetryableResponseError, run_worker_pool
+from data_operations.CrawlManifest import CrawlManifest, content_hash
+from data_operations.PackedStore import PackedStore
+
 # --- 사용자 정의 예외 ---
-class IPBlockedError(Exception):
+class IPBlockedError(RetryableResponseError):
     """IP 접근 제한 시 발생하는 사용자 정의 예외"""
     pass
 
+
+def detect_ip_block(content):
+    """응답 본문이 IP 차단 안내 페이지이면 IPBlockedError를 발생시켜 엔진이 재시도하도록 합니다."""
+    if b'IP' in content and b'alert' in content:
+        decoded_content = content.decode('utf-8', errors='ignore')
+        if '접근제한된 IP 입니다' in decoded_content:
+            raise IPBlockedError("IP가 차단되었습니다.")
+
 # --- 상수 정의 ---
 DEFAULT_HEADERS = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -29,54 +45,50 @@ BASE_URL_SERVICE = "http://www.law.go.kr/DRF/lawService.do"
 BASE_OUTPUT_DIR = os.path.join("data", "raw_laws")
 
 
+async def _truncate_quietly(file, size):
+    """기록에 실패한 뒤 파일을 size 바이트로 되돌립니다. 되돌리지 못하면 다음 실행의 truncate_unindexed에 맡깁니다."""
+    try:
+        await file.truncate(size)
+        # 추가 모드라도 tell()은 현재 위치를 돌려주므로, 다음 레코드의 오프셋이 맞도록 위치도 되돌립니다.
+        await file.seek(size)
+    except Exception as e:
+        tqdm.write(f"  기록에 실패한 줄을 잘라내지 못했습니다: {e}")
+
+
 class LawScraper:
     """
     대한민국 법제처 국가법령정보센터의 법령 데이터를 수집하는 비동기 스크레이퍼.
     (IP 차단 방지를 위한 동시성 제어 및 재시도 로직 강화)
+
+    output_format이 'files'이면 법령마다 .txt/.json 파일과 JSONL 한 줄을 저장하고,
+    'packed'이면 본문과 원문 JSON을 압축 세그먼트(laws-*.zst)에 이어 붙여 저장합니다.
     """
 
-    def __init__(self, oc_id, request_delay=1.0, max_retries=3, max_concurrency=5):
+    def __init__(self, oc_id, request_delay=1.0, max_retries=3, max_concurrency=5, output_format='files'):
         if not oc_id:
             raise ValueError("OC ID (인증키)는 필수입니다.")
+        if output_format not in ('files', 'packed'):
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {output_format}")
+        self.output_format = output_format
         self.oc_id = oc_id
         self.request_delay = request_delay # 요청 간 딜레이 증가
         self.max_retries = max_retries
-        self.semaphore = asyncio.Semaphore(max_concurrency) # 동시 요청 수 제한
+        # 공통 수집 엔진: 동시 요청 수 제한, IP 차단 감지, 지수 백오프(2, 4, 8초...) 재시도
+        self.engine = CollectionEngine(
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            request_delay=request_delay,
+            backoff_base=2.0,
+            headers=DEFAULT_HEADERS,
+            response_validator=detect_ip_block,
+        )
 
         os.makedirs(BASE_OUTPUT_DIR, exist_ok=True)
 
-    async def _make_request(self, session, method, url, params=None, data=None, headers=None, allow_redirects=True):
-        """중앙 집중식 비동기 요청 처리 메서드 (동시성 제어 및 IP 차단 감지 추가)"""
-        async with self.semaphore: # 한 번에 정해진 수의 요청만 실행
-            await asyncio.sleep(self.request_delay)
-            last_exception = None
-            req_headers = headers or session.headers
-            
-            for attempt in range(self.max_retries):
-                try:
-                    async with session.request(method, url, params=params, data=data, headers=req_headers,
-                                               allow_redirects=allow_redirects, timeout=30) as response:
-                        response.raise_for_status()
-                        content = await response.read()
-
-                        # IP 차단 메시지 확인
-                        if b'IP' in content and b'alert' in content:
-                            decoded_content = content.decode('utf-8', errors='ignore')
-                            if '접근제한된 IP 입니다' in decoded_content:
-                                raise IPBlockedError("IP가 차단되었습니다.")
-
-                        return content, response.url
-                except (aiohttp.ClientError, asyncio.TimeoutError, IPBlockedError) as e:
-                    last_exception = e
-                    tqdm.write(f"⚠️ 요청 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
-                    if attempt < self.max_retries - 1:
-                        # 지수 백오프: 2, 4, 8초... 순으로 대기 시간 증가
-                        wait_time = 2 ** (attempt + 1) 
-                        tqdm.write(f"   ➡️ {wait_time}초 후 재시도합니다...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        tqdm.write(f"❌ 최대 재시도({self.max_retries}회) 후 요청 최종 실패. URL: {url}, 오류: {last_exception}")
-            return None, None
+    async def _make_request(self, engine, method, url, params=None, data=None, headers=None, allow_redirects=True):
+        """중앙 집중식 비동기 요청 처리 메서드 (동시성 제어, IP 차단 감지, 재시도는 CollectionEngine이 처리)"""
+        return await engine.request(method, url, params=params, data=data, headers=headers,
+                                    allow_redirects=allow_redirects)
 
     async def _parse_law_list_xml_response(self, response_content):
         """법령 목록 API의 XML 응답을 파싱합니다."""
@@ -91,8 +103,12 @@ class LawScraper:
             tqdm.write(f" ❌ XML 파싱 중 오류 발생: {e}")
             return [], 0
 
-    async def fetch_law_list(self, session, efyd_range=None, display=100, max_pages=None):
-        """시행일자 범위를 기반으로 법령 목록을 비동기로 수집합니다. (XML 방식)"""
+    async def fetch_law_list(self, engine, efyd_range=None, display=100, max_pages=None, manifest=None):
+        """
+        시행일자 범위를 기반으로 법령 목록을 비동기로 수집합니다. (XML 방식)
+
+        manifest가 주어지면 조회를 마친 페이지를 체크포인트로 저장하고, 재실행 시 남은 페이지만 요청합니다.
+        """
         if not efyd_range:
             print("⚠️ 시행일자 범위(efyd_range)는 반드시 입력해야 합니다.")
             return pd.DataFrame()
@@ -109,10 +125,24 @@ class LawScraper:
             'efYd': efyd_range 
         }
 
-        content, _ = await self._make_request(session, 'GET', BASE_URL_SEARCH, params=params)
-        if not content: return pd.DataFrame()
+        listed_pages = {}
+        if manifest is not None:
+            listed_pages = manifest.start_listing({k: v for k, v in params.items() if k not in ('OC', 'page')})
+            if listed_pages:
+                print(f" 📌 목록 체크포인트에서 {len(listed_pages)}페이지를 불러왔습니다.")
+
+        total_count = manifest.get_meta('listing_total') if manifest is not None else None
+        if 1 in listed_pages and total_count is not None:
+            initial_data = listed_pages[1]
+        else:
+            content, _ = await self._make_request(engine, 'GET', BASE_URL_SEARCH, params=params)
+            if not content: return pd.DataFrame()
+
+            initial_data, total_count = await self._parse_law_list_xml_response(content)
+            if manifest is not None:
+                manifest.set_meta('listing_total', total_count)
+                manifest.save_listing_page(1, initial_data)
 
-        initial_data, total_count = await self._parse_law_list_xml_response(content)
         if total_count == 0:
             print("⚠️ 검색 결과가 없습니다.")
             return pd.DataFrame()
@@ -123,12 +153,22 @@ class LawScraper:
         print(f"📊 총 {total_count}개의 법령 발견. {pages_to_fetch}페이지에 걸쳐 수집합니다.")
 
         if pages_to_fetch > 1:
-            tasks = [self._make_request(session, 'GET', BASE_URL_SEARCH, params={**params, 'page': i}) for i in range(2, pages_to_fetch + 1)]
+            async def fetch_page(page):
+                page_content, _ = await self._make_request(engine, 'GET', BASE_URL_SEARCH, params={**params, 'page': page})
+                return page, page_content
+
+            for page in range(2, pages_to_fetch + 1):
+                if page in listed_pages:
+                    all_data.extend(listed_pages[page])
+            tasks = [fetch_page(i) for i in range(2, pages_to_fetch + 1) if i not in listed_pages]
             for f in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="📖 법령 목록 수집 중"):
-                page_content, _ = await f
+                page, page_content = await f
                 if page_content:
                     data, _ = await self._parse_law_list_xml_response(page_content)
                     if data: all_data.extend(data)
+                    # 요청에 성공한 페이지만 저장해 실패한 페이지는 다음 실행에서 다시 조회합니다.
+                    if manifest is not None:
+                        manifest.save_listing_page(page, data)
         
         df = pd.DataFrame(all_data)
         print(f"\n🎉 법령 목록 수집 완료! 총 {len(df)}건의 데이터를 수집했습니다.")
@@ -243,12 +283,12 @@ class LawScraper:
             traceback.print_exc()
             return None
 
-    async def _fetch_and_save_law(self, session, law_row, period_output_dir):
+    async def _fetch_and_save_law(self, engine, law_row, period_output_dir):
         """단일 법령의 본문을 수집하고 텍스트 파일과 JSON 원본 파일로 저장합니다. (JSON 방식)"""
         law_id = law_row['법령ID']
         params = {'OC': self.oc_id, 'target': 'law', 'type': 'JSON', 'ID': law_id}
         
-        response_content, _ = await self._make_request(session, 'GET', BASE_URL_SERVICE, params=params)
+        response_content, _ = await self._make_request(engine, 'GET', BASE_URL_SERVICE, params=params)
         if not response_content:
             return {'status': 'DOWNLOAD_FAIL', 'law_info': law_row}
 
@@ -261,6 +301,10 @@ class LawScraper:
         if not text_content:
             return {'status': 'PARSE_FAIL', 'law_info': law_row}
 
+        if self.output_format == 'packed':
+            # 파일을 만들지 않고 원문 JSON과 함께 반환하면 _process_laws_batch가 세그먼트에 기록합니다.
+            return {'status': 'SUCCESS', 'text': text_content, 'raw': json_data, 'law_info': law_row}
+
         base_filename = f"{law_row['법령ID']}_{self._sanitize_filename(law_row['법령명한글'])}"
         txt_path = os.path.join(period_output_dir, f"{base_filename}.txt")
         json_path = os.path.join(period_output_dir, f"{base_filename}.json")
@@ -278,25 +322,78 @@ class LawScraper:
         
         return {'status': 'SUCCESS', 'text': text_content, 'law_info': law_row}
 
-    async def _process_laws_batch(self, session, law_df, period_output_dir):
-        """주어진 데이터프레임의 법령들을 수집하고 결과를 반환합니다."""
-        if not isinstance(law_df, pd.DataFrame) or law_df.empty: return pd.DataFrame(), {}
+    async def _process_laws_batch(self, engine, law_df, period_output_dir, jsonl_path=None, manifest=None):
+        """
+        주어진 데이터프레임의 법령들을 고정된 수의 워커로 수집하고 상태별 결과를 반환합니다.
+
+        본문은 메모리에 모으지 않고, 수집이 끝난 법령부터 jsonl_path에 한 줄씩 추가합니다.
+        output_format이 'packed'이면 JSONL 대신 period_output_dir의 PackedStore 세그먼트에 추가합니다.
+        manifest가 주어지면 법령별 상태, 본문 해시, 레코드 위치를 함께 기록합니다.
+        """
+        status_map = {'SUCCESS': [], 'DOWNLOAD_FAIL': [], 'PARSE_FAIL': [], 'SAVE_FAIL': []}
+        if not isinstance(law_df, pd.DataFrame) or law_df.empty: return status_map
 
         print(f"➡️ {len(law_df)}개 법령의 본문 수집 및 저장 시작...")
-        
-        tasks = [self._fetch_and_save_law(session, row, period_output_dir) for _, row in law_df.iterrows()]
-        results = await tqdm.gather(*tasks, desc="✍️  법령 본문 수집/저장 중")
 
-        status_map = {'SUCCESS': [], 'DOWNLOAD_FAIL': [], 'PARSE_FAIL': [], 'SAVE_FAIL': []}
-        all_texts = []
-        for res in results:
-            status_map.setdefault(res['status'], []).append(res['law_info'])
-            all_texts.append(res.get('text'))
-        
-        df_with_texts = law_df.copy()
-        df_with_texts['법령본문'] = all_texts
-        
-        return df_with_texts, status_map
+        write_lock = asyncio.Lock()
+        packed = self.output_format == 'packed'
+        store = PackedStore(period_output_dir, prefix="laws") if packed else None
+        jsonl_name = os.path.basename(jsonl_path) if jsonl_path and not packed else None
+        if manifest is not None:
+            # 이전 실행이 중단되며 남긴, 매니페스트에 커밋되지 않은 레코드를 먼저 잘라냅니다.
+            for name in (store.segments() if packed else [jsonl_name] if jsonl_name else []):
+                manifest.truncate_unindexed(name)
+        # 매니페스트에 바이트 오프셋을 기록하기 위해 바이너리 추가 모드로 엽니다.
+        jsonl_file = await aiofiles.open(jsonl_path, 'ab') if jsonl_name else None
+
+        try:
+            with tqdm(total=len(law_df), desc="✍️  법령 본문 수집/저장 중") as pbar:
+                async def handle(row):
+                    if manifest is not None:
+                        manifest.mark_in_flight(row['법령ID'])
+                    res = await self._fetch_and_save_law(engine, row, period_output_dir)
+                    status = res['status']
+                    location = {}
+                    if status == 'SUCCESS':
+                        record = {**res['law_info'], '법령본문': res['text']}
+                        try:
+                            if store is not None:
+                                record['원문'] = res['raw']
+                                location = store.append_record(record)
+                                store.flush()
+                            elif jsonl_file is not None:
+                                line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+                                async with write_lock:
+                                    offset = await jsonl_file.tell()
+                                    try:
+                                        await jsonl_file.write(line)
+                                        # 매니페스트에 커밋되는 위치가 항상 디스크에 있도록 바로 내보냅니다.
+                                        await jsonl_file.flush()
+                                    except Exception:
+                                        # 일부만 쓰인 줄이 다음 레코드 앞에 끼어 남지 않도록 잘라냅니다.
+                                        await _truncate_quietly(jsonl_file, offset)
+                                        raise
+                                location = {'file': jsonl_name, 'offset': offset, 'length': len(line)}
+                        except Exception as e:
+                            tqdm.write(f"  [실패] ID {row['법령ID']}: 결과 기록 중 오류 발생 - {e}")
+                            status = 'SAVE_FAIL'
+                    # 기록까지 끝나 최종 상태가 정해진 뒤에 집계합니다.
+                    status_map.setdefault(status, []).append(res['law_info'])
+                    if manifest is not None:
+                        text = res.get('text') if status == 'SUCCESS' else None
+                        manifest.record(res['law_info']['법령ID'], status,
+                                        content_hash=content_hash(text) if text else None, **location)
+                    pbar.update(1)
+
+                rows = (row.to_dict() for _, row in law_df.iterrows())
+                await run_worker_pool(rows, handle, num_workers=self.engine.max_concurrency)
+        finally:
+            if jsonl_file is not None:
+                await jsonl_file.close()
+            if store is not None:
+                store.close()
+
+        return status_map
 
     async def _write_period_summary(self, period_output_dir, filename_suffix, status_map):
         """수집 기간에 대한 요약 리포트 파일을 작성합니다."""
@@ -379,8 +476,8 @@ async def main():
             await f.write(report_str)
         print(f"\n💾 종합 리포트가 '{report_path}'에 업데이트되었습니다.")
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        scraper = LawScraper(oc_id=MY_OC_ID)
+    scraper = LawScraper(oc_id=MY_OC_ID)
+    async with scraper.engine as engine:
 
         async def run_collection(params, is_test=False):
             """단일 수집 작업을 실행하고 결과를 반환하는 함수"""
@@ -390,65 +487,67 @@ async def main():
             
             print(f"\n" + "="*50 + f"\n▶️ {'테스트' if is_test else '전체'} 수집 실행: {filename_suffix}\n" + "="*50)
             
-            list_params = {'display': 5 if is_test else 100, 'max_pages': 1 if is_test else None}
-            df_list = await scraper.fetch_law_list(session, **params, **list_params)
-
-            if df_list is None or df_list.empty:
-                print(f"\n⚠️ {filename_suffix} 조건에 해당하는 데이터가 없습니다.")
-                return None
-
-            print("\n--- 시행일자별 법령 수 ---")
-            print(df_list['시행일자'].value_counts())
-            print("-------------------------\n")
-
-            print(f"[검증] 기존에 수집된 파일을 확인하여 누락된 항목만 선별합니다...")
-            rows_to_collect = []
-            rows_to_skip = []
-            
-            for _, row in df_list.iterrows():
-                base_filename = f"{row['법령ID']}_{scraper._sanitize_filename(row['법령명한글'])}"
-                txt_path = os.path.join(period_output_dir, f"{base_filename}.txt")
-                json_path = os.path.join(period_output_dir, f"{base_filename}.json")
-                if await aio_os.path.exists(txt_path) and await aio_os.path.exists(json_path):
-                    rows_to_skip.append(row)
+            # 기간별 매니페스트: 수집 현황과 체크포인트(목록 페이지, 처리 중 항목)를 함께 기록합니다.
+            manifest = CrawlManifest(period_output_dir)
+            try:
+                list_params = {'display': 5 if is_test else 100, 'max_pages': 1 if is_test else None}
+                df_list = await scraper.fetch_law_list(engine, **params, **list_params, manifest=manifest)
+
+                if df_list is None or df_list.empty:
+                    print(f"\n⚠️ {filename_suffix} 조건에 해당하는 데이터가 없습니다.")
+                    return None
+
+                print("\n--- 시행일자별 법령 수 ---")
+                print(df_list['시행일자'].value_counts())
+                print("-------------------------\n")
+
+                print(f"[검증] 매니페스트를 확인하여 누락된 항목만 선별합니다...")
+                if len(manifest) == 0:
+                    # 매니페스트 도입 이전에 수집된 디렉토리는 파일 목록을 한 번 읽어 등록합니다.
+                    seeded = manifest.seed_from_directory(suffixes=('.txt', '.json'))
+                    if seeded:
+                        print(f" 📇 기존 수집 파일 {seeded}건을 매니페스트에 등록했습니다.")
+                completed_ids = manifest.completed_ids()
+                in_flight_ids = manifest.in_flight_ids()
+
+                rows_to_collect = []
+                rows_to_skip = []
+                for row in df_list.to_dict('records'):
+                    if str(row['법령ID']) in completed_ids:
+                        rows_to_skip.append(row)
+                    else:
+                        rows_to_collect.append(row)
+
+                if in_flight_ids:
+                    # 이전 실행이 중단될 때 처리 중이던 법령부터 다시 수집합니다.
+                    rows_to_collect.sort(key=lambda row: str(row['법령ID']) not in in_flight_ids)
+                    print(f" 📌 이전 실행에서 처리 중이던 {len(in_flight_ids)}건부터 이어서 수집합니다.")
+
+                status_map = {'SKIPPED_EXISTS': rows_to_skip}
+
+                if rows_to_collect:
+                    # 수집 결과는 완료되는 즉시 JSONL에 추가됩니다. 이미 수집된 법령은 건너뛰므로
+                    # 여러 번 실행해도 기간별 JSONL 하나에 중복 없이 누적됩니다.
+                    jsonl_path = os.path.join(period_output_dir, f"collected_laws_{filename_suffix}.jsonl")
+                    df_to_collect = pd.DataFrame(rows_to_collect).reset_index(drop=True)
+                    collected_status_map = await scraper._process_laws_batch(
+                        engine, df_to_collect, period_output_dir, jsonl_path, manifest=manifest
+                    )
+                    for key, value in collected_status_map.items():
+                        status_map.setdefault(key, []).extend(value)
+                    saved_to = period_output_dir if scraper.output_format == 'packed' else jsonl_path
+                    print(f"\n💾 수집 결과({scraper.output_format})가 '{saved_to}'에 추가되었습니다.")
                 else:
-                    rows_to_collect.append(row)
-            
-            status_map = {'SKIPPED_EXISTS': [dict(row) for row in rows_to_skip]}
-            df_final_collected = pd.DataFrame()
-
-            if rows_to_collect:
-                df_to_collect = pd.DataFrame(rows_to_collect).reset_index(drop=True)
-                df_final_collected, collected_status_map = await scraper._process_laws_batch(session, df_to_collect, period_output_dir)
-                for key, value in collected_status_map.items():
-                    status_map.setdefault(key, []).extend(value)
-            else:
-                print(" ✅ 모든 항목이 이미 수집되었습니다. 신규 수집을 건너뜁니다.")
+                    print(" ✅ 모든 항목이 이미 수집되었습니다. 신규 수집을 건너뜁니다.")
 
-            await scraper._write_period_summary(period_output_dir, filename_suffix, status_map)
+                # 모든 항목을 수집했으면 목록 체크포인트를 지워 다음 실행에서 목록을 새로 조회합니다.
+                if len(status_map.get('SUCCESS', [])) == len(rows_to_collect):
+                    manifest.clear_listing()
+            finally:
+                # 중단되더라도 그때까지의 수집 결과와 체크포인트는 매니페스트에 남깁니다.
+                manifest.close()
 
-            print(f"\n[통합] 기존 파일과 새로 수집된 데이터를 통합합니다...")
-            skipped_texts = []
-            for row_dict in status_map['SKIPPED_EXISTS']:
-                base_filename = f"{row_dict['법령ID']}_{scraper._sanitize_filename(row_dict['법령명한글'])}"
-                txt_path = os.path.join(period_output_dir, f"{base_filename}.txt")
-                try:
-                    async with aiofiles.open(txt_path, 'r', encoding='utf-8') as f:
-                        text = await f.read()
-                    skipped_texts.append(text)
-                except Exception:
-                    skipped_texts.append(None)
-            
-            df_skipped = pd.DataFrame(status_map['SKIPPED_EXISTS'])
-            if not df_skipped.empty:
-                df_skipped['법령본문'] = skipped_texts
-            
-            df_final_total = pd.concat([df_final_collected, df_skipped], ignore_index=True)
-            if not df_final_total.empty:
-                df_final_total = df_final_total.set_index('법령ID').loc[df_list['법령ID'].astype(str)].reset_index()
-                json_path = os.path.join(period_output_dir, f"collected_laws_{filename_suffix}.json")
-                df_final_total.to_json(json_path, orient='records', force_ascii=False, indent=4)
-                print(f"\n💾 최종 통합 결과(JSON)가 '{json_path}'에 저장되었습니다.")
+            await scraper._write_period_summary(period_output_dir, filename_suffix, status_map)
             
             return status_map
 
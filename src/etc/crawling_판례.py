@@ -5,32 +5,44 @@ LawGovKrScraper
 
 주요 기능:
 - 판례 목록 조회 및 페이징
-- PDF 다운로드 및 텍스트 추출
-- 파일 기반 중복 수집 방지
-- 속도 제한 및 허용 시간 제약
+- PDF 다운로드 및 텍스트 추출 (다운로드와 텍스트 추출을 큐로 연결한 파이프라인, 추출은 프로세스 풀에서 실행)
+- 수집 결과의 JSONL 스트리밍 저장 (고정 워커 풀로 처리해 대상 규모와 무관하게 메모리 사용량 일정)
+- 선택적 압축 세그먼트 저장 형식 (output_format='packed': 판례별 파일 대신 PackedStore 세그먼트에 저장)
+- 출력 디렉토리별 매니페스트(SQLite) 기반 중복 수집 방지
+- 속도 제한 및 허용 시간 제약 (허용 시간이 끝나면 새 항목 수집을 멈추고 다음 실행에서 이어서 수집)
+- 중단 후 재시작 시 체크포인트(조회한 목록 페이지, 처리 중이던 항목)부터 이어서 수집
 - 로깅 및 리포트 생성
 - 테스트 모드 지원
 """
 import os
 import re
-import time
+import sys
 import datetime
 import io
 import json
 import logging
 import asyncio
-from collections import deque
+import time
+from concurrent.futures import ProcessPoolExecutor
 from xml.etree import ElementTree
 from urllib.parse import urljoin, parse_qs, urlparse
 
 import pandas as pd
-import aiohttp
 import aiofiles
 import aiofiles.os as aio_os
 from bs4 import BeautifulSoup
 import pdfplumber
 from tqdm import tqdm
 
+# 스크립트를 직접 실행할 때 공통 수집 엔진(data_operations)을 찾을 수 있도록 src 디렉토리를 sys.path에 추가합니다.
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from data_operations.CollectionEngine import CollectionEngine, run_worker_pool
+from data_operations.CrawlManifest import CrawlManifest, content_hash
+from data_operations.PackedStore import PackedStore
+
 # --- 설정 (Configuration) ---
 # 기본 출력 디렉토리. 수집된 데이터는 'data/raw'에 저장됩니다.
 BASE_OUTPUT_DIR = os.path.join("data", "raw")
@@ -58,40 +70,61 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-class RateLimiter:
+def extract_text_from_pdf(pdf_bytes: bytes) -> str | None:
     """
-    비동기 환경에서 API 요청 속도를 제어하는 클래스입니다.
-    주어진 시간(per_seconds) 동안 최대 호출 횟수(max_calls)를 제한하여 서버 부하를 줄입니다.
-
-    사용법:
-        limiter = RateLimiter(max_calls=3, per_seconds=2)
-        async with limiter:
-            # 이 블록 안의 코드는 2초에 3번 이하로만 실행됩니다.
-            await session.get(url)
+    PDF 바이너리에서 텍스트를 추출합니다.
+
+    CPU를 많이 쓰는 작업이므로 이벤트 루프가 아닌 프로세스 풀(ProcessPoolExecutor)에서 실행됩니다.
+    워커 프로세스로 전달(pickle)될 수 있도록 모듈 최상위 함수로 둡니다.
     """
-    def __init__(self, max_calls: int, per_seconds: float):
-        self.max_calls = max_calls
-        self.per_seconds = per_seconds
-        self.calls = deque()
+    if not pdf_bytes:
+        return None
+    try:
+        with io.BytesIO(pdf_bytes) as pdf_file, pdfplumber.open(pdf_file) as pdf:
+            return "\n".join(page.extract_text() or "" for page in pdf.pages)
+    except Exception as e:
+        logging.warning(f"PDF 텍스트 추출 실패: {e}")
+        return None
+
+
+async def _truncate_quietly(file, size):
+    """기록에 실패한 뒤 파일을 size 바이트로 되돌립니다. 되돌리지 못하면 다음 실행의 truncate_unindexed에 맡깁니다."""
+    try:
+        await file.truncate(size)
+        # 추가 모드라도 tell()은 현재 위치를 돌려주므로, 다음 레코드의 오프셋이 맞도록 위치도 되돌립니다.
+        await file.seek(size)
+    except Exception as e:
+        logging.error(f"기록에 실패한 줄을 잘라내지 못했습니다: {e}")
+
+
+class StageMetrics:
+    """파이프라인 단계(다운로드, 텍스트 추출)별 처리 건수와 처리량을 집계하는 클래스"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.bytes = 0
+        self.busy_sec = 0.0  # 각 건의 처리 시간 합계
+        self.first_started = None
+        self.last_finished = None
 
-    async def __aenter__(self):
-        """async with 진입 시 호출 속도를 체크하고 필요시 대기합니다."""
+    def add(self, started: float, nbytes: int):
+        """time.monotonic() 기준 시작 시각(started)부터 지금까지 처리한 한 건을 기록합니다."""
         now = time.monotonic()
-        # 오래된 호출 기록 제거
-        while self.calls and now - self.calls[0] > self.per_seconds:
-            self.calls.popleft()
-        
-        # 제한 횟수 초과 시 대기
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.per_seconds - (now - self.calls[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-        
-        self.calls.append(time.monotonic())
+        self.count += 1
+        self.bytes += nbytes
+        self.busy_sec += now - started
+        if self.first_started is None or started < self.first_started:
+            self.first_started = started
+        self.last_finished = now
+
+    def __str__(self):
+        elapsed = (self.last_finished - self.first_started) if self.count else 0.0
+        throughput = self.count / elapsed if elapsed > 0 else 0.0
+        avg = self.busy_sec / self.count if self.count else 0.0
+        return (f"{self.name}: {self.count}건, {self.bytes / 1024 / 1024:.1f}MB, "
+                f"{throughput:.2f}건/s (건당 평균 {avg:.2f}초)")
 
-    async def __aexit__(self, exc_type, exc, tb):
-        """async with 블록을 빠져나갈 때 별도 작업은 없습니다."""
-        pass
 
 async def wait_for_window(start_hour=3, end_hour=9):
     """
@@ -111,6 +144,18 @@ async def wait_for_window(start_hour=3, end_hour=9):
         logging.info(f"작업 허용 시간이 아닙니다. {int(wait_seconds // 3600)}시간 {int((wait_seconds % 3600) // 60)}분 후 작업을 시작합니다.")
         await asyncio.sleep(wait_seconds)
 
+
+def window_deadline(end_hour=9):
+    """
+    현재 작업 허용 시간 창이 끝나는 시각을 반환합니다.
+    wait_for_window 이후에 호출하며, 이 시각이 지나면 새 항목 수집을 시작하지 않습니다.
+    """
+    now = datetime.datetime.now()
+    deadline = now.replace(hour=end_hour, minute=0, second=0, microsecond=0)
+    if deadline <= now:
+        deadline += datetime.timedelta(days=1)
+    return deadline
+
 class LawGovKrScraper:
     """
     국가법령정보센터 판례 수집기 클래스.
@@ -122,49 +167,59 @@ class LawGovKrScraper:
         oc_id (str): 법제처 Open API 인증키.
         request_delay (float): 각 HTTP 요청 사이의 최소 지연 시간 (초).
         max_retries (int): 네트워크 오류 발생 시 최대 재시도 횟수.
+        max_concurrency (int): 동시에 진행할 수 있는 최대 HTTP 요청 수.
+        max_concurrent_cases (int): 동시에 다운로드할 최대 판례 수. 판례 하나당 요청이 여러 번 이어지므로
+            요청 동시성보다 조금 크게 두어 속도 제한 한도를 꽉 채우도록 합니다.
+        parse_workers (int, optional): PDF 텍스트 추출 프로세스 수. 기본값은 CPU 코어 수.
+        parse_queue_size (int, optional): 다운로드와 텍스트 추출 사이 큐의 최대 크기. 큐가 가득 차면
+            다운로드가 잠시 멈춰 메모리에 쌓이는 PDF 수를 제한합니다. 기본값은 parse_workers의 2배.
+        output_format (str): 'files'는 판례마다 .pdf/.txt 파일과 JSONL 한 줄을 저장합니다.
+            'packed'는 본문 레코드를 압축 세그먼트(cases-*.zst), PDF를 비압축 세그먼트(pdfs-*.bin)에
+            이어 붙여 저장하고 위치는 매니페스트에 기록합니다.
     """
-    def __init__(self, oc_id: str, request_delay: float = 0.2, max_retries: int = 3):
+    def __init__(self, oc_id: str, request_delay: float = 0.2, max_retries: int = 3,
+                 max_concurrency: int = 5, max_concurrent_cases: int = 10,
+                 parse_workers: int = None, parse_queue_size: int = None,
+                 output_format: str = 'files'):
         if not oc_id:
             raise ValueError("OC ID (인증키)는 필수입니다. API 키를 인자로 전달해주세요.")
+        if output_format not in ('files', 'packed'):
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {output_format}")
         self.oc_id = oc_id
         self.request_delay = request_delay
         self.max_retries = max_retries
+        self.max_concurrent_cases = max_concurrent_cases
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.parse_queue_size = parse_queue_size or self.parse_workers * 2
+        self.output_format = output_format
+        # 공통 수집 엔진: 호스트별로 2초에 3번(토큰 버킷)으로 요청 속도 제한,
+        # 재시도 간격은 1, 2, 4초... 순으로 증가
+        self.engine = CollectionEngine(
+            max_concurrency=max_concurrency,
+            rate_limit=(3, 2),
+            max_retries=max_retries,
+            request_delay=request_delay,
+            backoff_base=1.0,
+            headers=DEFAULT_HEADERS,
+        )
         # 데이터 저장을 위한 디렉토리 생성
         os.makedirs(BASE_OUTPUT_DIR, exist_ok=True)
         os.makedirs(RECOLLECT_DIR, exist_ok=True)
 
-    async def _make_request(self, session: aiohttp.ClientSession, method: str,
+    async def _make_request(self, engine: CollectionEngine, method: str,
                             url: str, params=None, data=None,
                             headers=None, allow_redirects=True):
         """
         비동기 HTTP 요청을 보내는 내부 헬퍼 메서드.
-        RateLimiter, 재시도 로직, 에러 로깅이 포함되어 있습니다.
+        속도 제한, 재시도, 에러 로깅은 공통 수집 엔진(CollectionEngine)이 처리합니다.
 
         Returns:
-            tuple[bytes | None, aiohttp.ClientResponse.url | None]: (응답 본문, 최종 URL)
+            tuple[bytes | None, yarl.URL | None]: (응답 본문, 최종 URL)
         """
-        await asyncio.sleep(self.request_delay)
-        last_exception = None
-        request_headers = headers or session.headers
-
-        for attempt in range(self.max_retries):
-            try:
-                # 2초에 3번으로 요청 속도 제한
-                async with RateLimiter(max_calls=3, per_seconds=2):
-                    async with session.request(
-                        method, url, params=params, data=data,
-                        headers=request_headers, allow_redirects=allow_redirects,
-                        timeout=aiohttp.ClientTimeout(total=30)
-                    ) as response:
-                        response.raise_for_status() # 200번대 응답이 아니면 예외 발생
-                        return await response.read(), response.url
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                last_exception = e
-                logging.warning(f"요청 실패 (시도 {attempt + 1}/{self.max_retries}): {url}, 오류: {e}")
-                await asyncio.sleep(2 ** attempt) # 재시도 간격 증가 (Exponential backoff)
-        
-        logging.error(f"최대 재시도({self.max_retries}회) 후에도 요청에 실패했습니다. URL: {url}, 최종 오류: {last_exception}")
-        return None, None
+        return await engine.request(
+            method, url, params=params, data=data,
+            headers=headers, allow_redirects=allow_redirects,
+        )
 
     async def _parse_list_response(self, content: bytes):
         """
@@ -197,19 +252,23 @@ class LawGovKrScraper:
                 pass
             return [], 0
 
-    async def fetch_case_list(self, session: aiohttp.ClientSession,
+    async def fetch_case_list(self, engine: CollectionEngine,
                               query=None, date=None, date_range=None,
-                              display=100, max_pages=None):
+                              display=100, max_pages=None, manifest=None):
         """
         판례 목록을 조회하고 모든 페이지를 순회하며 데이터를 수집합니다.
 
+        manifest가 주어지면 조회를 마친 페이지를 체크포인트로 저장하고, 같은 조건으로 다시 실행하면
+        저장된 페이지는 요청하지 않고 마지막으로 조회한 페이지 다음부터 이어서 조회합니다.
+
         Args:
-            session: aiohttp 클라이언트 세션.
+            engine: 공통 수집 엔진 (CollectionEngine).
             query (str, optional): 검색어.
             date (str, optional): 선고일자 (예: '2023.01.01').
             date_range (str, optional): 판시사항 게재일자 범위 (예: '20230101~20230131').
             display (int): 한 페이지에 표시할 항목 수 (최대 100).
             max_pages (int, optional): 수집할 최대 페이지 수. None이면 전체 페이지를 수집.
+            manifest (CrawlManifest, optional): 목록 체크포인트를 저장할 매니페스트.
 
         Returns:
             pd.DataFrame: 수집된 판례 목록 데이터프레임.
@@ -230,20 +289,35 @@ class LawGovKrScraper:
         if date_range: params['prncYd'] = date_range
 
         logging.info(f"판례 목록 수집을 시작합니다. 검색 조건: { {k:v for k,v in params.items() if k not in ['OC', 'target']} }")
-        
-        # 첫 페이지 요청으로 전체 개수 확인
-        content, _ = await self._make_request(session, 'GET', BASE_URL_SEARCH, params=params)
-        
-        if content:
-            try:
-                root = ElementTree.fromstring(content)
-                msg = root.find('message') or root.find('msg')
-                if msg is not None and msg.text:
-                    logging.info(f"API 응답 메시지: {msg.text}")
-            except Exception:
-                pass
 
-        initial_data, total_items = await self._parse_list_response(content)
+        listed_pages = {}
+        if manifest is not None:
+            listed_pages = manifest.start_listing({k: v for k, v in params.items() if k not in ('OC', 'page')})
+            if listed_pages:
+                logging.info(f"목록 체크포인트에서 {len(listed_pages)}페이지를 불러왔습니다. "
+                             f"(마지막 조회 페이지: {max(listed_pages)})")
+
+        total_items = manifest.get_meta('listing_total') if manifest is not None else None
+        if 1 in listed_pages and total_items is not None:
+            initial_data = listed_pages[1]
+        else:
+            # 첫 페이지 요청으로 전체 개수 확인
+            content, _ = await self._make_request(engine, 'GET', BASE_URL_SEARCH, params=params)
+
+            if content:
+                try:
+                    root = ElementTree.fromstring(content)
+                    msg = root.find('message') or root.find('msg')
+                    if msg is not None and msg.text:
+                        logging.info(f"API 응답 메시지: {msg.text}")
+                except Exception:
+                    pass
+
+            initial_data, total_items = await self._parse_list_response(content)
+            if content and manifest is not None:
+                manifest.set_meta('listing_total', total_items)
+                manifest.save_listing_page(1, initial_data)
+
         if total_items == 0:
             logging.info("검색된 판례가 없습니다.")
             return pd.DataFrame()
@@ -258,11 +332,17 @@ class LawGovKrScraper:
         if pages_to_fetch > 1:
             pbar = tqdm(range(2, pages_to_fetch + 1), desc="➡️  판례 목록 페이징")
             for page in pbar:
+                if page in listed_pages:
+                    all_data.extend(listed_pages[page])
+                    continue
                 params['page'] = page
                 pbar.set_postfix_str(f"페이지 {page}/{pages_to_fetch}")
-                page_content, _ = await self._make_request(session, 'GET', BASE_URL_SEARCH, params=params)
+                page_content, _ = await self._make_request(engine, 'GET', BASE_URL_SEARCH, params=params)
                 data, _ = await self._parse_list_response(page_content)
                 all_data.extend(data)
+                # 요청에 성공한 페이지만 저장해 실패한 페이지는 다음 실행에서 다시 조회합니다.
+                if page_content and manifest is not None:
+                    manifest.save_listing_page(page, data)
                 await asyncio.sleep(0.5) # 페이지 간 예의 있는 딜레이
 
         df = pd.DataFrame(all_data)
@@ -273,28 +353,7 @@ class LawGovKrScraper:
         """파일 이름으로 사용할 수 없는 특수문자를 '_'로 변경합니다."""
         return re.sub(r'[\\/*?:"<>|]', '_', str(name)).strip()
 
-    async def _extract_text_from_pdf(self, pdf_bytes: bytes) -> str | None:
-        """
-        PDF 파일의 바이너리 데이터에서 텍스트를 추출합니다.
-        실패 시 재시도 로직이 포함되어 있습니다.
-        """
-        if not pdf_bytes:
-            return None
-        
-        for attempt in range(self.max_retries):
-            try:
-                # pdfplumber를 사용하여 텍스트 추출
-                with io.BytesIO(pdf_bytes) as pdf_file, pdfplumber.open(pdf_file) as pdf:
-                    full_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-                    return full_text
-            except Exception as e:
-                logging.warning(f"PDF 텍스트 추출 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
-                await asyncio.sleep(1)
-        
-        logging.error("최대 재시도 후에도 PDF 텍스트 추출에 최종 실패했습니다.")
-        return None
-
-    async def _download_pdf_from_nts(self, session, final_url, case_row):
+    async def _download_pdf_from_nts(self, engine, final_url, case_row):
         """국세청(NTS) 웹사이트로부터 PDF를 다운로드합니다."""
         parsed_url = urlparse(str(final_url))
         query_params = parse_qs(parsed_url.query)
@@ -317,11 +376,11 @@ class LawGovKrScraper:
         }
         
         pdf_bytes, _ = await self._make_request(
-            session, 'POST', NTS_PDF_DOWNLOAD_URL, data=post_data, headers=headers
+            engine, 'POST', NTS_PDF_DOWNLOAD_URL, data=post_data, headers=headers
         )
         return pdf_bytes
 
-    async def _download_pdf_from_lawgo(self, session, final_url, case_row):
+    async def _download_pdf_from_lawgo(self, engine, final_url, case_row):
         """법제처(law.go.kr) 웹사이트로부터 PDF를 다운로드합니다."""
         post_data = {
             'precSeq': case_row['판례일련번호'],
@@ -336,31 +395,31 @@ class LawGovKrScraper:
         }
         
         pdf_bytes, _ = await self._make_request(
-            session, 'POST', LAWGO_PDF_DOWNLOAD_URL, data=post_data, headers=headers
+            engine, 'POST', LAWGO_PDF_DOWNLOAD_URL, data=post_data, headers=headers
         )
         return pdf_bytes
 
-    async def _fetch_and_save_case(self, session, case_row, output_dir):
+    async def _download_case(self, engine, case_row):
         """
-        개별 판례의 상세 정보를 조회하여 PDF를 다운로드하고 텍스트를 추출하여 저장합니다.
+        개별 판례의 상세 정보를 조회하여 PDF를 다운로드합니다.
         
         진행 과정:
         1. 판례일련번호로 상세 정보 페이지(껍데기) 요청
         2. 페이지 HTML에서 실제 내용이 담긴 iframe URL 추출
         3. iframe URL로 접근하여 최종 콘텐츠 페이지 URL 획득 (리디렉션 처리)
         4. 최종 URL이 국세청/법제처인지에 따라 다른 방식으로 PDF 다운로드
-        5. 다운로드한 PDF에서 텍스트 추출
-        6. PDF와 TXT 파일을 지정된 디렉토리에 저장
+
+        텍스트 추출과 저장은 _process_cases_batch의 추출 단계(_save_case)에서 이어서 처리합니다.
 
         Returns:
-            dict: 작업 결과 (상태, 판례 정보, 추출된 텍스트 등)
+            dict: 성공 시 {'status': 'DOWNLOADED', 'case_info', 'pdf_bytes'}, 실패 시 DOWNLOAD_FAIL 결과
         """
         case_id = case_row['판례일련번호']
         
         # 1. 상세 정보 페이지(껍데기) 요청
         params = {'OC': self.oc_id, 'target': 'prec', 'type': 'HTML', 'ID': case_id}
         shell_content, shell_url = await self._make_request(
-            session, 'GET', BASE_URL_SERVICE, params=params
+            engine, 'GET', BASE_URL_SERVICE, params=params
         )
         if not shell_content:
             return {'status': 'DOWNLOAD_FAIL', 'case_info': case_row, 'reason': 'Shell page fetch failed'}
@@ -379,26 +438,47 @@ class LawGovKrScraper:
         # 3. 실제 콘텐츠 페이지 URL 획득
         page_url = urljoin(str(shell_url), path)
         _, final_url = await self._make_request(
-            session, 'GET', page_url, headers={'Referer': str(shell_url)}
+            engine, 'GET', page_url, headers={'Referer': str(shell_url)}
         )
         if not final_url:
             return {'status': 'DOWNLOAD_FAIL', 'case_info': case_row, 'reason': 'Content page fetch failed'}
 
         # 4. PDF 다운로드
         if 'taxlaw.nts.go.kr' in str(final_url):
-            pdf_bytes = await self._download_pdf_from_nts(session, final_url, case_row)
+            pdf_bytes = await self._download_pdf_from_nts(engine, final_url, case_row)
         else:
-            pdf_bytes = await self._download_pdf_from_lawgo(session, final_url, case_row)
+            pdf_bytes = await self._download_pdf_from_lawgo(engine, final_url, case_row)
         
         if not pdf_bytes:
             return {'status': 'DOWNLOAD_FAIL', 'case_info': case_row, 'reason': 'PDF download failed'}
 
-        # 5. 텍스트 추출
-        text = await self._extract_text_from_pdf(pdf_bytes)
+        return {'status': 'DOWNLOADED', 'case_info': case_row, 'pdf_bytes': pdf_bytes}
+
+    async def _save_case(self, downloaded, text, output_dir, pdf_store=None):
+        """
+        다운로드한 PDF와 추출한 텍스트를 지정된 디렉토리에 저장합니다.
+        pdf_store가 주어지면(packed 형식) 파일을 만들지 않고 PDF를 세그먼트에 추가한 뒤
+        그 위치를 결과의 'pdf'에 담아 반환합니다. 본문은 _process_cases_batch에서 기록합니다.
+
+        Returns:
+            dict: 작업 결과 (상태, 판례 정보, 추출된 텍스트 등)
+        """
+        case_row = downloaded['case_info']
+        pdf_bytes = downloaded['pdf_bytes']
+        case_id = case_row['판례일련번호']
         if not text:
             return {'status': 'PARSE_FAIL', 'case_info': case_row}
 
-        # 6. 파일 저장
+        if pdf_store is not None:
+            try:
+                pdf_location = pdf_store.append(pdf_bytes)
+                pdf_store.flush()
+            except Exception as e:
+                logging.error(f"PDF 세그먼트 저장 중 오류 발생 (ID: {case_id}): {e}")
+                return {'status': 'SAVE_FAIL', 'case_info': case_row}
+            return {'status': 'SUCCESS', 'case_info': case_row, 'text': text, 'pdf': pdf_location}
+
+        # 파일 저장
         filename = f"{case_id}_{self._sanitize_filename(case_row.get('사건번호', ''))}"
         pdf_path = os.path.join(output_dir, f"{filename}.pdf")
         txt_path = os.path.join(output_dir, f"{filename}.txt")
@@ -417,45 +497,160 @@ class LawGovKrScraper:
 
         return {'status': 'SUCCESS', 'case_info': case_row, 'text': text}
 
-    async def _process_cases_batch(self, session, df, output_dir):
+    async def _process_cases_batch(self, engine, df, output_dir, jsonl_path=None, manifest=None, deadline=None):
         """
         판례 목록(DataFrame)을 비동기적으로 처리하고 진행 상황을 표시합니다.
-        """
-        if df.empty:
-            return pd.DataFrame(), {}
-            
-        logging.info(f"판례 본문 수집을 시작합니다: {len(df)}건 -> {output_dir}")
-        
-        tasks = [self._fetch_and_save_case(session, row, output_dir) for _, row in df.iterrows()]
-        
-        results = []
-        with tqdm(total=len(tasks), desc="✍️  판례 본문 수집") as pbar:
-            for coro in asyncio.as_completed(tasks):
-                result = await coro
-                results.append(result)
-                pbar.update(1)
 
+        다운로드 단계와 텍스트 추출 단계를 크기가 제한된 큐로 연결한 파이프라인입니다.
+        - 다운로드: max_concurrent_cases개의 고정 워커가 목록을 순서대로 꺼내 받은 PDF를 큐에 넣습니다.
+          큐가 가득 차면 대기하므로 메모리에 쌓이는 PDF 수가 제한됩니다.
+        - 텍스트 추출: parse_workers개의 소비자가 큐에서 꺼내 프로세스 풀에서 PDF를 파싱하고 저장합니다.
+        네트워크 대기와 PDF 파싱이 겹쳐서 진행되며, 두 단계의 처리량은 따로 기록됩니다.
+
+        결과 본문은 메모리에 모으지 않고 완료되는 즉시 jsonl_path에 한 줄씩 추가합니다.
+        output_format이 'packed'이면 JSONL 대신 output_dir의 PackedStore 세그먼트에 추가합니다.
+
+        Args:
+            jsonl_path (str, optional): 수집 성공 건을 기록할 JSONL 파일 경로 (추가 모드)
+            manifest (CrawlManifest, optional): 항목별 상태와 JSONL 오프셋을 기록할 매니페스트.
+                처리를 시작한 항목은 IN_FLIGHT로 기록되어, 중단 후 재시작하면 먼저 다시 수집됩니다.
+            deadline (datetime.datetime, optional): 이 시각 이후에는 새 항목 처리를 시작하지 않습니다.
+                이미 시작한 항목은 끝까지 처리하고, 남은 항목은 다음 실행에서 수집합니다.
+
+        Returns:
+            dict: 상태별 판례 정보 목록 (status_map)
+        """
         status_map = {
             'SUCCESS': [], 'DOWNLOAD_FAIL': [],
             'PARSE_FAIL': [], 'SAVE_FAIL': [], 'SKIPPED_EXISTS': []
         }
-        texts = []
-        # 결과를 case_id 기준으로 매핑하기 위한 딕셔너리
-        result_map = {r['case_info']['판례일련번호']: r for r in results}
-
-        for _, row in df.iterrows():
-            case_id = row['판례일련번호']
-            result = result_map.get(case_id)
-            if result:
-                status_map.setdefault(result['status'], []).append(result['case_info'])
-                texts.append(result.get('text'))
-            else:
-                # 이 경우는 거의 발생하지 않아야 함
-                texts.append(None)
+        if df.empty:
+            return status_map
+            
+        logging.info(f"판례 본문 수집을 시작합니다: {len(df)}건 -> {output_dir} "
+                     f"(추출 프로세스 {self.parse_workers}개, 큐 크기 {self.parse_queue_size})")
+
+        loop = asyncio.get_running_loop()
+        parse_queue = asyncio.Queue(maxsize=self.parse_queue_size)
+        download_stats = StageMetrics("다운로드")
+        parse_stats = StageMetrics("텍스트 추출")
+        write_lock = asyncio.Lock()
+        packed = self.output_format == 'packed'
+        text_store = PackedStore(output_dir, prefix="cases") if packed else None
+        # PDF는 이미 압축된 형식이므로 다시 압축하지 않습니다.
+        pdf_store = PackedStore(output_dir, prefix="pdfs", compression='none') if packed else None
+        jsonl_name = os.path.basename(jsonl_path) if jsonl_path and not packed else None
+        if manifest is not None:
+            # 이전 실행이 중단되며 남긴, 매니페스트에 커밋되지 않은 레코드를 먼저 잘라냅니다.
+            for name in (text_store.segments() if packed else [jsonl_name] if jsonl_name else []):
+                truncated = manifest.truncate_unindexed(name)
+                if truncated:
+                    logging.info(f"중단된 이전 실행의 미완료 기록 {truncated}바이트를 정리했습니다: {name}")
+        # 매니페스트에 바이트 오프셋을 기록하기 위해 바이너리 추가 모드로 엽니다.
+        jsonl_file = await aiofiles.open(jsonl_path, 'ab') if jsonl_name else None
 
-        out_df = df.copy()
-        out_df['판례본문'] = texts
-        return out_df, status_map
+        try:
+            with tqdm(total=len(df), desc="✍️  판례 본문 수집") as pbar, \
+                    ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+
+                async def finish(result):
+                    case_id = result['case_info']['판례일련번호']
+                    status = result['status']
+                    location = {}
+                    if status == 'SUCCESS':
+                        record = {**result['case_info'], '판례본문': result['text']}
+                        if 'pdf' in result:
+                            record['pdf'] = result['pdf']
+                        try:
+                            if text_store is not None:
+                                location = text_store.append_record(record)
+                                text_store.flush()
+                            elif jsonl_file is not None:
+                                line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+                                async with write_lock:
+                                    offset = await jsonl_file.tell()
+                                    try:
+                                        await jsonl_file.write(line)
+                                        # 매니페스트에 커밋되는 위치가 항상 디스크에 있도록 바로 내보냅니다.
+                                        await jsonl_file.flush()
+                                    except Exception:
+                                        # 일부만 쓰인 줄이 다음 레코드 앞에 끼어 남지 않도록 잘라냅니다.
+                                        await _truncate_quietly(jsonl_file, offset)
+                                        raise
+                                location = {'file': jsonl_name, 'offset': offset, 'length': len(line)}
+                        except Exception as e:
+                            logging.error(f"결과 기록 중 오류 발생 (ID: {case_id}): {e}")
+                            # 본문이 저장되지 않았으므로 완료로 기록하지 않아야 다음 실행에서 다시 수집합니다.
+                            status = 'SAVE_FAIL'
+                    status_map.setdefault(status, []).append(result['case_info'])
+                    if manifest is not None:
+                        text = result.get('text') if status == 'SUCCESS' else None
+                        manifest.record(case_id, status,
+                                        content_hash=content_hash(text) if text else None, **location)
+                    pbar.update(1)
+
+                async def download(row):
+                    if manifest is not None:
+                        manifest.mark_in_flight(row['판례일련번호'])
+                    started = time.monotonic()
+                    downloaded = await self._download_case(engine, row)
+                    if downloaded['status'] != 'DOWNLOADED':
+                        await finish(downloaded)
+                        return
+                    download_stats.add(started, len(downloaded['pdf_bytes']))
+                    # 추출이 밀려 큐가 가득 차면 여기서 대기하므로 다운로드도 함께 멈춥니다(역압).
+                    await parse_queue.put(downloaded)
+
+                async def parse_worker():
+                    while True:
+                        downloaded = await parse_queue.get()
+                        if downloaded is None:
+                            return
+                        case_id = downloaded['case_info']['판례일련번호']
+                        # 워커가 예외로 멈추면 가득 찬 parse_queue에 넣으려는 다운로드 워커가 영원히 대기하므로,
+                        # 한 건의 실패는 기록만 하고 다음 항목을 계속 처리합니다.
+                        try:
+                            started = time.monotonic()
+                            try:
+                                text = await loop.run_in_executor(pool, extract_text_from_pdf, downloaded['pdf_bytes'])
+                            except Exception as e:
+                                logging.error(f"PDF 텍스트 추출 프로세스 오류 (ID: {case_id}): {e}")
+                                text = None
+                            parse_stats.add(started, len(downloaded['pdf_bytes']))
+                            await finish(await self._save_case(downloaded, text, output_dir, pdf_store))
+                        except Exception as e:
+                            # 매니페스트에는 진행 중으로 남으므로 다음 실행에서 다시 수집합니다.
+                            logging.error(f"판례 처리 중 오류 발생 (ID: {case_id}): {e}")
+
+                parse_workers = [asyncio.create_task(parse_worker()) for _ in range(self.parse_workers)]
+                try:
+                    def rows():
+                        for _, row in df.iterrows():
+                            if deadline is not None and datetime.datetime.now() >= deadline:
+                                return
+                            yield row.to_dict()
+
+                    await run_worker_pool(rows(), download, num_workers=self.max_concurrent_cases)
+                    for _ in parse_workers:
+                        await parse_queue.put(None)
+                    await asyncio.gather(*parse_workers)
+                finally:
+                    for task in parse_workers:
+                        task.cancel()
+        finally:
+            if jsonl_file is not None:
+                await jsonl_file.close()
+            for store in (text_store, pdf_store):
+                if store is not None:
+                    store.close()
+
+        processed = sum(len(v) for v in status_map.values())
+        if processed < len(df):
+            logging.info(f"⏰ 작업 허용 시간이 끝나 {len(df) - processed}건은 다음 실행에서 이어서 수집합니다.")
+        logging.info(f"📊 {download_stats}")
+        logging.info(f"📊 {parse_stats}")
+        logging.info(f"📊 요청 통계: {engine.metrics}")
+        return status_map
 
     async def _write_period_summary(self, output_dir, suffix, status_map):
         """
@@ -494,7 +689,8 @@ class LawGovKrScraper:
         logging.info(f"기간별 리포트 작성 완료: {report_path}")
 
 async def run_scraper(oc_id: str, query: str = None, date: str = None, 
-                      date_range: str = None, test_mode: bool = False):
+                      date_range: str = None, test_mode: bool = False,
+                      output_format: str = 'files'):
     """
     판례 스크래퍼를 실행하는 메인 함수.
 
@@ -505,6 +701,7 @@ async def run_scraper(oc_id: str, query: str = None, date: str = None,
         date_range (str, optional): 판시사항 게재일자 범위 (예: '20230101~20231231'). Defaults to None.
         test_mode (bool, optional): 테스트 모드 활성화 여부. Defaults to False.
             - True일 경우, 시간 제약 없이 '판례' 검색어로 1페이지만 수집.
+        output_format (str, optional): 'files'(판례별 파일) 또는 'packed'(압축 세그먼트). Defaults to 'files'.
     """
     # --- 모드 설정: 일반 모드 vs 테스트 모드 ---
     if test_mode:
@@ -527,65 +724,90 @@ async def run_scraper(oc_id: str, query: str = None, date: str = None,
         output_suffix = date.replace('.', '') if date else (date_range or "query_search")
 
     # --- 크롤러 실행 ---
-    scraper = LawGovKrScraper(oc_id=oc_id)
+    scraper = LawGovKrScraper(oc_id=oc_id, output_format=output_format)
 
     # 테스트 모드가 아닐 때만 작업 허용 시간까지 대기
     if not test_mode:
         await wait_for_window()
 
-    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-        # 1. 판례 목록 가져오기
-        df_list = await scraper.fetch_case_list(
-            session, query=query_param, date=date_param, 
-            date_range=date_range_param, max_pages=max_pages
-        )
-
-        if df_list.empty:
-            logging.info("수집할 판례 목록이 없어 프로그램을 종료합니다.")
-            return
-
-        # 2. 파일 기반 중복 체크 후, 누락된 판례만 수집
-        output_dir = os.path.join(BASE_OUTPUT_DIR, output_suffix)
-        os.makedirs(output_dir, exist_ok=True)
-        
-        cases_to_process = []
-        skipped_case_infos = []
-        logging.info(f"기존 파일 확인 및 수집 대상 필터링 중... (총 {len(df_list)}건)")
-        for _, row in df_list.iterrows():
-            filename = f"{row['판례일련번호']}_{scraper._sanitize_filename(row.get('사건번호', ''))}"
-            txt_path = os.path.join(output_dir, f"{filename}.txt")
-            
-            if os.path.exists(txt_path):
-                skipped_case_infos.append(row.to_dict())
+    deadline = None if test_mode else window_deadline()
+
+    # 출력 디렉토리별 매니페스트: 수집 현황과 체크포인트(목록 페이지, 처리 중 항목)를 함께 기록합니다.
+    output_dir = os.path.join(BASE_OUTPUT_DIR, output_suffix)
+    manifest = CrawlManifest(output_dir)
+
+    try:
+        async with scraper.engine as engine:
+            # 1. 판례 목록 가져오기 (체크포인트가 있으면 이어서 조회)
+            df_list = await scraper.fetch_case_list(
+                engine, query=query_param, date=date_param, 
+                date_range=date_range_param, max_pages=max_pages, manifest=manifest
+            )
+
+            if df_list.empty:
+                logging.info("수집할 판례 목록이 없어 프로그램을 종료합니다.")
+                return
+
+            # 2. 매니페스트 기반 중복 체크 후, 누락된 판례만 수집
+            if len(manifest) == 0:
+                # 매니페스트 도입 이전에 수집된 디렉토리는 파일 목록을 한 번 읽어 등록합니다.
+                seeded = manifest.seed_from_directory(suffixes=('.txt',))
+                if seeded:
+                    logging.info(f"기존 수집 파일 {seeded}건을 매니페스트에 등록했습니다.")
+            completed_ids = manifest.completed_ids()
+            in_flight_ids = manifest.in_flight_ids()
+
+            cases_to_process = []
+            skipped_case_infos = []
+            logging.info(f"매니페스트 확인 및 수집 대상 필터링 중... (총 {len(df_list)}건)")
+            for row in df_list.to_dict('records'):
+                if str(row['판례일련번호']) in completed_ids:
+                    skipped_case_infos.append(row)
+                else:
+                    cases_to_process.append(row)
+
+            if in_flight_ids:
+                # 이전 실행이 중단될 때 처리 중이던 항목부터 다시 수집합니다.
+                cases_to_process.sort(key=lambda row: str(row['판례일련번호']) not in in_flight_ids)
+                logging.info(f"이전 실행에서 처리 중이던 {len(in_flight_ids)}건부터 이어서 수집합니다.")
+
+            logging.info(f"수집 완료 건 제외, 신규 수집 대상: {len(cases_to_process)}건 (건너뛰기: {len(skipped_case_infos)}건)")
+
+            status_map = {}
+            if cases_to_process:
+                df_to_process = pd.DataFrame(cases_to_process)
+                # 수집 성공 건은 완료되는 즉시 JSONL에 추가됩니다. (이전 실행에서 수집된 건은 건너뛰므로 중복되지 않음)
+                jsonl_path = os.path.join(output_dir, f"collected_cases_{output_suffix}.jsonl")
+                status_map = await scraper._process_cases_batch(
+                    engine, df_to_process, output_dir, jsonl_path, manifest=manifest, deadline=deadline
+                )
             else:
-                cases_to_process.append(row.to_dict())
-
-        logging.info(f"중복 파일 제외, 신규 수집 대상: {len(cases_to_process)}건 (건너뛰기: {len(skipped_case_infos)}건)")
-
-        status_map = {}
-        if cases_to_process:
-            df_to_process = pd.DataFrame(cases_to_process)
-            _, status_map = await scraper._process_cases_batch(session, df_to_process, output_dir)
-        else:
-            logging.info("신규로 수집할 판례가 없습니다.")
-        
-        # 건너뛴 항목을 status_map에 추가하여 리포트에 반영
-        status_map['SKIPPED_EXISTS'] = skipped_case_infos
-        
-        # 3. 수집 결과 리포트 작성
-        await scraper._write_period_summary(output_dir, output_suffix, status_map)
-        
-        # 4. 최종 결과 로깅 (재수집 로직은 제거됨)
-        all_failed_items = (status_map.get('DOWNLOAD_FAIL', []) + 
-                            status_map.get('PARSE_FAIL', []) + 
-                            status_map.get('SAVE_FAIL', []))
-
-        if not all_failed_items and cases_to_process:
-            logging.info("모든 신규 항목이 성공적으로 수집되었습니다.")
-        elif not all_failed_items and not cases_to_process:
-            logging.info("처리할 신규 항목이 없었고, 실패도 없었습니다.")
-        else:
-            logging.warning(f"총 {len(all_failed_items)}건의 항목 수집에 실패했습니다. 상세 내용은 리포트를 확인하세요.")
+                logging.info("신규로 수집할 판례가 없습니다.")
+
+            # 모든 항목을 수집했으면 목록 체크포인트를 지워 다음 실행에서 목록을 새로 조회합니다.
+            if len(status_map.get('SUCCESS', [])) == len(cases_to_process):
+                manifest.clear_listing()
+    finally:
+        # 중단되더라도 그때까지의 수집 결과와 체크포인트는 매니페스트에 남깁니다.
+        manifest.close()
+    
+    # 건너뛴 항목을 status_map에 추가하여 리포트에 반영
+    status_map['SKIPPED_EXISTS'] = skipped_case_infos
+    
+    # 3. 수집 결과 리포트 작성
+    await scraper._write_period_summary(output_dir, output_suffix, status_map)
+    
+    # 4. 최종 결과 로깅 (재수집 로직은 제거됨)
+    all_failed_items = (status_map.get('DOWNLOAD_FAIL', []) + 
+                        status_map.get('PARSE_FAIL', []) + 
+                        status_map.get('SAVE_FAIL', []))
+
+    if not all_failed_items and cases_to_process:
+        logging.info("모든 신규 항목이 성공적으로 수집되었습니다.")
+    elif not all_failed_items and not cases_to_process:
+        logging.info("처리할 신규 항목이 없었고, 실패도 없었습니다.")
+    else:
+        logging.warning(f"총 {len(all_failed_items)}건의 항목 수집에 실패했습니다. 상세 내용은 리포트를 확인하세요.")
 
     logging.info("✨ 모든 작업이 완료되었습니다. ✨")
 
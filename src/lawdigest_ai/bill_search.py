@@ -0,0 +1,134 @@
+from functools import lru_cache
+
+import numpy as np
+from qdrant_client.http import models
+
+# 쿼리 임베딩 LRU 캐시 크기. 같은 검색어가 반복되면 임베딩 모델을 다시 호출하지 않습니다.
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+
+def build_bill_filter(committee=None, stage=None, assembly_number=None, start_date=None, end_date=None):
+    """
+    검색 조건으로 Qdrant payload 필터를 만듭니다. 조건이 없으면 None을 반환합니다.
+
+    Args:
+        committee (str | list[str], optional): 소관 위원회 (여러 개면 하나라도 일치)
+        stage (str | list[str], optional): 처리 단계
+        assembly_number (int, optional): 국회 대수
+        start_date, end_date (str, optional): 제안일 범위 ('YYYY-MM-DD', 양 끝 포함)
+    """
+    conditions = []
+    for key, value in (('committee', committee), ('stage', stage)):
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            match = models.MatchAny(any=list(value))
+        else:
+            match = models.MatchValue(value=value)
+        conditions.append(models.FieldCondition(key=key, match=match))
+    if assembly_number is not None:
+        conditions.append(models.FieldCondition(key='assembly_number', match=models.MatchValue(value=int(assembly_number))))
+    if start_date or end_date:
+        conditions.append(models.FieldCondition(
+            key='propose_date',
+            range=models.DatetimeRange(gte=start_date, lte=end_date),
+        ))
+    return models.Filter(must=conditions) if conditions else None
+
+
+class BillSearcher:
+    """
+    Qdrant에 저장된 법안 벡터를 대상으로 의미 기반 검색을 수행하는 클래스입니다.
+
+    검색어를 EmbeddingGenerator로 임베딩하고(같은 검색어는 LRU 캐시에서 재사용),
+    위원회·처리 단계·국회 대수·제안일 조건을 payload 필터로 걸어 kNN 검색합니다.
+    필터 필드의 payload 인덱스는 QdrantManager.create_payload_indexes로 만듭니다.
+
+    청크 단위로 저장된 컬렉션이면 결과를 bill_id별로 묶어, 가장 점수가 높은 청크의 점수로 법안 순위를 매깁니다.
+    """
+    def __init__(self, embed_generator, vector_store, collection_name: str,
+                 query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE):
+        """
+        Args:
+            embed_generator (EmbeddingGenerator): 컬렉션을 만들 때 사용한 것과 같은 모델의 임베딩 생성기.
+            vector_store (VectorStore): QdrantManager 또는 LocalVectorStore.
+            collection_name (str): 검색할 컬렉션의 이름.
+            query_cache_size (int): 쿼리 임베딩 LRU 캐시 크기. 0이면 캐시를 사용하지 않습니다.
+        """
+        self.embed_generator = embed_generator
+        self.vector_store = vector_store
+        self.collection_name = collection_name
+        self._embed_query = (
+            lru_cache(maxsize=query_cache_size)(self._embed_query_uncached)
+            if query_cache_size else self._embed_query_uncached
+        )
+
+    def _embed_query_uncached(self, query: str):
+        vector = self.embed_generator.generate_batch([query], as_numpy=True)[0]
+        if vector is not None:
+            vector = np.asarray(vector, dtype=np.float32)
+            vector.flags.writeable = False  # 캐시에 보관되는 배열이 바뀌지 않도록 합니다.
+        return vector
+
+    def cache_info(self):
+        """쿼리 임베딩 캐시의 적중/미적중 통계를 반환합니다. 캐시를 사용하지 않으면 None."""
+        return self._embed_query.cache_info() if hasattr(self._embed_query, 'cache_info') else None
+
+    def search(self, query: str, limit: int = 10, committee=None, stage=None, assembly_number=None,
+               start_date=None, end_date=None, with_payload=True, chunks_per_bill: int = 3):
+        """
+        검색어와 의미가 가까운 법안을 유사도 순으로 반환합니다.
+
+        Args:
+            query (str): 검색어
+            limit (int): 반환할 최대 법안 수
+            committee, stage, assembly_number, start_date, end_date: 필터 조건 (build_bill_filter 참고)
+            with_payload (bool | list[str]): 결과에 포함할 payload (필드 목록 지정 가능)
+            chunks_per_bill (int): 법안마다 함께 반환할 최대 청크 수
+
+        Returns:
+            list[dict]: 최고 점수 청크의 payload에 'score'(코사인 유사도)를 더한 법안 목록.
+                청크 단위 컬렉션이면 'matched_chunks'(청크 번호, 점수, 청크 텍스트 목록)가 함께 들어갑니다.
+        """
+        query = (query or '').strip()
+        if not query:
+            print("⚠️ 검색어가 비어 있습니다.")
+            return []
+
+        vector = self._embed_query(query)
+        if vector is None:
+            print("❌ 검색어 임베딩 생성에 실패했습니다.")
+            return []
+
+        groups = self.vector_store.search_groups(
+            collection_name=self.collection_name,
+            query_vector=vector,
+            group_by='bill_id',
+            limit=limit,
+            group_size=chunks_per_bill,
+            query_filter=build_bill_filter(committee, stage, assembly_number, start_date, end_date),
+            with_payload=with_payload,
+        )
+        return [aggregate_bill_hits(group.hits) for group in groups if group.hits]
+
+
+def aggregate_bill_hits(hits):
+    """
+    한 법안의 검색 결과(점수 내림차순)를 법안 하나의 결과로 합칩니다.
+
+    법안 점수는 가장 높은 청크의 점수이고, 청크 필드(chunk_index, chunk_text)는 matched_chunks로 옮깁니다.
+    """
+    best = dict(hits[0].payload or {})
+    best.pop('chunk_text', None)
+    best.pop('chunk_index', None)
+    best['score'] = hits[0].score
+    if any('chunk_index' in (hit.payload or {}) for hit in hits):
+        best['matched_chunks'] = [
+            {
+                'chunk_index': hit.payload.get('chunk_index'),
+                'score': hit.score,
+                'chunk_text': hit.payload.get('chunk_text'),
+            }
+            for hit in hits
+        ]
+    return best
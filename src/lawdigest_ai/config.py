@@ -20,6 +20,11 @@ QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
 # .env에서 QDRANT_USE_HTTPS 값을 읽어와 True/False로 변환합니다.
 # 값이 'true', '1', 't', 'yes' 중 하나일 때 True가 됩니다. 기본값은 False입니다.
 QDRANT_USE_HTTPS = os.getenv("QDRANT_USE_HTTPS", "False").lower() in ('true', '1', 't', 'yes')
+# Qdrant REST(HTTP) 포트와 gRPC 포트. 기본값은 각각 6333, 6334입니다.
+QDRANT_PORT = int(os.getenv("QDRANT_PORT", 6333))
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", 6334))
+# True이면 gRPC로 통신합니다. 대량 업서트 시 JSON 직렬화 비용이 줄어듭니다.
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "False").lower() in ('true', '1', 't', 'yes')
 
 
 # --- 원본 데이터베이스(MySQL) 설정 ---
@@ -32,21 +37,27 @@ DB_PASSWORD = os.getenv("password")
 DB_NAME = os.getenv("database")
 
 
-def validate_config():
+def validate_config(require_qdrant=True, require_openai=True):
     """
     스크립트 실행에 필요한 필수 환경 변수들이 모두 설정되었는지 확인하는 함수입니다.
     하나라도 누락된 경우, 오류를 발생시켜 프로그램을 중단시킵니다.
+
+    Args:
+        require_qdrant (bool): False이면 QDRANT_HOST를 확인하지 않습니다. (LocalVectorStore로 오프라인 실행 시)
+        require_openai (bool): False이면 OPENAI_API_KEY를 확인하지 않습니다. (로컬 임베딩 모델 사용 시)
     """
     # 필수 환경 변수 목록을 딕셔너리 형태로 정의합니다.
     required_vars = {
-        "OPENAI_API_KEY": OPENAI_API_KEY,
-        "QDRANT_HOST": QDRANT_HOST,
         "DB_HOST": DB_HOST,
         "DB_PORT": DB_PORT,
         "DB_USERNAME": DB_USERNAME,
         "DB_PASSWORD": DB_PASSWORD,
         "DB_NAME": DB_NAME,
     }
+    if require_openai:
+        required_vars["OPENAI_API_KEY"] = OPENAI_API_KEY
+    if require_qdrant:
+        required_vars["QDRANT_HOST"] = QDRANT_HOST
     
     # 설정되지 않은(None) 환경 변수들의 목록을 찾습니다.
     missing_vars = [key for key, value in required_vars.items() if value is None]
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    (모델, 텍스트 해시)를 키로 임베딩 벡터를 로컬 디스크에 저장하는 캐시입니다.
+
+    모델마다 디렉토리 하나를 두고 다음 파일을 추가 전용(append-only)으로 기록합니다.
+    - keys.bin: 텍스트 sha256 다이제스트(32바이트)를 행 순서대로 이어 붙인 파일
+    - vectors.bin: 같은 순서의 벡터를 float16(또는 float32) 행렬로 이어 붙인 파일 (np.memmap으로 읽음)
+    - meta.json: 모델 이름, 벡터 차원, 자료형
+
+    텍스트가 바뀌지 않은 법안은 모델을 호출하지 않고 캐시에서 벡터를 읽으므로,
+    재색인 작업의 대부분이 디스크 I/O로 바뀝니다.
+    """
+    DIGEST_SIZE = 32
+
+    def __init__(self, cache_dir: str, model_id: str, dtype: str = 'float16'):
+        """
+        Args:
+            cache_dir (str): 캐시 최상위 디렉토리. 모델별 하위 디렉토리가 생성됩니다.
+            model_id (str): 임베딩 모델 식별자 (예: 'nlpai-lab/KURE-v1', 'text-embedding-3-small').
+            dtype (str): 저장 자료형 ('float16' 또는 'float32'). 이미 만들어진 캐시는 저장된 자료형을 따릅니다.
+        """
+        self.model_id = model_id
+        self.directory = os.path.join(cache_dir, re.sub(r'[^0-9A-Za-z._-]', '_', model_id))
+        os.makedirs(self.directory, exist_ok=True)
+        self.keys_path = os.path.join(self.directory, "keys.bin")
+        self.vectors_path = os.path.join(self.directory, "vectors.bin")
+        self.meta_path = os.path.join(self.directory, "meta.json")
+
+        self.dim = None
+        self.dtype = np.dtype(dtype)
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            self.dim = meta['dim']
+            self.dtype = np.dtype(meta['dtype'])
+
+        self.hits = 0
+        self.misses = 0
+        self._index = {}
+        self._rows = 0
+        self._vectors = None  # 읽기 전용 memmap, 행이 추가되면 다시 엽니다.
+        self._load_index()
+
+    @staticmethod
+    def text_key(text: str) -> bytes:
+        return hashlib.sha256(text.encode('utf-8')).digest()
+
+    def __len__(self):
+        return self._rows
+
+    def _load_index(self):
+        if self.dim is None or not os.path.exists(self.keys_path):
+            return
+        with open(self.keys_path, 'rb') as f:
+            keys = f.read()
+        row_bytes = self.dim * self.dtype.itemsize
+        vector_rows = os.path.getsize(self.vectors_path) // row_bytes if os.path.exists(self.vectors_path) else 0
+        # 기록 도중 중단되었다면 키와 벡터가 모두 온전한 행까지만 사용하고,
+        # 이후 추가되는 행이 어긋나지 않도록 나머지는 잘라냅니다.
+        self._rows = min(len(keys) // self.DIGEST_SIZE, vector_rows)
+        self._truncate_rows(self._rows)
+        for row in range(self._rows):
+            self._index[keys[row * self.DIGEST_SIZE:(row + 1) * self.DIGEST_SIZE]] = row
+
+    def _mapped_vectors(self):
+        if self._vectors is None or self._vectors.shape[0] < self._rows:
+            self._vectors = np.memmap(self.vectors_path, dtype=self.dtype, mode='r', shape=(self._rows, self.dim))
+        return self._vectors
+
+    def get_many(self, texts, as_numpy=False):
+        """
+        텍스트 목록의 캐시된 벡터를 조회합니다.
+
+        Args:
+            texts (list[str]): 조회할 텍스트 목록
+            as_numpy (bool): True이면 벡터를 리스트 대신 float32 numpy 배열로 반환합니다.
+
+        Returns:
+            list[list[float] | None]: texts와 같은 순서의 벡터 목록. 캐시에 없으면 None입니다.
+        """
+        results = [None] * len(texts)
+        rows = {}
+        for i, text in enumerate(texts):
+            row = self._index.get(self.text_key(text)) if text else None
+            if row is not None:
+                rows[i] = row
+        if rows:
+            vectors = self._mapped_vectors()
+            for i, row in rows.items():
+                vector = vectors[row].astype(np.float32)
+                results[i] = vector if as_numpy else vector.tolist()
+        self.hits += len(rows)
+        self.misses += sum(1 for text in texts if text) - len(rows)
+        return results
+
+    def put_many(self, texts, vectors):
+        """
+        새로 생성한 벡터를 캐시에 추가합니다. None인 벡터와 이미 캐시된 텍스트는 건너뜁니다.
+        """
+        # 기록이 모두 끝난 뒤에만 인덱스에 반영하도록 새 행 번호를 따로 모읍니다.
+        new_rows = {}
+        new_vectors = []
+        for text, vector in zip(texts, vectors):
+            if not text or vector is None:
+                continue
+            key = self.text_key(text)
+            if key in self._index or key in new_rows:
+                continue
+            new_rows[key] = self._rows + len(new_rows)
+            new_vectors.append(vector)
+        if not new_rows:
+            return
+
+        matrix = np.asarray(new_vectors, dtype=self.dtype)
+        if self.dim is None:
+            self.dim = matrix.shape[1]
+            with open(self.meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'model': self.model_id, 'dim': self.dim, 'dtype': self.dtype.name}, f)
+        elif matrix.shape[1] != self.dim:
+            raise ValueError(f"캐시된 벡터 차원({self.dim})과 새 벡터 차원({matrix.shape[1]})이 다릅니다.")
+
+        # 벡터를 먼저 기록해 키만 있고 벡터가 없는 행이 생기지 않도록 합니다.
+        # 기록에 실패하면 두 파일을 기존 행까지 되돌려 이후 추가되는 행이 어긋나지 않게 합니다.
+        try:
+            with open(self.vectors_path, 'ab') as f:
+                f.write(matrix.tobytes())
+            with open(self.keys_path, 'ab') as f:
+                f.write(b''.join(new_rows))
+        except Exception:
+            self._truncate_rows(self._rows)
+            raise
+        self._index.update(new_rows)
+        self._rows += len(new_rows)
+
+    def _truncate_rows(self, rows):
+        for path, size in ((self.keys_path, rows * self.DIGEST_SIZE),
+                           (self.vectors_path, rows * self.dim * self.dtype.itemsize)):
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def stats(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0.0
+        return f"캐시 적중 {self.hits}건 / 미적중 {self.misses}건 (적중률 {hit_rate:.1f}%, 저장된 벡터 {self._rows}개)"
@@ -9,25 +9,139 @@ if __package__ is None or __package__ == '':
     if src_dir not in sys.path:
         sys.path.insert(0, src_dir)
 
+import numpy as np
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
 from lawdigest_ai import config
+from lawdigest_ai.embedding_cache import EmbeddingCache
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 바이트 길이로 토큰 수를 보수적으로 추정합니다.
+    tiktoken = None
+
+# OpenAI 임베딩 API의 요청당 제한
+OPENAI_MAX_INPUTS_PER_REQUEST = 2048
+OPENAI_MAX_TOKENS_PER_REQUEST = 300_000
+# 로컬(HuggingFace) 모델의 기본 인코딩 배치 크기
+DEFAULT_LOCAL_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 32))
+# 로컬 모델 추론 백엔드: 'torch'(PyTorch) 또는 'onnx'(ONNX Runtime, CPU 전용 서버에서 더 빠름)
+LOCAL_BACKENDS = ('torch', 'onnx')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 추정합니다.
+    tiktoken이 설치되어 있으면 정확히 계산하고, 없으면 UTF-8 바이트 수의 절반(한글 1자 ≈ 1.5토큰)으로 추정합니다.
+    """
+    if tiktoken is not None:
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    return len(text.encode('utf-8')) // 2 + 1
+
+
+def plan_openai_batches(texts, max_inputs=OPENAI_MAX_INPUTS_PER_REQUEST,
+                        max_tokens=OPENAI_MAX_TOKENS_PER_REQUEST):
+    """
+    텍스트 목록을 OpenAI 요청 제한(요청당 입력 수, 토큰 수)을 넘지 않는 묶음으로 나눕니다.
+
+    Returns:
+        list[list[int]]: 요청별로 묶인 texts의 인덱스 목록
+    """
+    batches, current, current_tokens = [], [], 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_inputs or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def load_sentence_transformer(model_name, backend='torch', onnx_file_name=None, num_threads=None):
+    """
+    SentenceTransformer 모델을 지정한 백엔드로 불러옵니다.
+
+    Args:
+        model_name (str): HuggingFace 모델 이름 또는 로컬 경로
+        backend (str): 'torch' 또는 'onnx'. 'onnx'는 onnxruntime과 optimum이 필요하며,
+            모델 저장소에 ONNX 파일이 없으면 처음 불러올 때 변환합니다.
+        onnx_file_name (str, optional): 사용할 ONNX 파일 (예: 'onnx/model_qint8_avx512_vnni.onnx').
+            export_quantized_onnx로 만든 int8 양자화 모델을 지정할 수 있습니다.
+        num_threads (int, optional): 연산 하나에 사용할 CPU 스레드 수 (ONNX Runtime intra-op / torch 스레드)
+    """
+    if backend not in LOCAL_BACKENDS:
+        raise ValueError(f"지원하지 않는 추론 백엔드입니다: {backend}")
+
+    if backend == 'torch':
+        if num_threads:
+            import torch
+            torch.set_num_threads(num_threads)
+        return SentenceTransformer(model_name)
+
+    import onnxruntime
+    model_kwargs = {'provider': 'CPUExecutionProvider'}
+    if onnx_file_name:
+        model_kwargs['file_name'] = onnx_file_name
+    if num_threads:
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = num_threads
+        session_options.inter_op_num_threads = 1
+        model_kwargs['session_options'] = session_options
+    return SentenceTransformer(model_name, backend='onnx', model_kwargs=model_kwargs)
+
+
+def export_quantized_onnx(model_name, output_dir, quantization_config='avx512_vnni'):
+    """
+    모델을 ONNX로 변환하고 int8 동적 양자화한 사본을 output_dir에 저장합니다.
+
+    Args:
+        model_name (str): HuggingFace 모델 이름 또는 로컬 경로
+        output_dir (str): 변환된 모델을 저장할 디렉토리. 이후 model_name으로 이 경로를 사용합니다.
+        quantization_config (str): 'arm64', 'avx2', 'avx512', 'avx512_vnni' 중 서버 CPU에 맞는 것
+
+    Returns:
+        str: load_sentence_transformer의 onnx_file_name으로 넘길 양자화 모델 파일 경로 (output_dir 기준)
+    """
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    model = SentenceTransformer(model_name, backend='onnx')
+    model.save_pretrained(output_dir)
+    export_dynamic_quantized_onnx_model(model, quantization_config, output_dir)
+    return f"onnx/model_qint8_{quantization_config}.onnx"
+
 
 class EmbeddingGenerator:
     """
     OpenAI 또는 HuggingFace 임베딩 모델을 사용하여 주어진 텍스트로부터 벡터 표현(임베딩)을 생성하는 역할을 합니다.
     """
-    def __init__(self, model_type='openai', model_name=None):
+    def __init__(self, model_type='openai', model_name=None, cache_dir=None,
+                 backend='torch', onnx_file_name=None, num_threads=None):
         """
         EmbeddingGenerator 클래스의 인스턴스를 생성할 때 호출됩니다.
 
         Args:
             model_type (str): 사용할 모델 유형 ('openai' 또는 'huggingface').
             model_name (str): HuggingFace 모델을 사용할 경우, 모델의 이름.
+            cache_dir (str, optional): 임베딩 캐시 디렉토리. 지정하면 같은 모델·같은 텍스트의 임베딩은
+                모델을 다시 호출하지 않고 캐시에서 읽습니다.
+            backend (str): HuggingFace 모델의 추론 백엔드 ('torch' 또는 'onnx').
+            onnx_file_name (str, optional): backend='onnx'일 때 사용할 ONNX 파일 (int8 양자화 모델 등).
+            num_threads (int, optional): 로컬 모델 추론에 사용할 CPU 스레드 수.
         """
         self.model_type = model_type
         self.client = None
         self.huggingface_model = None
+        self.cache = None
+        if cache_dir:
+            model_id = config.EMBEDDING_MODEL if model_type == 'openai' else model_name
+            if model_id:
+                # ONNX·양자화 모델의 출력은 PyTorch와 미세하게 다르므로 캐시를 따로 둡니다.
+                if model_type == 'huggingface' and backend != 'torch':
+                    model_id = f"{model_id}-{backend}-{onnx_file_name or 'model.onnx'}"
+                self.cache = EmbeddingCache(cache_dir, f"{model_type}-{model_id}")
 
         if model_type == 'openai':
             try:
@@ -43,8 +157,8 @@ class EmbeddingGenerator:
                 return
             try:
                 # 지정된 HuggingFace 모델을 로드합니다.
-                self.huggingface_model = SentenceTransformer(model_name)
-                print(f"✅ HuggingFace 모델 '{model_name}'이(가) 성공적으로 로드되었습니다.")
+                self.huggingface_model = load_sentence_transformer(model_name, backend, onnx_file_name, num_threads)
+                print(f"✅ HuggingFace 모델 '{model_name}'이(가) 성공적으로 로드되었습니다. (백엔드: {backend})")
             except Exception as e:
                 # 모델 로딩 과정에서 오류 발생 시, 에러 메시지를 출력합니다.
                 print(f"❌ HuggingFace 모델 로드에 실패했습니다: {e}")
@@ -54,6 +168,7 @@ class EmbeddingGenerator:
     def generate(self, text: str):
         """
         입력된 텍스트 한 조각에 대한 임베딩 벡터를 생성합니다.
+        여러 텍스트를 처리할 때는 generate_batch를 사용하는 것이 훨씬 빠릅니다.
 
         Args:
             text (str): 임베딩을 생성할 대상 텍스트입니다.
@@ -66,40 +181,98 @@ class EmbeddingGenerator:
         if not text or not isinstance(text, str):
             print("⚠️ 임베딩할 텍스트가 유효하지 않습니다. (빈 문자열 또는 None)")
             return None
+        return self.generate_batch([text])[0]
+
+    def generate_batch(self, texts, batch_size=None, as_numpy=False):
+        """
+        여러 텍스트의 임베딩 벡터를 한 번에 생성합니다.
+
+        - OpenAI: 요청당 입력 수와 토큰 수 제한을 넘지 않도록 묶어 여러 텍스트를 한 요청으로 보냅니다.
+          묶음 요청이 실패하면 해당 묶음만 한 건씩 다시 요청합니다.
+        - HuggingFace: SentenceTransformer.encode에 목록 전체를 batch_size 단위로 넘깁니다.
+
+        Args:
+            texts (list[str]): 임베딩을 생성할 텍스트 목록입니다.
+            batch_size (int, optional): 로컬 모델의 인코딩 배치 크기. 기본값은 EMBEDDING_BATCH_SIZE 환경 변수(32).
+            as_numpy (bool): True이면 각 임베딩을 파이썬 리스트로 변환하지 않고 float32 numpy 배열로 반환합니다.
+                QdrantManager.upload_vectors에 그대로 넘길 때 사용합니다.
+
+        Returns:
+            list[list[float] | None]: texts와 같은 순서의 임베딩 목록. 유효하지 않거나 실패한 항목은 None입니다.
+        """
+        if self.cache is None:
+            return self._generate_batch(texts, batch_size, as_numpy)
+
+        # 캐시에 없는 텍스트만 모델로 임베딩하고 결과를 캐시에 추가합니다.
+        results = self.cache.get_many(texts, as_numpy=as_numpy)
+        missing = [i for i, vector in enumerate(results) if vector is None and texts[i]]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            generated = self._generate_batch(missing_texts, batch_size, as_numpy)
+            self.cache.put_many(missing_texts, generated)
+            for i, vector in zip(missing, generated):
+                results[i] = vector
+        return results
+
+    def _generate_batch(self, texts, batch_size=None, as_numpy=False):
+        """캐시를 거치지 않고 모델로 임베딩을 생성합니다. 인자와 반환값은 generate_batch와 같습니다."""
+        results = [None] * len(texts)
+        valid = [i for i, text in enumerate(texts) if text and isinstance(text, str)]
+        if len(valid) < len(texts):
+            print(f"⚠️ 유효하지 않은 텍스트 {len(texts) - len(valid)}건은 임베딩하지 않습니다. (빈 문자열 또는 None)")
+        if not valid:
+            return results
 
         if self.model_type == 'openai':
             # OpenAI 클라이언트가 정상적으로 초기화되었는지 확인합니다.
             if not self.client:
                 print("❌ OpenAI 클라이언트가 초기화되지 않아 임베딩을 생성할 수 없습니다.")
-                return None
-            try:
-                # OpenAI의 embeddings.create API를 호출하여 임베딩을 요청합니다.
-                response = self.client.embeddings.create(
-                    input=[text.replace("\n", " ")],  # API는 텍스트 내 개행 문자를 공백으로 처리하는 것을 권장합니다.
-                    model=config.EMBEDDING_MODEL
-                )
-                # API 응답 구조에 따라 결과 데이터에서 임베딩 벡터를 추출합니다.
-                embedding = response.data[0].embedding
-                return embedding
-            except Exception as e:
-                # API 호출 중 예외가 발생하면 오류 메시지를 출력하고 None을 반환합니다.
-                print(f"❌ OpenAI 텍스트 임베딩 생성 중 오류가 발생했습니다: {e}")
-                return None
+                return results
+            # API는 텍스트 내 개행 문자를 공백으로 처리하는 것을 권장합니다.
+            cleaned = [texts[i].replace("\n", " ") for i in valid]
+            for batch in plan_openai_batches(cleaned):
+                embeddings = self._request_openai_embeddings([cleaned[j] for j in batch])
+                if embeddings is None and len(batch) > 1:
+                    print(f"⚠️ 묶음 요청({len(batch)}건)이 실패하여 한 건씩 다시 요청합니다.")
+                    embeddings = [
+                        (self._request_openai_embeddings([cleaned[j]]) or [None])[0] for j in batch
+                    ]
+                for j, embedding in zip(batch, embeddings or [None] * len(batch)):
+                    if as_numpy and embedding is not None:
+                        embedding = np.asarray(embedding, dtype=np.float32)
+                    results[valid[j]] = embedding
+            return results
         elif self.model_type == 'huggingface':
             # HuggingFace 모델이 정상적으로 로드되었는지 확인합니다.
             if not self.huggingface_model:
                 print("❌ HuggingFace 모델이 로드되지 않아 임베딩을 생성할 수 없습니다.")
-                return None
+                return results
             try:
-                # HuggingFace 모델을 사용하여 임베딩을 생성합니다.
-                embedding = self.huggingface_model.encode(text)
-                return embedding.tolist()
+                # 목록 전체를 넘겨 모델이 batch_size 단위로 묶어 인코딩하도록 합니다.
+                embeddings = self.huggingface_model.encode(
+                    [texts[i] for i in valid],
+                    batch_size=batch_size or DEFAULT_LOCAL_BATCH_SIZE,
+                    show_progress_bar=False,
+                )
+                for i, embedding in zip(valid, embeddings):
+                    results[i] = embedding.astype(np.float32) if as_numpy else embedding.tolist()
             except Exception as e:
                 # 임베딩 생성 중 예외가 발생하면 오류 메시지를 출력하고 None을 반환합니다.
                 print(f"❌ HuggingFace 텍스트 임베딩 생성 중 오류가 발생했습니다: {e}")
-                return None
+            return results
         else:
             print(f"❌ 지원하지 않는 모델 유형({self.model_type})으로는 임베딩을 생성할 수 없습니다.")
+            return results
+
+    def _request_openai_embeddings(self, inputs):
+        """OpenAI embeddings.create를 한 번 호출합니다. 실패 시 None을 반환합니다."""
+        try:
+            response = self.client.embeddings.create(input=inputs, model=config.EMBEDDING_MODEL)
+            # 응답 순서가 입력 순서와 다를 수 있으므로 index 기준으로 정렬합니다.
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            # API 호출 중 예외가 발생하면 오류 메시지를 출력하고 None을 반환합니다.
+            print(f"❌ OpenAI 텍스트 임베딩 생성 중 오류가 발생했습니다: {e}")
             return None
 
 if __name__ == '__main__':
@@ -0,0 +1,391 @@
+import json
+import os
+import re
+import shutil
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+from qdrant_client.http import models
+
+from .vector_store import VectorStore
+
+try:
+    import hnswlib
+except ImportError:  # hnswlib이 없으면 정확 검색(brute-force)만 사용합니다.
+    hnswlib = None
+
+# HNSW 검색 후 필터로 걸러질 것을 고려해 limit의 몇 배를 후보로 가져올지
+HNSW_OVERSAMPLE = 10
+
+
+class _LocalCollection:
+    """컬렉션 하나의 벡터 행렬과 payload. 벡터는 코사인 유사도 계산을 위해 정규화해서 저장합니다."""
+
+    def __init__(self, dim):
+        self.dim = dim
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.size = 0  # 사용 중인 행 수 (self.vectors는 여유 공간을 포함할 수 있음)
+        self.ids = []
+        self.payloads = []
+        self.row_of = {}
+        self.hnsw = None
+
+    @property
+    def alive_rows(self):
+        return np.fromiter((point_id is not None for point_id in self.ids), dtype=bool, count=self.size)
+
+    def _ensure_capacity(self, rows):
+        if not self.vectors.flags.writeable or len(self.vectors) < rows:
+            # 로드한 memmap(읽기 전용)이거나 공간이 부족하면 두 배씩 늘린 메모리 배열로 옮깁니다.
+            capacity = max(rows, 2 * len(self.vectors), 1024)
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:self.size] = self.vectors[:self.size]
+            self.vectors = grown
+
+    def upsert(self, ids, vectors, payloads):
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+        self._ensure_capacity(self.size + len(ids))
+        for point_id, vector, payload in zip(ids, vectors, payloads):
+            point_id = str(point_id)
+            row = self.row_of.get(point_id)
+            if row is None:
+                row = self.size
+                self.size += 1
+                self.ids.append(point_id)
+                self.payloads.append(None)
+                self.row_of[point_id] = row
+            self.vectors[row] = vector
+            self.payloads[row] = payload or {}
+        self.hnsw = None
+
+    def delete(self, point_ids):
+        for point_id in point_ids:
+            row = self.row_of.pop(str(point_id), None)
+            if row is not None:
+                self.ids[row] = None
+                self.payloads[row] = None
+        self.hnsw = None
+
+
+def _to_datetime(value):
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _range_matches(value, condition_range):
+    if isinstance(condition_range, models.DatetimeRange):
+        value = _to_datetime(value)
+        convert = _to_datetime
+    else:
+        convert = float
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return False
+    if value is None:
+        return False
+    for bound, check in (('gte', value.__ge__), ('gt', value.__gt__), ('lte', value.__le__), ('lt', value.__lt__)):
+        limit = getattr(condition_range, bound)
+        if limit is not None and not check(convert(limit)):
+            return False
+    return True
+
+
+def _condition_matches(payload, condition):
+    if isinstance(condition, models.Filter):
+        return filter_matches(payload, condition)
+    if not isinstance(condition, models.FieldCondition):
+        raise NotImplementedError(f"LocalVectorStore가 지원하지 않는 필터 조건입니다: {type(condition).__name__}")
+    value = payload.get(condition.key)
+    values = value if isinstance(value, list) else [value]
+    if condition.match is not None:
+        if isinstance(condition.match, models.MatchValue):
+            return condition.match.value in values
+        if isinstance(condition.match, models.MatchAny):
+            return any(v in condition.match.any for v in values)
+        raise NotImplementedError(f"LocalVectorStore가 지원하지 않는 match 조건입니다: {type(condition.match).__name__}")
+    if condition.range is not None:
+        return any(_range_matches(v, condition.range) for v in values if v is not None)
+    return True
+
+
+def filter_matches(payload, query_filter):
+    """
+    payload가 Qdrant 필터(models.Filter)를 만족하는지 확인합니다.
+
+    must/should/must_not과 FieldCondition(MatchValue, MatchAny, Range, DatetimeRange)만 지원합니다.
+    """
+    if query_filter is None:
+        return True
+    must = query_filter.must or []
+    should = query_filter.should or []
+    must_not = query_filter.must_not or []
+    must = must if isinstance(must, list) else [must]
+    should = should if isinstance(should, list) else [should]
+    must_not = must_not if isinstance(must_not, list) else [must_not]
+    return (
+        all(_condition_matches(payload, condition) for condition in must)
+        and (not should or any(_condition_matches(payload, condition) for condition in should))
+        and not any(_condition_matches(payload, condition) for condition in must_not)
+    )
+
+
+def _select_payload(payload, with_payload):
+    if with_payload is True:
+        return dict(payload)
+    if not with_payload:
+        return None
+    return {key: payload[key] for key in with_payload if key in payload}
+
+
+class LocalVectorStore(VectorStore):
+    """
+    Qdrant 서버 없이 로컬 디렉토리에 벡터를 저장하고 검색하는 VectorStore 구현입니다.
+
+    컬렉션마다 `<directory>/<컬렉션>/` 아래에 다음 파일을 저장합니다.
+    - vectors.npy: 정규화된 float32 벡터 행렬. 로드할 때 메모리 매핑(mmap)으로 열어 바로 검색합니다.
+    - points.jsonl: 행 순서대로 {"id", "payload"}
+    - meta.json: 벡터 차원, 포인트 수
+
+    기본 검색은 행렬 곱 한 번으로 모든 벡터와의 코사인 유사도를 계산하는 정확 검색입니다.
+    index='hnsw'이고 hnswlib이 설치되어 있으면 근사 최근접 검색(HNSW)을 사용합니다.
+    변경 사항은 save()를 호출해야 파일에 기록됩니다.
+    """
+
+    def __init__(self, directory: str, index: str = 'exact'):
+        """
+        Args:
+            directory (str): 컬렉션을 저장할 디렉토리. 이미 저장된 컬렉션이 있으면 불러옵니다.
+            index (str): 'exact'(정확 검색) 또는 'hnsw'(hnswlib 필요).
+        """
+        if index not in ('exact', 'hnsw'):
+            raise ValueError(f"지원하지 않는 인덱스 유형입니다: {index}")
+        if index == 'hnsw' and hnswlib is None:
+            print("⚠️ hnswlib이 설치되어 있지 않아 정확 검색(brute-force)을 사용합니다.")
+            index = 'exact'
+        self.directory = directory
+        self.index = index
+        self.collections = {}
+        self._lock = threading.RLock()  # 파이프라인의 업로드 스레드가 동시에 업서트합니다.
+        os.makedirs(directory, exist_ok=True)
+        self.load()
+
+    def is_ready(self) -> bool:
+        return True
+
+    def _collection_dir(self, collection_name):
+        return os.path.join(self.directory, re.sub(r'[^0-9A-Za-z._-]', '_', collection_name))
+
+    def _get(self, collection_name):
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            raise KeyError(f"컬렉션 '{collection_name}'이(가) 존재하지 않습니다.")
+        return collection
+
+    # --- 저장 / 불러오기 ---
+
+    def load(self):
+        """디렉토리에 저장된 컬렉션을 모두 불러옵니다. 벡터 행렬은 메모리 매핑으로 엽니다."""
+        self.collections = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                meta_path = os.path.join(entry.path, "meta.json")
+                if not entry.is_dir() or not os.path.exists(meta_path):
+                    continue
+                with open(meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+                collection = _LocalCollection(meta['dim'])
+                if meta['count']:
+                    collection.vectors = np.load(os.path.join(entry.path, "vectors.npy"), mmap_mode='r')
+                with open(os.path.join(entry.path, "points.jsonl"), encoding='utf-8') as f:
+                    for row, line in enumerate(f):
+                        point = json.loads(line)
+                        collection.ids.append(point['id'])
+                        collection.payloads.append(point['payload'])
+                        collection.row_of[point['id']] = row
+                collection.size = len(collection.ids)
+                self.collections[meta['name']] = collection
+
+    def save(self):
+        """모든 컬렉션을 파일로 저장합니다. 삭제된 포인트는 이때 행렬에서 제거됩니다."""
+        for collection_name, collection in self.collections.items():
+            path = self._collection_dir(collection_name)
+            os.makedirs(path, exist_ok=True)
+            rows = np.flatnonzero(collection.alive_rows)
+            vectors = np.ascontiguousarray(collection.vectors[rows])
+            # 임시 파일에 쓴 뒤 교체해, 저장 도중 중단되어도 이전 파일이 남아 있도록 합니다.
+            np.save(os.path.join(path, "vectors.tmp.npy"), vectors)
+            with open(os.path.join(path, "points.jsonl.tmp"), 'w', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps(
+                        {'id': collection.ids[row], 'payload': collection.payloads[row]},
+                        ensure_ascii=False, default=str,
+                    ) + "\n")
+            os.replace(os.path.join(path, "vectors.tmp.npy"), os.path.join(path, "vectors.npy"))
+            os.replace(os.path.join(path, "points.jsonl.tmp"), os.path.join(path, "points.jsonl"))
+            with open(os.path.join(path, "meta.json"), 'w', encoding='utf-8') as f:
+                json.dump({'name': collection_name, 'dim': collection.dim, 'count': len(rows)}, f, ensure_ascii=False)
+        print(f"💾 로컬 벡터 저장소를 저장했습니다: {self.directory}")
+
+    # --- VectorStore 구현 ---
+
+    def create_collection(self, collection_name: str, vector_size: int, recreate: bool = False,
+                          quantization: str = None, on_disk: bool = False, on_disk_payload: bool = False):
+        """컬렉션을 만듭니다. 양자화·디스크 저장 옵션은 Qdrant 전용이므로 무시합니다."""
+        if collection_name in self.collections and not recreate:
+            print(f"✅ 컬렉션 '{collection_name}'이(가) 이미 존재합니다. (재생성하려면 --recreate 옵션을 사용하세요)")
+            return
+        if recreate:
+            shutil.rmtree(self._collection_dir(collection_name), ignore_errors=True)
+        self.collections[collection_name] = _LocalCollection(vector_size)
+        print(f"✅ 로컬 컬렉션 '{collection_name}'이(가) 생성되었습니다.")
+
+    def create_payload_indexes(self, collection_name: str, field_schemas: dict = None):
+        """로컬 저장소는 필터를 payload 순회로 평가하므로 인덱스를 만들지 않습니다."""
+
+    def upsert_points(self, collection_name: str, points: list, wait: bool = True) -> bool:
+        if not points:
+            print("⚠️ 업서트할 데이터가 없습니다.")
+            return False
+        return self.upload_vectors(
+            collection_name,
+            [point.id for point in points],
+            [point.vector for point in points],
+            [point.payload for point in points],
+            wait=wait,
+        )
+
+    def upload_vectors(self, collection_name: str, ids: list, vectors, payloads: list, wait: bool = True) -> bool:
+        if not len(ids):
+            print("⚠️ 업서트할 데이터가 없습니다.")
+            return False
+        try:
+            with self._lock:
+                self._get(collection_name).upsert(ids, vectors, payloads)
+            return True
+        except Exception as e:
+            print(f"❌ 데이터 업서트 중 오류가 발생했습니다: {e}")
+            return False
+
+    def fetch_payloads(self, collection_name: str, fields: list, batch_size: int = 1000) -> dict:
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            return {}
+        return {
+            point_id: {key: payload[key] for key in fields if key in payload}
+            for point_id, payload in zip(collection.ids, collection.payloads)
+            if point_id is not None
+        }
+
+    def delete_points(self, collection_name: str, point_ids: list):
+        if point_ids and collection_name in self.collections:
+            with self._lock:
+                self.collections[collection_name].delete(point_ids)
+            print(f"🗑️ {len(point_ids)}개의 데이터 포인트를 '{collection_name}' 컬렉션에서 삭제했습니다.")
+
+    def _ranked_rows(self, collection, query_vector, query_filter, needed):
+        """
+        쿼리와 유사한 순서대로 (행, 점수)를 만들어 냅니다. 필터를 만족하지 않는 행은 건너뜁니다.
+
+        needed: 필요한 결과 수의 추정치. HNSW는 이만큼(의 HNSW_OVERSAMPLE배) 후보를 먼저 확인하고,
+        필터를 만족하는 후보가 needed개 이상이면 그 후보를 점수 순으로 내보냅니다. 부족하면 HNSW 후보를 먼저
+        내보내지 않고 정확 검색으로 (HNSW 후보를 포함한) 전체를 점수 순으로 찾으므로, 결과 순서가 섞이지 않습니다.
+        """
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        query = query / norm if norm else query
+
+        alive = collection.alive_rows
+        seen = set()
+        if self.index == 'hnsw' and collection.size:
+            matched = [
+                (row, score)
+                for row, score in self._hnsw_candidates(collection, query, needed * HNSW_OVERSAMPLE, alive)
+                if filter_matches(collection.payloads[row], query_filter)
+            ]
+            if len(matched) >= needed:
+                # knn_query 결과는 점수 순입니다. 호출한 쪽이 needed개보다 더 필요로 할 때만 아래 정확 검색으로 이어집니다.
+                for row, score in matched:
+                    seen.add(row)
+                    yield row, score
+
+        if collection.size == 0:
+            return
+        scores = collection.vectors[:collection.size] @ query
+        scores = np.where(alive, scores, -np.inf)
+        for row in np.argsort(-scores, kind='stable'):
+            if not alive[row]:
+                break
+            if row in seen or not filter_matches(collection.payloads[row], query_filter):
+                continue
+            yield int(row), float(scores[row])
+
+    def _hnsw_candidates(self, collection, query, k, alive):
+        if collection.hnsw is None:
+            index = hnswlib.Index(space='ip', dim=collection.dim)
+            index.init_index(max_elements=max(collection.size, 1), ef_construction=200, M=16)
+            rows = np.flatnonzero(alive)
+            if len(rows):
+                index.add_items(collection.vectors[rows], rows)
+            collection.hnsw = index
+        count = collection.hnsw.get_current_count()
+        k = min(k, count)
+        if k == 0:
+            return []
+        collection.hnsw.set_ef(max(k, 64))
+        labels, distances = collection.hnsw.knn_query(query, k=k)
+        # 'ip' 공간의 거리는 1 - 내적입니다.
+        return [(int(row), float(1 - distance)) for row, distance in zip(labels[0], distances[0])]
+
+    def search(self, collection_name: str, query_vector, limit: int = 10, query_filter=None, with_payload=True):
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            print(f"❌ 컬렉션 '{collection_name}'이(가) 존재하지 않습니다.")
+            return []
+        results = []
+        for row, score in self._ranked_rows(collection, query_vector, query_filter, limit):
+            results.append(models.ScoredPoint(
+                id=collection.ids[row], version=0, score=score,
+                payload=_select_payload(collection.payloads[row], with_payload),
+            ))
+            if len(results) >= limit:
+                break
+        return results
+
+    def search_groups(self, collection_name: str, query_vector, group_by: str, limit: int = 10,
+                      group_size: int = 3, query_filter=None, with_payload=True):
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            print(f"❌ 컬렉션 '{collection_name}'이(가) 존재하지 않습니다.")
+            return []
+        groups = {}
+        for row, score in self._ranked_rows(collection, query_vector, query_filter, limit * group_size):
+            payload = collection.payloads[row]
+            key = payload.get(group_by)
+            if key is None:
+                continue
+            hits = groups.get(key)
+            if hits is None:
+                if len(groups) >= limit:
+                    # 새 그룹은 더 받지 않고, 이미 있는 그룹만 채웁니다.
+                    if all(len(h) >= group_size for h in groups.values()):
+                        break
+                    continue
+                hits = groups[key] = []
+            if len(hits) < group_size:
+                hits.append(models.ScoredPoint(
+                    id=collection.ids[row], version=0, score=score,
+                    payload=_select_payload(payload, with_payload),
+                ))
+        return [models.PointGroup(id=key, hits=hits) for key, hits in groups.items()]
@@ -1,30 +1,57 @@
 import qdrant_client
 from qdrant_client.http import models
 from . import config
+from .vector_store import VectorStore
 
-class QdrantManager:
+# 법안 컬렉션에서 검색 필터로 사용하는 payload 필드와 인덱스 유형
+BILL_PAYLOAD_INDEXES = {
+    'bill_id': models.PayloadSchemaType.KEYWORD,  # 청크 검색 결과를 법안별로 묶을 때 사용
+    'propose_date': models.PayloadSchemaType.DATETIME,
+    'assembly_number': models.PayloadSchemaType.INTEGER,
+    'stage': models.PayloadSchemaType.KEYWORD,
+    'committee': models.PayloadSchemaType.KEYWORD,
+}
+
+class QdrantManager(VectorStore):
     """
     Qdrant 벡터 데이터베이스와의 연결 및 상호작용을 관리하는 클래스입니다.
+    Qdrant 없이 실행하려면 같은 인터페이스(VectorStore)의 LocalVectorStore를 사용하세요.
     """
-    def __init__(self):
+    def __init__(self, prefer_grpc: bool = None):
         """
         QdrantManager 클래스의 인스턴스를 생성할 때 호출됩니다.
-        config.py에 정의된 호스트, API 키, HTTPS 사용 여부 정보를 사용하여 Qdrant 클라이언트를 초기화합니다.
+        config.py에 정의된 호스트, API 키, 포트, HTTPS 사용 여부 정보를 사용하여 Qdrant 클라이언트를 초기화합니다.
+
+        Args:
+            prefer_grpc (bool, optional): True이면 gRPC 포트(기본 6334)로 통신합니다.
+                지정하지 않으면 QDRANT_PREFER_GRPC 환경 변수를 따릅니다.
         """
+        if prefer_grpc is None:
+            prefer_grpc = config.QDRANT_PREFER_GRPC
         try:
             self.client = qdrant_client.QdrantClient(
                 host=config.QDRANT_HOST, 
                 api_key=config.QDRANT_API_KEY,
-                port=6333,  # Qdrant의 기본 gRPC 포트
+                port=config.QDRANT_PORT,  # Qdrant의 REST(HTTP) 포트
+                grpc_port=config.QDRANT_GRPC_PORT,
+                prefer_grpc=prefer_grpc,
                 https=config.QDRANT_USE_HTTPS # HTTPS 사용 여부를 config에서 가져와 설정
             )
-            protocol = "https" if config.QDRANT_USE_HTTPS else "http"
-            print(f"✅ Qdrant 클라이언트가 성공적으로 초기화되었습니다. ({protocol}://{config.QDRANT_HOST}:{6333})")
+            if prefer_grpc:
+                endpoint = f"grpc://{config.QDRANT_HOST}:{config.QDRANT_GRPC_PORT}"
+            else:
+                protocol = "https" if config.QDRANT_USE_HTTPS else "http"
+                endpoint = f"{protocol}://{config.QDRANT_HOST}:{config.QDRANT_PORT}"
+            print(f"✅ Qdrant 클라이언트가 성공적으로 초기화되었습니다. ({endpoint})")
         except Exception as e:
             print(f"❌ Qdrant 클라이언트 초기화에 실패했습니다: {e}")
             self.client = None
 
-    def create_collection(self, collection_name: str, vector_size: int, recreate: bool = False):
+    def is_ready(self) -> bool:
+        return self.client is not None
+
+    def create_collection(self, collection_name: str, vector_size: int, recreate: bool = False,
+                          quantization: str = None, on_disk: bool = False, on_disk_payload: bool = False):
         """
         Qdrant에 컬렉션을 생성하거나 재생성합니다.
 
@@ -32,61 +59,284 @@ class QdrantManager:
             collection_name (str): 생성할 컬렉션의 이름.
             vector_size (int): 컬렉션에 저장될 임베딩 벡터의 차원 수.
             recreate (bool): True일 경우, 동일한 이름의 컬렉션이 이미 존재하면 삭제 후 재생성합니다.
+            quantization (str, optional): 'int8'이면 스칼라 양자화를 사용합니다. 양자화된 벡터(원본의 1/4 크기)만
+                메모리에 두고 검색한 뒤, 원본 벡터로 재점수화합니다.
+            on_disk (bool): True이면 원본 벡터를 메모리 대신 디스크(mmap)에 저장합니다.
+            on_disk_payload (bool): True이면 payload를 디스크에 저장합니다.
+
+        옵션은 컬렉션을 새로 만들 때만 적용됩니다. 기존 컬렉션에 적용하려면 recreate=True로 다시 만드세요.
         """
         if not self.client:
             print("❌ Qdrant 클라이언트가 초기화되지 않아 컬렉션을 생성할 수 없습니다.")
             return
 
+        collection_options = {
+            'vectors_config': models.VectorParams(size=vector_size, distance=models.Distance.COSINE, on_disk=on_disk),
+            'on_disk_payload': on_disk_payload,
+        }
+        if quantization == 'int8':
+            collection_options['quantization_config'] = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        elif quantization is not None:
+            print(f"❌ 지원하지 않는 양자화 방식입니다: {quantization}")
+            return
+
         try:
-            # recreate 플래그가 True이면, 묻지도 따지지도 않고 컬렉션을 재생성합니다.
-            if recreate:
-                print(f"⚠️ --recreate 플래그가 활성화되었습니다. 기존 컬렉션 '{collection_name}'을(를) 삭제하고 재생성합니다.")
-                self.client.recreate_collection(
-                    collection_name=collection_name,
-                    vectors_config=models.VectorParams(size=vector_size, distance=models.Distance.COSINE)
-                )
-                print(f"✅ 컬렉션 '{collection_name}'이(가) 성공적으로 재생성되었습니다.")
+            # recreate_collection은 deprecated이므로 존재 여부를 확인한 뒤 삭제·생성을 직접 호출합니다.
+            exists = self.client.collection_exists(collection_name=collection_name)
+            if exists and not recreate:
+                print(f"✅ 컬렉션 '{collection_name}'이(가) 이미 존재합니다. (재생성하려면 --recreate 옵션을 사용하세요)")
                 return
 
-            # recreate 플래그가 False일 경우, 컬렉션 존재 여부를 확인합니다.
-            collections_response = self.client.get_collections()
-            existing_collections = [collection.name for collection in collections_response.collections]
-            
-            if collection_name not in existing_collections:
+            if exists:
+                print(f"⚠️ --recreate 플래그가 활성화되었습니다. 기존 컬렉션 '{collection_name}'을(를) 삭제하고 재생성합니다.")
+                self.client.delete_collection(collection_name=collection_name)
+            else:
                 print(f"ℹ️ 컬렉션 '{collection_name}'이(가) 존재하지 않습니다. 새로 생성합니다.")
-                self.client.recreate_collection(
+            self.client.create_collection(collection_name=collection_name, **collection_options)
+            print(f"✅ 컬렉션 '{collection_name}'이(가) 성공적으로 {'재생성' if exists else '생성'}되었습니다.")
+        except Exception as e:
+            print(f"❌ 컬렉션 작업 중 오류가 발생했습니다: {e}")
+
+    def create_payload_indexes(self, collection_name: str, field_schemas: dict = None):
+        """
+        필터 검색에 사용하는 payload 필드에 인덱스를 만듭니다. 이미 있는 인덱스는 건너뜁니다.
+
+        인덱스가 없으면 필터 조건을 만족하는 포인트를 찾기 위해 payload를 모두 훑어야 하므로,
+        필터가 걸린 kNN 검색이 컬렉션 크기에 비례해 느려집니다.
+
+        Args:
+            collection_name (str): 인덱스를 만들 컬렉션의 이름.
+            field_schemas (dict[str, models.PayloadSchemaType], optional): 필드 이름 -> 인덱스 유형.
+                기본값은 BILL_PAYLOAD_INDEXES입니다.
+        """
+        if not self.client:
+            print("❌ Qdrant 클라이언트가 초기화되지 않아 인덱스를 생성할 수 없습니다.")
+            return
+
+        field_schemas = field_schemas or BILL_PAYLOAD_INDEXES
+        try:
+            existing = self.client.get_collection(collection_name).payload_schema or {}
+            for field_name, field_schema in field_schemas.items():
+                if field_name in existing:
+                    continue
+                self.client.create_payload_index(
                     collection_name=collection_name,
-                    vectors_config=models.VectorParams(size=vector_size, distance=models.Distance.COSINE)
+                    field_name=field_name,
+                    field_schema=field_schema,
+                    wait=True,
                 )
-                print(f"✅ 컬렉션 '{collection_name}'이(가) 성공적으로 생성되었습니다.")
-            else:
-                print(f"✅ 컬렉션 '{collection_name}'이(가) 이미 존재합니다. (재생성하려면 --recreate 옵션을 사용하세요)")
+                print(f"✅ '{collection_name}' 컬렉션에 payload 인덱스 '{field_name}'을(를) 생성했습니다.")
         except Exception as e:
-            print(f"❌ 컬렉션 작업 중 오류가 발생했습니다: {e}")
+            print(f"❌ payload 인덱스 생성 중 오류가 발생했습니다: {e}")
+
+    def search(self, collection_name: str, query_vector, limit: int = 10, query_filter=None, with_payload=True):
+        """
+        쿼리 벡터와 가장 가까운 포인트를 유사도 순으로 검색합니다.
+
+        Args:
+            collection_name (str): 검색할 컬렉션의 이름.
+            query_vector (list[float] | numpy.ndarray): 쿼리 임베딩 벡터.
+            limit (int): 반환할 최대 결과 수.
+            query_filter (models.Filter, optional): payload 필터 조건.
+            with_payload (bool | list[str]): 함께 반환할 payload (필드 목록 지정 가능).
+
+        Returns:
+            list[models.ScoredPoint]: 유사도 순으로 정렬된 결과. 오류가 나면 빈 리스트를 반환합니다.
+        """
+        if not self.client:
+            print("❌ Qdrant 클라이언트가 초기화되지 않아 검색할 수 없습니다.")
+            return []
+
+        try:
+            response = self.client.query_points(
+                collection_name=collection_name,
+                query=query_vector,
+                query_filter=query_filter,
+                limit=limit,
+                with_payload=with_payload,
+                with_vectors=False,
+            )
+            return response.points
+        except Exception as e:
+            print(f"❌ 검색 중 오류가 발생했습니다: {e}")
+            return []
 
-    def upsert_points(self, collection_name: str, points: list):
+    def search_groups(self, collection_name: str, query_vector, group_by: str, limit: int = 10,
+                      group_size: int = 3, query_filter=None, with_payload=True):
+        """
+        검색 결과를 payload 필드(group_by) 값별로 묶어 반환합니다.
+
+        청크 단위로 저장된 컬렉션에서 같은 법안의 청크가 결과를 채우지 않도록 법안(bill_id)별로 묶을 때 사용합니다.
+
+        Args:
+            group_by (str): 묶을 payload 필드. keyword 인덱스가 있어야 빠릅니다.
+            limit (int): 반환할 최대 그룹 수.
+            group_size (int): 그룹마다 반환할 최대 포인트 수.
+            나머지 인자는 search와 같습니다.
+
+        Returns:
+            list[models.PointGroup]: 그룹별 최고 점수 순으로 정렬된 결과. 오류가 나면 빈 리스트를 반환합니다.
+        """
+        if not self.client:
+            print("❌ Qdrant 클라이언트가 초기화되지 않아 검색할 수 없습니다.")
+            return []
+
+        try:
+            response = self.client.query_points_groups(
+                collection_name=collection_name,
+                query=query_vector,
+                group_by=group_by,
+                query_filter=query_filter,
+                limit=limit,
+                group_size=group_size,
+                with_payload=with_payload,
+                with_vectors=False,
+            )
+            return response.groups
+        except Exception as e:
+            print(f"❌ 검색 중 오류가 발생했습니다: {e}")
+            return []
+
+    def upsert_points(self, collection_name: str, points: list, wait: bool = True):
         """
         데이터 포인트(PointStruct) 리스트를 지정된 Qdrant 컬렉션에 업서트합니다.
 
         Args:
             collection_name (str): 데이터를 업서트할 컬렉션의 이름.
             points (list[models.PointStruct]): Qdrant에 저장할 데이터 포인트 객체의 리스트.
+            wait (bool): True이면 업서트가 인덱스에 반영될 때까지 기다립니다.
+                False이면 서버가 요청을 WAL에 기록한 시점에 바로 반환합니다. 이 경우 마지막 요청을
+                wait=True로 보내면, 업데이트는 순서대로 반영되므로 그 이전 요청도 모두 반영된 것이 보장됩니다.
+
+        Returns:
+            bool: 업서트 요청 성공 여부
         """
         if not self.client:
             print("❌ Qdrant 클라이언트가 초기화되지 않아 데이터를 업로드할 수 없습니다.")
-            return
+            return False
         
         if not points:
             print("⚠️ 업서트할 데이터가 없습니다.")
-            return
+            return False
 
         try:
             # 지정된 컬렉션에 포인트들을 업서트합니다.
             self.client.upsert(
                 collection_name=collection_name,
                 points=points,
-                wait=True  # API 호출이 완전히 처리될 때까지 대기하여 작업의 성공을 보장합니다.
+                wait=wait,
+            )
+            if wait:
+                print(f"✅ {len(points)}개의 데이터 포인트를 '{collection_name}' 컬렉션에 성공적으로 업서트했습니다.")
+            return True
+        except Exception as e:
+            print(f"❌ 데이터 업서트 중 오류가 발생했습니다: {e}")
+            return False
+
+    def upload_vectors(self, collection_name: str, ids: list, vectors, payloads: list, wait: bool = True):
+        """
+        numpy 행렬 형태의 벡터를 리스트로 변환하지 않고 그대로 업서트합니다.
+
+        PointStruct는 벡터를 파이썬 float 리스트로 요구하지만, upload_collection은 numpy 배열을 받아
+        전송 형식(gRPC는 protobuf, REST는 JSON)으로 바로 직렬화합니다.
+
+        Args:
+            collection_name (str): 데이터를 업서트할 컬렉션의 이름.
+            ids (list[str]): 포인트 ID 리스트.
+            vectors (numpy.ndarray): (포인트 수, 벡터 차원) 크기의 행렬.
+            payloads (list[dict]): 포인트별 payload 리스트.
+            wait (bool): True이면 업서트가 반영될 때까지 기다립니다. (upsert_points 참고)
+
+        Returns:
+            bool: 업서트 요청 성공 여부
+        """
+        if not self.client:
+            print("❌ Qdrant 클라이언트가 초기화되지 않아 데이터를 업로드할 수 없습니다.")
+            return False
+
+        if not len(ids):
+            print("⚠️ 업서트할 데이터가 없습니다.")
+            return False
+
+        try:
+            self.client.upload_collection(
+                collection_name=collection_name,
+                vectors=vectors,
+                payload=payloads,
+                ids=ids,
+                batch_size=len(ids),  # 호출한 쪽에서 이미 배치로 나누었으므로 요청 한 번으로 보냅니다.
+                wait=wait,
             )
-            print(f"✅ {len(points)}개의 데이터 포인트를 '{collection_name}' 컬렉션에 성공적으로 업서트했습니다.")
+            if wait:
+                print(f"✅ {len(ids)}개의 데이터 포인트를 '{collection_name}' 컬렉션에 성공적으로 업서트했습니다.")
+            return True
         except Exception as e:
             print(f"❌ 데이터 업서트 중 오류가 발생했습니다: {e}")
+            return False
+
+    def fetch_payloads(self, collection_name: str, fields: list, batch_size: int = 1000):
+        """
+        컬렉션의 모든 포인트에 대해 지정한 payload 필드만 조회합니다. (벡터는 가져오지 않습니다)
+
+        증분 동기화에서 포인트별 content_hash를 원본 DB 행과 비교할 때 사용합니다.
+
+        Args:
+            collection_name (str): 조회할 컬렉션의 이름.
+            fields (list[str]): 가져올 payload 키 목록.
+            batch_size (int): scroll 요청 한 번에 가져올 포인트 수.
+
+        Returns:
+            dict[str, dict]: 포인트 ID -> payload. 컬렉션이 없거나 오류가 나면 빈 딕셔너리를 반환합니다.
+        """
+        if not self.client:
+            print("❌ Qdrant 클라이언트가 초기화되지 않아 포인트를 조회할 수 없습니다.")
+            return {}
+
+        payloads = {}
+        try:
+            if not self.client.collection_exists(collection_name):
+                return {}
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=collection_name,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=models.PayloadSelectorInclude(include=list(fields)),
+                    with_vectors=False,
+                )
+                for record in records:
+                    payloads[str(record.id)] = record.payload or {}
+                if offset is None:
+                    break
+        except Exception as e:
+            print(f"❌ 포인트 payload 조회 중 오류가 발생했습니다: {e}")
+            return {}
+        return payloads
+
+    def delete_points(self, collection_name: str, point_ids: list):
+        """
+        포인트 ID 목록에 해당하는 포인트를 컬렉션에서 삭제합니다.
+
+        Args:
+            collection_name (str): 포인트를 삭제할 컬렉션의 이름.
+            point_ids (list[str]): 삭제할 포인트 ID 리스트.
+        """
+        if not self.client:
+            print("❌ Qdrant 클라이언트가 초기화되지 않아 데이터를 삭제할 수 없습니다.")
+            return
+
+        if not point_ids:
+            return
+
+        try:
+            self.client.delete(
+                collection_name=collection_name,
+                points_selector=models.PointIdsList(points=list(point_ids)),
+                wait=True,
+            )
+            print(f"🗑️ {len(point_ids)}개의 데이터 포인트를 '{collection_name}' 컬렉션에서 삭제했습니다.")
+        except Exception as e:
+            print(f"❌ 데이터 삭제 중 오류가 발생했습니다: {e}")
@@ -0,0 +1,132 @@
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 글자 수로 토큰 수를 추정합니다.
+    tiktoken = None
+
+try:
+    from transformers import AutoTokenizer
+except ImportError:  # transformers가 없으면 tiktoken(또는 글자 수 추정)을 사용합니다.
+    AutoTokenizer = None
+
+# 청크 하나의 최대 토큰 수와 이웃한 청크끼리 겹치는 토큰 수 기본값
+DEFAULT_CHUNK_TOKENS = 512
+DEFAULT_CHUNK_OVERLAP = 64
+# 토큰 수를 셀 기본 임베딩 모델. 청크 크기 제한은 임베딩 모델의 토크나이저 기준이어야 합니다.
+DEFAULT_TOKENIZER_MODEL = 'nlpai-lab/KURE-v1'
+# tiktoken이 없을 때 사용하는 글자당 토큰 수 (한글 1자 ≈ 1.5토큰, embedding_generator.estimate_tokens와 같은 가정)
+TOKENS_PER_CHAR = 1.5
+
+_encoding = None
+_tokenizers = {}
+
+
+def _get_encoding():
+    global _encoding
+    if _encoding is None:
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    return _encoding
+
+
+def get_tokenizer(model_name: str = DEFAULT_TOKENIZER_MODEL):
+    """
+    임베딩 모델의 (fast) 토크나이저를 불러옵니다. 모델별로 한 번만 불러옵니다.
+
+    Returns:
+        PreTrainedTokenizerFast | None: transformers가 없거나, 불러오지 못했거나, 글자 위치(offset)를
+            지원하지 않는 토크나이저이면 None
+    """
+    if not model_name or AutoTokenizer is None:
+        return None
+    if model_name not in _tokenizers:
+        tokenizer = None
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        except Exception as e:
+            print(f"⚠️ 토크나이저 '{model_name}'을(를) 불러오지 못해 tiktoken으로 토큰 수를 계산합니다: {e}")
+        _tokenizers[model_name] = tokenizer if getattr(tokenizer, 'is_fast', False) else None
+    return _tokenizers[model_name]
+
+
+def _tiktoken_spans(text: str):
+    """
+    tiktoken 토큰마다 원문에서의 (시작, 끝) 글자 위치를 반환합니다.
+
+    BPE 토큰은 한글 한 글자(UTF-8 3바이트)의 중간에서 끝날 수 있습니다. 토큰 경계를 그 글자의 시작으로
+    내려 맞추므로, 글자는 항상 통째로 한 토큰 구간에 들어가고 잘린 바이트(U+FFFD)가 생기지 않습니다.
+    """
+    encoding = _get_encoding()
+    # 바이트 위치 -> 그 바이트가 속한 글자의 위치
+    char_at = []
+    for index, char in enumerate(text):
+        char_at.extend([index] * len(char.encode('utf-8')))
+    char_at.append(len(text))
+
+    spans = []
+    position = 0
+    for token in encoding.encode(text):
+        end = position + len(encoding.decode_single_token_bytes(token))
+        spans.append((char_at[position], char_at[end]))
+        position = end
+    return spans
+
+
+def _token_spans(text: str, model_name: str):
+    """토큰별 (시작, 끝) 글자 위치. 임베딩 모델 토크나이저 → tiktoken 순서로 사용하고, 둘 다 없으면 None"""
+    tokenizer = get_tokenizer(model_name)
+    if tokenizer is not None:
+        encoded = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True, verbose=False)
+        return [tuple(span) for span in encoded['offset_mapping']]
+    if tiktoken is not None:
+        return _tiktoken_spans(text)
+    return None
+
+
+def count_tokens(text: str, model_name: str = DEFAULT_TOKENIZER_MODEL) -> int:
+    """
+    텍스트의 토큰 수를 계산합니다.
+
+    model_name의 토크나이저를 불러올 수 있으면 그 기준으로, 아니면 tiktoken(cl100k_base)으로 세고,
+    둘 다 없으면 글자 수로 추정합니다. OpenAI 임베딩 모델이면 model_name=None으로 tiktoken을 사용합니다.
+    """
+    tokenizer = get_tokenizer(model_name)
+    if tokenizer is not None:
+        return len(tokenizer(text, add_special_tokens=False, verbose=False)['input_ids'])
+    if tiktoken is not None:
+        return len(_get_encoding().encode(text))
+    return int(len(text) * TOKENS_PER_CHAR) + 1
+
+
+def split_text(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS, overlap: int = DEFAULT_CHUNK_OVERLAP,
+               model_name: str = DEFAULT_TOKENIZER_MODEL):
+    """
+    긴 텍스트를 max_tokens 토큰 이하의 창으로 나눕니다. 이웃한 창은 overlap 토큰만큼 겹칩니다.
+
+    조항 하나가 창 경계에 걸려 잘리더라도 겹치는 구간 덕분에 어느 한 청크에는 온전히 들어가도록 합니다.
+    토큰은 count_tokens와 같은 토크나이저로 나누고, 창은 토큰의 글자 위치로 원문을 잘라 만듭니다.
+    (토큰을 다시 디코딩하지 않으므로 창 경계에서 글자가 깨지지 않습니다.)
+    토크나이저를 하나도 쓸 수 없으면 글자 단위 창을 사용합니다.
+
+    Returns:
+        list[str]: 청크 목록. 텍스트가 max_tokens 이하이면 [text]
+    """
+    if max_tokens <= 0 or not 0 <= overlap < max_tokens:
+        raise ValueError("max_tokens는 양수이고 overlap은 0 이상 max_tokens 미만이어야 합니다.")
+
+    spans = _token_spans(text, model_name)
+    if spans is None:
+        window = max(1, int(max_tokens / TOKENS_PER_CHAR))
+        step = max(1, window - int(overlap / TOKENS_PER_CHAR))
+        spans = [(index, index + 1) for index in range(len(text))]
+    else:
+        window, step = max_tokens, max_tokens - overlap
+
+    if len(spans) <= window:
+        return [text]
+
+    chunks = []
+    for start in range(0, len(spans), step):
+        end = min(start + window, len(spans))
+        chunks.append(text[spans[start][0]:spans[end - 1][1]].strip())
+        if end >= len(spans):
+            break
+    return [chunk for chunk in chunks if chunk]
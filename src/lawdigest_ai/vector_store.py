@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+
+
+class VectorStore(ABC):
+    """
+    벡터 파이프라인(tools/update_vector_db.py)과 검색(bill_search.BillSearcher)이 사용하는 벡터 저장소 인터페이스입니다.
+
+    - QdrantManager: Qdrant 서버(또는 qdrant_client 메모리 모드)를 사용하는 구현
+    - LocalVectorStore: Qdrant 없이 numpy 행렬과 로컬 파일만으로 동작하는 구현 (노트북, CI, 오프라인 벤치마크용)
+
+    검색 결과는 두 구현 모두 qdrant_client의 ScoredPoint/PointGroup 모델로 반환합니다.
+    save를 제외한 메서드는 모두 구현해야 합니다.
+    """
+
+    @abstractmethod
+    def is_ready(self) -> bool:
+        """저장소를 사용할 준비가 되었는지(연결 또는 로드에 성공했는지) 반환합니다."""
+
+    @abstractmethod
+    def create_collection(self, collection_name: str, vector_size: int, recreate: bool = False,
+                          quantization: str = None, on_disk: bool = False, on_disk_payload: bool = False):
+        """컬렉션을 만듭니다. 이미 있으면 recreate=True일 때만 지우고 다시 만듭니다."""
+
+    @abstractmethod
+    def create_payload_indexes(self, collection_name: str, field_schemas: dict = None):
+        """검색 필터에 쓰는 payload 필드의 인덱스를 만듭니다."""
+
+    @abstractmethod
+    def upsert_points(self, collection_name: str, points: list, wait: bool = True) -> bool:
+        """PointStruct 목록을 업서트하고 성공 여부를 반환합니다."""
+
+    @abstractmethod
+    def upload_vectors(self, collection_name: str, ids: list, vectors, payloads: list, wait: bool = True) -> bool:
+        """ID·벡터 행렬·payload 목록을 업서트하고 성공 여부를 반환합니다."""
+
+    @abstractmethod
+    def fetch_payloads(self, collection_name: str, fields: list, batch_size: int = 1000) -> dict:
+        """모든 포인트의 payload 중 fields만 {포인트 ID: payload} 형태로 반환합니다."""
+
+    @abstractmethod
+    def delete_points(self, collection_name: str, point_ids: list):
+        """포인트를 삭제합니다."""
+
+    @abstractmethod
+    def search(self, collection_name: str, query_vector, limit: int = 10, query_filter=None, with_payload=True):
+        """query_vector와 가까운 포인트를 점수 순으로 최대 limit개 반환합니다."""
+
+    @abstractmethod
+    def search_groups(self, collection_name: str, query_vector, group_by: str, limit: int = 10,
+                      group_size: int = 3, query_filter=None, with_payload=True):
+        """payload의 group_by 값(예: bill_id)별로 묶어 상위 limit개 그룹을 반환합니다."""
+
+    def save(self):
+        """변경 사항을 영구 저장소에 기록합니다. 서버가 직접 저장하는 구현에서는 아무 일도 하지 않습니다."""
+
+
+def open_vector_store(backend: str = 'qdrant', local_dir: str = None, prefer_grpc: bool = None, index: str = 'exact'):
+    """
+    설정에 맞는 VectorStore 구현을 만듭니다.
+
+    Args:
+        backend (str): 'qdrant'(Qdrant 서버) 또는 'local'(LocalVectorStore)
+        local_dir (str, optional): backend='local'일 때 저장 디렉토리
+        prefer_grpc (bool, optional): backend='qdrant'일 때 gRPC 사용 여부
+        index (str): backend='local'일 때 'exact' 또는 'hnsw'
+    """
+    if backend == 'qdrant':
+        from .qdrant_manager import QdrantManager
+        return QdrantManager(prefer_grpc=prefer_grpc)
+    if backend == 'local':
+        if not local_dir:
+            raise ValueError("로컬 벡터 저장소를 사용하려면 local_dir을 지정해야 합니다.")
+        from .local_vector_store import LocalVectorStore
+        return LocalVectorStore(local_dir, index=index)
+    raise ValueError(f"지원하지 않는 벡터 저장소입니다: {backend}")
@@ -0,0 +1,113 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_operations.BackupStore import BackupStore, split_dump_chunks
+
+
+def make_dump(num_rows, start=0, changed=()):
+    lines = [b"CREATE TABLE `Bill` (`billId` varchar(32));\n"]
+    for i in range(start, start + num_rows):
+        title = "수정된 제목" if i in changed else "주택법 일부개정법률안"
+        lines.append(f"INSERT INTO `Bill` VALUES ('PRC_{i:08d}','{title}');\n".encode('utf-8'))
+    return b"".join(lines)
+
+
+def make_store(path, **kwargs):
+    return BackupStore(str(path), compression='gzip', min_chunk_size=2048, max_chunk_size=8192, **kwargs)
+
+
+def test_chunks_reassemble_to_original():
+    dump = make_dump(2000)
+    chunks = list(split_dump_chunks(io.BytesIO(dump), min_size=2048, max_size=8192))
+
+    assert b"".join(chunks) == dump
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 8192 + 200 for chunk in chunks)
+
+
+def test_unchanged_table_is_stored_once(tmp_path):
+    store = make_store(tmp_path)
+
+    first = store.begin_backup(database='lawdigest')
+    store.add_table(first, 'Bill', io.BytesIO(make_dump(2000)))
+    store.commit_backup(first)
+    size_after_first = store.total_size()
+
+    second = store.begin_backup(database='lawdigest')
+    second['id'] += '-2'
+    entry = store.add_table(second, 'Bill', io.BytesIO(make_dump(2000)))
+    store.commit_backup(second)
+
+    assert entry['new_chunks'] == 0
+    assert store.total_size() == size_after_first
+    assert size_after_first < len(make_dump(2000)) / 3
+
+
+def test_changed_rows_only_store_nearby_chunks(tmp_path):
+    store = make_store(tmp_path)
+    first = store.begin_backup(database='lawdigest')
+    entry_first = store.add_table(first, 'Bill', io.BytesIO(make_dump(5000)))
+    store.commit_backup(first)
+
+    second = store.begin_backup(database='lawdigest')
+    entry_second = store.add_table(second, 'Bill', io.BytesIO(make_dump(5000, changed={2500})))
+
+    assert 0 < entry_second['new_chunks'] <= 2
+    assert len(entry_second['chunks']) == len(entry_first['chunks'])
+
+
+def test_export_restores_dump_and_catalog_persists(tmp_path):
+    store = make_store(tmp_path)
+    backup = store.begin_backup(database='lawdigest')
+    store.add_table(backup, 'Bill', io.BytesIO(make_dump(1000)))
+    store.add_table(backup, '__routines__', io.BytesIO(b"-- routines\n"))
+    store.commit_backup(backup)
+
+    reopened = make_store(tmp_path)
+    output = io.BytesIO()
+    reopened.export(reopened.get_backup(), output)
+
+    assert output.getvalue() == make_dump(1000) + b"-- routines\n"
+    with pytest.raises(ValueError):
+        reopened.get_backup('missing')
+
+
+def test_retention_removes_oldest_backups_and_orphan_chunks(tmp_path):
+    store = make_store(tmp_path)
+    for i in range(3):
+        backup = store.begin_backup(database='lawdigest')
+        backup['id'] = f'backup-{i}'
+        store.add_table(backup, 'Bill', io.BytesIO(make_dump(1000, start=i * 1000)))
+        store.commit_backup(backup)
+    latest_size = store.total_size() // 3
+
+    removed = store.enforce_retention(max_bytes=latest_size + 1024)
+
+    assert removed == ['backup-0', 'backup-1']
+    assert [backup['id'] for backup in store.backups()] == ['backup-2']
+    stored_files = [name for _, _, names in os.walk(tmp_path / 'chunks') for name in names]
+    assert len(stored_files) == len(store.catalog['chunks'])
+    output = io.BytesIO()
+    store.export(store.get_backup(), output)
+    assert output.getvalue() == make_dump(1000, start=2000)
+
+
+def test_record_table_merges_chunks_written_by_worker_store(tmp_path):
+    store = make_store(tmp_path)
+    worker_store = make_store(tmp_path)
+
+    entry = worker_store.add_table({'tables': {}}, 'Bill', io.BytesIO(make_dump(2000)))
+    backup = store.begin_backup(database='lawdigest')
+    recorded = store.record_table(backup, 'Bill', entry, worker_store.chunk_entries(entry['chunks']))
+    store.commit_backup(backup)
+
+    assert recorded['new_chunks'] == len(set(entry['chunks']))
+    assert store.total_size() == worker_store.total_size()
+    output = io.BytesIO()
+    make_store(tmp_path).export(store.get_backup(), output)
+    assert output.getvalue() == make_dump(2000)
@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from data_operations.CollectionEngine import (
+    CollectionEngine, PageFetchError, TokenBucket, parse_response, run_worker_pool,
+)
+
+# 열린국회정보(xml) 형식을 흉내내는 매퍼
+MAPPER = {
+    "page_param": "pIndex",
+    "size_param": "pSize",
+    "data_path": ".//row",
+    "total_count_path": ".//list_total_count",
+    "result_code_path": ".//RESULT/CODE",
+    "result_msg_path": ".//RESULT/MESSAGE",
+    "success_code": "INFO-000",
+    "empty_codes": ("INFO-200",),
+}
+
+TOTAL_ROWS = 25
+
+
+def make_page(rows, total=TOTAL_ROWS, code="INFO-000"):
+    body = "".join(f"<row><ID>{i}</ID></row>" for i in rows)
+    return (
+        f"<api><head><list_total_count>{total}</list_total_count>"
+        f"<RESULT><CODE>{code}</CODE><MESSAGE>ok</MESSAGE></RESULT></head>{body}</api>"
+    )
+
+
+def run_with_server(handler, scenario):
+    """로컬 aiohttp 서버를 띄우고 scenario(engine, base_url)를 실행합니다."""
+    async def main():
+        app = web.Application()
+        app.router.add_get("/api", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with CollectionEngine(max_concurrency=3, backoff_base=0.01) as engine:
+                return await scenario(engine, str(server.make_url("/api")))
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_parse_response_handles_empty_code():
+    content = make_page([], total=0, code="INFO-200").encode()
+    assert parse_response(content, "xml", MAPPER) == ([], 0)
+
+
+def test_fetch_pages_collects_all_pages_in_order():
+    async def handler(request):
+        page = int(request.query["pIndex"])
+        size = int(request.query["pSize"])
+        rows = range((page - 1) * size, min(page * size, TOTAL_ROWS))
+        return web.Response(text=make_page(rows), content_type="application/xml")
+
+    async def scenario(engine, url):
+        rows = await engine.fetch_pages(url, {"pIndex": 1, "pSize": 10}, MAPPER, format="xml")
+        return rows, engine.metrics.summary()
+
+    rows, metrics = run_with_server(handler, scenario)
+
+    assert [int(row["ID"]) for row in rows] == list(range(TOTAL_ROWS))
+    assert metrics["requests"] == 3
+    assert metrics["rows"] == TOTAL_ROWS
+
+
+def test_request_retries_server_errors():
+    calls = {"count": 0}
+
+    async def handler(request):
+        calls["count"] += 1
+        if calls["count"] < 3:
+            return web.Response(status=500)
+        return web.Response(text=make_page([1], total=1), content_type="application/xml")
+
+    async def scenario(engine, url):
+        rows = await engine.fetch_pages(url, {"pIndex": 1, "pSize": 10}, MAPPER, format="xml")
+        return rows, engine.metrics.summary()
+
+    rows, metrics = run_with_server(handler, scenario)
+
+    assert rows == [{"ID": "1"}]
+    assert metrics["retries"] == 2
+    assert metrics["failures"] == 0
+
+
+def test_fetch_pages_raises_with_pages_that_failed_after_retries():
+    async def handler(request):
+        page = int(request.query["pIndex"])
+        if page in (2, 3):
+            return web.Response(status=500)
+        size = int(request.query["pSize"])
+        rows = range((page - 1) * size, min(page * size, TOTAL_ROWS))
+        return web.Response(text=make_page(rows), content_type="application/xml")
+
+    async def scenario(engine, url):
+        with pytest.raises(PageFetchError) as concurrent:
+            await engine.fetch_pages(url, {"pIndex": 1, "pSize": 10}, MAPPER, format="xml")
+        # 첫 페이지 실패도 '데이터 없음'으로 보이지 않고 예외가 되어야 합니다.
+        with pytest.raises(PageFetchError) as first:
+            await engine.fetch_pages(url, {"pIndex": 2, "pSize": 10}, MAPPER, format="xml")
+        # 전체 개수가 없는 매퍼(순차 요청)도 마찬가지입니다.
+        with pytest.raises(PageFetchError) as sequential:
+            await engine.fetch_pages(url, {"pIndex": 1, "pSize": 10},
+                                     {**MAPPER, "total_count_path": None}, format="xml")
+        return concurrent.value.pages, first.value.pages, sequential.value.pages
+
+    assert run_with_server(handler, scenario) == ([2, 3], [2], [2])
+
+
+def test_token_bucket_is_shared_across_concurrent_tasks():
+    # 0.3초에 3번: 동시에 6번 요청하면 버스트 3번 이후 나머지 3번은 0.3초에 걸쳐 나눠 통과해야 합니다.
+    async def main():
+        bucket = TokenBucket.from_limit(3, 0.3)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(main())
+    assert 0.28 <= elapsed < 1.0
+
+
+def test_run_worker_pool_bounds_concurrency_and_read_ahead():
+    state = {"active": 0, "peak": 0, "consumed": 0, "max_read_ahead": 0}
+    done = []
+
+    def items():
+        for i in range(50):
+            state["consumed"] += 1
+            yield i
+
+    async def handler(item):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        # 생성기를 큐 크기 이상 앞서 읽지 않아야 합니다. (워커 3 + 큐 6 + 대기 중인 put 1)
+        state["max_read_ahead"] = max(state["max_read_ahead"], state["consumed"] - len(done))
+        await asyncio.sleep(0.001)
+        state["active"] -= 1
+        done.append(item)
+
+    asyncio.run(run_worker_pool(items(), handler, num_workers=3))
+
+    assert sorted(done) == list(range(50))
+    assert state["peak"] <= 3
+    assert state["max_read_ahead"] <= 10
@@ -0,0 +1,76 @@
+import json
+
+from data_operations.CrawlManifest import CrawlManifest, content_hash
+
+
+def write_jsonl(path, records):
+    """레코드를 JSONL로 쓰고 (id, offset, length) 목록을 반환합니다."""
+    locations = []
+    with open(path, 'ab') as f:
+        for record in records:
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+            locations.append((record['id'], f.tell(), len(line)))
+            f.write(line)
+    return locations
+
+
+def test_record_and_read_back_by_offset(tmp_path):
+    records = [{'id': str(i), '본문': f"판례 본문 {i}"} for i in range(5)]
+    with CrawlManifest(str(tmp_path)) as manifest:
+        for item_id, offset, length in write_jsonl(tmp_path / "out.jsonl", records):
+            manifest.record(item_id, 'SUCCESS', content_hash=content_hash(item_id),
+                            file="out.jsonl", offset=offset, length=length)
+        manifest.record("99", 'DOWNLOAD_FAIL')
+
+    # 다시 열어도 기록이 유지되어야 합니다.
+    with CrawlManifest(str(tmp_path)) as manifest:
+        assert manifest.completed_ids() == {str(i) for i in range(5)}
+        assert manifest.read_record("3") == records[3]
+        assert manifest.read_record("99") is None
+        assert list(manifest.iter_records(["4", "99", "0"])) == [records[4], records[0]]
+        assert list(manifest.iter_records()) == records
+
+
+def test_seed_from_directory_requires_all_suffixes(tmp_path):
+    (tmp_path / "001_민법.txt").write_text("a", encoding='utf-8')
+    (tmp_path / "001_민법.json").write_text("{}", encoding='utf-8')
+    (tmp_path / "002_상법.txt").write_text("b", encoding='utf-8')
+
+    with CrawlManifest(str(tmp_path)) as manifest:
+        assert manifest.seed_from_directory(suffixes=('.txt', '.json')) == 1
+        assert manifest.completed_ids() == {"001"}
+
+
+def test_listing_checkpoint_resumes_and_resets_on_new_params(tmp_path):
+    params = {'target': 'prec', 'prncYd': '20230101~20230131'}
+    with CrawlManifest(str(tmp_path)) as manifest:
+        assert manifest.start_listing(params) == {}
+        manifest.set_meta('listing_total', 250)
+        manifest.save_listing_page(1, [{'id': '1'}])
+        manifest.save_listing_page(2, [{'id': '2'}])
+
+    with CrawlManifest(str(tmp_path)) as manifest:
+        assert manifest.start_listing(params) == {1: [{'id': '1'}], 2: [{'id': '2'}]}
+        assert manifest.get_meta('listing_total') == 250
+        assert manifest.get_meta('listing_last_page') == 2
+        # 조회 조건이 바뀌면 체크포인트를 버립니다.
+        assert manifest.start_listing({**params, 'prncYd': '20230201~20230228'}) == {}
+        assert manifest.get_meta('listing_total') is None
+
+
+def test_in_flight_and_truncate_unindexed_tail(tmp_path):
+    path = tmp_path / "out.jsonl"
+    with CrawlManifest(str(tmp_path)) as manifest:
+        for item_id, offset, length in write_jsonl(path, [{'id': 'a'}, {'id': 'b'}]):
+            manifest.record(item_id, 'SUCCESS', file="out.jsonl", offset=offset, length=length)
+        manifest.mark_in_flight('c')
+    indexed_size = path.stat().st_size
+    # 중단으로 반쯤 쓰인 레코드
+    with open(path, 'ab') as f:
+        f.write(b'{"id": "c", "tex')
+
+    with CrawlManifest(str(tmp_path)) as manifest:
+        assert manifest.in_flight_ids() == {'c'}
+        assert manifest.truncate_unindexed("out.jsonl") == 16
+        assert path.stat().st_size == indexed_size
+        assert list(manifest.iter_records()) == [{'id': 'a'}, {'id': 'b'}]
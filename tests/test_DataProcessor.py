@@ -0,0 +1,56 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_operations.DataProcessor import DataProcessor
+
+
+def make_bills():
+    return pd.DataFrame({
+        'billId': ['B1', 'B2', 'B3'],
+        'billName': [
+            '조세특례제한법 일부개정법률안(김형동의원 등 11인)',
+            '주택법 일부개정법률안(이민준의원ㆍ박서연의원 등 12인)',
+            '정부조직법 일부개정법률안',
+        ],
+        'proposerKind': ['의원', '의원', '정부'],
+    })
+
+
+def test_process_congressman_bills_uses_injected_coactors():
+    fetcher = MagicMock()
+    df_coactors = pd.DataFrame({
+        'billId': ['B1', 'B2'],
+        'publicProposerIdList': [['A', 'B', 'C'], ['D', 'E', 'F']],
+    })
+
+    df = DataProcessor(fetcher).process_congressman_bills(make_bills(), df_coactors)
+
+    fetcher.fetch_bills_coactors.assert_not_called()
+    assert df['billName'].tolist() == ['조세특례제한법 일부개정법률안', '주택법 일부개정법률안']
+    assert df['proposers'].tolist() == ['김형동의원 등 11인', '이민준의원ㆍ박서연의원 등 12인']
+    assert df['rstProposerIdList'].tolist() == [['A'], ['D', 'E']]
+
+
+def test_process_congressman_bills_fetches_only_congressman_coactors():
+    fetcher = MagicMock()
+    fetcher.fetch_bills_coactors.return_value = pd.DataFrame({
+        'billId': ['B1'], 'publicProposerIdList': [['A', 'B']],
+    })
+
+    df = DataProcessor(fetcher).process_congressman_bills(make_bills())
+
+    (requested,), _ = fetcher.fetch_bills_coactors.call_args
+    assert requested['billId'].tolist() == ['B1', 'B2']
+    assert df['billId'].tolist() == ['B1']
+
+
+def test_slice_proposer_ids_handles_missing_values():
+    proposers = pd.Series(['홍길동의원 등 10인', None, '김철수의원ㆍ이영희의원'])
+    id_lists = pd.Series([['A', 'B'], ['C'], None])
+
+    assert DataProcessor.slice_proposer_ids(proposers, id_lists) == [['A'], [], []]
@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_operations.AISummarizer import AISummarizer
+from src.data_operations.DataProcessor import DataProcessor
+from src.data_operations.DataSchema import STRING_DTYPE, apply_schema, to_records, value_counts
+
+
+def make_bills(num_bills=3):
+    return pd.DataFrame({
+        'billId': [f'B{i}' for i in range(num_bills)],
+        'billName': [f'주택법 일부개정법률안(홍길동의원 등 1{i}인)' for i in range(num_bills)],
+        'billNumber': [str(2200000 + i) for i in range(num_bills)],
+        'summary': ['제안이유 및 주요내용'] * num_bills,
+        'proposeDate': ['2024-06-01', '2024-06-02', None][:num_bills],
+        'stage': ['접수'] * num_bills,
+        'proposerKind': ['의원'] * num_bills,
+        'assemblyNumber': ['22'] * num_bills,
+    })
+
+
+def test_apply_schema_converts_declared_columns():
+    df = apply_schema(make_bills(), 'bills')
+
+    assert df['billId'].dtype == STRING_DTYPE
+    assert isinstance(df['proposerKind'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['assemblyNumber'].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df['proposeDate'])
+    assert df['proposeDate'].isna().tolist() == [False, False, True]
+
+
+def test_apply_schema_normalizes_list_columns_and_keeps_input():
+    raw = pd.DataFrame({'billId': ['B1', 'B2'], 'publicProposerIdList': [['A'], None], 'extra': [1, 2]})
+
+    df = apply_schema(raw, 'bill_coactors')
+
+    assert df['publicProposerIdList'].tolist() == [['A'], []]
+    assert df['extra'].dtype == raw['extra'].dtype
+    assert raw['billId'].dtype == object
+
+
+def test_apply_schema_rejects_unknown_subject():
+    with pytest.raises(ValueError):
+        apply_schema(make_bills(), 'unknown')
+
+
+def test_to_records_is_json_serializable():
+    df = apply_schema(make_bills(), 'bills')
+    df['briefSummary'] = None
+
+    records = to_records(df)
+
+    json.dumps(records, ensure_ascii=False)
+    assert records[0]['proposeDate'] == '2024-06-01'
+    assert records[2]['proposeDate'] is None
+    assert records[0]['proposerKind'] == '의원'
+
+
+def test_value_counts_skips_unused_categories():
+    df = apply_schema(make_bills(), 'bills')
+    df['proposerKind'] = df['proposerKind'].cat.add_categories(['위원장', '정부'])
+
+    assert df['proposerKind'].value_counts()['정부'] == 0
+    assert value_counts(df['proposerKind']).to_dict() == {'의원': 3}
+    assert value_counts(df['billNumber']).to_dict() == df['billNumber'].value_counts().to_dict()
+
+
+def test_missing_summary_is_not_sent_to_llm(monkeypatch):
+    class FakeChatModel:
+        prompts = []
+
+        def __init__(self, **kwargs):
+            pass
+
+        def invoke(self, messages):
+            FakeChatModel.prompts.append(messages[1]['content'])
+            return type('Response', (), {'content': '요약'})()
+
+    # 패키지가 AISummarizer 클래스를 같은 이름으로 다시 내보내므로 모듈은 sys.modules에서 찾습니다.
+    monkeypatch.setattr(sys.modules[AISummarizer.__module__], '_load_chat_model', lambda: (FakeChatModel, dict, dict))
+    df = apply_schema(make_bills(), 'bills')
+    df.loc[1, 'summary'] = None
+    df['proposers'] = '홍길동'
+    df['briefSummary'] = None
+    df['gptSummary'] = None
+
+    summarizer = AISummarizer()
+    df = summarizer.AI_title_summarize(df, model='test')
+    df = summarizer.AI_content_summarize(df, model='test')
+
+    assert df['summary'].isna().tolist() == [False, True, False]
+    assert len(FakeChatModel.prompts) == 4
+    assert not any('<NA>' in prompt for prompt in FakeChatModel.prompts)
+    assert df['gptSummary'].isna().tolist() == [False, True, False]
+
+
+def test_typed_frame_flows_through_processor():
+    df_bills = apply_schema(make_bills(), 'bills')
+    df_coactors = apply_schema(
+        pd.DataFrame({'billId': ['B0', 'B1', 'B2'], 'publicProposerIdList': [['A', 'B']] * 3}), 'bill_coactors'
+    )
+
+    df = DataProcessor(fetcher=None).process_congressman_bills(df_bills, df_coactors)
+
+    assert df['rstProposerIdList'].tolist() == [['A']] * 3
+    assert df['billName'].tolist() == ['주택법 일부개정법률안'] * 3
+
+
+def test_schema_reduces_memory():
+    df = make_bills(2).sample(10000, replace=True, random_state=0).reset_index(drop=True)
+
+    before = df.memory_usage(deep=True).sum()
+    after = apply_schema(df, 'bills').memory_usage(deep=True).sum()
+
+    assert after < before / 2
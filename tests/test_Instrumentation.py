@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_operations.Instrumentation import Instrumentation
+from src.data_operations.ReportManager import ReportManager
+
+
+def test_span_records_latency_rows_bytes_and_errors():
+    instrumentation = Instrumentation()
+
+    with instrumentation.span("db.query", bytes=10) as timing:
+        timing.add(rows=3)
+    with pytest.raises(ValueError):
+        with instrumentation.span("db.query"):
+            raise ValueError("실패")
+
+    stats = instrumentation.snapshot()["stages"]["db.query"]
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["rows"] == 3
+    assert stats["bytes"] == 10
+    assert 0 < timing.elapsed <= stats["max_sec"] + 1e-4
+
+
+def test_histogram_quantiles():
+    instrumentation = Instrumentation()
+    for _ in range(90):
+        instrumentation.record("http.request", 0.02)
+    for _ in range(10):
+        instrumentation.record("http.request", 3.0)
+
+    stats = instrumentation.snapshot()["stages"]["http.request"]
+
+    assert stats["p50_sec"] == 0.025
+    assert stats["p99_sec"] == 3.0
+    assert stats["histogram"] == {"0.025": 90, "5.0": 10}
+    assert stats["total_sec"] == pytest.approx(31.8)
+
+
+def test_threads_share_counters():
+    instrumentation = Instrumentation()
+
+    def work():
+        for _ in range(1000):
+            instrumentation.record("embed.batch", 0.001, rows=1)
+            instrumentation.count("llm.content.total_tokens", 2)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["stages"]["embed.batch"]["rows"] == 4000
+    assert snapshot["counters"] == {"llm.content.total_tokens": 8000}
+
+
+def test_report_manager_exports_json_sorted_by_total_time(tmp_path):
+    instrumentation = Instrumentation()
+    instrumentation.record("parse.xml", 0.1, rows=100)
+    instrumentation.record("fetch.bills", 2.0, rows=100, bytes=2048)
+
+    path = ReportManager(report_dir=str(tmp_path)).save_instrumentation("hourly_update", instrumentation)
+
+    assert path == os.path.join(str(tmp_path), "hourly_update_instrumentation.json")
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["run_name"] == "hourly_update"
+    assert list(report["stages"]) == ["fetch.bills", "parse.xml"]
+    assert report["stages"]["fetch.bills"]["rows_per_sec"] == 50
+    assert instrumentation.format_summary().splitlines()[0].startswith("fetch.bills: 1회")
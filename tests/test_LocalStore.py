@@ -0,0 +1,109 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+pytest.importorskip("pyarrow")
+
+from src.data_operations.DataSchema import apply_schema
+from src.data_operations.LocalStore import LocalStore
+
+
+def make_bills():
+    return apply_schema(pd.DataFrame({
+        'billId': ['B1', 'B2', 'B3'],
+        'billName': ['주택법', '민법', '형법'],
+        'proposeDate': ['2024-06-01', '2024-06-02', '2024-06-02'],
+        'stage': ['접수', '접수', '소관위심사'],
+        'proposerKind': ['의원', '의원', '정부'],
+        'assemblyNumber': ['22', '22', '22'],
+        'briefSummary': [None, None, None],
+    }), 'bills')
+
+
+def test_write_partitions_and_restores_types(tmp_path):
+    store = LocalStore(str(tmp_path))
+
+    assert store.write('bills', make_bills()) == 3
+
+    assert (tmp_path / 'bills' / 'assembly=22' / 'date=2024-06-02').is_dir()
+    df = store.read('bills').sort_values('billId', ignore_index=True)
+    assert df['billId'].tolist() == ['B1', 'B2', 'B3']
+    assert pd.api.types.is_datetime64_any_dtype(df['proposeDate'])
+    assert isinstance(df['stage'].dtype, pd.CategoricalDtype)
+    assert store.subjects() == ['bills']
+
+
+def test_upsert_replaces_rows_with_same_key(tmp_path):
+    store = LocalStore(str(tmp_path))
+    store.write('bills', make_bills())
+
+    updated = make_bills().iloc[[1]].copy()
+    updated['stage'] = '본회의의결'
+    updated['briefSummary'] = '요약'
+    store.write('bills', updated)
+
+    df = store.read('bills').set_index('billId')
+    assert len(df) == 3
+    assert df.loc['B2', 'stage'] == '본회의의결'
+    assert df.loc['B2', 'briefSummary'] == '요약'
+    assert len(list((tmp_path / 'bills' / 'assembly=22' / 'date=2024-06-02').glob('*.parquet'))) == 1
+
+
+def test_append_keeps_duplicates(tmp_path):
+    store = LocalStore(str(tmp_path))
+    store.write('bills', make_bills(), mode='append')
+    store.write('bills', make_bills(), mode='append')
+
+    assert len(store.read('bills')) == 6
+
+
+def test_read_filters(tmp_path):
+    store = LocalStore(str(tmp_path))
+    store.write('bills', make_bills())
+
+    df = store.read('bills', columns=['billId'], start_date='2024-06-02', filters=[('proposerKind', '==', '의원')])
+
+    assert df['billId'].tolist() == ['B2']
+    assert store.read('bills', assembly=21).empty
+    assert store.read('lawmakers').empty
+
+
+def test_changed_rows_detects_new_and_modified_rows(tmp_path):
+    store = LocalStore(str(tmp_path))
+    # 표결 수는 API 응답 문자열과 fillna(0)의 숫자가 섞여 있습니다.
+    df_vote = pd.DataFrame({'billId': ['X', 'Y'], 'totalVoteCount': ['250', 0]})
+    store.write('bill_vote', df_vote, assembly=22)
+
+    assert store.changed_rows('bill_vote', df_vote).empty
+
+    df_new = pd.DataFrame({'billId': ['X', 'Y', 'Z'], 'totalVoteCount': ['251', 0, '200']})
+    assert store.changed_rows('bill_vote', df_new)['billId'].tolist() == ['X', 'Z']
+
+
+def test_changed_rows_compares_list_columns_by_value(tmp_path):
+    store = LocalStore(str(tmp_path))
+    df_coactors = apply_schema(pd.DataFrame({
+        'billId': ['B1', 'B2'],
+        'representativeProposerIdList': [['P1'], ['P2']],
+        'publicProposerIdList': [['P3', 'P4'], []],
+        'ProposerName': [['홍길동', '김철수'], ['이영희']],
+    }), 'bill_coactors')
+    store.write('bill_coactors', df_coactors, assembly=22)
+
+    stored = store.read('bill_coactors').sort_values('billId', ignore_index=True)
+    assert stored['publicProposerIdList'].tolist() == [['P3', 'P4'], []]
+    # Parquet에서 다시 읽은 리스트는 numpy 배열이지만, 값이 같으면 변경으로 보지 않아야 합니다.
+    assert store.changed_rows('bill_coactors', df_coactors).empty
+
+    df_new = df_coactors.copy()
+    df_new.at[1, 'ProposerName'] = ['이영희', '박민수']
+    assert store.changed_rows('bill_coactors', df_new)['billId'].tolist() == ['B2']
+
+
+def test_unknown_subject_raises(tmp_path):
+    with pytest.raises(ValueError):
+        LocalStore(str(tmp_path)).write('unknown', make_bills())
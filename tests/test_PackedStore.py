@@ -0,0 +1,35 @@
+import pytest
+
+from data_operations.CrawlManifest import CrawlManifest
+from data_operations.PackedStore import PackedStore
+
+
+@pytest.mark.parametrize("compression", ["zstd", "gzip"])
+def test_append_and_random_read(tmp_path, compression):
+    records = [{"id": str(i), "본문": "법령 본문 " * i} for i in range(20)]
+    # 세그먼트 크기를 작게 잡아 여러 세그먼트로 나뉘도록 합니다.
+    with PackedStore(str(tmp_path), prefix="laws", compression=compression, segment_size=200) as store:
+        locations = [store.append_record(record) for record in records]
+        assert len(store.segments()) > 1
+        assert store.read_record(**locations[7]) == records[7]
+
+    # 다시 열어 스트리밍으로 읽어도 기록 순서대로 모두 나와야 합니다.
+    with PackedStore(str(tmp_path), prefix="laws", compression=compression, segment_size=200) as store:
+        assert list(store.iter_records()) == records
+        assert store.read_record(**locations[19]) == records[19]
+
+
+def test_manifest_reads_packed_records(tmp_path):
+    with PackedStore(str(tmp_path), prefix="cases") as store, CrawlManifest(str(tmp_path)) as manifest:
+        for i in range(3):
+            manifest.record(i, "SUCCESS", **store.append_record({"id": i}))
+        store.flush()
+        assert manifest.read_record(1) == {"id": 1}
+        assert list(manifest.iter_records([2, 0])) == [{"id": 2}, {"id": 0}]
+
+
+def test_uncompressed_blobs(tmp_path):
+    with PackedStore(str(tmp_path), prefix="pdfs", compression="none") as store:
+        location = store.append(b"%PDF-1.4 ...")
+        assert location["file"] == "pdfs-00000.bin"
+        assert store.read(**location) == b"%PDF-1.4 ..."
@@ -0,0 +1,88 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("duckdb")
+
+from src.data_operations.DataSchema import apply_schema
+from src.data_operations.LocalStore import LocalStore
+from src.data_operations.QueryEngine import QueryEngine
+from src.data_operations.ReportManager import ReportManager
+
+
+@pytest.fixture
+def store_root(tmp_path):
+    store = LocalStore(str(tmp_path))
+    store.write('bills', apply_schema(pd.DataFrame({
+        'billId': ['B1', 'B2', 'B3'],
+        'proposeDate': ['2024-06-01', '2024-06-20', '2024-07-02'],
+        'proposerKind': ['의원', '의원', '정부'],
+        'assemblyNumber': ['22', '22', '22'],
+    }), 'bills'))
+    store.write('bill_timeline', pd.DataFrame({
+        'billId': ['B1', 'B1', 'B1', 'B2'],
+        'statusUpdateDate': ['2024-06-01', '2024-06-05', '2024-06-15', '2024-06-21'],
+        'stage': ['접수', '소관위접수', '본회의의결', '접수'],
+        'committee': [None, '법제사법위원회', '법제사법위원회', None],
+    }), assembly=22)
+    store.write('vote_party', pd.DataFrame({
+        'billId': ['B1', 'B1', 'B2'],
+        'partyName': ['A당', 'B당', 'A당'],
+        'voteForCount': [100, 50, 20],
+    }), assembly=22)
+    return str(tmp_path)
+
+
+def test_registers_only_stored_subjects(store_root):
+    with QueryEngine(store_root) as engine:
+        assert engine.register_tables() == ['bills', 'timeline', 'vote_party']
+        assert engine.distribution('lawmakers', 'partyName') == {}
+
+        LocalStore(store_root).write('lawmakers', pd.DataFrame({
+            'congressmanId': ['M1', 'M2'], 'partyName': ['A당', 'A당'], 'assemblyNumber': [22, 22],
+        }))
+        assert engine.distribution('lawmakers', 'partyName') == {'A당': 2}
+
+
+def test_distribution(store_root):
+    with QueryEngine(store_root) as engine:
+        assert engine.distribution('bills', 'proposerKind') == {'의원': 2, '정부': 1}
+        assert engine.distribution('bills', 'proposeDate', limit=1) == {'2024-06-01': 1}
+        assert engine.distribution('bills', 'proposerKind', assembly=21) == {}
+        assert engine.distribution('bills', 'no_such_column') == {}
+
+
+def test_aggregate_queries(store_root):
+    with QueryEngine(store_root) as engine:
+        votes = engine.party_vote_counts(assembly=22)
+        assert votes.to_dict('records') == [
+            {'partyName': 'A당', 'voteForCount': 120, 'billCount': 2},
+            {'partyName': 'B당', 'voteForCount': 50, 'billCount': 1},
+        ]
+
+        monthly = engine.bills_per_committee_per_month(start_date='2024-06-01', end_date='2024-06-30')
+        assert sorted(map(tuple, monthly.values.tolist())) == [('2024-06', '미회부', 1), ('2024-06', '법제사법위원회', 1)]
+
+        transitions = engine.stage_transition_times().set_index(['fromStage', 'toStage'])
+        assert transitions.loc[('접수', '소관위접수'), 'avgDays'] == 4
+        assert transitions.loc[('소관위접수', '본회의의결'), 'medianDays'] == 10
+
+
+def test_parameterized_query(store_root):
+    with QueryEngine(store_root) as engine:
+        df = engine.query("SELECT COUNT(*) AS n FROM timeline WHERE date >= ?", ['2024-06-05'])
+        assert df['n'].iloc[0] == 3
+
+
+def test_report_manager_stored_distribution(store_root, tmp_path):
+    report_manager = ReportManager(report_dir=str(tmp_path / 'reports'))
+    with QueryEngine(store_root) as engine:
+        distribution = report_manager.calculate_stored_distribution('bills', engine)
+
+    assert distribution['법안 발의주체별 분포'] == {'의원': 2, '정부': 1}
+    assert len(distribution['법안 제안일자별 분포']) == 3
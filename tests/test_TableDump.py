@@ -0,0 +1,95 @@
+import datetime
+import decimal
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_operations.BackupStore import BackupStore
+from src.data_operations.TableDump import (
+    TableChecksum, dump_table_lines, iter_statements, restore_into_sqlite, sql_literal, table_checksum,
+)
+
+COLUMNS = ['billId', 'billName', 'proposeDate', 'amount', 'summary', 'raw', 'ratio', 'elapsed']
+
+
+def make_rows(count=1200):
+    return [
+        (
+            i,
+            f"주택법 일부개정법률안('{i}'호);\n두 번째 줄 \\",
+            datetime.datetime(2024, 6, 1, 9, 30, i % 60),
+            decimal.Decimal('1.50'),
+            None,
+            b'\x00\xff',
+            0.1,
+            datetime.timedelta(hours=26, minutes=3),
+        )
+        for i in range(count)
+    ]
+
+
+def dump(rows, checksum=None):
+    return list(dump_table_lines('Bill', COLUMNS, rows, "CREATE TABLE `Bill` (\n  `billId` int\n)", checksum))
+
+
+def test_sql_literal():
+    assert sql_literal(None) == 'NULL'
+    assert sql_literal(True) == '1'
+    assert sql_literal(42) == '42'
+    assert sql_literal("의원's") == "'의원''s'"
+    assert sql_literal(b'\x01\xab') == "X'01ab'"
+    assert sql_literal(datetime.date(2024, 6, 1)) == "'2024-06-01'"
+    assert sql_literal(datetime.timedelta(hours=-1, minutes=30)) == "'-00:30:00'"
+
+
+def test_statements_survive_newlines_and_semicolons_in_values():
+    lines = dump(make_rows(250))
+    # 청크 경계가 줄 중간이 아니어도 문장 단위로 다시 나눌 수 있어야 합니다.
+    data = b"".join(lines)
+    chunks = [data[i:i + 777] for i in range(0, len(data), 777)]
+
+    statements = list(iter_statements(chunks))
+
+    assert statements[3].startswith('DROP TABLE IF EXISTS `Bill`')
+    assert sum(statement.startswith('INSERT INTO') for statement in statements) == 250
+
+
+def test_restore_into_sqlite_matches_dump_checksum():
+    rows = make_rows()
+    expected = TableChecksum()
+    lines = dump(rows, expected)
+    connection = sqlite3.connect(':memory:')
+
+    assert restore_into_sqlite(connection, 'Bill', COLUMNS, lines) == len(rows)
+
+    restored = table_checksum(connection.cursor(), 'Bill', COLUMNS)
+    assert restored.rows == expected.rows == len(rows)
+    assert restored.hexdigest() == expected.hexdigest()
+
+
+def test_checksum_ignores_row_order_but_detects_changes():
+    rows = make_rows(50)
+    original = TableChecksum()
+    dump(rows, original)
+
+    reordered = TableChecksum()
+    dump(list(reversed(rows)), reordered)
+    changed = TableChecksum()
+    dump(rows[:-1] + [(999,) + rows[-1][1:]], changed)
+
+    assert reordered.hexdigest() == original.hexdigest()
+    assert changed.hexdigest() != original.hexdigest()
+
+
+def test_row_inserted_mid_table_reuses_almost_all_chunks(tmp_path):
+    store = BackupStore(str(tmp_path), compression='gzip', min_chunk_size=32 * 1024, max_chunk_size=256 * 1024)
+    rows = make_rows(20000)
+    first = store.add_table({'tables': {}}, 'Bill', dump(rows))
+
+    inserted = rows[:10000] + [(-1,) + rows[0][1:]] + rows[10000:]
+    second = store.add_table({'tables': {}}, 'Bill', dump(inserted))
+
+    assert len(first['chunks']) > 20
+    assert second['new_chunks'] <= 2
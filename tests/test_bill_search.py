@@ -0,0 +1,76 @@
+import pytest
+
+qdrant_client = pytest.importorskip("qdrant_client")
+import numpy as np
+from qdrant_client.http import models
+
+from lawdigest_ai.bill_search import BillSearcher, build_bill_filter
+from lawdigest_ai.qdrant_manager import QdrantManager
+
+
+class FakeEmbeddingGenerator:
+    """검색어 길이에 따라 방향이 정해지는 2차원 벡터를 돌려주는 임베딩 생성기"""
+    def __init__(self):
+        self.calls = 0
+
+    def generate_batch(self, texts, as_numpy=False):
+        self.calls += 1
+        return [np.array([1.0, float(len(text))], dtype=np.float32) for text in texts]
+
+
+@pytest.fixture
+def searcher():
+    qdrant_manager = QdrantManager.__new__(QdrantManager)
+    qdrant_manager.client = qdrant_client.QdrantClient(":memory:")
+    qdrant_manager.create_collection("bills", vector_size=2)
+    qdrant_manager.create_payload_indexes("bills")
+    bills = [
+        (1, [1.0, 0.0], {"bill_id": "A", "committee": "법제사법위원회", "propose_date": "2024-01-10", "assembly_number": 22}),
+        (2, [1.0, 1.0], {"bill_id": "B", "committee": "법제사법위원회", "propose_date": "2024-03-05", "assembly_number": 22}),
+        (3, [1.0, 2.0], {"bill_id": "C", "committee": "보건복지위원회", "propose_date": "2024-03-20", "assembly_number": 22}),
+    ]
+    qdrant_manager.upsert_points("bills", [
+        models.PointStruct(id=point_id, vector=vector, payload=payload) for point_id, vector, payload in bills
+    ])
+    return BillSearcher(FakeEmbeddingGenerator(), qdrant_manager, "bills")
+
+
+def test_search_ranks_and_filters(searcher):
+    results = searcher.search("가", limit=3)  # 쿼리 벡터 [1, 1]
+    assert [bill["bill_id"] for bill in results][0] == "B"
+    assert results[0]["score"] >= results[1]["score"]
+
+    filtered = searcher.search("가", committee="법제사법위원회", start_date="2024-02-01", end_date="2024-03-31")
+    assert [bill["bill_id"] for bill in filtered] == ["B"]
+
+
+def test_query_embedding_is_cached(searcher):
+    searcher.search("전세사기")
+    searcher.search("전세사기", committee="보건복지위원회")
+    assert searcher.embed_generator.calls == 1
+    assert searcher.cache_info().hits == 1
+
+
+def test_build_bill_filter():
+    assert build_bill_filter() is None
+    bill_filter = build_bill_filter(stage=["접수", "본회의 심의"], assembly_number="22")
+    assert [condition.key for condition in bill_filter.must] == ["stage", "assembly_number"]
+    assert bill_filter.must[1].match.value == 22
+
+
+def test_chunk_hits_are_grouped_per_bill():
+    qdrant_manager = QdrantManager.__new__(QdrantManager)
+    qdrant_manager.client = qdrant_client.QdrantClient(":memory:")
+    qdrant_manager.create_collection("chunks", vector_size=2)
+    qdrant_manager.upsert_points("chunks", [
+        models.PointStruct(id=i, vector=[1.0, float(i)], payload={"bill_id": "AB"[i % 2], "chunk_index": i // 2, "chunk_text": f"청크{i}"})
+        for i in range(4)
+    ])
+    searcher = BillSearcher(FakeEmbeddingGenerator(), qdrant_manager, "chunks")
+
+    results = searcher.search("가", limit=5, chunks_per_bill=2)  # 쿼리 벡터 [1, 1]
+
+    assert [bill["bill_id"] for bill in results] == ["B", "A"]
+    assert "chunk_text" not in results[0]
+    assert [chunk["chunk_text"] for chunk in results[0]["matched_chunks"]] == ["청크1", "청크3"]
+    assert results[0]["score"] == results[0]["matched_chunks"][0]["score"]
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'etc')))
+
+import crawling_법령_old as crawler
+from data_operations.CrawlManifest import CrawlManifest
+from data_operations.PackedStore import PackedStore
+
+LAWS = pd.DataFrame({'법령ID': ['1', '2', '3'], '법령명한글': ['가법', '나법', '다법']})
+
+
+class FlakyFile:
+    """'쓰기 실패'가 들어 있는 줄은 앞부분만 쓰고 예외를 내는 파일 대역"""
+
+    def __init__(self, file):
+        self.file = file
+
+    async def write(self, data):
+        if '쓰기 실패'.encode('utf-8') in data:
+            await self.file.write(data[:10])
+            raise OSError("디스크 오류")
+        return await self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+def make_scraper(monkeypatch, output_format):
+    scraper = crawler.LawScraper('test', output_format=output_format)
+
+    async def fetch_and_save_law(engine, law_row, period_output_dir):
+        # 요청을 보내지 않고 바로 기록할 결과를 반환합니다.
+        text = "쓰기 실패" if law_row['법령ID'] == '2' else f"법령 본문 {law_row['법령ID']}"
+        return {'status': 'SUCCESS', 'law_info': law_row, 'text': text, 'raw': {'법령ID': law_row['법령ID']}}
+
+    monkeypatch.setattr(scraper, '_fetch_and_save_law', fetch_and_save_law)
+    return scraper
+
+
+def run_batch(scraper, output_dir, jsonl_path=None):
+    async def main():
+        with CrawlManifest(str(output_dir)) as manifest:
+            status_map = await scraper._process_laws_batch(
+                scraper.engine, LAWS, str(output_dir), jsonl_path=jsonl_path, manifest=manifest,
+            )
+            return status_map, manifest.completed_ids(), {
+                law_id: manifest.read_record(law_id) for law_id in manifest.completed_ids()
+            }
+    return asyncio.run(main())
+
+
+def test_failed_jsonl_write_is_save_fail_and_leaves_no_partial_line(monkeypatch, tmp_path):
+    scraper = make_scraper(monkeypatch, 'files')
+    real_open = crawler.aiofiles.open
+
+    async def flaky_open(*args, **kwargs):
+        return FlakyFile(await real_open(*args, **kwargs))
+
+    monkeypatch.setattr(crawler.aiofiles, 'open', flaky_open)
+    jsonl_path = tmp_path / 'laws.jsonl'
+
+    status_map, completed, records = run_batch(scraper, tmp_path, str(jsonl_path))
+
+    assert [law['법령ID'] for law in status_map['SAVE_FAIL']] == ['2']
+    assert sorted(law['법령ID'] for law in status_map['SUCCESS']) == ['1', '3']
+    assert completed == {'1', '3'}
+    assert records['3']['법령본문'] == "법령 본문 3"
+    lines = jsonl_path.read_text(encoding='utf-8').splitlines()
+    assert sorted(json.loads(line)['법령ID'] for line in lines) == ['1', '3']
+
+
+def test_failed_packed_write_is_save_fail(monkeypatch, tmp_path):
+    scraper = make_scraper(monkeypatch, 'packed')
+    real_append_record = PackedStore.append_record
+
+    def append_record(self, record):
+        if record['법령본문'] == "쓰기 실패":
+            raise OSError("디스크 오류")
+        return real_append_record(self, record)
+
+    monkeypatch.setattr(PackedStore, 'append_record', append_record)
+
+    status_map, completed, records = run_batch(scraper, tmp_path)
+
+    assert [law['법령ID'] for law in status_map['SAVE_FAIL']] == ['2']
+    assert completed == {'1', '3'}
+    assert records['1']['법령본문'] == "법령 본문 1"
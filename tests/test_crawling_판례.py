@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'etc')))
+
+import crawling_판례 as crawler
+from data_operations.CrawlManifest import CrawlManifest
+from data_operations.PackedStore import PackedStore
+
+CASES = pd.DataFrame({'판례일련번호': ['1', '2', '3'], '사건번호': ['가', '나', '다']})
+
+
+class FlakyFile:
+    """'쓰기 실패'가 들어 있는 줄은 앞부분만 쓰고 예외를 내는 파일 대역"""
+
+    def __init__(self, file):
+        self.file = file
+
+    async def write(self, data):
+        if '쓰기 실패'.encode('utf-8') in data:
+            await self.file.write(data[:10])
+            raise OSError("디스크 오류")
+        return await self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+def make_scraper(monkeypatch, tmp_path, output_format):
+    monkeypatch.chdir(tmp_path)
+    scraper = crawler.LawGovKrScraper('test', parse_workers=1, output_format=output_format)
+
+    async def download_case(engine, row):
+        # 추출 단계를 거치지 않고 바로 저장할 결과를 반환합니다.
+        text = "쓰기 실패" if row['판례일련번호'] == '2' else f"판례 본문 {row['판례일련번호']}"
+        return {'status': 'SUCCESS', 'case_info': row, 'text': text}
+
+    monkeypatch.setattr(scraper, '_download_case', download_case)
+    return scraper
+
+
+def run_batch(scraper, output_dir, jsonl_path=None, timeout=None):
+    async def batch():
+        with CrawlManifest(str(output_dir)) as manifest:
+            status_map = await scraper._process_cases_batch(
+                scraper.engine, CASES, str(output_dir), jsonl_path=jsonl_path, manifest=manifest,
+            )
+            return status_map, manifest.completed_ids(), {
+                case_id: manifest.read_record(case_id) for case_id in manifest.completed_ids()
+            }
+
+    async def main():
+        return await asyncio.wait_for(batch(), timeout)
+    return asyncio.run(main())
+
+
+def test_failed_jsonl_write_is_save_fail_and_leaves_no_partial_line(monkeypatch, tmp_path):
+    scraper = make_scraper(monkeypatch, tmp_path, 'files')
+    real_open = crawler.aiofiles.open
+
+    async def flaky_open(*args, **kwargs):
+        return FlakyFile(await real_open(*args, **kwargs))
+
+    monkeypatch.setattr(crawler.aiofiles, 'open', flaky_open)
+    output_dir = tmp_path / 'out'
+    jsonl_path = output_dir / 'cases.jsonl'
+    output_dir.mkdir()
+
+    status_map, completed, records = run_batch(scraper, output_dir, str(jsonl_path))
+
+    assert [case['판례일련번호'] for case in status_map['SAVE_FAIL']] == ['2']
+    assert sorted(case['판례일련번호'] for case in status_map['SUCCESS']) == ['1', '3']
+    assert completed == {'1', '3'}
+    assert records['3']['판례본문'] == "판례 본문 3"
+    lines = jsonl_path.read_text(encoding='utf-8').splitlines()
+    assert sorted(json.loads(line)['판례일련번호'] for line in lines) == ['1', '3']
+
+
+def test_failed_packed_write_is_save_fail(monkeypatch, tmp_path):
+    scraper = make_scraper(monkeypatch, tmp_path, 'packed')
+    real_append_record = PackedStore.append_record
+
+    def append_record(self, record):
+        if record['판례본문'] == "쓰기 실패":
+            raise OSError("디스크 오류")
+        return real_append_record(self, record)
+
+    monkeypatch.setattr(PackedStore, 'append_record', append_record)
+
+    status_map, completed, records = run_batch(scraper, tmp_path / 'out')
+
+    assert [case['판례일련번호'] for case in status_map['SAVE_FAIL']] == ['2']
+    assert completed == {'1', '3'}
+    assert records['1']['판례본문'] == "판례 본문 1"
+
+
+def test_parse_worker_keeps_consuming_after_a_case_fails(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    scraper = crawler.LawGovKrScraper('test', parse_workers=1, parse_queue_size=1, output_format='files')
+
+    async def download_case(engine, row):
+        return {'status': 'DOWNLOADED', 'case_info': row, 'pdf_bytes': b'%PDF'}
+
+    async def save_case(downloaded, text, output_dir, pdf_store=None):
+        case_id = downloaded['case_info']['판례일련번호']
+        if case_id == '1':
+            raise OSError("디스크 오류")
+        return {'status': 'SUCCESS', 'case_info': downloaded['case_info'], 'text': f"판례 본문 {case_id}"}
+
+    monkeypatch.setattr(scraper, '_download_case', download_case)
+    monkeypatch.setattr(scraper, '_save_case', save_case)
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+
+    # 워커가 멈추면 다운로드 워커가 가득 찬 큐 앞에서 영원히 대기하므로 시간 제한을 둡니다.
+    status_map, completed, _ = run_batch(scraper, output_dir, str(output_dir / 'cases.jsonl'), timeout=10)
+
+    assert sorted(case['판례일련번호'] for case in status_map['SUCCESS']) == ['2', '3']
+    assert completed == {'2', '3'}
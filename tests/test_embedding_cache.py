@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from lawdigest_ai.embedding_cache import EmbeddingCache
+
+
+def test_put_and_get_persist_across_instances(tmp_path):
+    texts = ["법안 제목: 가", "법안 제목: 나", "법안 제목: 다"]
+    vectors = np.random.default_rng(0).normal(size=(3, 8)).tolist()
+
+    cache = EmbeddingCache(str(tmp_path), "huggingface-nlpai-lab/KURE-v1")
+    assert cache.get_many(texts) == [None, None, None]
+    cache.put_many(texts, [vectors[0], None, vectors[2]])
+
+    reopened = EmbeddingCache(str(tmp_path), "huggingface-nlpai-lab/KURE-v1")
+    cached = reopened.get_many(texts + ["", "새 텍스트"])
+    assert len(reopened) == 2
+    np.testing.assert_allclose(cached[0], vectors[0], atol=1e-2)
+    np.testing.assert_allclose(cached[2], vectors[2], atol=1e-2)
+    assert cached[1] is None and cached[3] is None and cached[4] is None
+    assert (reopened.hits, reopened.misses) == (2, 2)
+
+
+def test_models_do_not_share_entries(tmp_path):
+    EmbeddingCache(str(tmp_path), "openai-text-embedding-3-small").put_many(["a"], [[1.0, 2.0]])
+    assert EmbeddingCache(str(tmp_path), "huggingface-other").get_many(["a"]) == [None]
+
+
+def test_incomplete_trailing_row_is_ignored(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "m")
+    cache.put_many(["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+    # 벡터 기록 도중 중단된 상황: 키는 있지만 벡터가 반만 기록됨
+    with open(cache.keys_path, 'ab') as f:
+        f.write(EmbeddingCache.text_key("c"))
+    with open(cache.vectors_path, 'ab') as f:
+        f.write(b"\x00\x00")
+
+    reopened = EmbeddingCache(str(tmp_path), "m")
+    assert len(reopened) == 2
+    assert reopened.get_many(["b", "c"]) == [[3.0, 4.0], None]
+    # 잘린 뒤 추가한 행도 올바른 위치에 기록되어야 합니다.
+    reopened.put_many(["c"], [[5.0, 6.0]])
+    assert EmbeddingCache(str(tmp_path), "m").get_many(["a", "c"]) == [[1.0, 2.0], [5.0, 6.0]]
+
+
+def test_rejected_batch_leaves_index_unchanged(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "m")
+    cache.put_many(["a"], [[1.0, 2.0]])
+
+    with pytest.raises(ValueError):
+        cache.put_many(["b", "c"], [[3.0, 4.0, 5.0], [6.0, 7.0, 8.0]])
+
+    assert len(cache) == 1
+    assert cache.get_many(["a", "b", "c"]) == [[1.0, 2.0], None, None]
+    # 거부된 텍스트도 나중에 올바른 차원으로 추가할 수 있어야 합니다.
+    cache.put_many(["b", "b"], [[3.0, 4.0], [9.0, 9.0]])
+    assert EmbeddingCache(str(tmp_path), "m").get_many(["a", "b"]) == [[1.0, 2.0], [3.0, 4.0]]
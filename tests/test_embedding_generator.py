@@ -0,0 +1,79 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from lawdigest_ai import embedding_generator
+from lawdigest_ai.embedding_generator import EmbeddingGenerator, plan_openai_batches
+
+
+class FakeEmbeddings:
+    """입력 길이를 벡터로 돌려주고, 요청 횟수를 세는 OpenAI embeddings 대역"""
+
+    def __init__(self, fail_batches=False):
+        self.calls = []
+        self.fail_batches = fail_batches
+
+    def create(self, input, model):
+        self.calls.append(list(input))
+        if self.fail_batches and len(input) > 1:
+            raise RuntimeError("batch rejected")
+        # 응답 순서가 뒤섞여도 index로 정렬되는지 확인하기 위해 역순으로 반환
+        data = [SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+def make_openai_generator(fake):
+    generator = EmbeddingGenerator.__new__(EmbeddingGenerator)
+    generator.model_type = 'openai'
+    generator.huggingface_model = None
+    generator.client = SimpleNamespace(embeddings=fake)
+    generator.cache = None
+    return generator
+
+
+def test_plan_openai_batches_respects_limits():
+    texts = ["가" * 10] * 7
+    batches = plan_openai_batches(texts, max_inputs=3, max_tokens=10**6)
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    per_text = embedding_generator.estimate_tokens(texts[0])
+    batches = plan_openai_batches(texts, max_inputs=100, max_tokens=per_text * 2)
+    assert all(len(batch) <= 2 for batch in batches)
+    assert sum(batches, []) == list(range(7))
+
+
+def test_generate_batch_sends_one_request_and_keeps_order():
+    fake = FakeEmbeddings()
+    vectors = make_openai_generator(fake).generate_batch(["a", "", "abc", None, "ab"])
+
+    assert len(fake.calls) == 1
+    assert vectors == [[1.0], None, [3.0], None, [2.0]]
+
+
+def test_generate_batch_falls_back_to_single_requests():
+    fake = FakeEmbeddings(fail_batches=True)
+    vectors = make_openai_generator(fake).generate_batch(["a", "abc"])
+
+    assert vectors == [[1.0], [3.0]]
+    assert len(fake.calls) == 3
+
+
+@pytest.mark.skipif(not os.getenv("EMBEDDING_PARITY_MODEL"),
+                    reason="EMBEDDING_PARITY_MODEL(예: nlpai-lab/KURE-v1)을 지정해야 모델을 내려받아 비교합니다.")
+def test_onnx_backend_matches_torch():
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("optimum")
+    import numpy as np
+
+    model_name = os.environ["EMBEDDING_PARITY_MODEL"]
+    texts = ["대한민국은 민주공화국이다.", "전세사기 피해자 지원 및 주거안정에 관한 특별법 일부개정법률안"]
+    torch_vectors = np.array(EmbeddingGenerator('huggingface', model_name).generate_batch(texts))
+    onnx_vectors = np.array(EmbeddingGenerator('huggingface', model_name, backend='onnx', num_threads=2).generate_batch(texts))
+
+    cosine = (torch_vectors * onnx_vectors).sum(axis=1) / (
+        np.linalg.norm(torch_vectors, axis=1) * np.linalg.norm(onnx_vectors, axis=1)
+    )
+    assert cosine.min() > 0.999
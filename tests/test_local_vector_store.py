@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from qdrant_client.http import models
+
+from lawdigest_ai.bill_search import build_bill_filter
+from lawdigest_ai.local_vector_store import LocalVectorStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    vector_store = LocalVectorStore(str(tmp_path))
+    vector_store.create_collection("bills", vector_size=2)
+    vector_store.upload_vectors(
+        "bills",
+        ["a", "b", "c", "d"],
+        np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [1.0, 0.9]], dtype=np.float32),
+        [
+            {"bill_id": "A", "committee": "법제사법위원회", "propose_date": "2024-01-10"},
+            {"bill_id": "B", "committee": "법제사법위원회", "propose_date": "2024-03-05"},
+            {"bill_id": "C", "committee": "보건복지위원회", "propose_date": "2024-03-20"},
+            {"bill_id": "B", "committee": "법제사법위원회", "propose_date": "2024-03-05"},
+        ],
+    )
+    return vector_store
+
+
+def test_exact_search_with_filter(store):
+    results = store.search("bills", [1.0, 1.0], limit=2)
+    assert [point.id for point in results] == ["b", "d"]
+    assert results[0].score == pytest.approx(1.0)
+
+    bill_filter = build_bill_filter(committee="법제사법위원회", start_date="2024-02-01")
+    assert [point.id for point in store.search("bills", [1.0, 0.0], query_filter=bill_filter)] == ["d", "b"]
+
+
+def test_search_groups(store):
+    groups = store.search_groups("bills", [1.0, 1.0], group_by="bill_id", limit=2, group_size=2)
+    assert [group.id for group in groups] == ["B", "A"]
+    assert [hit.id for hit in groups[0].hits] == ["b", "d"]
+
+
+def test_save_load_and_update(store, tmp_path):
+    store.delete_points("bills", ["c"])
+    store.save()
+
+    reopened = LocalVectorStore(str(tmp_path))
+    assert isinstance(reopened.collections["bills"].vectors, np.memmap)
+    assert set(reopened.fetch_payloads("bills", ["bill_id"])) == {"a", "b", "d"}
+
+    # 불러온 memmap 위에서도 업서트할 수 있습니다.
+    reopened.upsert_points("bills", [models.PointStruct(id="a", vector=[0.0, 1.0], payload={"bill_id": "A2"})])
+    assert reopened.search("bills", [0.0, 1.0], limit=1)[0].payload == {"bill_id": "A2"}
+
+
+def test_short_hnsw_candidates_fall_back_to_score_order(store, monkeypatch):
+    # hnswlib 없이 근사 검색을 흉내 냅니다: 가장 가까운 'a'(행 0)를 놓치고 'd'(행 3)만 찾았습니다.
+    store.index = "hnsw"
+    monkeypatch.setattr(store, "_hnsw_candidates", lambda collection, query, k, alive: [(3, 0.74)])
+    bill_filter = build_bill_filter(committee="법제사법위원회")
+
+    # 후보가 충분하면 HNSW 결과를 그대로 사용합니다.
+    assert [point.id for point in store.search("bills", [1.0, 0.0], limit=1, query_filter=bill_filter)] == ["d"]
+
+    # 부족하면 HNSW 후보를 먼저 내보내지 않고, 정확 검색 결과를 점수 순으로 반환합니다.
+    results = store.search("bills", [1.0, 0.0], limit=3, query_filter=bill_filter)
+    assert [point.id for point in results] == ["a", "d", "b"]
+    assert [point.score for point in results] == sorted((point.score for point in results), reverse=True)
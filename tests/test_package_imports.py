@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 패키지만 import 했을 때 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = ["pandas", "pymysql", "langchain", "langchain_community", "IPython"]
+
+
+def run_python(code: str, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+
+
+def loaded_modules(code: str):
+    result = run_python(code + "\nimport sys\nprint(' '.join(sys.modules))")
+    return set(result.stdout.split())
+
+
+def parse_importtime(stderr: str) -> dict:
+    """`python -X importtime` 출력에서 모듈별 누적 import 시간(us)을 읽습니다."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.mark.parametrize("package", ["src", "src.data_operations"])
+def test_package_import_is_lazy(package):
+    modules = loaded_modules(f"import {package}")
+    assert not modules & set(HEAVY_MODULES)
+
+
+def test_attribute_access_loads_submodule():
+    modules = loaded_modules("import src.data_operations as ops\nassert ops.DataProcessor.__name__ == 'DataProcessor'")
+    assert "src.data_operations.DataProcessor" in modules
+    assert "src.data_operations.DatabaseManager" not in modules
+
+
+def test_unknown_attribute_raises():
+    import src.data_operations as ops
+    with pytest.raises(AttributeError):
+        ops.NoSuchManager
+    assert "WorkFlowManager" in dir(ops)
+
+
+def test_workflow_manager_does_not_load_llm_stack():
+    """표결 수집 크론 작업(tools/collect_votes.py)은 LLM을 쓰지 않으므로 langchain과 IPython을 로드하지 않아야 합니다."""
+    pytest.importorskip("pymysql")
+    modules = loaded_modules("from src.data_operations.WorkFlowManager import WorkFlowManager")
+    assert not modules & {"langchain", "langchain_community", "IPython"}
+
+
+def test_importtime_benchmark():
+    """`python -X importtime`으로 패키지 import 비용을 측정합니다."""
+    cumulative = parse_importtime(run_python("import src.data_operations", "-X", "importtime").stderr)
+    package_us = cumulative["src.data_operations"]
+    print(f"src.data_operations import: {package_us / 1000:.2f} ms")
+    # 지연 로딩이 깨지면 pandas 등이 함께 로드되어 수백 ms로 늘어납니다.
+    assert package_us < 50_000
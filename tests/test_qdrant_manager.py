@@ -0,0 +1,74 @@
+import uuid
+
+import pytest
+
+qdrant_client = pytest.importorskip("qdrant_client")
+from qdrant_client.http import models
+
+from lawdigest_ai.qdrant_manager import QdrantManager
+
+
+@pytest.fixture
+def manager():
+    # 실제 서버 대신 메모리 모드 클라이언트를 사용합니다.
+    qdrant_manager = QdrantManager.__new__(QdrantManager)
+    qdrant_manager.client = qdrant_client.QdrantClient(":memory:")
+    qdrant_manager.create_collection("bills", vector_size=2)
+    return qdrant_manager
+
+
+def test_fetch_payloads_and_delete_points(manager):
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    manager.upsert_points("bills", [
+        models.PointStruct(id=point_id, vector=[1.0, float(i)], payload={"content_hash": f"h{i}", "bill_name": "x"})
+        for i, point_id in enumerate(ids)
+    ])
+
+    payloads = manager.fetch_payloads("bills", fields=["content_hash"], batch_size=2)
+    assert payloads == {point_id: {"content_hash": f"h{i}"} for i, point_id in enumerate(ids)}
+
+    manager.delete_points("bills", ids[:2])
+    assert list(manager.fetch_payloads("bills", fields=["content_hash"])) == [ids[2]]
+
+
+def test_fetch_payloads_missing_collection(manager):
+    assert manager.fetch_payloads("unknown", fields=["content_hash"]) == {}
+
+
+def test_upload_vectors_accepts_numpy(manager):
+    import numpy as np
+
+    ids = [str(uuid.uuid4()) for _ in range(4)]
+    vectors = np.random.default_rng(0).normal(size=(4, 2)).astype(np.float32)
+    assert manager.upload_vectors("bills", ids, vectors, [{"content_hash": str(i)} for i in range(4)], wait=True)
+    assert manager.client.count("bills").count == 4
+
+
+def test_create_collection_with_storage_options():
+    # 메모리 모드는 저장 옵션을 보관하지 않으므로 클라이언트에 전달된 인자를 확인합니다.
+    class RecordingClient:
+        def collection_exists(self, collection_name):
+            return False
+
+        def create_collection(self, **kwargs):
+            self.kwargs = kwargs
+
+    qdrant_manager = QdrantManager.__new__(QdrantManager)
+    qdrant_manager.client = RecordingClient()
+    qdrant_manager.create_collection("bills", vector_size=2, quantization='int8', on_disk=True, on_disk_payload=True)
+
+    kwargs = qdrant_manager.client.kwargs
+    assert kwargs['vectors_config'].on_disk is True
+    assert kwargs['on_disk_payload'] is True
+    assert kwargs['quantization_config'].scalar.type == models.ScalarType.INT8
+
+
+def test_create_collection_keeps_or_recreates_existing(manager):
+    manager.upload_vectors("bills", [str(uuid.uuid4())], [[1.0, 0.0]], [{"content_hash": "h"}], wait=True)
+
+    manager.create_collection("bills", vector_size=2)
+    assert manager.client.count("bills").count == 1
+
+    manager.create_collection("bills", vector_size=3, recreate=True)
+    assert manager.client.count("bills").count == 0
+    assert manager.client.get_collection("bills").config.params.vectors.size == 3
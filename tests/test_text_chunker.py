@@ -0,0 +1,79 @@
+import re
+
+import pytest
+
+from lawdigest_ai import text_chunker
+from lawdigest_ai.text_chunker import count_tokens, split_text
+
+
+def test_short_text_is_single_chunk():
+    assert split_text("짧은 법안 요약", max_tokens=512) == ["짧은 법안 요약"]
+
+
+@pytest.mark.parametrize("use_tiktoken", [True, False])
+def test_windows_overlap_and_respect_limit(monkeypatch, use_tiktoken):
+    monkeypatch.setattr(text_chunker, "AutoTokenizer", None)
+    if not use_tiktoken:
+        monkeypatch.setattr(text_chunker, "tiktoken", None)
+    elif text_chunker.tiktoken is None:
+        pytest.skip("tiktoken이 설치되어 있지 않습니다.")
+
+    text = " ".join(f"제{i}조 이 법은 공포한 날부터 시행한다." for i in range(200))
+    chunks = split_text(text, max_tokens=100, overlap=20)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 110 for chunk in chunks)
+    # 이웃한 청크는 앞 청크의 끝부분을 공유합니다.
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous[-5:] in current or current[:5] in previous
+    # 마지막 조항까지 빠짐없이 들어갑니다.
+    assert "제199조" in chunks[-1]
+
+
+def test_invalid_overlap():
+    with pytest.raises(ValueError):
+        split_text("텍스트", max_tokens=10, overlap=10)
+
+
+class FakeTokenizer:
+    """공백 단위로 나누고 글자 위치(offset)를 돌려주는 fast 토크나이저 대역"""
+
+    is_fast = True
+
+    def __call__(self, text, add_special_tokens=True, return_offsets_mapping=False, verbose=True):
+        matches = list(re.finditer(r"\S+", text))
+        encoded = {"input_ids": list(range(len(matches)))}
+        if return_offsets_mapping:
+            encoded["offset_mapping"] = [match.span() for match in matches]
+        return encoded
+
+
+def test_uses_embedding_model_tokenizer_offsets(monkeypatch):
+    monkeypatch.setattr(text_chunker, "get_tokenizer", lambda model_name: FakeTokenizer() if model_name else None)
+    text = "  " + " ".join(f"제{i}조" for i in range(25)) + "\n"
+
+    chunks = split_text(text, max_tokens=10, overlap=3, model_name="nlpai-lab/KURE-v1")
+
+    assert count_tokens(text, "nlpai-lab/KURE-v1") == 25
+    assert chunks[0] == " ".join(f"제{i}조" for i in range(10))
+    assert chunks[1].startswith("제7조 ")
+    assert chunks[-1].endswith("제24조")
+    assert all(chunk in text and count_tokens(chunk, "nlpai-lab/KURE-v1") <= 10 for chunk in chunks)
+
+
+def test_tiktoken_windows_do_not_split_characters(monkeypatch):
+    if text_chunker.tiktoken is None:
+        pytest.skip("tiktoken이 설치되어 있지 않습니다.")
+    # 바이트 하나가 토큰 하나인 인코딩: 한글 한 글자(3바이트)가 항상 여러 토큰에 걸칩니다.
+    encoding = text_chunker.tiktoken.Encoding(
+        name="bytes", pat_str=r"\S+|\s+", mergeable_ranks={bytes([i]): i for i in range(256)}, special_tokens={},
+    )
+    monkeypatch.setattr(text_chunker, "AutoTokenizer", None)
+    monkeypatch.setattr(text_chunker, "_encoding", encoding)
+    text = "주택임대차보호법 일부개정법률안 제안이유 및 주요내용"
+
+    chunks = split_text(text, max_tokens=10, overlap=4, model_name=None)
+
+    assert len(chunks) > 3
+    assert all("\ufffd" not in chunk and chunk in text for chunk in chunks)
+    assert chunks[0].startswith("주택임") and chunks[-1].endswith("주요내용")
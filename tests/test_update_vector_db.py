@@ -0,0 +1,168 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tools')))
+
+from lawdigest_ai.local_vector_store import LocalVectorStore
+from update_vector_db import (
+    VectorPipelineConfig, build_bill_query, build_chunk_texts, build_embedding_text, compute_content_hash,
+    find_stale_points, index_existing_points, point_id_for, select_changed_bills, stream_to_vector_store,
+)
+
+LONG_SUMMARY = " ".join(f"제{i}조 이 법은 공포한 날부터 시행한다." for i in range(60))
+CHUNKING = (64, 8)
+
+
+def make_bill(bill_id, summary="짧은 요약", propose_date="2024-03-05", **fields):
+    return {
+        'bill_id': bill_id, 'bill_name': f"{bill_id} 일부개정법률안", 'committee': "법제사법위원회",
+        'propose_date': propose_date, 'summary': summary, 'gpt_summary': None, 'brief_summary': None,
+        **fields,
+    }
+
+
+class FakeDatabase:
+    """stream_query만 흉내 내는 DatabaseManager 대역. 호출된 쿼리와 파라미터를 기록합니다."""
+
+    def __init__(self, bills):
+        self.bills = bills
+        self.queries = []
+
+    def stream_query(self, query, params=None, batch_size=1000):
+        self.queries.append((query, params))
+        for start in range(0, len(self.bills), batch_size):
+            yield self.bills[start:start + batch_size]
+
+
+class FakeEmbedder:
+    """텍스트 길이로 2차원 벡터를 만듭니다. '임베딩 실패'가 들어 있는 텍스트는 None을 반환합니다."""
+
+    def generate_batch(self, texts, as_numpy=False):
+        return [
+            None if "임베딩 실패" in text else np.array([len(text), 1.0], dtype=np.float32)
+            for text in texts
+        ]
+
+
+class FailingStore(LocalVectorStore):
+    def upload_vectors(self, collection_name, ids, vectors, payloads, wait=True):
+        return False
+
+
+def make_config(chunk_max_tokens=CHUNKING[0]):
+    return VectorPipelineConfig(
+        collection_name='bills', batch_size=2, start_date=None, end_date=None,
+        chunk_max_tokens=chunk_max_tokens, chunk_overlap=CHUNKING[1], upload_workers=2,
+    )
+
+
+def sync(store, bills, incremental=True):
+    existing = index_existing_points(store.fetch_payloads('bills', ['bill_id', 'content_hash', 'propose_date']))
+    return stream_to_vector_store(
+        make_config(), FakeDatabase(bills), FakeEmbedder(), store,
+        existing_bills=existing if incremental else None,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    vector_store = LocalVectorStore(str(tmp_path))
+    vector_store.create_collection('bills', vector_size=2)
+    return vector_store
+
+
+def test_build_bill_query_passes_dates_and_limit_as_params():
+    query, params = build_bill_query(limit=5, start_date='2024-01-01', end_date='2024-12-31', columns='bill_id')
+
+    assert query == "SELECT bill_id FROM Bill WHERE propose_date >= %s AND propose_date <= %s LIMIT %s"
+    assert params == ('2024-01-01', '2024-12-31', 5)
+    assert build_bill_query(columns='COUNT(*) AS cnt') == ("SELECT COUNT(*) AS cnt FROM Bill", ())
+
+
+def test_build_chunk_texts_repeats_header_in_every_chunk():
+    short = make_bill('A')
+    assert build_chunk_texts(short, *CHUNKING) == [build_embedding_text(short)]
+    assert build_chunk_texts({'bill_id': 'A'}, *CHUNKING) == []
+
+    chunks = build_chunk_texts(make_bill('A', summary=LONG_SUMMARY), *CHUNKING)
+
+    assert len(chunks) > 2
+    assert all(chunk.startswith("법안 제목: A 일부개정법률안") for chunk in chunks)
+    assert all("전체 요약: " in chunk for chunk in chunks)
+    assert chunks[0].split("전체 요약: ")[1].startswith("제0조")
+    assert LONG_SUMMARY.endswith(chunks[-1].split("전체 요약: ")[1])
+
+
+def test_select_changed_bills_compares_content_hash():
+    unchanged, changed = make_bill('A'), make_bill('B')
+    existing = index_existing_points({
+        'p1': {'bill_id': 'A', 'content_hash': compute_content_hash(unchanged, CHUNKING)},
+        'p2': {'bill_id': 'B', 'content_hash': 'old'},
+        # 청크마다 해시가 다르면(중간에 중단된 갱신) 다시 임베딩합니다.
+        'p3': {'bill_id': 'C', 'content_hash': compute_content_hash(make_bill('C'), CHUNKING)},
+        'p4': {'bill_id': 'C', 'content_hash': 'old'},
+    })
+
+    selected = select_changed_bills([unchanged, changed, make_bill('C'), make_bill('D')], existing, CHUNKING)
+
+    assert [bill['bill_id'] for bill in selected] == ['B', 'C', 'D']
+    assert existing['C']['point_ids'] == ['p3', 'p4']
+
+
+def test_find_stale_points_only_within_date_window():
+    existing = {
+        'A': {'propose_date': '2024-03-05', 'point_ids': ['a0', 'a1']},
+        'B': {'propose_date': '2024-03-05T00:00:00', 'point_ids': ['b0']},
+        'C': {'propose_date': '2023-12-31', 'point_ids': ['c0']},
+        'D': {'propose_date': '2025-01-01', 'point_ids': ['d0']},
+        'E': {'propose_date': None, 'point_ids': ['e0']},
+    }
+
+    assert find_stale_points(existing, {'A'}, '2024-01-01', '2024-12-31') == ['b0']
+    assert find_stale_points(existing, {'A'}, start_date='2024-01-01') == ['b0', 'd0']
+    assert sorted(find_stale_points(existing, {'A'})) == ['b0', 'c0', 'd0', 'e0']
+
+
+def test_incremental_sync_skips_unchanged_and_removes_shrunk_chunks(store):
+    upserted, unchanged, seen, obsolete = sync(store, [
+        make_bill('A', summary=LONG_SUMMARY), make_bill('B'), make_bill('C'),
+    ])
+    a_chunks = len(build_chunk_texts(make_bill('A', summary=LONG_SUMMARY), *CHUNKING))
+    assert (upserted, unchanged, obsolete) == (a_chunks + 2, 0, [])
+    assert seen == {'A', 'B', 'C'}
+
+    # A는 요약이 짧아져 청크 하나만 남고, B는 그대로, C는 DB에서 사라졌습니다.
+    upserted, unchanged, seen, obsolete = sync(store, [make_bill('A'), make_bill('B')])
+
+    assert (upserted, unchanged, seen) == (1, 1, {'A', 'B'})
+    assert sorted(obsolete) == sorted(point_id_for('A', i) for i in range(1, a_chunks))
+    existing = index_existing_points(store.fetch_payloads('bills', ['bill_id', 'content_hash', 'propose_date']))
+    assert find_stale_points(existing, seen) == [point_id_for('C', 0)]
+
+
+def test_obsolete_points_kept_when_new_vectors_are_not_stored(store, tmp_path):
+    sync(store, [make_bill('A', summary=LONG_SUMMARY), make_bill('B', summary=LONG_SUMMARY)])
+    num_chunks = len(build_chunk_texts(make_bill('B', summary=LONG_SUMMARY), *CHUNKING))
+
+    # A는 새 청크 임베딩에 실패했고, B는 정상입니다.
+    _, _, _, obsolete = sync(store, [make_bill('A', bill_name="임베딩 실패"), make_bill('B')])
+    assert sorted(obsolete) == sorted(point_id_for('B', i) for i in range(1, num_chunks))
+
+    # 업서트에 실패하면 이전 청크를 지우지 않습니다.
+    store.save()
+    failing = FailingStore(str(tmp_path))
+    upserted, unchanged, _, obsolete = sync(failing, [make_bill('A')])
+    assert (upserted, unchanged, obsolete) == (0, 0, [])
+
+
+def test_full_sync_upserts_every_bill_without_obsolete_ids(store):
+    sync(store, [make_bill('A'), make_bill('B')])
+
+    upserted, unchanged, seen, obsolete = sync(store, [make_bill('A'), make_bill('B')], incremental=False)
+
+    assert (upserted, unchanged, seen, obsolete) == (2, 0, set(), [])
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# 'src' 디렉토리를 sys.path에 추가하여 'lawdigest_ai' 모듈을 찾을 수 있도록 합니다.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(os.path.abspath(os.path.join(current_dir, '..')), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from lawdigest_ai.bill_search import BillSearcher
+from lawdigest_ai.embedding_generator import EmbeddingGenerator
+from lawdigest_ai.vector_store import open_vector_store
+
+# 검색어를 지정하지 않았을 때 사용하는 기본 검색어
+DEFAULT_QUERIES = [
+    "전세사기 피해자 지원",
+    "청년 주거 안정",
+    "반려동물 학대 처벌 강화",
+    "중대재해 처벌",
+    "저출생 대책 육아휴직 확대",
+    "개인정보 유출 과징금",
+    "의대 정원 확대",
+    "탄소중립 재생에너지",
+    "소상공인 손실보상",
+    "디지털 성범죄 처벌",
+]
+
+
+def percentile(values, q):
+    """정렬된 값 목록에서 q(0~100) 백분위수를 선형 보간으로 계산합니다."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(searcher, queries, rounds, **filters):
+    """검색어 목록을 rounds번 반복 검색하고 요청별 지연 시간(ms)을 반환합니다."""
+    latencies = []
+    for _ in range(rounds):
+        for query in queries:
+            start = time.perf_counter()
+            searcher.search(query, **filters)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label, latencies):
+    print(
+        f"📊 {label}: {len(latencies)}건 | p50 {percentile(latencies, 50):.1f}ms | "
+        f"p99 {percentile(latencies, 99):.1f}ms | 평균 {statistics.mean(latencies):.1f}ms"
+    )
+
+
+def main(collection_name, model_type, model_name, rounds, limit, committee=None, start_date=None, end_date=None,
+         backend='qdrant', store_dir=None, index='exact'):
+    """
+    법안 검색 API의 지연 시간을 측정합니다.
+
+    첫 라운드는 쿼리 임베딩 캐시가 비어 있는 상태(임베딩 + 검색), 이후 라운드는 캐시가 채워진 상태(검색만)입니다.
+    backend='local'이면 Qdrant 없이 LocalVectorStore(store_dir)에 저장된 컬렉션을 검색합니다.
+    """
+    embed_generator = EmbeddingGenerator(model_type=model_type, model_name=model_name)
+    vector_store = open_vector_store(backend, local_dir=store_dir, index=index)
+    searcher = BillSearcher(embed_generator, vector_store, collection_name)
+    filters = {'limit': limit, 'committee': committee, 'start_date': start_date, 'end_date': end_date}
+
+    report("캐시 미적중 (임베딩 + 검색)", measure(searcher, DEFAULT_QUERIES, 1, **filters))
+    if rounds > 1:
+        report("캐시 적중 (검색만)", measure(searcher, DEFAULT_QUERIES, rounds - 1, **filters))
+    print(f"🗃️ 쿼리 임베딩 캐시: {searcher.cache_info()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="법안 의미 검색의 p50/p99 지연 시간을 측정하는 스크립트")
+    parser.add_argument("--collection", default="KURE_embedding_test", help="검색할 Qdrant 컬렉션 이름")
+    parser.add_argument("--model-type", default="huggingface", choices=["huggingface", "openai"], help="임베딩 모델 유형")
+    parser.add_argument("--model-name", default="nlpai-lab/KURE-v1", help="HuggingFace 모델 이름")
+    parser.add_argument("--rounds", type=int, default=5, help="검색어 목록 반복 횟수 (첫 회는 캐시 미적중)")
+    parser.add_argument("--limit", type=int, default=10, help="검색 결과 수")
+    parser.add_argument("--committee", help="소관 위원회 필터")
+    parser.add_argument("--start-date", help="제안일 시작 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", help="제안일 종료 (YYYY-MM-DD)")
+    parser.add_argument("--backend", default="qdrant", choices=["qdrant", "local"], help="벡터 저장소 (local: Qdrant 없이 로컬 파일)")
+    parser.add_argument("--store-dir", default=os.path.join(os.path.dirname(src_path), "data", "vector_store"),
+                        help="--backend local일 때 로컬 벡터 저장소 디렉토리")
+    parser.add_argument("--index", default="exact", choices=["exact", "hnsw"], help="--backend local일 때 검색 방식")
+
+    args = parser.parse_args()
+
+    main(args.collection, args.model_type, args.model_name, args.rounds, args.limit,
+         committee=args.committee, start_date=args.start_date, end_date=args.end_date,
+         backend=args.backend, store_dir=args.store_dir, index=args.index)
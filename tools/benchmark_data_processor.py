@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+# 프로젝트 루트 경로를 sys.path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.data_operations.DataProcessor import DataProcessor
+from src.data_operations.DataSchema import apply_schema
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["형동", "민준", "서연", "지훈", "하은", "도윤", "수아", "예준", "지아", "시우"]
+STAGES = ["접수", "소관위접수", "소관위심사", "체계자구심사", "본회의의결", "대안반영폐기"]
+
+
+def make_synthetic_bills(num_bills, seed=0):
+    """의원 발의 법안 num_bills건과 발의자 데이터(billId, publicProposerIdList)를 만듭니다."""
+    rng = random.Random(seed)
+    bills, coactors = [], []
+    for i in range(num_bills):
+        bill_id = f"PRC_{i:08d}"
+        count = rng.randint(1, 3)
+        names = ", ".join(f"{rng.choice(SURNAMES)}{rng.choice(GIVEN_NAMES)}의원" for _ in range(count))
+        total = rng.randint(10, 20)
+        bills.append({
+            'billId': bill_id,
+            'billName': f"조세특례제한법 일부개정법률안({names} 등 {total}인)",
+            'billNumber': str(2200000 + i),
+            'summary': "제안이유 및 주요내용 " * 20,
+            'proposeDate': f"2024-{rng.randint(6, 12):02d}-{rng.randint(1, 28):02d}",
+            'stage': rng.choice(STAGES),
+            'proposerKind': '의원',
+            'assemblyNumber': '22',
+        })
+        coactors.append({'billId': bill_id, 'publicProposerIdList': [f"MONA_{i}_{j}" for j in range(total)]})
+    return pd.DataFrame(bills), pd.DataFrame(coactors)
+
+
+def legacy_rst_proposer_ids(df):
+    """변경 전 구현: 행마다 re.findall(.apply)과 iterrows로 rstProposerIdList를 만듭니다."""
+    name_lists = df['proposers'].apply(
+        lambda value: re.findall(r'[가-힣]+(?=의원)', value) if isinstance(value, str) else []
+    )
+    df = df.assign(rstProposerNameList=name_lists)
+    return [row['publicProposerIdList'][:len(row['rstProposerNameList'])] for _, row in df.iterrows()]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def compare_schema(df_bills):
+    """object 컬럼 DataFrame과 DataSchema를 적용한 DataFrame의 메모리 사용량과 groupby 시간을 비교합니다."""
+    df_typed, convert_elapsed = timed(apply_schema, df_bills, 'bills')
+    for label, df in (("object", df_bills), ("스키마 적용", df_typed)):
+        memory_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+        _, groupby_elapsed = timed(lambda: df.groupby('proposeDate', observed=True)['billId'].count())
+        print(f"   - {label}: 메모리 {memory_mb:.1f}MB | groupby('proposeDate') {groupby_elapsed * 1000:.1f}ms")
+    print(f"   - apply_schema 변환 시간: {convert_elapsed:.3f}s")
+
+
+def main(num_bills, seed):
+    """합성 법안 데이터로 의원 발의 법안 처리 시간을 측정하고 변경 전 구현과 결과를 비교합니다."""
+    df_bills, df_coactors = make_synthetic_bills(num_bills, seed)
+    processor = DataProcessor(fetcher=None)
+
+    df_result, total_elapsed = timed(processor.process_congressman_bills, df_bills, df_coactors)
+
+    legacy_ids, legacy_elapsed = timed(legacy_rst_proposer_ids, df_result)
+    new_ids, new_elapsed = timed(processor.slice_proposer_ids, df_result['proposers'], df_result['publicProposerIdList'])
+
+    if legacy_ids != new_ids:
+        raise SystemExit("❌ 변경 전 구현과 rstProposerIdList 결과가 다릅니다.")
+
+    print(f"\n📊 법안 {num_bills:,}건")
+    print(f"   - process_congressman_bills 전체: {total_elapsed:.3f}s")
+    print(f"   - rstProposerIdList (apply + iterrows): {legacy_elapsed:.3f}s")
+    print(f"   - rstProposerIdList (str.count + 컬럼 순회): {new_elapsed:.3f}s")
+    print(f"   - 속도 향상: {legacy_elapsed / max(new_elapsed, 1e-9):.1f}배")
+
+    print(f"\n📊 법안 프레임 자료형 (법안 {num_bills:,}건)")
+    compare_schema(df_bills)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DataProcessor 의원 발의 법안 처리 성능을 측정하는 스크립트")
+    parser.add_argument("--num-bills", type=int, default=50000, help="합성 법안 수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+
+    args = parser.parse_args()
+
+    main(args.num_bills, args.seed)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# 'src' 디렉토리를 sys.path에 추가하여 'lawdigest_ai' 모듈을 찾을 수 있도록 합니다.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(os.path.abspath(os.path.join(current_dir, '..')), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from lawdigest_ai.embedding_generator import export_quantized_onnx, load_sentence_transformer
+
+# 벤치마크용 법안 요약 문장. --num-texts만큼 반복해서 사용합니다.
+SAMPLE_TEXTS = [
+    "법안 제목: 전세사기피해자 지원 및 주거안정에 관한 특별법 일부개정법률안\n\n소관 위원회: 국토교통위원회",
+    "현행법은 임대차계약이 종료된 후 보증금을 반환받지 못한 임차인에게 임차권등기명령을 신청할 수 있도록 하고 있음.",
+    "이에 육아휴직 기간을 자녀 1명당 1년 6개월로 늘리고, 육아휴직 급여의 상한액을 상향하려는 것임(안 제70조).",
+    "중대재해 발생 시 사업주와 경영책임자의 안전보건 확보의무 위반에 대한 처벌 기준을 명확히 하려는 것임.",
+    "개인정보처리자가 개인정보를 유출한 경우 부과하는 과징금의 산정 기준을 전체 매출액으로 변경하려는 것임.",
+]
+
+
+def run_backend(label, model_name, backend, onnx_file_name, num_threads, texts, batch_size):
+    """모델을 불러와 cold start(로드 + 첫 인코딩)와 처리량을 측정하고 임베딩을 반환합니다."""
+    start = time.perf_counter()
+    model = load_sentence_transformer(model_name, backend, onnx_file_name, num_threads)
+    load_seconds = time.perf_counter() - start
+    model.encode(texts[:1], show_progress_bar=False)
+    cold_start = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectors = model.encode(texts, batch_size=batch_size, show_progress_bar=False)
+    elapsed = time.perf_counter() - start
+    print(
+        f"📊 {label}: 로드 {load_seconds:.1f}s | cold start {cold_start:.1f}s | "
+        f"{len(texts) / elapsed:.1f} texts/s ({len(texts)}건, 배치 {batch_size})"
+    )
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def cosine_rows(a, b):
+    return (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+
+
+def main(model_name, backends, num_texts, batch_size, num_threads, quantized_dir, quantization_config):
+    """
+    같은 모델을 PyTorch, ONNX Runtime, int8 양자화 ONNX로 불러와 cold start 시간과 처리량을 비교하고,
+    PyTorch 출력과의 코사인 유사도(정합성)를 함께 출력합니다.
+    """
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] + f" ({i})" for i in range(num_texts)]
+    print(f"🚀 임베딩 백엔드 벤치마크: {model_name} | 스레드 {num_threads or '기본값'}")
+
+    results = {}
+    for backend in backends:
+        if backend == 'onnx-int8':
+            if not os.path.exists(os.path.join(quantized_dir, "onnx")):
+                print(f"⏳ int8 양자화 ONNX 모델을 {quantized_dir}에 생성합니다...")
+                export_quantized_onnx(model_name, quantized_dir, quantization_config)
+            file_name = f"onnx/model_qint8_{quantization_config}.onnx"
+            results[backend] = run_backend(backend, quantized_dir, 'onnx', file_name, num_threads, texts, batch_size)
+        else:
+            results[backend] = run_backend(backend, model_name, backend, None, num_threads, texts, batch_size)
+
+    if 'torch' in results:
+        for backend, vectors in results.items():
+            if backend != 'torch':
+                cosine = cosine_rows(results['torch'], vectors)
+                print(f"🔍 {backend} vs torch 코사인 유사도: 최소 {cosine.min():.5f} / 평균 {cosine.mean():.5f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 임베딩 모델의 PyTorch/ONNX/int8 ONNX 백엔드를 비교하는 스크립트")
+    parser.add_argument("--model-name", default="nlpai-lab/KURE-v1", help="HuggingFace 모델 이름")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"],
+                        choices=["torch", "onnx", "onnx-int8"], help="비교할 백엔드")
+    parser.add_argument("--num-texts", type=int, default=256, help="처리량 측정에 사용할 텍스트 수")
+    parser.add_argument("--batch-size", type=int, default=32, help="인코딩 배치 크기")
+    parser.add_argument("--threads", type=int, help="추론에 사용할 CPU 스레드 수")
+    parser.add_argument("--quantized-dir", default=os.path.join(os.path.dirname(src_path), "data", "models", "KURE-v1-onnx"),
+                        help="int8 양자화 ONNX 모델을 저장할(또는 불러올) 디렉토리")
+    parser.add_argument("--quantization-config", default="avx512_vnni",
+                        choices=["arm64", "avx2", "avx512", "avx512_vnni"], help="양자화 대상 CPU 명령어 세트")
+
+    args = parser.parse_args()
+
+    main(args.model_name, args.backends, args.num_texts, args.batch_size, args.threads,
+         args.quantized_dir, args.quantization_config)
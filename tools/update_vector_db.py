@@ -1,12 +1,16 @@
 import sys
 import os
 import uuid
+import hashlib
+import json
+import queue
+import threading
 from dataclasses import dataclass
 from typing import Optional
-from qdrant_client.http import models
+import numpy as np
 from tqdm import tqdm
-# [MODIFICATION START] 날짜 처리를 위한 datetime, timedelta 임포트
-from datetime import datetime, timedelta
+# [MODIFICATION START] 날짜 처리를 위한 datetime 임포트
+from datetime import datetime
 # [MODIFICATION END]
 
 # --- 경로 설정 ---
@@ -19,9 +23,11 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 from data_operations.DatabaseManager import DatabaseManager
+from data_operations.Instrumentation import instrumentation, span
 from lawdigest_ai import config as project_config
 from lawdigest_ai.embedding_generator import EmbeddingGenerator
-from lawdigest_ai.qdrant_manager import QdrantManager
+from lawdigest_ai.vector_store import open_vector_store
+from lawdigest_ai.text_chunker import DEFAULT_TOKENIZER_MODEL, count_tokens, split_text
 
 # ===========================================================================
 # 설정 영역: 여기서 임베딩 및 메타데이터에 사용할 필드를 관리합니다.
@@ -34,6 +40,8 @@ EMBEDDING_FIELDS = [
     {"name": "한 줄 요약", "key": "brief_summary"},
     {"name": "전체 요약", "key": "summary"},
 ]
+# 청크 단위 임베딩 시 토큰 창으로 나누는 긴 텍스트 필드. 나머지 필드는 모든 청크 앞에 머리말로 붙습니다.
+LONG_TEXT_FIELDS = ["gpt_summary", "summary"]
 METADATA_FIELDS = [
     "bill_id", "bill_name", "committee", "summary", "brief_summary",
     "gpt_summary", "propose_date", "assembly_number", "stage",
@@ -44,6 +52,15 @@ METADATA_FIELDS = [
 # --- 상수 및 네임스페이스 정의 ---
 
 BATCH_SIZE = 100
+# 단계 사이 큐에 쌓아 둘 최대 배치 수와 동시에 업서트 요청을 보낼 스레드 수
+QUEUE_SIZE = 4
+UPLOAD_WORKERS = 2
+# 임베딩 캐시 위치: (모델, 임베딩 텍스트 해시)별 벡터를 저장해 바뀌지 않은 법안은 다시 임베딩하지 않습니다.
+EMBEDDING_CACHE_DIR = os.path.join(project_root, 'data', 'embedding_cache')
+# Qdrant 없이 실행할 때(vector_backend='local') 벡터를 저장할 위치
+LOCAL_VECTOR_STORE_DIR = os.path.join(project_root, 'data', 'vector_store')
+# 단계별 소요 시간·처리량(Instrumentation) 리포트 저장 위치
+REPORT_DIR = os.path.join(project_root, 'reports')
 NAMESPACE_UUID = uuid.UUID('6f29a8f8-14ca-43a8-8e69-de1a1389c086')
 
 @dataclass
@@ -53,9 +70,15 @@ class VectorPipelineConfig:
     이 클래스의 기본값이 파이프라인의 기본 설정으로 사용됩니다.
     """
     collection_name: str = "KURE_embedding_test"
-    recreate: bool = True
+    recreate: bool = False
+    # 증분 동기화: payload의 content_hash와 DB 행을 비교해 새로 추가되거나 바뀐 법안만 업서트하고,
+    # 조회 범위 안에서 DB에서 사라진 법안의 포인트는 삭제합니다. False이면 조회한 법안을 모두 다시 업서트합니다.
+    incremental: bool = True
     test_mode: bool = True
     batch_size: int = BATCH_SIZE
+    # DB 조회 → 임베딩 → 업서트 단계를 잇는 큐 크기와 업서트 스레드 수
+    queue_size: int = QUEUE_SIZE
+    upload_workers: int = UPLOAD_WORKERS
 
     # 날짜 필터
     start_date: Optional[str] = '2025-09-17'
@@ -65,6 +88,30 @@ class VectorPipelineConfig:
     # 임베딩 모델 설정
     model_type = 'huggingface'
     model_name = 'nlpai-lab/KURE-v1'
+    # 로컬 모델 추론 백엔드('torch' 또는 'onnx')와 CPU 스레드 수.
+    # int8 양자화 모델은 embedding_generator.export_quantized_onnx로 만든 뒤 model_name과 onnx_file_name에 지정합니다.
+    embedding_backend: str = 'torch'
+    onnx_file_name: Optional[str] = None
+    embedding_threads: Optional[int] = None
+
+    # 벡터 저장소: 'qdrant'(Qdrant 서버) 또는 'local'(Qdrant 없이 로컬 파일에 저장, 노트북·CI·오프라인 벤치마크용)
+    vector_backend: str = 'qdrant'
+    local_store_dir: str = LOCAL_VECTOR_STORE_DIR
+    local_index: str = 'exact'  # 'local'일 때 'exact'(정확 검색) 또는 'hnsw'(hnswlib 필요)
+
+    # Qdrant 전송 방식과 컬렉션 저장 옵션 (저장 옵션은 컬렉션을 새로 만들 때만 적용됩니다)
+    prefer_grpc: bool = project_config.QDRANT_PREFER_GRPC
+    quantization: Optional[str] = 'int8'  # 스칼라(int8) 양자화. None이면 사용하지 않습니다.
+    on_disk_vectors: bool = True
+    on_disk_payload: bool = True
+
+    # 청크 단위 임베딩: 긴 필드(LONG_TEXT_FIELDS)를 chunk_max_tokens 토큰 창(chunk_overlap만큼 겹침)으로 나눠
+    # 청크마다 포인트를 만들고 payload에 부모 bill_id를 기록합니다. None이면 법안당 벡터 하나를 만듭니다.
+    chunk_max_tokens: Optional[int] = 512
+    chunk_overlap: int = 64
+
+    # 임베딩 캐시 디렉토리. None이면 캐시를 사용하지 않습니다.
+    embedding_cache_dir: Optional[str] = EMBEDDING_CACHE_DIR
 
 
 
@@ -77,54 +124,368 @@ def get_required_db_fields():
         all_keys.insert(0, 'bill_id')
     return all_keys
 
-def fetch_bills_from_db(db_manager: DatabaseManager, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None):
-    """데이터베이스에서 필요한 모든 법안 정보를 동적으로 가져옵니다."""
-    # [MODIFICATION START] 함수 호출 시 단계 표시 메시지를 run_pipeline으로 이동
-    # print("\n-- [단계 1/3] 데이터베이스에서 법안 데이터 조회 --")
-    # [MODIFICATION END]
-    
-    fields_to_fetch = get_required_db_fields()
-    query = f"SELECT {', '.join(fields_to_fetch)} FROM Bill"
-    
+def build_bill_query(limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, columns: Optional[str] = None):
+    """
+    법안 조회 쿼리와 파라미터를 만듭니다. 기간과 LIMIT은 모두 파라미터로 전달합니다.
+
+    Returns:
+        tuple[str, tuple]: (쿼리, 파라미터)
+    """
+    columns = columns or ', '.join(get_required_db_fields())
+    query = f"SELECT {columns} FROM Bill"
+
     where_clauses = []
     params = []
-
     if start_date:
         where_clauses.append("propose_date >= %s")
         params.append(start_date)
-        # [MODIFICATION START] 필터 로그 메시지를 run_pipeline으로 이동
-        # print(f"▶️ 시작일 필터: {start_date}")
-        # [MODIFICATION END]
-    
     if end_date:
         where_clauses.append("propose_date <= %s")
         params.append(end_date)
-        # [MODIFICATION START] 필터 로그 메시지를 run_pipeline으로 이동
-        # print(f"▶️ 종료일 필터: {end_date}")
-        # [MODIFICATION END]
-
     if where_clauses:
         query += " WHERE " + " AND ".join(where_clauses)
 
     if limit:
-        query += f" LIMIT {limit}"
-    query += ";"
+        query += " LIMIT %s"
+        params.append(int(limit))
+    return query, tuple(params)
+
 
+def fetch_bills_from_db(db_manager: DatabaseManager, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """데이터베이스에서 필요한 모든 법안 정보를 동적으로 가져옵니다."""
+    query, params = build_bill_query(limit=limit, start_date=start_date, end_date=end_date)
     try:
-        # [MODIFICATION START] 쿼리 실행 로그를 run_pipeline으로 이동
-        # print(f"▶️ 필요한 필드 목록: {fields_to_fetch}")
-        # print(f"▶️ 실행 쿼리: {query}")
-        # [MODIFICATION END]
-        bills = db_manager.execute_query(query, tuple(params) if params else None)
-        # [MODIFICATION START] 결과 로그를 run_pipeline으로 이동
-        # print(f"✅ 총 {len(bills)}개의 법안 데이터를 성공적으로 조회했습니다.")
-        # [MODIFICATION END]
-        return bills
+        return db_manager.execute_query(query, params or None) or []
     except Exception as e:
         print(f"❌ 데이터베이스에서 법안 조회 중 오류 발생: {e}")
         return []
 
 
+def count_bills_in_db(db_manager: DatabaseManager, start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """조회 기간에 해당하는 법안 수를 반환합니다. (진행률 표시용)"""
+    query, params = build_bill_query(start_date=start_date, end_date=end_date, columns="COUNT(*) AS cnt")
+    result = db_manager.execute_query(query, params or None, fetch_one=True)
+    return result['cnt'] if result else None
+
+
+def iter_bill_batches(db_manager: DatabaseManager, batch_size: int, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """
+    기간 전체를 쿼리 한 번으로 조회하고, 서버 측 커서로 batch_size건씩 나누어 반환합니다.
+
+    Yields:
+        list[dict]: 법안 배치
+    """
+    query, params = build_bill_query(limit=limit, start_date=start_date, end_date=end_date)
+    yield from db_manager.stream_query(query, params or None, batch_size=batch_size)
+
+
+def build_embedding_text(bill):
+    """EMBEDDING_FIELDS 설정에 따라 법안 한 건의 임베딩 대상 텍스트를 만듭니다."""
+    text_parts = []
+    for field in EMBEDDING_FIELDS:
+        value = bill.get(field['key'])
+        if value:
+            value_str = value.strftime('%Y-%m-%d') if hasattr(value, 'strftime') else str(value)
+            text_parts.append(f"{field['name']}: {value_str}")
+    return "\n\n".join(text_parts)
+
+
+def build_payload(bill):
+    """METADATA_FIELDS 설정에 따라 Qdrant 포인트의 payload를 만듭니다."""
+    payload = {}
+    for key in METADATA_FIELDS:
+        value = bill.get(key)
+        if value is not None:
+            payload[key] = value.isoformat() if hasattr(value, 'isoformat') else value
+    return payload
+
+
+def build_chunk_texts(bill, max_tokens, overlap, model_name=DEFAULT_TOKENIZER_MODEL):
+    """
+    법안 한 건을 청크 텍스트 목록으로 나눕니다. 토큰 수는 model_name 토크나이저 기준입니다. (text_chunker 참고)
+
+    전체 임베딩 텍스트가 max_tokens 이하이면 청크 하나(build_embedding_text와 같음)를 반환합니다.
+    그보다 길면 LONG_TEXT_FIELDS의 각 필드를 토큰 창으로 나누고, 청크마다 나머지 필드(제목, 위원회 등)를
+    머리말로 붙여 청크만으로도 어떤 법안인지 알 수 있게 합니다.
+
+    Returns:
+        list[str]: 청크 텍스트 목록 (빈 법안이면 빈 리스트)
+    """
+    full_text = build_embedding_text(bill)
+    if not full_text or count_tokens(full_text, model_name) <= max_tokens:
+        return [full_text] if full_text else []
+
+    header = build_embedding_text({
+        key: value for key, value in bill.items() if key not in LONG_TEXT_FIELDS
+    })
+    # 머리말이 차지하는 만큼 창을 줄이되, 너무 작아지지 않도록 최소 크기를 둡니다.
+    window = max(max_tokens - count_tokens(header, model_name), max_tokens // 4)
+    chunks = []
+    for field in EMBEDDING_FIELDS:
+        value = bill.get(field['key'])
+        if field['key'] not in LONG_TEXT_FIELDS or not value:
+            continue
+        for part in split_text(str(value), window, min(overlap, window // 2), model_name):
+            chunks.append("\n\n".join(filter(None, [header, f"{field['name']}: {part}"])))
+    return chunks or [header]
+
+
+def compute_content_hash(bill, chunking=None):
+    """
+    임베딩 텍스트와 payload를 합쳐 법안 한 건의 내용 해시(sha256)를 계산합니다.
+
+    chunking(청크 크기, 겹침, 토크나이저 모델)이 바뀌면 같은 법안도 다시 임베딩해야 하므로 해시에 함께 포함합니다.
+    """
+    content = json.dumps(
+        {"text": build_embedding_text(bill), "payload": build_payload(bill), "chunking": chunking},
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def point_id_for(bill_id, chunk_index=None):
+    """법안(또는 법안의 청크)의 포인트 ID를 만듭니다. 같은 입력이면 항상 같은 UUID입니다."""
+    name = str(bill_id) if chunk_index is None else f"{bill_id}#{chunk_index}"
+    return str(uuid.uuid5(NAMESPACE_UUID, name))
+
+
+def index_existing_points(existing_payloads):
+    """
+    포인트별 payload를 법안 단위로 묶습니다. 청크 단위 컬렉션에서는 법안 하나에 포인트가 여러 개입니다.
+
+    Args:
+        existing_payloads (dict[str, dict]): 포인트 ID -> payload (bill_id, content_hash, propose_date 포함)
+
+    Returns:
+        dict[str, dict]: bill_id -> {'content_hash', 'propose_date', 'point_ids'}
+    """
+    existing_bills = {}
+    for point_id, payload in existing_payloads.items():
+        bill_id = payload.get('bill_id')
+        if bill_id is None:
+            continue
+        entry = existing_bills.setdefault(str(bill_id), {
+            'content_hash': payload.get('content_hash'),
+            'propose_date': payload.get('propose_date'),
+            'point_ids': [],
+        })
+        if entry['content_hash'] != payload.get('content_hash'):
+            entry['content_hash'] = None  # 청크마다 해시가 다르면(중간에 중단된 갱신) 다시 임베딩합니다.
+        entry['point_ids'].append(point_id)
+    return existing_bills
+
+
+def select_changed_bills(bills, existing_bills, chunking=None):
+    """
+    Qdrant에 저장된 content_hash와 비교해 새로 추가되었거나 내용이 바뀐 법안만 반환합니다.
+
+    Args:
+        bills (list[dict]): DB에서 조회한 법안 배치
+        existing_bills (dict[str, dict]): index_existing_points의 반환값
+        chunking (tuple, optional): (청크 크기, 겹침, 토크나이저 모델). compute_content_hash 참고
+    """
+    changed = []
+    for bill in bills:
+        existing = existing_bills.get(str(bill['bill_id']))
+        if existing is None or existing['content_hash'] != compute_content_hash(bill, chunking):
+            changed.append(bill)
+    return changed
+
+
+def find_stale_points(existing_bills, seen_bill_ids, start_date=None, end_date=None):
+    """
+    조회 기간에 제안된 법안 중 이번 조회에서 보이지 않은(DB에서 사라진) 법안의 포인트 ID를 반환합니다.
+
+    Args:
+        existing_bills (dict[str, dict]): index_existing_points의 반환값
+        seen_bill_ids (set[str]): 이번 조회에서 DB에 존재한 법안 ID
+        start_date, end_date (str, optional): 조회 기간
+    """
+    stale_ids = []
+    for bill_id, entry in existing_bills.items():
+        if bill_id in seen_bill_ids:
+            continue
+        propose_date = str(entry.get('propose_date') or '')[:10]
+        if start_date and (not propose_date or propose_date < start_date):
+            continue
+        if end_date and (not propose_date or propose_date > end_date):
+            continue
+        stale_ids.extend(entry['point_ids'])
+    return stale_ids
+
+
+_END_OF_STREAM = object()
+
+
+def stream_to_vector_store(pipeline_config, db_manager, embed_generator, vector_store, total=None, limit=None, existing_bills=None):
+    """
+    DB 조회 → 임베딩 → 업서트 세 단계를 크기가 제한된 큐로 연결해 동시에 실행합니다.
+
+    - 조회 스레드: 서버 측 커서에서 배치를 읽고 (증분 동기화 시) 바뀐 법안만 골라 임베딩 큐에 넣습니다.
+    - 임베딩(현재 스레드): 배치를 (청크 단위로 나눠) 임베딩해 포인트로 만든 뒤 업로드 큐에 넣습니다.
+    - 업로드 스레드(upload_workers개): wait=False로 업서트해 임베딩이 네트워크 I/O를 기다리지 않게 합니다.
+
+    마지막 배치는 다른 업서트가 모두 끝난 뒤 wait=True로 보내, 반환 시점에는 모든 포인트가 반영되어 있습니다.
+
+    Args:
+        existing_bills (dict, optional): 증분 동기화용 index_existing_points 반환값. None이면 모든 법안을 업서트합니다.
+
+    Returns:
+        tuple[int, int, set[str], list[str]]: (업서트한 포인트 수, 변경 없어 건너뛴 법안 수, 조회된 법안 ID 집합,
+            바뀐 법안의 이전 포인트 중 더 이상 쓰이지 않는 포인트 ID 목록. 새 포인트 업서트에 성공한 법안만 포함)
+    """
+    collection_name = pipeline_config.collection_name
+    bill_queue = queue.Queue(maxsize=pipeline_config.queue_size)
+    upload_queue = queue.Queue(maxsize=pipeline_config.queue_size)
+    # 청크 크기는 임베딩 모델의 토크나이저 기준입니다. OpenAI 모델은 tiktoken(model_name=None)으로 셉니다.
+    tokenizer_model = pipeline_config.model_name if pipeline_config.model_type == 'huggingface' else None
+    chunking = (
+        (pipeline_config.chunk_max_tokens, pipeline_config.chunk_overlap, tokenizer_model)
+        if pipeline_config.chunk_max_tokens else None
+    )
+    seen_bill_ids = set()
+    obsolete_point_ids = []
+    counts = {'upserted': 0, 'unchanged': 0, 'failed': 0}
+    counts_lock = threading.Lock()
+    errors = []
+    stop = threading.Event()  # 임베딩 단계에서 오류가 나면 조회 스레드를 멈춥니다.
+    pbar = tqdm(total=total, desc="임베딩 생성 및 업서트 처리 중")
+
+    def read_bills():
+        try:
+            for bill_batch in iter_bill_batches(
+                db_manager,
+                batch_size=pipeline_config.batch_size,
+                limit=limit,
+                start_date=pipeline_config.start_date,
+                end_date=pipeline_config.end_date,
+            ):
+                if stop.is_set():
+                    break
+                fetched = len(bill_batch)
+                if existing_bills is not None:
+                    seen_bill_ids.update(str(bill['bill_id']) for bill in bill_batch)
+                    bill_batch = select_changed_bills(bill_batch, existing_bills, chunking)
+                    with counts_lock:
+                        counts['unchanged'] += fetched - len(bill_batch)
+                if bill_batch:
+                    bill_queue.put((bill_batch, fetched))
+                else:
+                    pbar.update(fetched)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            bill_queue.put(_END_OF_STREAM)
+
+    def record_upload(item, ok):
+        with counts_lock:
+            counts['upserted' if ok else 'failed'] += len(item[0])
+            # 새 포인트가 저장된 경우에만 이전 포인트를 지웁니다. 실패하면 이전 포인트라도 남겨 둡니다.
+            if ok:
+                obsolete_point_ids.extend(item[4])
+        pbar.update(item[3])
+
+    def upload_points():
+        while True:
+            item = upload_queue.get()
+            if item is _END_OF_STREAM:
+                break
+            with span("vector.upsert", rows=len(item[0]), bytes=item[1].nbytes):
+                ok = vector_store.upload_vectors(collection_name, *item[:3], wait=False)
+            record_upload(item, ok)
+
+    reader = threading.Thread(target=read_bills, name="bill-reader", daemon=True)
+    uploaders = [
+        threading.Thread(target=upload_points, name=f"qdrant-uploader-{i}", daemon=True)
+        for i in range(max(1, pipeline_config.upload_workers))
+    ]
+    reader.start()
+    for uploader in uploaders:
+        uploader.start()
+
+    # 마지막 배치는 일관성 확인(barrier)용으로 남겨 두었다가 업로드 스레드가 모두 끝난 뒤 보냅니다.
+    pending = None
+    try:
+        while True:
+            item = bill_queue.get()
+            if item is _END_OF_STREAM:
+                break
+            bill_batch, fetched = item
+            # 배치 단위로 임베딩을 한 번에 생성합니다. (OpenAI는 요청 수, 로컬 모델은 인코딩 횟수를 줄임)
+            entries = []  # (포인트 ID, payload, 임베딩 텍스트)
+            obsolete_by_bill = {}
+            for bill in bill_batch:
+                payload = {**build_payload(bill), 'content_hash': compute_content_hash(bill, chunking)}
+                if chunking is None:
+                    new_ids = [point_id_for(bill['bill_id'])]
+                    entries.append((new_ids[0], payload, build_embedding_text(bill)))
+                else:
+                    chunks = build_chunk_texts(bill, *chunking)
+                    new_ids = [point_id_for(bill['bill_id'], i) for i in range(len(chunks))]
+                    entries.extend(
+                        (point_id, {**payload, 'chunk_index': i, 'chunk_text': text}, text)
+                        for i, (point_id, text) in enumerate(zip(new_ids, chunks))
+                    )
+                # 청크 수가 줄었거나 청크 설정이 바뀌었으면 이전 포인트를 지웁니다.
+                existing = (existing_bills or {}).get(str(bill['bill_id']))
+                if existing:
+                    obsolete_by_bill[str(bill['bill_id'])] = set(existing['point_ids']) - set(new_ids)
+
+            # 벡터는 파이썬 리스트로 바꾸지 않고 numpy 행렬 그대로 업로드합니다.
+            texts = [text for _, _, text in entries]
+            with span("embed.batch", rows=len(texts), bytes=sum(len(text.encode('utf-8')) for text in texts)):
+                vectors = embed_generator.generate_batch(texts, as_numpy=True)
+            embedded = []
+            failed_bills = set()
+            for entry, vector in zip(entries, vectors):
+                if vector is None:
+                    failed_bills.add(str(entry[1]['bill_id']))
+                else:
+                    embedded.append((entry, vector))
+            # 임베딩에 실패한 청크가 있는 법안은 이전 포인트를 지우지 않습니다.
+            obsolete = [
+                point_id
+                for bill_id, point_ids in obsolete_by_bill.items() if bill_id not in failed_bills
+                for point_id in point_ids
+            ]
+            if not embedded:
+                pbar.update(fetched)
+                continue
+            ids = [entry[0] for entry, _ in embedded]
+            matrix = np.stack([vector for _, vector in embedded])
+            payloads = [entry[1] for entry, _ in embedded]
+            if pending is not None:
+                upload_queue.put(pending)
+            pending = (ids, matrix, payloads, fetched, obsolete)
+    except BaseException:
+        pbar.close()
+        raise
+    finally:
+        stop.set()
+        # 조회 스레드가 가득 찬 큐에서 멈추지 않도록 남은 배치를 비웁니다.
+        while reader.is_alive():
+            try:
+                bill_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        for _ in uploaders:
+            upload_queue.put(_END_OF_STREAM)
+        for uploader in uploaders:
+            uploader.join()
+
+    if pending is not None:
+        with span("vector.upsert", rows=len(pending[0]), bytes=pending[1].nbytes):
+            ok = vector_store.upload_vectors(collection_name, *pending[:3], wait=True)
+        record_upload(pending, ok)
+    pbar.close()
+
+    if errors:
+        raise errors[0]
+    if counts['failed']:
+        print(f"⚠️ 업서트에 실패한 포인트: {counts['failed']}건")
+    return counts['upserted'], counts['unchanged'], seen_bill_ids, obsolete_point_ids
+
+
 def run_pipeline(pipeline_config: VectorPipelineConfig):
     """
     전체 데이터 파이프라인을 실행합니다.
@@ -135,7 +496,7 @@ def run_pipeline(pipeline_config: VectorPipelineConfig):
     if pipeline_config.test_mode:
         print("\n🧪 테스트 모드로 실행합니다. 5개의 데이터만 처리합니다.")
 
-    print(f"🚀 Qdrant 컬렉션 '{pipeline_config.collection_name}'에 대한 파이프라인을 시작합니다.")
+    print(f"🚀 벡터 컬렉션 '{pipeline_config.collection_name}'에 대한 파이프라인을 시작합니다.")
 
     # [MODIFICATION START] 날짜 유효성 검사 로직 추가
     if pipeline_config.start_date and pipeline_config.end_date:
@@ -147,26 +508,41 @@ def run_pipeline(pipeline_config: VectorPipelineConfig):
     # [MODIFICATION END]
 
     try:
-        project_config.validate_config()
+        project_config.validate_config(
+            require_qdrant=pipeline_config.vector_backend == 'qdrant',
+            require_openai=pipeline_config.model_type == 'openai',
+        )
     except ValueError as e:
         print(f"❌ 설정 오류: {e}")
         return
 
     db_manager = DatabaseManager()
-    embed_generator = EmbeddingGenerator(model_type=pipeline_config.model_type, model_name=pipeline_config.model_name)
-    qdrant_manager = QdrantManager()
+    embed_generator = EmbeddingGenerator(
+        model_type=pipeline_config.model_type,
+        model_name=pipeline_config.model_name,
+        cache_dir=pipeline_config.embedding_cache_dir,
+        backend=pipeline_config.embedding_backend,
+        onnx_file_name=pipeline_config.onnx_file_name,
+        num_threads=pipeline_config.embedding_threads,
+    )
+    vector_store = open_vector_store(
+        pipeline_config.vector_backend,
+        local_dir=pipeline_config.local_store_dir,
+        prefer_grpc=pipeline_config.prefer_grpc,
+        index=pipeline_config.local_index,
+    )
 
     # --- 객체 초기화 상태 디버깅 ---
     db_status = db_manager.connection is not None
-    qdrant_status = qdrant_manager.client is not None
+    store_status = vector_store.is_ready()
     embed_status = (embed_generator.model_type == 'openai' and embed_generator.client is not None) or \
                    (embed_generator.model_type == 'huggingface' and embed_generator.huggingface_model is not None)
 
-    if not all([db_status, qdrant_status, embed_status]):
+    if not all([db_status, store_status, embed_status]):
         print("❌ 파이프라인 실행에 필요한 객체 초기화에 실패했습니다. 작업을 중단합니다.")
         print(f"  - DB 연결 상태: {'성공' if db_status else '실패'}")
         print(f"  - 임베딩 생성기 상태: {'성공' if embed_status else '실패'} (모델 타입: {embed_generator.model_type})")
-        print(f"  - Qdrant 클라이언트 상태: {'성공' if qdrant_status else '실패'}")
+        print(f"  - 벡터 저장소 상태: {'성공' if store_status else '실패'} ({pipeline_config.vector_backend})")
         return
 
     # --- 벡터 차원 동적 결정 ---
@@ -186,103 +562,77 @@ def run_pipeline(pipeline_config: VectorPipelineConfig):
     
     print(f"✅ 동적으로 확인된 벡터 차원: {vector_size}")
 
-    qdrant_manager.create_collection(
+    vector_store.create_collection(
         collection_name=pipeline_config.collection_name,
         vector_size=vector_size,
         recreate=pipeline_config.recreate,
+        quantization=pipeline_config.quantization,
+        on_disk=pipeline_config.on_disk_vectors,
+        on_disk_payload=pipeline_config.on_disk_payload,
     )
+    # 검색 API(lawdigest_ai.bill_search)의 필터 필드에 payload 인덱스를 만듭니다.
+    vector_store.create_payload_indexes(pipeline_config.collection_name)
 
     limit = 5 if pipeline_config.test_mode else None
-    
-    # [MODIFICATION START] 일별 순차 조회 로직으로 변경
-    print("\n-- [단계 1/3] 데이터베이스에서 법안 데이터 조회 --")
-    all_bills = []
-    if pipeline_config.start_date and pipeline_config.end_date:
-        start_dt = datetime.strptime(pipeline_config.start_date, '%Y-%m-%d')
-        end_dt = datetime.strptime(pipeline_config.end_date, '%Y-%m-%d')
-        current_dt = start_dt
-        
-        print(f"▶️ 조회 기간: {pipeline_config.start_date} ~ {pipeline_config.end_date}")
-        
-        while current_dt <= end_dt:
-            current_date_str = current_dt.strftime('%Y-%m-%d')
-            print(f"⏳ {current_date_str} 데이터 조회 중...")
-            # 하루치 데이터만 조회
-            daily_bills = fetch_bills_from_db(
-                db_manager, 
-                limit=limit, 
-                start_date=current_date_str, 
-                end_date=current_date_str
-            )
-            if daily_bills:
-                all_bills.extend(daily_bills)
-            
-            current_dt += timedelta(days=1)
-            # 테스트 모드에서는 하루만 실행하고 종료
-            if pipeline_config.test_mode:
-                break
+
+    print("\n-- [단계 1/3] 데이터베이스 조회 범위 확인 --")
+    if pipeline_config.start_date or pipeline_config.end_date:
+        print(f"▶️ 조회 기간: {pipeline_config.start_date or '처음'} ~ {pipeline_config.end_date or '마지막'}")
     else:
-        # 날짜 지정이 없으면 전체 데이터를 가져옴
         print("▶️ 전체 기간의 데이터를 조회합니다.")
-        all_bills = fetch_bills_from_db(db_manager, limit=limit)
-    
-    print(f"✅ 총 {len(all_bills)}개의 법안 데이터를 성공적으로 조회했습니다.")
-    bills = all_bills
-    # [MODIFICATION END]
-    
-    if not bills:
+    total = count_bills_in_db(db_manager, pipeline_config.start_date, pipeline_config.end_date)
+    if limit and total is not None:
+        total = min(total, limit)
+    print(f"✅ 조회 대상 법안: {total if total is not None else '알 수 없음'}건")
+    if total == 0:
         print("⚠️ 처리할 법안 데이터가 없습니다. 작업을 종료합니다.")
         db_manager.close()
         return
 
+    incremental = pipeline_config.incremental and not pipeline_config.recreate
+    existing_bills = {}
+    if incremental:
+        existing_payloads = vector_store.fetch_payloads(
+            collection_name=pipeline_config.collection_name,
+            fields=['bill_id', 'content_hash', 'propose_date'],
+        )
+        existing_bills = index_existing_points(existing_payloads)
+        print(
+            f"🔄 증분 동기화: 컬렉션에 저장된 법안 {len(existing_bills)}건"
+            f"(포인트 {len(existing_payloads)}개)과 비교합니다."
+        )
+
     print(
-        "\n-- [단계 2/3] 텍스트 임베딩 생성 및 Qdrant 업서트 (배치 크기: "
+        "\n-- [단계 2/3] 법안 스트리밍 조회, 임베딩 생성 및 벡터 저장소 업서트 (배치 크기: "
         f"{pipeline_config.batch_size}) --"
     )
-    points_batch = []
-    for bill in tqdm(bills, desc="임베딩 생성 및 업서트 처리 중"):
-        text_parts = []
-        for field in EMBEDDING_FIELDS:
-            value = bill.get(field['key'])
-            if value:
-                value_str = value.strftime('%Y-%m-%d') if hasattr(value, 'strftime') else str(value)
-                text_parts.append(f"{field['name']}: {value_str}")
-        text_to_embed = "\n\n".join(text_parts)
-
-        vector = embed_generator.generate(text_to_embed)
-
-        if vector:
-            payload = {}
-            for key in METADATA_FIELDS:
-                value = bill.get(key)
-                if value is not None:
-                    payload[key] = value.isoformat() if hasattr(value, 'isoformat') else value
-            
-            qdrant_id = str(uuid.uuid5(NAMESPACE_UUID, bill['bill_id']))
-
-            point = models.PointStruct(
-                id=qdrant_id,
-                vector=vector,
-                payload=payload
-            )
-            points_batch.append(point)
-        
-        if len(points_batch) >= pipeline_config.batch_size:
-            if points_batch:
-                qdrant_manager.upsert_points(
-                    collection_name=pipeline_config.collection_name,
-                    points=points_batch,
-                )
-                points_batch = []
-
-    if points_batch:
-        qdrant_manager.upsert_points(
-            collection_name=pipeline_config.collection_name,
-            points=points_batch,
+    upserted, unchanged, seen_bill_ids, obsolete_ids = stream_to_vector_store(
+        pipeline_config, db_manager, embed_generator, vector_store,
+        total=total, limit=limit, existing_bills=existing_bills if incremental else None,
+    )
+    print(f"✅ 업서트 {upserted}건" + (f", 변경 없음 {unchanged}건" if incremental else ""))
+
+    if obsolete_ids:
+        print(f"🔄 내용이 바뀐 법안의 이전 포인트 {len(obsolete_ids)}개를 삭제합니다.")
+        vector_store.delete_points(pipeline_config.collection_name, obsolete_ids)
+
+    # 테스트 모드는 일부만 조회하므로 누락된 법안을 삭제 대상으로 보지 않습니다.
+    if incremental and not pipeline_config.test_mode:
+        stale_ids = find_stale_points(
+            existing_bills, seen_bill_ids, pipeline_config.start_date, pipeline_config.end_date
         )
+        print(f"🔄 DB에서 사라진 법안의 포인트 {len(stale_ids)}개를 삭제합니다.")
+        vector_store.delete_points(pipeline_config.collection_name, stale_ids)
+
+    if embed_generator.cache is not None:
+        print(f"🗃️ 임베딩 {embed_generator.cache.stats()}")
 
     print("\n-- [단계 3/3] 작업 완료 및 자원 해제 --")
+    vector_store.save()
     db_manager.close()
+    report_path = os.path.join(REPORT_DIR, 'update_vector_db_instrumentation.json')
+    instrumentation.export_json(report_path, run_name='update_vector_db', collection=pipeline_config.collection_name)
+    print(f"⏱️ 단계별 소요 시간 ({report_path}):\n{instrumentation.format_summary()}")
     print("🎉 모든 작업이 성공적으로 완료되었습니다.")
 
 def main():